@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_alloc.py
+#       Compare a steady-state update loop packing keys and values into new
+#       strings, as set_key and set_value used to, with the cursor's reusable
+#       buffers.  Reports updates per second and the packed strings or buffer
+#       growths per update; where the interpreter can count its allocated
+#       memory blocks (sys.getallocatedblocks), also reports blocks still
+#       allocated per update.
+from __future__ import print_function
+
+import sys
+import wtbench, wiredtiger
+
+nrows = 10000
+nupdates = 100000
+
+def set_key_strings(c, *args):
+    # The previous Cursor.set_key: a new string per call, pinned on the
+    # cursor.
+    if len(args) == 1 and type(args[0]) == tuple:
+        args = args[0]
+    if c.is_column:
+        c._set_recno(long(args[0]))
+    elif c.is_json:
+        c._set_key_str(args[0])
+    else:
+        c._key = c._key_plan.pack(*args)
+        c._set_key(c._key)
+
+def set_value_strings(c, *args):
+    # The previous Cursor.set_value.
+    if c.is_json:
+        c._set_value_str(args[0])
+    else:
+        if len(args) == 1 and type(args[0]) == tuple:
+            args = args[0]
+        c._value = c._value_plan.pack(*args)
+        c._set_value(c._value)
+
+def update_strings(c, i):
+    set_key_strings(c, 'key%08d' % (i % nrows))
+    set_value_strings(c, 'value', i, i << 20)
+    c.update()
+
+def update_buffers(c, i):
+    c.set_key('key%08d' % (i % nrows))
+    c.set_value('value', i, i << 20)
+    c.update()
+
+# The packed objects behind the cursor's key and value: a changed length
+# means a reused buffer grew, a changed id means a new object.
+def packed(c):
+    key = getattr(c, '_key', c._key_buf)
+    value = getattr(c, '_value', c._value_buf)
+    return (id(key), len(key), id(value), len(value))
+
+def allocated():
+    if hasattr(sys, 'getallocatedblocks'):
+        return sys.getallocatedblocks()
+    return 0
+
+conn = wiredtiger.wiredtiger_open(wtbench.home(), 'create,cache_size=100MB')
+session = conn.open_session()
+uri = 'table:alloc'
+session.create(uri, 'key_format=S,value_format=SiQ')
+c = session.open_cursor(uri)
+for i in xrange(nrows):
+    c['key%08d' % i] = ('value', i, i << 20)
+c.close()
+
+print('%-24s%14s%14s%14s' % ('update', 'updates/s', 'packs/update',
+    'blocks/update'))
+for name, update in (('strings', update_strings), ('buffers', update_buffers)):
+    c = session.open_cursor(uri)
+    # Warm up, so the buffers reach their steady-state size.
+    for i in xrange(nrows):
+        update(c, i)
+    packs = 0
+    before = packed(c)
+    blocks = allocated()
+    for i in xrange(nupdates):
+        update(c, i)
+        after = packed(c)
+        packs += (after[:2] != before[:2]) + (after[2:] != before[2:])
+        before = after
+    blocks = allocated() - blocks
+    rate = wtbench.measure(lambda: update(c, 12345))
+    wtbench.report(name, rate, float(packs) / nupdates,
+        float(blocks) / nupdates)
+    c.close()
+
+conn.close()
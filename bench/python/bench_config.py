@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_config.py
+#       Compare empty transactions and cursor opens configured with strings
+#       and with compiled configurations, in operations per second.
+from __future__ import print_function
+
+import wtbench, wiredtiger
+
+conn = wiredtiger.wiredtiger_open(wtbench.home(), 'create')
+session = conn.open_session()
+uri = 'table:config'
+session.create(uri, 'key_format=S,value_format=S')
+
+begin = 'isolation=snapshot,priority=1'
+commit = 'sync=off'
+cursor = 'overwrite=false,raw'
+compiled_begin = conn.compile_configuration(
+    'WT_SESSION.begin_transaction', begin)
+compiled_commit = conn.compile_configuration(
+    'WT_SESSION.commit_transaction', commit)
+compiled_cursor = conn.compile_configuration('WT_SESSION.open_cursor', cursor)
+
+def transaction(begin, commit):
+    session.begin_transaction(begin)
+    session.commit_transaction(commit)
+
+def open_cursor(config):
+    session.open_cursor(uri, None, config).close()
+
+print('%-24s%14s' % ('operation', 'ops/s'))
+for name, func in (
+    ('transaction string', lambda: transaction(begin, commit)),
+    ('transaction compiled',
+        lambda: transaction(compiled_begin, compiled_commit)),
+    ('open_cursor string', lambda: open_cursor(cursor)),
+    ('open_cursor compiled', lambda: open_cursor(compiled_cursor))):
+    wtbench.report(name, wtbench.measure(func))
+
+conn.close()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_cursor_cache.py
+#       Compare opening a cursor, searching and closing it, in sessions with
+#       and without cursor caching, in operations per second.
+from __future__ import print_function
+
+import wtbench, wiredtiger
+
+conn = wiredtiger.wiredtiger_open(wtbench.home(), 'create')
+setup = conn.open_session()
+uris = ('file:cache', 'table:cache')
+for uri in uris:
+    setup.create(uri, 'key_format=S,value_format=S')
+    c = setup.open_cursor(uri, None)
+    c['key'] = 'value'
+    c.close()
+
+def search(session, uri):
+    c = session.open_cursor(uri, None)
+    c.set_key('key')
+    c.search()
+    c.close()
+
+print('%-24s%14s' % ('operation', 'ops/s'))
+for config in ('cache_cursors=false', 'cache_cursors=true'):
+    session = conn.open_session(config)
+    for uri in uris:
+        wtbench.report('%s %s' % (uri.split(':')[0], config.split('=')[1]),
+            wtbench.measure(lambda: search(session, uri)))
+    session.close()
+
+conn.close()
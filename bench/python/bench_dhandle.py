@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_dhandle.py
+#       Sweep the number of tables and measure opening and closing cursors on
+#       randomly chosen tables, in operations per second, with the average
+#       number of data handle hash entries each session and connection lookup
+#       walked.  Table counts can be given as arguments, for example:
+#
+#       python bench_dhandle.py 1000 10000 100000 1000000
+#
+#       Every table holds a file open, raise the open file limit as needed.
+from __future__ import print_function
+
+import random, resource, sys
+import wtbench, wiredtiger
+from wiredtiger import stat
+
+counts = [int(a) for a in sys.argv[1:]] or [1000, 10000, 100000, 1000000]
+soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+def stats(session):
+    c = session.open_cursor('statistics:', None, None)
+    ret = dict((s, c[s][2]) for s in (
+        stat.conn.dh_conn_hash_buckets,
+        stat.conn.dh_conn_hash_lookup, stat.conn.dh_conn_hash_walk,
+        stat.conn.dh_session_hash_lookup, stat.conn.dh_session_hash_walk))
+    c.close()
+    return ret
+
+def walked(before, after, lookup, walk):
+    lookups = after[lookup] - before[lookup]
+    if lookups == 0:
+        return 0.0
+    return float(after[walk] - before[walk]) / lookups
+
+print('%-24s%14s%14s%14s%14s' %
+    ('tables', 'ops/s', 'buckets', 'conn walk', 'session walk'))
+for count in counts:
+    if hard != resource.RLIM_INFINITY and count + 100 > hard:
+        print('%d tables: open file limit is %d, stopping' % (count, hard))
+        break
+    conn = wiredtiger.wiredtiger_open(wtbench.home(),
+        'create,statistics=(fast),file_manager=(close_idle_time=3600)')
+    session = conn.open_session()
+    uris = ['table:t%07d' % i for i in xrange(count)]
+    for uri in uris:
+        session.create(uri, 'key_format=S,value_format=S')
+
+    # The first cursor open on each table in a new session misses in the
+    # session's handle cache and looks in the connection's hash table, later
+    # opens find the handle in the session's hash table.
+    session.close()
+    session = conn.open_session()
+    before = stats(session)
+    for uri in uris:
+        session.open_cursor(uri, None).close()
+    def open_close():
+        session.open_cursor(random.choice(uris), None).close()
+    middle = stats(session)
+    ops = wtbench.measure(open_close)
+    after = stats(session)
+    wtbench.report(str(count), ops, after[stat.conn.dh_conn_hash_buckets],
+        walked(before, middle, stat.conn.dh_conn_hash_lookup,
+        stat.conn.dh_conn_hash_walk),
+        walked(middle, after, stat.conn.dh_session_hash_lookup,
+        stat.conn.dh_session_hash_walk))
+    conn.close()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_latency.py
+#       Compare cursor search and update with and without latency histograms,
+#       in operations per second.
+from __future__ import print_function
+
+import wtbench, wiredtiger
+
+uri = 'file:latency'
+
+def run(config):
+    conn = wiredtiger.wiredtiger_open(wtbench.home(), 'create,' + config)
+    session = conn.open_session()
+    session.create(uri, 'key_format=i,value_format=S')
+    c = session.open_cursor(uri)
+    for i in xrange(1, 1001):
+        c[i] = 'value'
+    keys = range(1, 1001)
+
+    def search():
+        for i in keys:
+            c.set_key(i)
+            c.search()
+
+    def update():
+        for i in keys:
+            c.set_key(i)
+            c.set_value('value')
+            c.update()
+
+    results = (wtbench.measure(search) * 1000,
+        wtbench.measure(update) * 1000)
+    conn.close()
+    return results
+
+print('%-24s%14s%14s' % ('statistics', 'search/s', 'update/s'))
+for config in ('fast', 'fast,latency'):
+    wtbench.report(config, *run('statistics=(%s)' % config))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_load.py
+#       Compare loading a table with cursor[key] = value against
+#       Cursor.insert_many, for bulk and regular cursors, in rows per second.
+from __future__ import print_function
+
+import sys, time
+import wtbench, wiredtiger
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+def rows():
+    for i in xrange(nrows):
+        yield ('key%010d' % i, ('value%d' % i, i, i << 20))
+
+def load_setitem(c):
+    for key, value in rows():
+        c[key] = value
+
+def load_many(c):
+    assert c.insert_many(rows()) == []
+
+conn = wiredtiger.wiredtiger_open(wtbench.home(), 'create,cache_size=1GB')
+session = conn.open_session()
+
+print('%-24s%14s%14s%14s' % ('load', 'setitem/s', 'many/s', 'speedup'))
+for config in ('bulk', None):
+    results = []
+    for load in (load_setitem, load_many):
+        uri = 'table:' + load.__name__
+        session.create(uri, 'key_format=S,value_format=SiQ')
+        c = session.open_cursor(uri, None, config)
+        start = time.time()
+        load(c)
+        c.close()
+        results.append(nrows / (time.time() - start))
+        session.drop(uri)
+    wtbench.report(config or 'regular', results[0], results[1],
+        results[1] / results[0])
+
+conn.close()
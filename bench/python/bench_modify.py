@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_modify.py
+#       Compare replacing a few bytes of a large value with update and with
+#       modify, passing Modify objects, (offset, size, data) tuples and a
+#       ModifyVector, in operations per second.
+from __future__ import print_function
+
+import sys
+import wtbench, wiredtiger
+
+value_size = int(sys.argv[1]) if len(sys.argv) > 1 else 64 * 1024
+nmods = 4
+delta = 'x' * 16
+
+conn = wiredtiger.wiredtiger_open(wtbench.home(), 'create,cache_size=1GB')
+session = conn.open_session()
+uri = 'table:modify'
+session.create(uri, 'key_format=S,value_format=u')
+c = session.open_cursor(uri)
+value = bytearray('v' * value_size)
+c['document'] = str(value)
+
+offsets = [i * (value_size // nmods) for i in xrange(nmods)]
+objects = [wiredtiger.Modify(delta, offset, len(delta)) for offset in offsets]
+tuples = [(offset, len(delta), delta) for offset in offsets]
+vector = wiredtiger.ModifyVector()
+for offset in offsets:
+    vector.append(offset, len(delta), delta)
+
+def update():
+    for offset in offsets:
+        value[offset:offset + len(delta)] = delta
+    c.set_key('document')
+    c.set_value(str(value))
+    c.update()
+
+def modify(mods):
+    c.set_key('document')
+    c.modify(mods)
+
+print('%-24s%14s' % ('operation', 'ops/s'))
+for name, func in (('update', update),
+    ('modify objects', lambda: modify(objects)),
+    ('modify tuples', lambda: modify(tuples)),
+    ('modify vector', lambda: modify(vector))):
+    wtbench.report(name, wtbench.measure(func))
+
+conn.close()
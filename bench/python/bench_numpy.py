@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_numpy.py
+#       Compare summing a column-store table's values using cursor iteration,
+#       next_batch and to_numpy, and loading it with insert_many and from_numpy,
+#       in rows per second.
+from __future__ import print_function
+
+import sys
+import wtbench, wiredtiger
+import numpy
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+batch = 10000
+
+def sum_iterate(session, uri):
+    c = session.open_cursor(uri)
+    total = sum(value for key, value in c)
+    c.close()
+    return total
+
+def sum_batch(session, uri):
+    c = session.open_cursor(uri)
+    total = 0
+    while True:
+        rows = c.next_batch(batch)
+        total += sum(row[1] for row in rows)
+        if len(rows) < batch:
+            break
+    c.close()
+    return total
+
+def sum_numpy(session, uri):
+    c = session.open_cursor(uri)
+    total = 0
+    while True:
+        arr = c.to_numpy(batch)
+        total += int(arr['value'].sum())
+        if len(arr) < batch:
+            break
+    c.close()
+    return total
+
+def load_many(session, uri):
+    session.drop(uri, 'force')
+    session.create(uri, 'key_format=r,value_format=Q')
+    c = session.open_cursor(uri, None, 'bulk')
+    c.insert_many((i + 1, i) for i in xrange(nrows))
+    c.close()
+
+def load_numpy(session, uri):
+    session.drop(uri, 'force')
+    session.create(uri, 'key_format=r,value_format=Q')
+    c = session.open_cursor(uri, None, 'bulk')
+    arr = numpy.empty(nrows, c.numpy_dtype())
+    arr['key'] = numpy.arange(1, nrows + 1)
+    arr['value'] = numpy.arange(nrows)
+    c.from_numpy(arr)
+    c.close()
+
+conn = wiredtiger.wiredtiger_open(wtbench.home(), 'create,cache_size=1GB')
+session = conn.open_session()
+uri = 'table:column'
+expect = nrows * (nrows - 1) // 2
+
+load_numpy(session, uri)
+for scan in (sum_iterate, sum_batch, sum_numpy):
+    assert scan(session, uri) == expect
+
+print('%-24s%14s%14s%14s' % ('sum', 'iterate/s', 'batch/s', 'numpy/s'))
+wtbench.report('column', *[nrows * wtbench.measure(lambda: scan(session, uri))
+    for scan in (sum_iterate, sum_batch, sum_numpy)])
+print('%-24s%14s%14s' % ('load', 'insert_many/s', 'numpy/s'))
+wtbench.report('column', *[nrows * wtbench.measure(lambda: load(session, uri))
+    for load in (load_many, load_numpy)])
+
+conn.close()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_packing.py
+#       Compare the pure-Python packing functions with the C implementation
+#       from the _packing extension, on typical key and value formats.
+from __future__ import print_function
+
+import wtbench
+from wiredtiger import packing
+
+formats = [
+    ('r', (123456789,)),
+    ('Q', (2 ** 48 + 17,)),
+    ('S', ('key-0000012345',)),
+    ('iS', (42, 'forty two')),
+    ('SiQu', ('user00001234', -17, 1 << 40, 'x' * 100)),
+    ('SiQu/1KB', ('user00001234', -17, 1 << 40, 'x' * 1024)),
+    ('5i5S', (1, 2, 3, 4, 5, 'a', 'bb', 'ccc', 'dddd', 'eeeee')),
+]
+
+if packing.pack == packing._pack_python:
+    print('The _packing extension is not built, only reporting Python.')
+
+print('%-24s%14s%14s%14s' % ('format', 'python/s', 'C/s', 'speedup'))
+for name, values in formats:
+    fmt = name.split('/')[0]
+    packed = packing._pack_python(fmt, *values)
+    assert packing.pack(fmt, *values) == packed
+
+    py = wtbench.measure(lambda: packing._pack_python(fmt, *values))
+    c = wtbench.measure(lambda: packing.pack(fmt, *values))
+    wtbench.report('pack ' + name, py, c, c / py)
+
+    py = wtbench.measure(lambda: packing._unpack_python(fmt, packed))
+    c = wtbench.measure(lambda: packing.unpack(fmt, packed))
+    wtbench.report('unpack ' + name, py, c, c / py)
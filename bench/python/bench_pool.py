@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_pool.py
+#       Compare requests per second from Python threads that open a session
+#       and cursor for each request with threads sharing a session pool.  Each
+#       request is a single search.
+from __future__ import print_function
+
+import threading
+import wtbench, wiredtiger
+from wiredtiger.pool import SessionPool
+
+nrows = 10000
+nthreads = 8
+uri = 'table:pool'
+
+def search(c, i):
+    c.set_key(i % nrows)
+    c.search()
+    c.reset()
+
+def unpooled(conn):
+    def request(i):
+        session = conn.open_session()
+        search(session.open_cursor(uri), i)
+        session.close()
+    return request
+
+def pooled(pool):
+    def request(i):
+        with pool.checkout() as s:
+            search(s.cursor(uri), i)
+    return request
+
+def run(request):
+    def threads():
+        def worker(n):
+            for i in xrange(n, n + 1000):
+                request(i)
+        ts = [threading.Thread(target=worker, args=(n * 1000,))
+            for n in xrange(nthreads)]
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join()
+    return wtbench.measure(threads) * nthreads * 1000
+
+conn = wiredtiger.wiredtiger_open(wtbench.home(), 'create')
+session = conn.open_session()
+session.create(uri, 'key_format=i,value_format=S')
+c = session.open_cursor(uri, None, 'bulk')
+c.insert_many((i, 'value%d' % i) for i in xrange(nrows))
+c.close()
+
+print('%-24s%14s' % ('sessions', 'requests/s'))
+wtbench.report('open per request', run(unpooled(conn)))
+pool = SessionPool(conn, max_sessions=nthreads, cursors=[uri])
+wtbench.report('pool', run(pooled(pool)))
+pool.close()
+pool = SessionPool(conn, max_sessions=2, cursors=[uri])
+wtbench.report('pool of 2', run(pooled(pool)))
+pool.close()
+conn.close()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_scan.py
+#       Compare full-table scans using cursor iteration with next_batch, in
+#       rows per second, for a row-store and a column-store table.
+from __future__ import print_function
+
+import sys
+import wtbench, wiredtiger
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+batch = 1000
+
+tables = [
+    ('row', 'key_format=S,value_format=SiQ',
+        lambda i: 'key%010d' % i, lambda i: ('value%d' % i, i, i << 20)),
+    ('column', 'key_format=r,value_format=Q',
+        lambda i: i + 1, lambda i: i),
+]
+
+def scan_iterate(session, uri):
+    c = session.open_cursor(uri)
+    count = 0
+    for row in c:
+        count += 1
+    c.close()
+    return count
+
+def scan_batch(session, uri, raw=False):
+    c = session.open_cursor(uri)
+    count = 0
+    while True:
+        if raw:
+            n = len(c.next_batch(batch, raw=True)[1]) - 1
+        else:
+            n = len(c.next_batch(batch))
+        count += n
+        if n < batch:
+            break
+    c.close()
+    return count
+
+conn = wiredtiger.wiredtiger_open(wtbench.home(), 'create,cache_size=1GB')
+session = conn.open_session()
+
+print('%-24s%14s%14s%14s' % ('scan', 'iterate/s', 'batch/s', 'raw/s'))
+for name, config, key, value in tables:
+    uri = 'table:' + name
+    session.create(uri, config)
+    c = session.open_cursor(uri, None, 'bulk')
+    for i in xrange(nrows):
+        c[key(i)] = value(i)
+    c.close()
+    assert scan_iterate(session, uri) == nrows
+    assert scan_batch(session, uri) == nrows
+
+    results = [nrows * wtbench.measure(lambda: scan(session, uri))
+        for scan in (scan_iterate, scan_batch,
+        lambda session, uri: scan_batch(session, uri, True))]
+    wtbench.report(name, *results)
+
+conn.close()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_stat.py
+#       Compare reading the statistics of a table row by row from a statistics
+#       cursor and as a snapshot, in tables per second.
+from __future__ import print_function
+
+import wtbench, wiredtiger
+
+conn = wiredtiger.wiredtiger_open(wtbench.home(), 'create,statistics=(fast)')
+session = conn.open_session()
+uri = 'table:stat'
+session.create(uri, 'key_format=S,value_format=S')
+statcursor = session.open_cursor('statistics:' + uri, None, None)
+
+def rows():
+    c = session.open_cursor('statistics:' + uri, None, None)
+    values = [v for key, desc, pvalue, v in c]
+    c.close()
+
+def snapshot():
+    session.stat_snapshot(uri)
+
+def snapshot_open():
+    statcursor.stat_snapshot()
+
+print('%-24s%14s' % ('read', 'tables/s'))
+wtbench.report('cursor rows', wtbench.measure(rows))
+wtbench.report('snapshot', wtbench.measure(snapshot))
+wtbench.report('snapshot open cursor', wtbench.measure(snapshot_open))
+
+conn.close()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_statlog.py
+#       Compare the cost of the text, JSON and binary statistics log formats
+#       when logging many tables, in CPU time and log bytes per interval.
+from __future__ import print_function
+
+import glob, os, sys, time
+import wtbench, wiredtiger
+
+ntables = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+seconds = 5
+
+def run(fmt):
+    home = wtbench.home()
+    conn = wiredtiger.wiredtiger_open(home, 'create,statistics=(fast)')
+    session = conn.open_session()
+    cursors = []
+    for i in xrange(ntables):
+        uri = 'table:statlog%d' % i
+        session.create(uri, 'key_format=i,value_format=S')
+        c = session.open_cursor(uri)
+        c[1] = 'value'
+        cursors.append(c)
+
+    # The process is otherwise idle, its CPU time is the logging thread's.
+    conn.reconfigure('statistics_log=(wait=1,sources=[file:]%s)' % fmt)
+    start = os.times()
+    time.sleep(seconds)
+    end = os.times()
+    conn.close()
+
+    cpu = (end[0] + end[1]) - (start[0] + start[1])
+    size = sum(os.path.getsize(f)
+        for f in glob.glob(os.path.join(home, 'WiredTigerStat.*')))
+    return ('%.2f' % (cpu * 1000 / seconds), '%d' % (size / 1024 / seconds))
+
+print('%d tables' % ntables)
+print('%-24s%14s%14s' % ('format', 'CPU ms/int', 'KB/int'))
+for name, fmt in (('text', ''), ('json', ',json'), ('binary', ',binary')):
+    print('%-24s%14s%14s' % ((name,) + run(fmt)))
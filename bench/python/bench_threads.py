@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# bench_threads.py
+#       Measure how reads from Python threads scale with the number of
+#       threads, with and without a checkpoint running concurrently.  Each read
+#       positions a cursor on a random key and reads the following rows with
+#       next_batch, the GIL is released while the engine does the work.
+from __future__ import print_function
+
+import multiprocessing, random, sys, threading, time
+import wtbench, wiredtiger
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+seconds = 3.0
+batch = 100
+uri = 'table:threads'
+
+class reader(threading.Thread):
+    def __init__(self, conn, done):
+        threading.Thread.__init__(self)
+        self.conn = conn
+        self.done = done
+        self.rows = 0
+
+    def run(self):
+        session = self.conn.open_session()
+        c = session.open_cursor(uri)
+        r = random.Random(self.ident)
+        while not self.done.isSet():
+            c.set_key('key%010d' % r.randrange(nrows))
+            c.search()
+            self.rows += len(c.next_batch(batch)) + 1
+        session.close()
+
+# Keep updating so every checkpoint has dirty pages to write.
+class checkpointer(threading.Thread):
+    def __init__(self, conn, done):
+        threading.Thread.__init__(self)
+        self.conn = conn
+        self.done = done
+        self.checkpoints = 0
+
+    def run(self):
+        session = self.conn.open_session()
+        c = session.open_cursor(uri)
+        r = random.Random(0)
+        while not self.done.isSet():
+            for i in xrange(1000):
+                c['key%010d' % r.randrange(nrows)] = ('updated', i, i)
+            session.checkpoint()
+            self.checkpoints += 1
+        session.close()
+
+def run(conn, nthreads, checkpoint):
+    done = threading.Event()
+    readers = [reader(conn, done) for i in xrange(nthreads)]
+    threads = list(readers)
+    if checkpoint:
+        ckpt = checkpointer(conn, done)
+        threads.append(ckpt)
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    done.set()
+    for t in threads:
+        t.join()
+    return sum(t.rows for t in readers) / seconds, \
+        ckpt.checkpoints if checkpoint else 0
+
+conn = wiredtiger.wiredtiger_open(wtbench.home(), 'create,cache_size=2GB')
+session = conn.open_session()
+session.create(uri, 'key_format=S,value_format=SiQ')
+c = session.open_cursor(uri, None, 'bulk')
+c.insert_many(('key%010d' % i, ('value%d' % i, i, i << 20))
+    for i in xrange(nrows))
+c.close()
+session.checkpoint()
+
+ncpus = multiprocessing.cpu_count()
+counts = sorted(set([1, 2, 4, 8, ncpus]))
+print('%-24s%14s%14s%14s%14s' % ('threads', 'rows/s', 'scaling',
+    'rows/s+ckpt', 'checkpoints'))
+base = None
+for nthreads in counts:
+    rows, ignored = run(conn, nthreads, False)
+    ckpt_rows, checkpoints = run(conn, nthreads, True)
+    if base is None:
+        base = rows
+    wtbench.report(str(nthreads), rows, rows / base, ckpt_rows, checkpoints)
+
+conn.close()
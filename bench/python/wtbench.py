@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# wtbench.py
+#       Used as a first import by the Python benchmarks, sets up the paths
+#       needed to import the wiredtiger module from a build tree and provides
+#       common timing and reporting.
+from __future__ import print_function
+
+import os, shutil, sys, time
+thisdir = os.path.dirname(os.path.abspath(__file__))
+wt_dir = os.path.dirname(os.path.dirname(thisdir))
+wt_builddir = os.path.join(wt_dir, 'build_posix')
+
+def _prepend_env_path(pathvar, s):
+    last = ''
+    try:
+        last = ':' + os.environ[pathvar]
+    except:
+        pass
+    os.environ[pathvar] = s + last
+
+# Initialize the python path so needed modules can be imported.
+# If the path already works, don't change it.
+try:
+    import wiredtiger
+except:
+    sys.path.insert(0, os.path.join(wt_dir, 'lang', 'python'))
+    sys.path.insert(0, os.path.join(wt_builddir, 'lang', 'python'))
+    try:
+        import wiredtiger
+    except:
+        # The dynamic linker has already cached the library search path,
+        # the only option is to set it and restart the interpreter.
+        if '_wtbench_init' not in os.environ:
+            os.environ['_wtbench_init'] = 'true'
+            dotlibs = os.path.join(wt_builddir, '.libs')
+            _prepend_env_path('LD_LIBRARY_PATH', dotlibs)
+            _prepend_env_path('DYLD_LIBRARY_PATH', dotlibs)
+            py_args = sys.argv
+            py_args.insert(0, sys.executable)
+            os.execv(sys.executable, py_args)
+        raise
+
+# home --
+#   Return an empty database directory for a benchmark.
+def home(name='WT_BENCH'):
+    shutil.rmtree(name, True)
+    os.mkdir(name)
+    return name
+
+# measure --
+#   Call a function repeatedly for at least the given number of seconds,
+# return the number of calls per second.
+def measure(func, seconds=1.0):
+    calls = 0
+    batch = 1
+    start = time.time()
+    while True:
+        for i in xrange(batch):
+            func()
+        calls += batch
+        elapsed = time.time() - start
+        if elapsed >= seconds:
+            return calls / elapsed
+        batch *= 2
+
+# report --
+#   Print a line of results, a name followed by numeric columns.
+def report(name, *values):
+    print('%-24s' % name + ''.join('%14.1f' % v for v in values))
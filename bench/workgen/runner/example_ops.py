@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# example_ops.py
+#    Run the truncate, modify, checkpoint and sleep operations together and
+#    check the tables afterward.
+from runner import *
+from wiredtiger import *
+from workgen import *
+
+context = Context()
+conn = wiredtiger_open("WT_TEST", "create,cache_size=200MB")
+s = conn.open_session()
+
+tname = 'table:modify'
+s.create(tname, 'key_format=S,value_format=u')
+table = Table(tname)
+table.options.key_size = 10
+table.options.value_size = 100
+
+oname = 'table:oplog'
+s.create(oname, 'key_format=S,value_format=S')
+oplog = Table(oname)
+oplog.options.key_size = 12
+oplog.options.value_size = 50
+
+pop = Thread(Operation(Operation.OP_INSERT, table) * 1000 +
+    Operation(Operation.OP_INSERT, oplog) * 1000)
+Workload(context, pop).run(conn)
+
+# Values grow and shrink by modifies, within the configured bounds.
+grow = Thread(op_config(
+    Operation(Operation.OP_MODIFY, table, Key(), Value(20)),
+    'modify_delta=10,modify_max=300'))
+shrink = Thread(op_config(
+    Operation(Operation.OP_MODIFY, table, Key(), Value(5)),
+    'modify_delta=-5,modify_min=60'))
+
+# An oplog style table: inserts appended, two threads truncating the oldest
+# entries to keep about 1500 of them.
+ins = Thread(Operation(Operation.OP_INSERT, oplog))
+ins.options.throttle = 2000
+trunc = Thread(op_config(Operation(Operation.OP_TRUNCATE, oplog),
+    'truncate_count=1500,truncate_pct=10') +
+    Operation(Operation.OP_SLEEP, '0.001'))
+
+ckpt = Thread(Operation(Operation.OP_SLEEP, '1') +
+    Operation(Operation.OP_CHECKPOINT, ''))
+
+workload = Workload(context, grow + shrink + ins + trunc * 2 + ckpt)
+workload.options.run_time = 5
+workload.options.report_interval = 1
+workload.run(conn)
+
+stats = workload.stats
+assert stats.modify.ops > 0
+assert stats.truncate.ops > 0
+assert stats.checkpoint.ops > 0
+assert stats.insert.ops > 0
+
+c = s.open_cursor(tname)
+sizes = [len(v) for k, v in c]
+c.close()
+assert len(sizes) == 1000
+assert min(sizes) >= 60 and max(sizes) <= 300
+
+c = s.open_cursor(oname)
+entries = sum(1 for kv in c)
+c.close()
+assert entries <= 1500 + 150 + 1
+print('modify sizes: %d-%d, oplog entries: %d' %
+    (min(sizes), max(sizes), entries))
+conn.close()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+from runner import *
+from wiredtiger import *
+from workgen import *
+
+conn = wiredtiger_open("WT_TEST", "create,cache_size=500MB")
+s = conn.open_session()
+tname = "table:test"
+s.create(tname, 'key_format=S,value_format=S')
+table = Table(tname)
+table.options.key_size = 20
+table.options.value_size = 100
+
+context = Context()
+populate = Phase(Thread(Operation(Operation.OP_INSERT, table) * 500000))
+populate.options.name = 'populate'
+
+# Each reader does up to 10000 reads per second, scaled by the schedules.
+opread = Operation(Operation.OP_SEARCH, table)
+treader = Thread(opread)
+treader.options.throttle = 10000
+opwrite = Operation(Operation.OP_UPDATE, table)
+twriter = Thread(txn(opwrite * 2))
+twriter.options.throttle = 2000
+
+warmup = Phase(treader * 4)
+warmup.options.name = 'warm-up'
+warmup.options.run_time = 10
+warmup.options.throttle_schedule = 'ramp(0.1,1.0)'
+
+steady = Phase(treader * 4 + twriter * 2)
+steady.options.name = 'steady'
+steady.options.run_time = 20
+steady.options.throttle_schedule = 'sine(1.0,0.2,10)'
+
+spike = Phase(treader * 8 + twriter * 4)
+spike.options.name = 'spike'
+spike.options.run_time = 10
+spike.options.throttle_schedule = 'step(0:1.0,2:3.0,8:1.0)'
+
+drain = Phase(twriter * 2)
+drain.options.name = 'drain'
+drain.options.run_time = 10
+drain.options.throttle_schedule = 'ramp(1.0,0.0)'
+
+workload = Workload(context, populate + warmup + steady + spike + drain)
+workload.options.report_interval = 5
+print('phased workload:')
+workload.run(conn)
@@ -38,6 +38,13 @@ def txn(op, config=None):
     op._transaction = t
     return op
 
+# op_config --
+#   Set the configuration of an operation, e.g. "modify_delta=100" for a
+#   modify or "truncate_count=1000" for a truncate.
+def op_config(op, config):
+    op._config = config
+    return op
+
 # Check for a local build that contains the wt utility. First check in
 # current working directory, then in build_posix and finally in the disttop
 # directory. This isn't ideal - if a user has multiple builds in a tree we
@@ -136,11 +143,15 @@ def _op_get_group_list(op):
 
 def _op_multi_table_as_list(ops_arg, tables, pareto_tables, multiplier):
     result = []
-    if ops_arg._optype != Operation.OP_NONE:
+    if ops_arg._optype == Operation.OP_CHECKPOINT or \
+       ops_arg._optype == Operation.OP_SLEEP:
+        result.append(Operation(ops_arg))
+    elif ops_arg._optype != Operation.OP_NONE:
         if pareto_tables <= 0:
             for table in tables:
                 for i in range(0, multiplier):
-                    result.append(Operation(ops_arg._optype, table, ops_arg._key, ops_arg._value))
+                    result.append(op_config(Operation(ops_arg._optype, table,
+                        ops_arg._key, ops_arg._value), ops_arg._config))
         else:
             # Use the multiplier unless the length of the list will be large.
             # In any case, make sure there's at least a multiplier of 3, to
@@ -161,7 +172,8 @@ def _op_multi_table_as_list(ops_arg, tables, pareto_tables, multiplier):
                 key = Key(ops_arg._key)
                 key._pareto.range_low = (1.0 * i)/count
                 key._pareto.range_high = (1.0 * (i + 1))/count
-                result.append(Operation(ops_arg._optype, table, key, ops_arg._value))
+                result.append(op_config(Operation(ops_arg._optype, table,
+                    key, ops_arg._value), ops_arg._config))
     else:
         for op in _op_get_group_list(ops_arg):
             for o in _op_multi_table_as_list(op, tables, pareto_tables, \
@@ -240,7 +252,7 @@ def _op_log_op(op, log_table):
 
 def _optype_is_write(optype):
     return optype == Operation.OP_INSERT or optype == Operation.OP_UPDATE or \
-        optype == Operation.OP_REMOVE
+        optype == Operation.OP_MODIFY or optype == Operation.OP_REMOVE
 
 # Emulate wtperf's log_like option.  For all operations, add a second
 # insert operation going to a log table.
@@ -298,6 +310,59 @@ def op_group_transaction(ops_arg, ops_per_txn, txn_config):
     ops_arg._group = OpList(oplist)
     return ops_arg
 
+# op_scan --
+#   Return a scan of the table: a search_near followed by length calls to
+#   next, or prev if backward is set.  If length_max is given, the length of
+#   each scan is chosen from [length, length_max], uniformly or using the
+#   pareto parameter.
+def op_scan(table, length, length_max=0, pareto=0, backward=False, key=None):
+    config = 'scan_length=' + str(length)
+    if length_max != 0:
+        config += ',scan_length_max=' + str(length_max)
+    if pareto != 0:
+        config += ',scan_pareto=' + str(pareto)
+    if backward:
+        config += ',scan_direction=backward'
+    if key == None:
+        key = Key()
+    return op_config(Operation(Operation.OP_SCAN, table, key), config)
+
+# Count the searches of each table in a set of operations, including the
+# repeats of groups, keeping the first search seen for each table.
+def _op_count_searches(ops_arg, multiplier, counts, firsts, order):
+    if ops_arg._optype == Operation.OP_SEARCH:
+        uri = ops_arg._table._uri
+        if uri not in counts:
+            counts[uri] = 0
+            firsts[uri] = ops_arg
+            order.append(uri)
+        counts[uri] += multiplier
+    if ops_arg._group != None:
+        for op in _op_get_group_list(ops_arg):
+            _op_count_searches(op, multiplier * ops_arg._repeatgroup,
+                               counts, firsts, order)
+
+# op_mix_scans --
+#   Mix scans into an existing set of operations.  For every ratio searches
+#   of a table, a scan of that table is added, using the key distribution of
+#   the searches.  The scans are configured as in op_scan.
+def op_mix_scans(ops_arg, ratio, length, length_max=0, pareto=0,
+                 backward=False):
+    counts = {}
+    firsts = {}
+    order = []
+    _op_count_searches(ops_arg, 1, counts, firsts, order)
+    if len(order) == 0:
+        raise Exception('op_mix_scans: no search operations to mix with')
+    ops = ops_arg
+    for uri in order:
+        search = firsts[uri]
+        nscans = max(1, counts[uri] / ratio)
+        scan = op_scan(search._table, length, length_max, pareto, backward,
+                       search._key)
+        ops = op_append(ops, scan * nscans if nscans > 1 else scan)
+    return ops
+
 # Populate using range partition with the random range.
 # We will totally fill 0 or more tables (fill_tables), and 0 or
 # 1 table will be partially filled.  The rest (if any) will
@@ -28,8 +28,24 @@
 #
 # runner/latency.py
 #      Utility functions for showing latency statistics
+#
+# With Workload.options.latency_precision set, workgen also records latencies
+# (in microseconds) in log-linear (HDR) histograms.  The histograms of each
+# sample interval are written to the latency_hdr_file in HdrHistogram log
+# format, and the percentiles of the run are appended as a line of JSON to
+# the latency_json_file.  Either can be merged and compared from here, for
+# example to check a run for percentile regressions:
+#
+#   python latency.py merge -o base.json run1/latency.hlog run2/latency.hlog
+#   python latency.py compare --threshold 10 base.json WT_TEST/latency.json
+#
+# compare exits with status 1 if any percentile regressed.
 from __future__ import print_function
-import sys
+import argparse, base64, json, struct, sys, zlib
+
+# The percentiles summarized, as named in the latency JSON.
+_PERCENTILES = [('p50', 50.0), ('p90', 90.0), ('p99', 99.0),
+                ('p99.9', 99.9), ('p99.99', 99.99), ('max', 100.0)]
 
 def _show_buckets(fh, title, mult, buckets, n):
     shown = False
@@ -80,6 +96,9 @@ def _latency_optype(fh, name, ch, t):
     print('  avg: ' + str(t.latency/t.latency_ops) + \
           ', min: ' + str(t.min_latency) + ', max: ' + str(t.max_latency),
           file=fh)
+    if t.percentile(100.0) != 0:
+        print('  ' + ', '.join([name + ': ' + str(t.percentile(pct))
+                                for name, pct in _PERCENTILES[:-1]]), file=fh)
     us = t.us()
     ms = t.ms()
     sec = t.sec()
@@ -109,14 +128,269 @@ def _latency_optype(fh, name, ch, t):
     _show_buckets(fh, name + ' sec', 1000000, sec, 100)
     print('', file=fh)
 
+def _latency_stats(fh, stats, prefix = ''):
+    _latency_optype(fh, prefix + 'insert', 'I', stats.insert)
+    _latency_optype(fh, prefix + 'read', 'R', stats.read)
+    _latency_optype(fh, prefix + 'remove', 'X', stats.remove)
+    _latency_optype(fh, prefix + 'update', 'U', stats.update)
+    _latency_optype(fh, prefix + 'modify', 'M', stats.modify)
+    _latency_optype(fh, prefix + 'scan', 'S', stats.scan)
+    _latency_optype(fh, prefix + 'scan row', 'W', stats.scan_row)
+    _latency_optype(fh, prefix + 'truncate', 'T', stats.truncate)
+    _latency_optype(fh, prefix + 'checkpoint', 'C', stats.checkpoint)
+    _latency_optype(fh, prefix + 'not found', 'N', stats.not_found)
+
+# With an open loop, the workload's stats hold service times, measured from
+# the actual start of each operation, and its response_stats hold response
+# times, measured from the scheduled start.  Both are shown.
 def workload_latency(workload, outfilename = None):
     if outfilename:
         fh = open(outfilename, 'w')
     else:
         fh = sys.stdout
-    _latency_optype(fh, 'insert', 'I', workload.stats.insert)
-    _latency_optype(fh, 'read', 'R', workload.stats.read)
-    _latency_optype(fh, 'remove', 'X', workload.stats.remove)
-    _latency_optype(fh, 'update', 'U', workload.stats.update)
-    _latency_optype(fh, 'truncate', 'T', workload.stats.truncate)
-    _latency_optype(fh, 'not found', 'N', workload.stats.not_found)
+    if workload.options.open_loop:
+        _latency_stats(fh, workload.stats, 'service time: ')
+        _latency_stats(fh, workload.response_stats, 'response time: ')
+    else:
+        _latency_stats(fh, workload.stats)
+
+# A histogram decoded from an HdrHistogram log, with the same layout as
+# workgen's LatencyHistogram.
+class _HdrHistogram(object):
+    def __init__(self, precision, lowest, highest):
+        self.config = (precision, lowest, highest)
+        largest = 2 * 10 ** precision
+        magnitude = 0
+        while (1 << magnitude) < largest:
+            magnitude += 1
+        self.unit_magnitude = lowest.bit_length() - 1
+        self.half_magnitude = magnitude - 1
+        self.half_count = 1 << (magnitude - 1)
+        self.mask = ((1 << magnitude) - 1) << self.unit_magnitude
+        smallest_untrackable = (1 << magnitude) << self.unit_magnitude
+        buckets = 1
+        while smallest_untrackable <= highest:
+            smallest_untrackable <<= 1
+            buckets += 1
+        self.counts = [0] * ((buckets + 1) * self.half_count)
+        self.total = 0
+
+    def add(self, other):
+        if self.config != other.config:
+            raise ValueError('cannot merge histograms with different ' +
+                             'precision or range')
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.total += other.total
+
+    def _value(self, index):
+        bucket = (index >> self.half_magnitude) - 1
+        sub = (index & (self.half_count - 1)) + self.half_count
+        if bucket < 0:
+            sub -= self.half_count
+            bucket = 0
+        return sub << (bucket + self.unit_magnitude)
+
+    def _highest_equivalent(self, value):
+        bucket = (value | self.mask).bit_length() - \
+                 (self.unit_magnitude + self.half_magnitude + 1)
+        shift = bucket + self.unit_magnitude
+        return (((value >> shift) + 1) << shift) - 1
+
+    def percentile(self, pct):
+        if self.total == 0:
+            return 0
+        target = int(pct / 100.0 * self.total + 0.5)
+        target = min(max(target, 1), self.total)
+        running = 0
+        for i, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                return self._highest_equivalent(self._value(i))
+        return 0
+
+    def summary(self):
+        result = {'count': self.total}
+        for name, pct in _PERCENTILES:
+            result[name] = self.percentile(pct)
+        return result
+
+# Decode a ZigZag LEB128 value, returning it and the next position.
+def _hdr_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        if shift == 56:
+            value |= b << 56
+            break
+        value |= (b & 0x7f) << shift
+        if b < 0x80:
+            break
+        shift += 7
+    return (value >> 1) ^ -(value & 1), pos
+
+# Decode a histogram in the compressed V2 encoding used by HdrHistogram logs.
+def _hdr_decode(text):
+    data = base64.b64decode(text)
+    cookie, length = struct.unpack('>Ii', data[0:8])
+    if cookie & ~0xf0 != 0x1c849304:
+        raise ValueError('not a compressed HdrHistogram')
+    data = bytearray(zlib.decompress(data[8:8 + length]))
+    cookie, length, offset, precision, lowest, highest, ratio = \
+        struct.unpack('>Iiiiqqd', bytes(data[0:40]))
+    if cookie & ~0xf0 != 0x1c849303:
+        raise ValueError('unsupported HdrHistogram encoding')
+    if offset != 0:
+        raise ValueError('normalized HdrHistogram not supported')
+    hist = _HdrHistogram(precision, lowest, highest)
+    pos = 40
+    index = 0
+    while pos < 40 + length:
+        count, pos = _hdr_varint(data, pos)
+        if count < 0:
+            index -= count
+        else:
+            hist.counts[index] = count
+            hist.total += count
+            index += 1
+    return hist
+
+# Read an HdrHistogram log written by workgen, returning a histogram for each
+# tag merged over all its intervals.
+def hdr_log_read(filename, hists = None):
+    if hists == None:
+        hists = dict()
+    with open(filename) as fh:
+        for line in fh:
+            line = line.strip()
+            if line == '' or line.startswith('#') or line.startswith('"'):
+                continue
+            tag = ''
+            if line.startswith('Tag='):
+                tag, line = line[4:].split(',', 1)
+            hist = _hdr_decode(line.split(',')[-1])
+            if tag in hists:
+                hists[tag].add(hist)
+            else:
+                hists[tag] = hist
+    return hists
+
+# The latency JSON for histograms read from HdrHistogram logs.  Tags use
+# '-' where the JSON uses spaces, response times are tagged 'response-'.
+def _hdr_summary(hists):
+    result = {'units': 'us', 'workgen': dict()}
+    for tag, hist in hists.items():
+        section = 'workgen'
+        if tag.startswith('response-'):
+            section = 'response'
+            tag = tag[len('response-'):]
+        result.setdefault(section, dict())[tag.replace('-', ' ')] = \
+            hist.summary()
+    return result
+
+# Read the latency percentiles of a run, from an HdrHistogram log (.hlog)
+# or from the last line of a latency JSON file.
+def latency_read(filename):
+    if filename.endswith('.hlog'):
+        return _hdr_summary(hdr_log_read(filename))
+    with open(filename) as fh:
+        lines = [line for line in fh if line.strip() != '']
+    if len(lines) == 0:
+        raise ValueError(filename + ': no latency JSON')
+    return json.loads(lines[-1])
+
+# Merge the HdrHistogram logs of several runs, returning their latency
+# percentiles as JSON, also written to outfilename if given.
+def latency_merge(filenames, outfilename = None):
+    hists = dict()
+    for filename in filenames:
+        if not filename.endswith('.hlog'):
+            raise ValueError(filename + ': only HdrHistogram logs (.hlog) ' +
+                             'can be merged')
+        hdr_log_read(filename, hists)
+    result = _hdr_summary(hists)
+    if outfilename:
+        with open(outfilename, 'w') as fh:
+            print(json.dumps(result, sort_keys=True), file=fh)
+    return result
+
+# The latencies by operation type of each part of a run, with a label.
+def _latency_sections(summary):
+    sections = [('', summary.get('workgen', dict())),
+                ('response ', summary.get('response', dict()))]
+    for phase in summary.get('phases', []):
+        prefix = 'phase ' + phase['name'] + ' '
+        sections.append((prefix, phase.get('workgen', dict())))
+        sections.append((prefix + 'response ', phase.get('response', dict())))
+    return sections
+
+# Compare the latency percentiles of two runs, each read by latency_read.
+# A percentile regresses when the new latency is more than threshold percent
+# and more than min_change microseconds above the base.  The regressions
+# are returned as a list of (operation, percentile, base, new) tuples.
+def latency_compare(base, new, threshold = 10.0, min_change = 1,
+                    percentiles = None, fh = sys.stdout):
+    if percentiles == None:
+        percentiles = [name for name, pct in _PERCENTILES[:-1]]
+    base_ops = dict(_latency_sections(latency_read(base)))
+    regressions = []
+    print('{:<32} {:>10} {:>12} {:>12} {:>9}'.format(
+        'operation', 'percentile', 'base (us)', 'new (us)', 'change'),
+          file=fh)
+    for prefix, ops in _latency_sections(latency_read(new)):
+        for op in sorted(ops):
+            if op not in base_ops.get(prefix, dict()):
+                continue
+            for name, pct in _PERCENTILES:
+                b = base_ops[prefix][op][name]
+                n = ops[op][name]
+                change = '' if b == 0 else \
+                         '{:+.1f}%'.format(100.0 * (n - b) / b)
+                flag = ''
+                if name in percentiles and n - b > min_change and \
+                   n > b * (1.0 + threshold / 100.0):
+                    regressions.append((prefix + op, name, b, n))
+                    flag = ' REGRESSION'
+                print('{:<32} {:>10} {:>12} {:>12} {:>9}{}'.format(
+                    prefix + op, name, b, n, change, flag), file=fh)
+    print(str(len(regressions)) + ' regression(s) above ' +
+          str(threshold) + '%', file=fh)
+    return regressions
+
+def _main(argv):
+    parser = argparse.ArgumentParser(
+        description='Merge or compare workgen latency percentiles.')
+    subparsers = parser.add_subparsers(dest='command')
+    merge = subparsers.add_parser('merge',
+        help='merge HdrHistogram logs into latency JSON')
+    merge.add_argument('-o', '--output', help='output file, default stdout')
+    merge.add_argument('files', nargs='+', help='HdrHistogram logs (.hlog)')
+    compare = subparsers.add_parser('compare',
+        help='compare two runs, exit status 1 on a regression')
+    compare.add_argument('-t', '--threshold', type=float, default=10.0,
+        help='percent increase that is a regression, default 10')
+    compare.add_argument('-m', '--min-change', type=int, default=1,
+        help='microseconds increase that is a regression, default 1')
+    compare.add_argument('-p', '--percentiles',
+        default=','.join([name for name, pct in _PERCENTILES[:-1]]),
+        help='comma separated percentiles checked, default %(default)s')
+    compare.add_argument('base', help='latency JSON or HdrHistogram log')
+    compare.add_argument('new', help='latency JSON or HdrHistogram log')
+    args = parser.parse_args(argv)
+    if args.command == 'merge':
+        result = latency_merge(args.files, args.output)
+        if not args.output:
+            print(json.dumps(result, sort_keys=True))
+        return 0
+    elif args.command == 'compare':
+        regressions = latency_compare(args.base, args.new, args.threshold,
+                                      args.min_change,
+                                      args.percentiles.split(','))
+        return 1 if regressions else 0
+    parser.print_usage()
+    return 2
+
+if __name__ == '__main__':
+    sys.exit(_main(sys.argv[1:]))
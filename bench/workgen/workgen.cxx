@@ -27,6 +27,7 @@
  */
 
 #define __STDC_LIMIT_MACROS   // needed to get UINT64_MAX in C++
+#include <algorithm>
 #include <iomanip>
 #include <iostream>
 #include <fstream>
@@ -95,10 +96,18 @@ extern "C" {
             std::cout << args << std::endl;                             \
     } while(0)
 
+#define OP_HAS_TABLE(op)                                                \
+    ((op)->_optype != Operation::OP_NONE &&                             \
+      (op)->_optype != Operation::OP_CHECKPOINT &&                      \
+      (op)->_optype != Operation::OP_SLEEP)
+
 #define OP_HAS_VALUE(op)                                                \
     ((op)->_optype == Operation::OP_INSERT ||                           \
+      (op)->_optype == Operation::OP_MODIFY ||                          \
       (op)->_optype == Operation::OP_UPDATE)
 
+#define SLEEP_CHECK_US  100000   // how often a sleep checks for stop
+
 namespace workgen {
 
 // The number of contexts.  Normally there is one context created, but it will
@@ -257,9 +266,14 @@ int ContextInternal::create_all() {
     if (_runtime_alloced != _tint_last) {
         // The array references are 1-based, we'll waste one entry.
         TableRuntime *new_table_runtime = new TableRuntime[_tint_last + 1];
-        memcpy(new_table_runtime, _table_runtime, sizeof(uint64_t) * _runtime_alloced);
-        memset(&new_table_runtime[_runtime_alloced], 0,
-          sizeof(uint64_t) * (_tint_last - _runtime_alloced + 1));
+        uint32_t copied = 0;
+        if (_table_runtime != NULL) {
+            copied = _runtime_alloced + 1;
+            memcpy(new_table_runtime, _table_runtime,
+              sizeof(TableRuntime) * copied);
+        }
+        memset(&new_table_runtime[copied], 0,
+          sizeof(TableRuntime) * (_tint_last + 1 - copied));
         delete _table_runtime;
         _table_runtime = new_table_runtime;
         _runtime_alloced = _tint_last;
@@ -269,38 +283,59 @@ int ContextInternal::create_all() {
 
 Monitor::Monitor(WorkloadRunner &wrunner) :
     _errno(0), _exception(), _wrunner(wrunner), _stop(false), _handle(),
-    _out(NULL), _json(NULL) {}
+    _out(NULL), _json(NULL), _hdr(NULL) {}
 Monitor::~Monitor() {}
 
+// Latency percentiles for the sample JSON, when there's a histogram.
+static std::string json_percentiles(const Track &track) {
+    std::stringstream sstm;
+
+    if (track._histogram != NULL && track._histogram->_total != 0)
+        sstm << ",\"p50 latency\":" << track.percentile(50.0)
+             << ",\"p90 latency\":" << track.percentile(90.0)
+             << ",\"p99 latency\":" << track.percentile(99.0)
+             << ",\"p99.9 latency\":" << track.percentile(99.9)
+             << ",\"p99.99 latency\":" << track.percentile(99.99);
+    return (sstm.str());
+}
+
 int Monitor::run() {
-    struct timespec t;
+    struct timespec prev_t, t;
     struct tm *tm, _tm;
     char time_buf[64], version[100];
-    Stats prev_totals;
+    Stats prev_totals, prev_response_totals;
     WorkloadOptions *options = &_wrunner._workload->options;
     uint64_t latency_max = (uint64_t)options->max_latency;
-    bool first;
-
-    (*_out) << "#time,"
-            << "totalsec,"
-            << "read ops per second,"
-            << "insert ops per second,"
-            << "update ops per second,"
-            << "checkpoints,"
-            << "read average latency(uS),"
-            << "read minimum latency(uS),"
-            << "read maximum latency(uS),"
-            << "insert average latency(uS),"
-            << "insert min latency(uS),"
-            << "insert maximum latency(uS),"
-            << "update average latency(uS),"
-            << "update min latency(uS),"
-            << "update maximum latency(uS)"
-            << std::endl;
+    bool first, phases;
+
+    // A multi-phase workload runs a monitor for each phase, adding the phase
+    // name to each line of output.  The header is only written once.
+    phases = !_wrunner._workload->_phases.empty();
+    if (_wrunner._phase_number == 0) {
+        (*_out) << "#time,"
+                << "totalsec,"
+                << "read ops per second,"
+                << "insert ops per second,"
+                << "update ops per second,"
+                << "checkpoints,"
+                << "read average latency(uS),"
+                << "read minimum latency(uS),"
+                << "read maximum latency(uS),"
+                << "insert average latency(uS),"
+                << "insert min latency(uS),"
+                << "insert maximum latency(uS),"
+                << "update average latency(uS),"
+                << "update min latency(uS),"
+                << "update maximum latency(uS)";
+        if (phases)
+            (*_out) << ",phase";
+        (*_out) << std::endl;
+    }
 
-    first = true;
+    first = (_wrunner._phase_number == 0);
     workgen_version(version, sizeof(version));
-    Stats prev_interval;
+    Stats prev_interval, prev_response_interval;
+    prev_t = _wrunner._start;
     while (!_stop) {
         int waitsecs = (first && options->warmup > 0) ? options->warmup :
           options->sample_interval;
@@ -313,26 +348,43 @@ int Monitor::run() {
         tm = localtime_r(&t.tv_sec, &_tm);
         (void)strftime(time_buf, sizeof(time_buf), "%b %d %H:%M:%S", tm);
 
-        Stats new_totals(true);
+        Stats new_totals(true), new_response_totals(true);
+        new_totals.track_histogram(options->latency_precision);
+        new_response_totals.track_histogram(options->open_loop ?
+          options->latency_precision : 0);
         for (std::vector<ThreadRunner>::iterator tr =
-          _wrunner._trunners.begin(); tr != _wrunner._trunners.end(); tr++)
+          _wrunner._trunners.begin(); tr != _wrunner._trunners.end(); tr++) {
             new_totals.add(tr->_stats, true);
+            if (options->open_loop)
+                new_response_totals.add(tr->_response_stats, true);
+        }
         Stats interval(new_totals);
         interval.subtract(prev_totals);
         interval.smooth(prev_interval);
+        Stats response_interval(new_response_totals);
+        response_interval.subtract(prev_response_totals);
+        response_interval.smooth(prev_response_interval);
 
         int interval_secs = options->sample_interval;
         uint64_t cur_reads = interval.read.ops / interval_secs;
         uint64_t cur_inserts = interval.insert.ops / interval_secs;
         uint64_t cur_updates = interval.update.ops / interval_secs;
 
+        // Report a checkpoint if one is running now, or if any finished
+        // during the interval.
+        bool checkpointing = (interval.checkpoint.ops != 0);
+        for (std::vector<ThreadRunner>::iterator tr =
+          _wrunner._trunners.begin(); tr != _wrunner._trunners.end(); tr++)
+            if (tr->_in_checkpoint)
+                checkpointing = true;
+
         uint64_t totalsec = ts_sec(t - _wrunner._start);
         (*_out) << time_buf
                 << "," << totalsec
                 << "," << cur_reads
                 << "," << cur_inserts
                 << "," << cur_updates
-                << "," << 'N'   // checkpoint in progress
+                << "," << (checkpointing ? 'Y' : 'N')
                 << "," << interval.read.average_latency()
                 << "," << interval.read.min_latency
                 << "," << interval.read.max_latency
@@ -341,8 +393,10 @@ int Monitor::run() {
                 << "," << interval.insert.max_latency
                 << "," << interval.update.average_latency()
                 << "," << interval.update.min_latency
-                << "," << interval.update.max_latency
-                << std::endl;
+                << "," << interval.update.max_latency;
+        if (phases)
+            (*_out) << "," << _wrunner._phase->options.name;
+        (*_out) << std::endl;
 
         if (_json != NULL) {
 #define	WORKGEN_TIMESTAMP_JSON		"%Y-%m-%dT%H:%M:%S.000Z"
@@ -355,6 +409,7 @@ int Monitor::run() {
             << ",\"average latency\":" << (t).average_latency()    \
             << ",\"min latency\":" << (t).min_latency              \
             << ",\"max latency\":" << (t).max_latency              \
+            << json_percentiles(t)                                 \
             << "}"
 
             (*_json) << "{";
@@ -362,12 +417,38 @@ int Monitor::run() {
                 (*_json) << "\"version\":\"" << version << "\",";
                 first = false;
             }
-            (*_json) << "\"localTime\":\"" << time_buf
-                     << "\",\"workgen\":{"
+            (*_json) << "\"localTime\":\"" << time_buf << "\",";
+            if (phases)
+                (*_json) << "\"phase\":\"" << _wrunner._phase->options.name
+                         << "\",";
+            (*_json) << "\"workgen\":{"
                      << TRACK_JSON("read", interval.read) << ","
                      << TRACK_JSON("insert", interval.insert) << ","
-                     << TRACK_JSON("update", interval.update)
-                     << "}}" << std::endl;
+                     << TRACK_JSON("update", interval.update) << ","
+                     << TRACK_JSON("scan", interval.scan) << ","
+                     << TRACK_JSON("scan row", interval.scan_row)
+                     << "}";
+            // With an open loop, the latencies above are service times,
+            // these are response times from the scheduled start.
+            if (options->open_loop)
+                (*_json) << ",\"response\":{"
+                         << TRACK_JSON("read", response_interval.read) << ","
+                         << TRACK_JSON("insert", response_interval.insert)
+                         << ","
+                         << TRACK_JSON("update", response_interval.update)
+                         << ","
+                         << TRACK_JSON("scan", response_interval.scan)
+                         << "}";
+            (*_json) << "}" << std::endl;
+        }
+
+        if (_hdr != NULL) {
+            double start = ts_us(prev_t - _wrunner._hdr_start) / 1.0e6;
+            double length = ts_us(t - prev_t) / 1.0e6;
+            interval.hdr_log(*_hdr, "", start, length);
+            if (options->open_loop)
+                response_interval.hdr_log(*_hdr, "response-", start, length);
+            _hdr->flush();
         }
 
         uint64_t read_max = interval.read.max_latency;
@@ -386,6 +467,9 @@ int Monitor::run() {
 
         prev_interval.assign(interval);
         prev_totals.assign(new_totals);
+        prev_response_interval.assign(response_interval);
+        prev_response_totals.assign(new_response_totals);
+        prev_t = t;
     }
     return (0);
 }
@@ -410,7 +494,8 @@ ThreadRunner::ThreadRunner() :
     _errno(0), _exception(), _thread(NULL), _context(NULL), _icontext(NULL),
     _workload(NULL), _wrunner(NULL), _rand_state(NULL),
     _throttle(NULL), _throttle_ops(0), _throttle_limit(0),
-    _in_transaction(false), _number(0), _stats(false), _table_usage(),
+    _in_transaction(false), _in_checkpoint(false), _number(0), _stats(false),
+    _response_stats(false), _table_usage(),
     _cursors(NULL), _stop(false), _session(NULL), _keybuf(NULL),
     _valuebuf(NULL), _repeat(false) {
 }
@@ -427,10 +512,15 @@ int ThreadRunner::create_all(WT_CONNECTION *conn) {
     WT_RET(conn->open_session(conn, NULL, NULL, &_session));
     _table_usage.clear();
     _stats.track_latency(_workload->options.sample_interval > 0);
+    _response_stats.track_latency(_workload->options.sample_interval > 0);
+    _stats.track_histogram(_workload->options.latency_precision);
+    _response_stats.track_histogram(_workload->options.open_loop ?
+      _workload->options.latency_precision : 0);
     WT_RET(workgen_random_alloc(_session, &_rand_state));
     _throttle_ops = 0;
     _throttle_limit = 0;
     _in_transaction = 0;
+    _in_checkpoint = false;
     keysize = 1;
     valuesize = 1;
     op_create_all(&_thread->_op, keysize, valuesize);
@@ -525,7 +615,7 @@ int ThreadRunner::run() {
     VERBOSE(*this, "thread " << name << " running");
     if (options->throttle != 0) {
         _throttle = new Throttle(*this, options->throttle,
-          options->throttle_burst);
+          options->throttle_burst, _wrunner->_schedule);
     }
     for (int cnt = 0; !_stop && (_repeat || cnt < 1) && ret == 0; cnt++)
         WT_ERR(op_run(&_thread->_op));
@@ -554,13 +644,17 @@ void ThreadRunner::op_create_all(Operation *op, size_t &keysize,
     tint_t tint;
 
     op->create_all();
-    if (op->_optype != Operation::OP_NONE) {
+    if (OP_HAS_TABLE(op)) {
         op->kv_compute_max(true, false);
         if (OP_HAS_VALUE(op))
             op->kv_compute_max(false, op->_table.options.random_value);
         if (op->_key._keytype == Key::KEYGEN_PARETO &&
           op->_key._pareto.param == 0)
             THROW("Key._pareto value must be set if KEYGEN_PARETO specified");
+        if (op->_optype == Operation::OP_MODIFY &&
+          op->_modify_delta > op->_valuesize)
+            THROW("modify_delta larger than the Value.size for table '"
+              << op->_table._uri << "'");
         op->kv_size_buffer(true, keysize);
         op->kv_size_buffer(false, valuesize);
 
@@ -585,7 +679,8 @@ void ThreadRunner::op_create_all(Operation *op, size_t &keysize,
         }
         uint32_t usage_flags = CONTAINER_VALUE(_table_usage,
           op->_table._internal->_tint, 0);
-        if (op->_optype == Operation::OP_SEARCH)
+        if (op->_optype == Operation::OP_SEARCH ||
+          op->_optype == Operation::OP_SCAN)
             usage_flags |= ThreadRunner::USAGE_READ;
         else
             usage_flags |= ThreadRunner::USAGE_WRITE;
@@ -605,22 +700,12 @@ void ThreadRunner::op_create_all(Operation *op, size_t &keysize,
 // and more evenly distributed with pareto_param at 100 (the maximum).
 //
 static uint64_t
-pareto_calculation(uint32_t randint, uint64_t recno_max,
-  ParetoOptions &pareto) {
+pareto_param_calculation(double r, uint64_t recno_max, int param) {
     double S1, S2, U;
     uint32_t result;
-    double r;
 
-    r = (double)randint;
-    if (pareto.range_high != 1.0 || pareto.range_low != 0.0) {
-        if (pareto.range_high <= pareto.range_low ||
-          pareto.range_high > 1.0 || pareto.range_low < 0.0)
-            THROW("Pareto illegal range");
-        r = (pareto.range_low * (double)UINT32_MAX) +
-          r * (pareto.range_high - pareto.range_low);
-    }
     S1 = (-1 / PARETO_SHAPE);
-    S2 = recno_max * (pareto.param / 100.0) * (PARETO_SHAPE - 1);
+    S2 = recno_max * (param / 100.0) * (PARETO_SHAPE - 1);
     U = 1 - r / (double)UINT32_MAX;    // interval [0, 1)
     result = (uint64_t)((pow(U, S1) - 1) * S2);
 
@@ -640,6 +725,24 @@ pareto_calculation(uint32_t randint, uint64_t recno_max,
     return (result);
 }
 
+// As above, with the random value optionally restricted to a part of its
+// range.
+static uint64_t
+pareto_calculation(uint32_t randint, uint64_t recno_max,
+  ParetoOptions &pareto) {
+    double r;
+
+    r = (double)randint;
+    if (pareto.range_high != 1.0 || pareto.range_low != 0.0) {
+        if (pareto.range_high <= pareto.range_low ||
+          pareto.range_high > 1.0 || pareto.range_low < 0.0)
+            THROW("Pareto illegal range");
+        r = (pareto.range_low * (double)UINT32_MAX) +
+          r * (pareto.range_high - pareto.range_low);
+    }
+    return (pareto_param_calculation(r, recno_max, pareto.param));
+}
+
 uint64_t ThreadRunner::op_get_key_recno(Operation *op, uint64_t range,
   tint_t tint) {
     uint64_t recno_count;
@@ -659,27 +762,84 @@ uint64_t ThreadRunner::op_get_key_recno(Operation *op, uint64_t range,
     return (rval % recno_count + 1);  // recnos are one-based.
 }
 
+// Return the number of rows a scan visits after its initial search_near.
+// When a maximum is configured, lengths are spread between Operation's
+// _scan_length and _scan_length_max, uniformly unless _scan_pareto is set.
+uint64_t ThreadRunner::op_get_scan_length(Operation *op) {
+    uint64_t spread;
+    uint32_t rval;
+
+    if (op->_scan_length_max <= op->_scan_length)
+        return (op->_scan_length);
+    spread = op->_scan_length_max - op->_scan_length + 1;
+    rval = workgen_random(_rand_state);
+    if (op->_scan_pareto != 0)
+        return (op->_scan_length + pareto_param_calculation(
+          (double)rval, spread, op->_scan_pareto) % spread);
+    return (op->_scan_length + rval % spread);
+}
+
+// For a count based truncate, claim the next range of recnos to be truncated,
+// returning the first recno of the range and the last through lastp.  Zero
+// means the table does not yet hold more than Operation._truncate_count
+// entries.  Entries are removed in steps of _truncate_pct percent of the
+// count, taking as many steps as needed to catch up with the inserts.
+uint64_t ThreadRunner::op_get_truncate_recno(Operation *op, tint_t tint,
+  uint64_t *lastp) {
+    TableRuntime *runtime;
+    uint64_t entries, excess, step, truncate_recno;
+
+    *lastp = 0;
+    runtime = &_icontext->_table_runtime[tint];
+    step = MAX(op->_truncate_count * op->_truncate_pct / 100, 1);
+
+    // Threads truncating the same table each compute a new truncate point
+    // from the current one, only one of them can install it. The others
+    // start again from the point that was installed.  Each thread owns the
+    // range between the point it started from and the one it installed.
+    do {
+        truncate_recno = runtime->_truncate_recno;
+        entries = runtime->_max_recno - truncate_recno;
+        if (entries <= op->_truncate_count)
+            return (0);
+        excess = entries - op->_truncate_count;
+        excess = ((excess + step - 1) / step) * step;
+    } while (!workgen_atomic_cas64(&runtime->_truncate_recno,
+      truncate_recno, truncate_recno + excess));
+    *lastp = truncate_recno + excess;
+    return (truncate_recno + 1);
+}
+
 int ThreadRunner::op_run(Operation *op) {
     Track *track;
+    Track Stats::*stat;
     tint_t tint = op->_table._internal->_tint;
     WT_CURSOR *cursor;
     WT_DECL_RET;
+    timespec scheduled;
     uint64_t recno;
-    uint64_t range;
-    bool measure_latency, own_cursor;
+    uint64_t range, truncate_last;
+    bool measure_latency, open_loop, own_cursor;
 
-    track = NULL;
+    stat = NULL;
     cursor = NULL;
-    recno = 0;
+    recno = truncate_last = 0;
     own_cursor = false;
     range = op->_table.options.range;
-    if (_throttle != NULL) {
+    open_loop = _workload->options.open_loop;
+    ts_clear(scheduled);
+    if (_throttle != NULL && open_loop) {
+        if (op->_optype != Operation::OP_NONE &&
+          op->_optype != Operation::OP_SLEEP)
+            _throttle->next_start(!_in_transaction, &scheduled);
+    } else if (_throttle != NULL) {
         if (_throttle_ops >= _throttle_limit && !_in_transaction) {
             WT_ERR(_throttle->throttle(_throttle_ops,
               &_throttle_limit));
             _throttle_ops = 0;
         }
-        if (op->_optype != Operation::OP_NONE)
+        if (op->_optype != Operation::OP_NONE &&
+          op->_optype != Operation::OP_SLEEP)
             ++_throttle_ops;
     }
 
@@ -692,8 +852,11 @@ int ThreadRunner::op_run(Operation *op) {
     // (and most likely when the threads are first beginning).  Any
     // WT_NOTFOUND returns are allowed and get their own statistic bumped.
     switch (op->_optype) {
+    case Operation::OP_CHECKPOINT:
+        stat = &Stats::checkpoint;
+        break;
     case Operation::OP_INSERT:
-        track = &_stats.insert;
+        stat = &Stats::insert;
         if (op->_key._keytype == Key::KEYGEN_APPEND ||
           op->_key._keytype == Key::KEYGEN_AUTO)
             recno = workgen_atomic_add64(
@@ -701,38 +864,65 @@ int ThreadRunner::op_run(Operation *op) {
         else
             recno = op_get_key_recno(op, range, tint);
         break;
+    case Operation::OP_MODIFY:
+        stat = &Stats::modify;
+        recno = op_get_key_recno(op, range, tint);
+        break;
     case Operation::OP_REMOVE:
-        track = &_stats.remove;
+        stat = &Stats::remove;
+        recno = op_get_key_recno(op, range, tint);
+        break;
+    case Operation::OP_SCAN:
+        stat = &Stats::scan;
         recno = op_get_key_recno(op, range, tint);
         break;
     case Operation::OP_SEARCH:
-        track = &_stats.read;
+        stat = &Stats::read;
         recno = op_get_key_recno(op, range, tint);
         break;
+    case Operation::OP_TRUNCATE:
+        if (op->_truncate_count != 0) {
+            // Nothing is counted until there is something to truncate.
+            if ((recno = op_get_truncate_recno(op, tint,
+              &truncate_last)) != 0)
+                stat = &Stats::truncate;
+        } else {
+            stat = &Stats::truncate;
+            recno = op_get_key_recno(op, range, tint);
+            truncate_last = MIN(recno + op->_truncate_range - 1,
+              op->_keymax);
+        }
+        break;
     case Operation::OP_UPDATE:
-        track = &_stats.update;
+        stat = &Stats::update;
         recno = op_get_key_recno(op, range, tint);
         break;
     case Operation::OP_NONE:
+    case Operation::OP_SLEEP:
         recno = 0;
         break;
     }
-    if ((op->_flags & WORKGEN_OP_REOPEN) != 0 &&
-      op->_optype != Operation::OP_NONE) {
+    if ((op->_flags & WORKGEN_OP_REOPEN) != 0 && OP_HAS_TABLE(op)) {
         WT_ERR(_session->open_cursor(_session, op->_table._uri.c_str(), NULL,
           NULL, &cursor));
         own_cursor = true;
     } else
         cursor = _cursors[tint];
 
+    track = (stat == NULL) ? NULL : &(_stats.*stat);
     measure_latency = track != NULL && track->ops != 0 &&
       track->track_latency() &&
       (track->ops % _workload->options.sample_rate == 0);
 
     VERBOSE(*this, "OP " << op->_optype << " " << op->_table._uri.c_str() << ", recno=" << recno);
     timespec start;
-    if (measure_latency)
+    if (measure_latency) {
         workgen_epoch(&start);
+        // Without a schedule, or inside a transaction where we may be
+        // ahead of it, the response time is the service time.
+        if (scheduled == 0 || start < scheduled)
+            scheduled = start;
+    }
 
     if (op->_transaction != NULL) {
         if (_in_transaction)
@@ -741,7 +931,7 @@ int ThreadRunner::op_run(Operation *op) {
           op->_transaction->_begin_config.c_str());
         _in_transaction = true;
     }
-    if (op->_optype != Operation::OP_NONE) {
+    if (OP_HAS_TABLE(op)) {
         op->kv_gen(true, 0, recno, _keybuf);
         cursor->set_key(cursor, _keybuf);
         if (OP_HAS_VALUE(op)) {
@@ -749,18 +939,38 @@ int ThreadRunner::op_run(Operation *op) {
             if (op->_table.options.random_value)
                 r = workgen_random(_rand_state);
             op->kv_gen(false, r, recno, _valuebuf);
-            cursor->set_value(cursor, _valuebuf);
+            // A modify takes its data from the value buffer directly.  Raw
+            // byte values are set with an item, keeping the nul byte so the
+            // stored value is the same size as a string value.
+            if (op->_optype != Operation::OP_MODIFY) {
+                if (strcmp(cursor->value_format, "u") == 0) {
+                    WT_ITEM item;
+                    item.data = _valuebuf;
+                    item.size = (size_t)op->_valuesize;
+                    cursor->set_value(cursor, &item);
+                } else
+                    cursor->set_value(cursor, _valuebuf);
+            }
         }
         switch (op->_optype) {
         case Operation::OP_INSERT:
             WT_ERR(cursor->insert(cursor));
             break;
+        case Operation::OP_MODIFY:
+            WT_ERR_NOTFOUND_OK(op_modify(op, cursor));
+            break;
         case Operation::OP_REMOVE:
             WT_ERR_NOTFOUND_OK(cursor->remove(cursor));
             break;
+        case Operation::OP_SCAN:
+            WT_ERR_NOTFOUND_OK(op_scan(op, cursor));
+            break;
         case Operation::OP_SEARCH:
             ret = cursor->search(cursor);
             break;
+        case Operation::OP_TRUNCATE:
+            WT_ERR_NOTFOUND_OK(op_truncate(op, cursor, truncate_last));
+            break;
         case Operation::OP_UPDATE:
             WT_ERR_NOTFOUND_OK(cursor->update(cursor));
             break;
@@ -769,15 +979,28 @@ int ThreadRunner::op_run(Operation *op) {
         }
         if (ret != 0) {
             ASSERT(ret == WT_NOTFOUND);
+            stat = &Stats::not_found;
             track = &_stats.not_found;
             ret = 0;  // WT_NOTFOUND allowed.
         }
         cursor->reset(cursor);
-    }
+    } else if (op->_optype == Operation::OP_CHECKPOINT) {
+        if (_in_transaction)
+            THROW("checkpoint not supported within a transaction");
+        _in_checkpoint = true;
+        ret = _session->checkpoint(_session,
+          op->_config.empty() ? NULL : op->_config.c_str());
+        _in_checkpoint = false;
+        WT_ERR(ret);
+    } else if (op->_optype == Operation::OP_SLEEP)
+        op_sleep(op);
     if (measure_latency) {
         timespec stop;
         workgen_epoch(&stop);
         track->incr_with_latency(ts_us(stop - start));
+        if (open_loop)
+            (_response_stats.*stat).incr_with_latency(
+              ts_us(stop - scheduled));
     } else if (track != NULL)
         track->incr();
 
@@ -800,6 +1023,113 @@ err:
     return (ret);
 }
 
+// Replace part of the value with new data from the value buffer.  The value
+// grows by Operation._modify_delta bytes unless that would take it outside
+// the bounds of _modify_min and _modify_max, in which case the replaced and
+// new data are the same size.  The record is searched first to find its
+// current length.
+int ThreadRunner::op_modify(Operation *op, WT_CURSOR *cursor) {
+    WT_ITEM value;
+    WT_MODIFY entry;
+    size_t datasize, replace;
+    int delta;
+
+    if (strcmp(cursor->value_format, "u") != 0)
+        THROW("OP_MODIFY requires value_format=u for table '"
+          << op->_table._uri << "'");
+    WT_RET(cursor->search(cursor));
+    WT_RET(cursor->get_value(cursor, &value));
+
+    delta = op->_modify_delta;
+    if (delta > 0 && op->_modify_max != 0 &&
+      (int64_t)value.size + delta > op->_modify_max)
+        delta = 0;
+    if (delta < 0 && (int64_t)value.size + delta < op->_modify_min)
+        delta = 0;
+    datasize = (size_t)op->_valuesize;
+    replace = (size_t)((int)datasize - delta);
+    if (replace > value.size)
+        replace = value.size;
+
+    entry.data.data = _valuebuf;
+    entry.data.size = datasize;
+    entry.size = replace;
+    entry.offset = 0;
+    if (value.size > replace)
+        entry.offset =
+          workgen_random(_rand_state) % (value.size - replace + 1);
+    return (cursor->modify(cursor, &entry, 1));
+}
+
+// Position the cursor with search_near, then visit the following rows with
+// next, or the preceding rows with prev for a backward scan.  Each row is
+// counted, and sampled for latency, separately from the scan as a whole.
+// Reaching the end of the table finishes the scan early.
+int ThreadRunner::op_scan(Operation *op, WT_CURSOR *cursor) {
+    Track *track;
+    WT_DECL_RET;
+    timespec start, stop;
+    uint64_t length, n;
+    int exact;
+    bool backward, measure_latency;
+
+    backward = (op->_flags & WORKGEN_OP_SCAN_BACKWARD) != 0;
+    length = op_get_scan_length(op);
+    WT_RET(cursor->search_near(cursor, &exact));
+    track = &_stats.scan_row;
+    for (n = 0; n < length && !_stop; n++) {
+        measure_latency = track->ops != 0 && track->track_latency() &&
+          (track->ops % _workload->options.sample_rate == 0);
+        if (measure_latency)
+            workgen_epoch(&start);
+        ret = backward ? cursor->prev(cursor) : cursor->next(cursor);
+        if (ret == WT_NOTFOUND)
+            return (0);
+        WT_RET(ret);
+        if (measure_latency) {
+            workgen_epoch(&stop);
+            track->incr_with_latency(ts_us(stop - start));
+        } else
+            track->incr();
+    }
+    return (0);
+}
+
+// Sleep for the configured time, waking periodically to check whether the
+// thread has been told to stop.
+void ThreadRunner::op_sleep(Operation *op) {
+    uint64_t remaining, usecs;
+
+    for (remaining = op->_sleep_us; remaining > 0 && !_stop;
+      remaining -= usecs) {
+        usecs = MIN(remaining, SLEEP_CHECK_US);
+        usleep((useconds_t)usecs);
+    }
+}
+
+// Truncate the table from the cursor's key up to and including the given
+// recno, zero means there is nothing to do.  The range is either claimed by a
+// count based truncate or Operation._truncate_range entries starting at a
+// chosen recno.
+int ThreadRunner::op_truncate(Operation *op, WT_CURSOR *cursor,
+  uint64_t last) {
+    WT_CURSOR *stop;
+    WT_DECL_RET;
+
+    if (last == 0)
+        return (0);
+
+    // The start key references _keybuf, the stop key needs its own buffer.
+    std::vector<char> stopkey((size_t)op->_keysize);
+    op->kv_gen(true, 0, last, &stopkey[0]);
+    WT_RET(_session->open_cursor(_session, op->_table._uri.c_str(), NULL,
+      NULL, &stop));
+    stop->set_key(stop, &stopkey[0]);
+    ret = _session->truncate(_session, NULL, cursor, stop, NULL);
+    WT_TRET(stop->close(stop));
+    return (ret);
+}
+
 #ifdef _DEBUG
 std::string ThreadRunner::get_debug() {
     return (_debug_messages.str());
@@ -807,9 +1137,11 @@ std::string ThreadRunner::get_debug() {
 #endif
 
 Throttle::Throttle(ThreadRunner &runner, double throttle,
-    double throttle_burst) : _runner(runner), _throttle(throttle),
-    _burst(throttle_burst), _next_div(), _ops_delta(0), _ops_prev(0),
-    _ops_per_div(0), _ms_per_div(0), _started(false) {
+    double throttle_burst, const ThrottleSchedule *schedule) :
+    _runner(runner), _throttle(throttle), _burst(throttle_burst),
+    _schedule(schedule), _next_start(), _next_div(), _ops_delta(0),
+    _ops_prev(0), _ops_per_div(0), _ms_per_div(0), _started(false) {
+    ts_clear(_next_start);
     ts_clear(_next_div);
     _ms_per_div = (uint64_t)ceill(1000.0 / THROTTLE_PER_SEC);
     _ops_per_div = (uint64_t)ceill(_throttle / THROTTLE_PER_SEC);
@@ -837,10 +1169,16 @@ static float rand_signed(uint32_t r) {
 // greater).  This has the effect of randomizing how much clumping happens, and
 // ensures that multiple threads aren't executing in lock step.
 //
+// When the phase has a throttle schedule, the number of operations is scaled
+// by the schedule's factor at the current time.  While the factor is zero,
+// the thread waits, without making up the operations it missed.
+//
 int Throttle::throttle(uint64_t op_count, uint64_t *op_limit) {
     uint64_t ops;
     int64_t sleep_ms;
+    double factor;
     timespec now;
+    bool waited;
 
     workgen_epoch(&now);
     DEBUG_CAPTURE(_runner, "throttle: ops=" << op_count);
@@ -860,6 +1198,14 @@ int Throttle::throttle(uint64_t op_count, uint64_t *op_limit) {
         }
         _next_div = ts_add_ms(_next_div, _ms_per_div);
     }
+    if (_schedule != NULL) {
+        factor = schedule_factor(now, &waited);
+        if (waited) {
+            _next_div = ts_add_ms(now, _ms_per_div);
+            _ops_delta = 0;
+        }
+        _ops_per_div = (uint64_t)ceill(_throttle * factor / THROTTLE_PER_SEC);
+    }
     ops = _ops_per_div;
     if (_ops_delta < (int64_t)ops) {
         ops -= _ops_delta;
@@ -874,6 +1220,196 @@ int Throttle::throttle(uint64_t op_count, uint64_t *op_limit) {
     return (0);
 }
 
+// With an open loop, operations are scheduled to start at even intervals set
+// by the throttle, regardless of how long earlier operations took.  A thread
+// that has fallen behind its schedule does not wait, it runs operations back
+// to back until it catches up, and their latency is measured from the
+// scheduled start.  The caller does not wait within a transaction.
+void Throttle::next_start(bool wait, timespec *start) {
+    double factor;
+    timespec now;
+    bool waited;
+
+    workgen_epoch(&now);
+    factor = schedule_factor(now, &waited);
+    if (!_started || waited) {
+        _next_start = now;
+        _started = true;
+    }
+    *start = _next_start;
+    if (factor > 0.0)
+        _next_start = ts_add_ns(_next_start,
+          (uint64_t)(NSEC_PER_SEC / (_throttle * factor)));
+    if (wait && now < *start)
+        usleep((useconds_t)ts_us(*start - now));
+}
+
+// Return the factor the throttle schedule applies at the current time, 1.0
+// if there is no schedule.  While the factor is zero, wait, updating the
+// current time.
+double Throttle::schedule_factor(timespec &now, bool *waited) {
+    double factor;
+
+    *waited = false;
+    if (_schedule == NULL)
+        return (1.0);
+    while ((factor = _schedule->factor(ts_ms(now -
+      _runner._wrunner->_start) / 1000.0)) <= 0.0 && !_runner._stop) {
+        usleep((useconds_t)ms_to_us(_ms_per_div));
+        workgen_epoch(&now);
+        *waited = true;
+    }
+    return (factor);
+}
+
+ThrottleSchedule::ThrottleSchedule() : _shape(CONSTANT), _args(), _points(),
+    _run_time(0) {}
+ThrottleSchedule::~ThrottleSchedule() {}
+
+// Return the factor applied to thread throttles at the given number of
+// seconds into the phase.
+double ThrottleSchedule::factor(double secs) const {
+    double result;
+    size_t i;
+
+    switch (_shape) {
+    case RAMP:
+        if (secs >= _run_time)
+            result = _args[1];
+        else
+            result = _args[0] + (_args[1] - _args[0]) * secs / _run_time;
+        break;
+    case SINE:
+        result = _args[0] + _args[1] * sin(2 * M_PI * secs / _args[2]);
+        break;
+    case STEP:
+        for (i = 1; i < _points.size() && _points[i].first <= secs; i++)
+            ;
+        result = _points[i - 1].second;
+        break;
+    case CONSTANT:
+    default:
+        result = 1.0;
+        break;
+    }
+    return (result < 0.0 ? 0.0 : result);
+}
+
+// Parse a number appearing in a throttle schedule.
+static double schedule_double(const std::string &spec,
+  const std::string &value) {
+    char *end;
+    double result;
+
+    result = strtod(value.c_str(), &end);
+    if (value.empty() || *end != '\0')
+        THROW("throttle_schedule \"" << spec << "\": \"" << value
+          << "\" is not a number");
+    return (result);
+}
+
+// A throttle schedule is empty, or one of:
+//    ramp(start,end)           factor moves linearly over the run time
+//    sine(mean,amplitude,secs) factor follows a sine wave with the period
+//    step(secs:factor,...)     factor changes at each of the times
+//    trace(filename)           as step, reading a "secs factor" pair per line
+void ThrottleSchedule::parse(const std::string &spec, int run_time) {
+    std::string name, args, item;
+    size_t pos;
+
+    _shape = CONSTANT;
+    _args.clear();
+    _points.clear();
+    _run_time = run_time;
+    if (spec.empty())
+        return;
+
+    pos = spec.find('(');
+    if (pos == std::string::npos || spec[spec.size() - 1] != ')')
+        THROW("throttle_schedule \"" << spec << "\": expected "
+          "\"name(arguments)\"");
+    name = spec.substr(0, pos);
+    args = spec.substr(pos + 1, spec.size() - pos - 2);
+    if (name == "trace") {
+        read_trace(spec, args);
+        _shape = STEP;
+        return;
+    }
+    std::stringstream sstm(args);
+    while (std::getline(sstm, item, ',')) {
+        if (name == "step")
+            parse_point(spec, item);
+        else
+            _args.push_back(schedule_double(spec, item));
+    }
+    if (name == "ramp") {
+        if (_args.size() != 2)
+            THROW("throttle_schedule \"" << spec << "\": ramp requires "
+              "a start and an end");
+        if (run_time <= 0)
+            THROW("throttle_schedule \"" << spec << "\": ramp requires "
+              "a run_time");
+        _shape = RAMP;
+    } else if (name == "sine") {
+        if (_args.size() != 3 || _args[2] <= 0.0)
+            THROW("throttle_schedule \"" << spec << "\": sine requires "
+              "a mean, an amplitude and a positive period");
+        _shape = SINE;
+    } else if (name == "step") {
+        if (_points.empty())
+            THROW("throttle_schedule \"" << spec << "\": step requires "
+              "at least one secs:factor pair");
+        _shape = STEP;
+    } else
+        THROW("throttle_schedule \"" << spec << "\": unknown schedule \""
+          << name << "\"");
+}
+
+// Add a secs:factor pair to a step schedule, the times must increase.
+void ThrottleSchedule::parse_point(const std::string &spec,
+  const std::string &point) {
+    double secs;
+    size_t pos;
+
+    if ((pos = point.find(':')) == std::string::npos)
+        THROW("throttle_schedule \"" << spec << "\": expected "
+          "\"secs:factor\", got \"" << point << "\"");
+    secs = schedule_double(spec, point.substr(0, pos));
+    if (!_points.empty() && secs <= _points.back().first)
+        THROW("throttle_schedule \"" << spec << "\": times must increase");
+    _points.push_back(std::make_pair(secs,
+      schedule_double(spec, point.substr(pos + 1))));
+}
+
+// Read a rate trace, each line has a time in seconds and a factor, separated
+// by white space or a comma.  Blank lines and lines starting with '#' are
+// ignored.
+void ThrottleSchedule::read_trace(const std::string &spec,
+  const std::string &filename) {
+    std::ifstream in(filename.c_str());
+    std::string line;
+    size_t pos;
+
+    if (!in)
+        THROW_ERRNO(errno, "throttle_schedule \"" << spec
+          << "\": trace file could not be opened");
+    while (std::getline(in, line)) {
+        if ((pos = line.find_first_not_of(" \t")) == std::string::npos ||
+          line[pos] == '#')
+            continue;
+        std::replace(line.begin(), line.end(), ',', ' ');
+        std::stringstream sstm(line);
+        std::string secs, factor, extra;
+        sstm >> secs >> factor >> extra;
+        if (factor.empty() || !extra.empty())
+            THROW("throttle_schedule \"" << spec << "\": trace line \""
+              << line << "\" is not a \"secs factor\" pair");
+        parse_point(spec, secs + ":" + factor);
+    }
+    if (_points.empty())
+        THROW("throttle_schedule \"" << spec << "\": trace file is empty");
+}
+
 ThreadOptions::ThreadOptions() : name(), throttle(0.0), throttle_burst(1.0),
     _options() {
     _options.add_string("name", name, "name of the thread");
@@ -932,37 +1468,67 @@ void Thread::describe(std::ostream &os) const {
 Operation::Operation() :
     _optype(OP_NONE), _table(), _key(), _value(), _config(), _transaction(NULL),
     _group(NULL), _repeatgroup(0), _flags(0),
-    _keysize(0), _valuesize(0), _keymax(0), _valuemax(0) {
+    _keysize(0), _valuesize(0), _keymax(0), _valuemax(0),
+    _modify_delta(0), _modify_max(0), _modify_min(0), _scan_length(0),
+    _scan_length_max(0), _scan_pareto(0), _sleep_us(0),
+    _truncate_count(0), _truncate_pct(0), _truncate_range(0) {
 }
 
 Operation::Operation(OpType optype, Table table, Key key, Value value) :
     _optype(optype), _table(table), _key(key), _value(value), _config(),
     _transaction(NULL), _group(NULL), _repeatgroup(0), _flags(0),
-    _keysize(0), _valuesize(0), _keymax(0), _valuemax(0) {
+    _keysize(0), _valuesize(0), _keymax(0), _valuemax(0),
+    _modify_delta(0), _modify_max(0), _modify_min(0), _scan_length(0),
+    _scan_length_max(0), _scan_pareto(0), _sleep_us(0),
+    _truncate_count(0), _truncate_pct(0), _truncate_range(0) {
     size_check();
 }
 
 Operation::Operation(OpType optype, Table table, Key key) :
     _optype(optype), _table(table), _key(key), _value(), _config(),
     _transaction(NULL), _group(NULL), _repeatgroup(0), _flags(0),
-    _keysize(0), _valuesize(0), _keymax(0), _valuemax(0) {
+    _keysize(0), _valuesize(0), _keymax(0), _valuemax(0),
+    _modify_delta(0), _modify_max(0), _modify_min(0), _scan_length(0),
+    _scan_length_max(0), _scan_pareto(0), _sleep_us(0),
+    _truncate_count(0), _truncate_pct(0), _truncate_range(0) {
     size_check();
 }
 
 Operation::Operation(OpType optype, Table table) :
     _optype(optype), _table(table), _key(), _value(), _config(),
     _transaction(NULL), _group(NULL), _repeatgroup(0), _flags(0),
-    _keysize(0), _valuesize(0), _keymax(0), _valuemax(0) {
+    _keysize(0), _valuesize(0), _keymax(0), _valuemax(0),
+    _modify_delta(0), _modify_max(0), _modify_min(0), _scan_length(0),
+    _scan_length_max(0), _scan_pareto(0), _sleep_us(0),
+    _truncate_count(0), _truncate_pct(0), _truncate_range(0) {
     size_check();
 }
 
+Operation::Operation(OpType optype, const char *config) :
+    _optype(optype), _table(), _key(), _value(), _config(config),
+    _transaction(NULL), _group(NULL), _repeatgroup(0), _flags(0),
+    _keysize(0), _valuesize(0), _keymax(0), _valuemax(0),
+    _modify_delta(0), _modify_max(0), _modify_min(0), _scan_length(0),
+    _scan_length_max(0), _scan_pareto(0), _sleep_us(0),
+    _truncate_count(0), _truncate_pct(0), _truncate_range(0) {
+    if (OP_HAS_TABLE(this))
+        THROW("operation requires a table");
+}
+
 Operation::Operation(const Operation &other) :
     _optype(other._optype), _table(other._table), _key(other._key),
     _value(other._value), _config(other._config),
     _transaction(other._transaction), _group(other._group),
     _repeatgroup(other._repeatgroup), _flags(other._flags),
     _keysize(other._keysize), _valuesize(other._valuesize),
-    _keymax(other._keymax), _valuemax(other._valuemax) {
+    _keymax(other._keymax), _valuemax(other._valuemax),
+    _modify_delta(other._modify_delta), _modify_max(other._modify_max),
+    _modify_min(other._modify_min), _scan_length(other._scan_length),
+    _scan_length_max(other._scan_length_max),
+    _scan_pareto(other._scan_pareto), _sleep_us(other._sleep_us),
+    _truncate_count(other._truncate_count),
+    _truncate_pct(other._truncate_pct),
+    _truncate_range(other._truncate_range) {
     // Creation and destruction of _group and _transaction is managed
     // by Python.
 }
@@ -976,31 +1542,139 @@ Operation& Operation::operator=(const Operation &other) {
     _table = other._table;
     _key = other._key;
     _value = other._value;
+    _config = other._config;
     _transaction = other._transaction;
     _group = other._group;
     _repeatgroup = other._repeatgroup;
+    _flags = other._flags;
     _keysize = other._keysize;
     _valuesize = other._valuesize;
     _keymax = other._keymax;
     _valuemax = other._valuemax;
+    _modify_delta = other._modify_delta;
+    _modify_max = other._modify_max;
+    _modify_min = other._modify_min;
+    _scan_length = other._scan_length;
+    _scan_length_max = other._scan_length_max;
+    _scan_pareto = other._scan_pareto;
+    _sleep_us = other._sleep_us;
+    _truncate_count = other._truncate_count;
+    _truncate_pct = other._truncate_pct;
+    _truncate_range = other._truncate_range;
     return (*this);
 }
 
+// Parse a non-negative integer configuration value.
+static uint64_t config_uint(const std::string &name, const std::string &value) {
+    char *end;
+    unsigned long long result;
+
+    errno = 0;
+    result = strtoull(value.c_str(), &end, 10);
+    if (value.empty() || *end != '\0' || errno != 0 || value[0] == '-')
+        THROW("operation config \"" << name << "\" requires a non-negative "
+          "integer: \"" << value << "\"");
+    return ((uint64_t)result);
+}
+
+// The configuration of an operation depends on its type.  A checkpoint's
+// configuration is passed to WT_SESSION::checkpoint, a sleep's configuration
+// is the number of seconds to sleep.  Otherwise, it is a comma separated list
+// of "name" or "name=value" items.
 void Operation::create_all() {
     size_check();
 
     _flags = 0;
-    if (!_config.empty()) {
-        if (_config == "reopen")
+    _modify_delta = _modify_max = _modify_min = 0;
+    _scan_length = _scan_length_max = 0;
+    _scan_pareto = 0;
+    _sleep_us = 0;
+    _truncate_count = _truncate_pct = _truncate_range = 0;
+    if (_optype == OP_CHECKPOINT)
+        return;
+    if (_optype == OP_SLEEP) {
+        char *end;
+        double secs = strtod(_config.c_str(), &end);
+        if (_config.empty() || *end != '\0' || secs < 0.0)
+            THROW("OP_SLEEP requires a number of seconds: \"" << _config
+              << "\"");
+        _sleep_us = (uint64_t)(secs * WT_MILLION);
+        return;
+    }
+
+    std::stringstream sstm(_config);
+    std::string item;
+    bool has_length = false, has_pct = false;
+    while (std::getline(sstm, item, ',')) {
+        std::string name(item), value;
+        size_t pos = item.find('=');
+        if (pos != std::string::npos) {
+            name = item.substr(0, pos);
+            value = item.substr(pos + 1);
+        }
+        if (name == "reopen" && pos == std::string::npos)
             _flags |= WORKGEN_OP_REOPEN;
+        else if (_optype == OP_MODIFY && name == "modify_delta") {
+            char *end;
+            long delta = strtol(value.c_str(), &end, 10);
+            if (value.empty() || *end != '\0' ||
+              delta > INT32_MAX || delta < -INT32_MAX)
+                THROW("operation config \"modify_delta\" requires an "
+                  "integer: \"" << value << "\"");
+            _modify_delta = (int)delta;
+        } else if (_optype == OP_MODIFY && name == "modify_max")
+            _modify_max = (int)MIN(config_uint(name, value), INT32_MAX);
+        else if (_optype == OP_MODIFY && name == "modify_min")
+            _modify_min = (int)MIN(config_uint(name, value), INT32_MAX);
+        else if (_optype == OP_SCAN && name == "scan_direction") {
+            if (value == "backward")
+                _flags |= WORKGEN_OP_SCAN_BACKWARD;
+            else if (value != "forward")
+                THROW("operation config \"scan_direction\" must be "
+                  "\"forward\" or \"backward\": \"" << value << "\"");
+        } else if (_optype == OP_SCAN && name == "scan_length") {
+            _scan_length = config_uint(name, value);
+            has_length = true;
+        } else if (_optype == OP_SCAN && name == "scan_length_max")
+            _scan_length_max = config_uint(name, value);
+        else if (_optype == OP_SCAN && name == "scan_pareto")
+            _scan_pareto = (int)MIN(config_uint(name, value), INT32_MAX);
+        else if (_optype == OP_TRUNCATE && name == "truncate_count")
+            _truncate_count = config_uint(name, value);
+        else if (_optype == OP_TRUNCATE && name == "truncate_pct") {
+            _truncate_pct = config_uint(name, value);
+            has_pct = true;
+        } else if (_optype == OP_TRUNCATE && name == "truncate_range")
+            _truncate_range = config_uint(name, value);
         else
             THROW("operation has illegal config: \"" << _config << "\"");
     }
+    if (_optype == OP_SCAN) {
+        if (!has_length)
+            _scan_length = 100;
+        if (_scan_length_max != 0 && _scan_length_max < _scan_length)
+            THROW("scan_length_max less than scan_length");
+        if (_scan_pareto != 0 && _scan_length_max == 0)
+            THROW("scan_pareto requires scan_length_max");
+        if (_scan_pareto > 100)
+            THROW("scan_pareto must be between 1 and 100");
+    }
+    if (_optype == OP_TRUNCATE) {
+        if ((_truncate_count == 0) == (_truncate_range == 0))
+            THROW("OP_TRUNCATE requires one of truncate_count or "
+              "truncate_range");
+        if (has_pct && _truncate_count == 0)
+            THROW("truncate_pct requires truncate_count");
+        if (!has_pct)
+            _truncate_pct = 10;
+        if (_truncate_pct < 1 || _truncate_pct > 100)
+            THROW("truncate_pct must be between 1 and 100");
+    }
 }
 
 void Operation::describe(std::ostream &os) const {
     os << "Operation: " << _optype;
-    if (_optype != OP_NONE) {
+    if (OP_HAS_TABLE(this)) {
         os << ", ";  _table.describe(os);
         os << ", "; _key.describe(os);
         os << ", "; _value.describe(os);
@@ -1029,16 +1703,29 @@ void Operation::describe(std::ostream &os) const {
 void Operation::get_static_counts(Stats &stats, int multiplier) {
     switch (_optype) {
     case OP_NONE:
+    case OP_SLEEP:
+        break;
+    case OP_CHECKPOINT:
+        stats.checkpoint.ops += multiplier;
         break;
     case OP_INSERT:
         stats.insert.ops += multiplier;
         break;
+    case OP_MODIFY:
+        stats.modify.ops += multiplier;
+        break;
     case OP_REMOVE:
         stats.remove.ops += multiplier;
         break;
+    case OP_SCAN:
+        stats.scan.ops += multiplier;
+        break;
     case OP_SEARCH:
         stats.read.ops += multiplier;
         break;
+    case OP_TRUNCATE:
+        stats.truncate.ops += multiplier;
+        break;
     case OP_UPDATE:
         stats.update.ops += multiplier;
         break;
@@ -1116,22 +1803,252 @@ void Operation::kv_gen(bool iskey, uint32_t randomizer, uint64_t n,
 }
 
 void Operation::size_check() const {
-    if (_optype != OP_NONE && _key._size == 0 && _table.options.key_size == 0)
+    if (OP_HAS_TABLE(this) && _key._size == 0 &&
+      _table.options.key_size == 0)
         THROW("operation requires a key size");
     if (OP_HAS_VALUE(this) && _value._size == 0 &&
       _table.options.value_size == 0)
         THROW("operation requires a value size");
 }
 
+LatencyHistogram::LatencyHistogram(int precision) : _precision(precision),
+    _sub_bucket_half_count_magnitude(0), _sub_bucket_half_count(0),
+    _sub_bucket_mask(0), _counts_len(0), _counts(NULL), _total(0) {
+    uint64_t largest, smallest_untrackable;
+    int buckets, magnitude;
+
+    // Enough sub-buckets to distinguish values to the given number of
+    // significant digits, with a power of two more buckets to cover
+    // the range of values.
+    if (precision < 1 || precision > 5)
+        THROW("latency histogram precision must be between 1 and 5");
+    largest = 2;
+    for (int i = 0; i < precision; i++)
+        largest *= 10;
+    for (magnitude = 0; (1ULL << magnitude) < largest; magnitude++)
+        ;
+    _sub_bucket_half_count_magnitude = magnitude - 1;
+    _sub_bucket_half_count = 1ULL << (magnitude - 1);
+    _sub_bucket_mask = (1ULL << magnitude) - 1;
+    smallest_untrackable = 1ULL << magnitude;
+    for (buckets = 1; smallest_untrackable <= LATENCY_HISTOGRAM_MAX;
+      buckets++)
+        smallest_untrackable <<= 1;
+    _counts_len = (buckets + 1) * (int)_sub_bucket_half_count;
+    _counts = new uint64_t[_counts_len];
+    memset(_counts, 0, sizeof(uint64_t) * _counts_len);
+}
+
+LatencyHistogram::LatencyHistogram(const LatencyHistogram &other) :
+    _precision(other._precision),
+    _sub_bucket_half_count_magnitude(other._sub_bucket_half_count_magnitude),
+    _sub_bucket_half_count(other._sub_bucket_half_count),
+    _sub_bucket_mask(other._sub_bucket_mask), _counts_len(other._counts_len),
+    _counts(new uint64_t[other._counts_len]), _total(other._total) {
+    memcpy(_counts, other._counts, sizeof(uint64_t) * _counts_len);
+}
+
+LatencyHistogram::~LatencyHistogram() {
+    delete [] _counts;
+}
+
+void LatencyHistogram::add(const LatencyHistogram &other) {
+    ASSERT(_counts_len == other._counts_len);
+    for (int i = 0; i < _counts_len; i++)
+        _counts[i] += other._counts[i];
+    _total += other._total;
+}
+
+void LatencyHistogram::assign(const LatencyHistogram &other) {
+    ASSERT(_counts_len == other._counts_len);
+    memcpy(_counts, other._counts, sizeof(uint64_t) * _counts_len);
+    _total = other._total;
+}
+
+int LatencyHistogram::bucket_index(uint64_t value) const {
+    return (64 - __builtin_clzll(value | _sub_bucket_mask) -
+      (_sub_bucket_half_count_magnitude + 1));
+}
+
+void LatencyHistogram::clear() {
+    memset(_counts, 0, sizeof(uint64_t) * _counts_len);
+    _total = 0;
+}
+
+// Append a ZigZag LEB128 encoded value, as used in HdrHistogram's V2
+// encoding.
+static void hdr_put_varint(std::string &buf, int64_t value) {
+    uint64_t v;
+
+    v = ((uint64_t)value << 1) ^ (uint64_t)(value >> 63);
+    while (v >= 0x80) {
+        buf += (char)((v & 0x7f) | 0x80);
+        v >>= 7;
+    }
+    buf += (char)v;
+}
+
+static void hdr_put_int(std::string &buf, uint64_t value, int nbytes) {
+    for (int shift = (nbytes - 1) * 8; shift >= 0; shift -= 8)
+        buf += (char)((value >> shift) & 0xff);
+}
+
+// Wrap the buffer in a zlib stream.  The deflate blocks are stored rather
+// than compressed, any zlib reader can inflate them and there's no need for
+// a compression library.
+static std::string hdr_zlib_stored(const std::string &buf) {
+    std::string result;
+    size_t len, off;
+    uint32_t a, b;
+
+    result += (char)0x78;
+    result += (char)0x01;
+    off = 0;
+    do {
+        len = MIN(buf.size() - off, 0xffff);
+        result += (char)(off + len == buf.size() ? 0x01 : 0x00);
+        result += (char)(len & 0xff);
+        result += (char)(len >> 8);
+        result += (char)(~len & 0xff);
+        result += (char)((~len >> 8) & 0xff);
+        result.append(buf, off, len);
+        off += len;
+    } while (off < buf.size());
+
+    a = 1;
+    b = 0;
+    for (size_t i = 0; i < buf.size(); i++) {
+        a = (a + (uint8_t)buf[i]) % 65521;
+        b = (b + a) % 65521;
+    }
+    hdr_put_int(result, (b << 16) | a, 4);
+    return (result);
+}
+
+static std::string hdr_base64(const std::string &buf) {
+    static const char *digits =
+      "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
+    std::string result;
+    uint32_t group;
+    size_t i, n;
+
+    for (i = 0; i < buf.size(); i += 3) {
+        n = MIN(buf.size() - i, 3);
+        group = (uint32_t)(uint8_t)buf[i] << 16;
+        if (n > 1)
+            group |= (uint32_t)(uint8_t)buf[i + 1] << 8;
+        if (n > 2)
+            group |= (uint32_t)(uint8_t)buf[i + 2];
+        result += digits[(group >> 18) & 0x3f];
+        result += digits[(group >> 12) & 0x3f];
+        result += (n > 1 ? digits[(group >> 6) & 0x3f] : '=');
+        result += (n > 2 ? digits[group & 0x3f] : '=');
+    }
+    return (result);
+}
+
+// The HdrHistogram V2 encoding: a header followed by the counts, where a run
+// of zero counts is a single negative value.
+std::string LatencyHistogram::encode() const {
+    std::string counts, encoded, result;
+    union { double d; uint64_t u; } ratio;
+    int i, last, zeros;
+
+    for (last = _counts_len - 1; last >= 0 && _counts[last] == 0; last--)
+        ;
+    for (i = 0; i <= last; i++) {
+        if (_counts[i] == 0) {
+            for (zeros = 0; _counts[i] == 0; i++)
+                zeros++;
+            hdr_put_varint(counts, -(int64_t)zeros);
+            i--;
+        } else
+            hdr_put_varint(counts, (int64_t)_counts[i]);
+    }
+    hdr_put_int(encoded, 0x1c849313, 4);       // V2 encoding cookie
+    hdr_put_int(encoded, counts.size(), 4);
+    hdr_put_int(encoded, 0, 4);                // normalizing index offset
+    hdr_put_int(encoded, (uint64_t)_precision, 4);
+    hdr_put_int(encoded, 1, 8);                // lowest trackable value
+    hdr_put_int(encoded, LATENCY_HISTOGRAM_MAX, 8);
+    ratio.d = 1.0;                             // integer to double ratio
+    hdr_put_int(encoded, ratio.u, 8);
+    encoded += counts;
+
+    encoded = hdr_zlib_stored(encoded);
+    hdr_put_int(result, 0x1c849314, 4);        // V2 compressed cookie
+    hdr_put_int(result, encoded.size(), 4);
+    result += encoded;
+    return (hdr_base64(result));
+}
+
+// The largest value that is recorded in the same count as the given value.
+uint64_t LatencyHistogram::highest_equivalent(uint64_t value) const {
+    int bucket;
+
+    bucket = bucket_index(value);
+    return ((((value >> bucket) + 1) << bucket) - 1);
+}
+
+uint64_t LatencyHistogram::index_value(int index) const {
+    int bucket;
+    uint64_t sub;
+
+    bucket = (index >> _sub_bucket_half_count_magnitude) - 1;
+    sub = (index & (_sub_bucket_half_count - 1)) + _sub_bucket_half_count;
+    if (bucket < 0) {
+        sub -= _sub_bucket_half_count;
+        bucket = 0;
+    }
+    return (sub << bucket);
+}
+
+uint64_t LatencyHistogram::percentile(double pct) const {
+    uint64_t running, target;
+
+    if (_total == 0)
+        return (0);
+    target = (uint64_t)(pct / 100.0 * _total + 0.5);
+    target = MAX(target, 1);
+    target = MIN(target, _total);
+    running = 0;
+    for (int i = 0; i < _counts_len; i++) {
+        running += _counts[i];
+        if (running >= target)
+            return (highest_equivalent(index_value(i)));
+    }
+    return (0);
+}
+
+void LatencyHistogram::record(uint64_t value) {
+    int bucket;
+
+    value = MIN(value, LATENCY_HISTOGRAM_MAX);
+    bucket = bucket_index(value);
+    _counts[((bucket + 1) << _sub_bucket_half_count_magnitude) +
+      (int)((value >> bucket) - _sub_bucket_half_count)]++;
+    _total++;
+}
+
+void LatencyHistogram::subtract(const LatencyHistogram &other) {
+    ASSERT(_counts_len == other._counts_len);
+    for (int i = 0; i < _counts_len; i++)
+        _counts[i] -= other._counts[i];
+    _total -= other._total;
+}
+
 Track::Track(bool latency_tracking) : ops(0), latency_ops(0), latency(0),
-    min_latency(0), max_latency(0), us(NULL), ms(NULL), sec(NULL) {
+    min_latency(0), max_latency(0), _histogram(NULL), us(NULL), ms(NULL),
+    sec(NULL) {
     track_latency(latency_tracking);
 }
 
 Track::Track(const Track &other) : ops(other.ops),
     latency_ops(other.latency_ops), latency(other.latency),
     min_latency(other.min_latency), max_latency(other.max_latency),
-    us(NULL), ms(NULL), sec(NULL) {
+    _histogram(NULL), us(NULL), ms(NULL), sec(NULL) {
+    if (other._histogram != NULL)
+        _histogram = new LatencyHistogram(*other._histogram);
     if (other.us != NULL) {
         us = new uint32_t[LATENCY_US_BUCKETS];
         ms = new uint32_t[LATENCY_MS_BUCKETS];
@@ -1143,6 +2060,7 @@ Track::Track(const Track &other) : ops(other.ops),
 }
 
 Track::~Track() {
+    delete _histogram;
     if (us != NULL) {
         delete us;
         delete ms;
@@ -1170,6 +2088,8 @@ void Track::add(Track &other, bool reset) {
         for (int i = 0; i < LATENCY_SEC_BUCKETS; i++)
             sec[i] += other.sec[i];
     }
+    if (_histogram != NULL && other._histogram != NULL)
+        _histogram->add(*other._histogram);
 }
 
 void Track::assign(const Track &other) {
@@ -1197,6 +2117,19 @@ void Track::assign(const Track &other) {
         memcpy(ms, other.ms, sizeof(uint32_t) * LATENCY_MS_BUCKETS);
         memcpy(sec, other.sec, sizeof(uint32_t) * LATENCY_SEC_BUCKETS);
     }
+
+    if (other._histogram == NULL ||
+      (_histogram != NULL && _histogram->_precision !=
+      other._histogram->_precision)) {
+        delete _histogram;
+        _histogram = NULL;
+    }
+    if (other._histogram != NULL) {
+        if (_histogram == NULL)
+            _histogram = new LatencyHistogram(*other._histogram);
+        else
+            _histogram->assign(*other._histogram);
+    }
 }
 
 uint64_t Track::average_latency() const {
@@ -1217,6 +2150,8 @@ void Track::clear() {
         memset(ms, 0, sizeof(uint32_t) * LATENCY_MS_BUCKETS);
         memset(sec, 0, sizeof(uint32_t) * LATENCY_SEC_BUCKETS);
     }
+    if (_histogram != NULL)
+        _histogram->clear();
 }
 
 void Track::incr() {
@@ -1233,6 +2168,8 @@ void Track::incr_with_latency(uint64_t usecs) {
         max_latency = (uint32_t)usecs;
     if (usecs < min_latency)
         min_latency = (uint32_t)usecs;
+    if (_histogram != NULL)
+        _histogram->record(usecs);
 
     // Update a latency bucket.
     // First buckets: usecs from 100us to 1000us at 100us each.
@@ -1267,6 +2204,13 @@ void Track::subtract(const Track &other) {
         for (int i = 0; i < LATENCY_SEC_BUCKETS; i++)
             sec[i] -= other.sec[i];
     }
+    if (_histogram != NULL && other._histogram != NULL)
+        _histogram->subtract(*other._histogram);
+}
+
+// The latency (uS) at the given percentile, 0 without a histogram.
+uint64_t Track::percentile(double pct) const {
+    return (_histogram == NULL ? 0 : _histogram->percentile(pct));
 }
 
 // If there are no entries in this Track, take them from
@@ -1282,6 +2226,15 @@ void Track::smooth(const Track &other) {
     }
 }
 
+void Track::track_histogram(int precision) {
+    if (_histogram != NULL && _histogram->_precision != precision) {
+        delete _histogram;
+        _histogram = NULL;
+    }
+    if (precision > 0 && _histogram == NULL)
+        _histogram = new LatencyHistogram(precision);
+}
+
 void Track::track_latency(bool newval) {
     if (newval) {
         if (us == NULL) {
@@ -1326,40 +2279,54 @@ void Track::_get_sec(long *result) {
         memset(result, 0, sizeof(long) * LATENCY_SEC_BUCKETS);
 }
 
-Stats::Stats(bool latency) : insert(latency), not_found(latency),
-    read(latency), remove(latency), update(latency), truncate(latency) {
+Stats::Stats(bool latency) : checkpoint(latency), insert(latency),
+    modify(latency), not_found(latency), read(latency), remove(latency),
+    scan(latency), scan_row(latency), update(latency), truncate(latency) {
 }
 
-Stats::Stats(const Stats &other) : insert(other.insert),
-    not_found(other.not_found), read(other.read), remove(other.remove),
-    update(other.update), truncate(other.truncate) {
+Stats::Stats(const Stats &other) : checkpoint(other.checkpoint),
+    insert(other.insert), modify(other.modify), not_found(other.not_found),
+    read(other.read), remove(other.remove), scan(other.scan),
+    scan_row(other.scan_row), update(other.update), truncate(other.truncate) {
 }
 
 Stats::~Stats() {}
 
 void Stats::add(Stats &other, bool reset) {
+    checkpoint.add(other.checkpoint, reset);
     insert.add(other.insert, reset);
+    modify.add(other.modify, reset);
     not_found.add(other.not_found, reset);
     read.add(other.read, reset);
     remove.add(other.remove, reset);
+    scan.add(other.scan, reset);
+    scan_row.add(other.scan_row, reset);
     update.add(other.update, reset);
     truncate.add(other.truncate, reset);
 }
 
 void Stats::assign(const Stats &other) {
+    checkpoint.assign(other.checkpoint);
     insert.assign(other.insert);
+    modify.assign(other.modify);
     not_found.assign(other.not_found);
     read.assign(other.read);
     remove.assign(other.remove);
+    scan.assign(other.scan);
+    scan_row.assign(other.scan_row);
     update.assign(other.update);
     truncate.assign(other.truncate);
 }
 
 void Stats::clear() {
+    checkpoint.clear();
     insert.clear();
+    modify.clear();
     not_found.clear();
     read.clear();
     remove.clear();
+    scan.clear();
+    scan_row.clear();
     update.clear();
     truncate.clear();
 }
@@ -1371,8 +2338,11 @@ void Stats::describe(std::ostream &os) const {
     }
     os << ", inserts " << insert.ops;
     os << ", updates " << update.ops;
+    os << ", modifies " << modify.ops;
     os << ", truncates " << truncate.ops;
     os << ", removes " << remove.ops;
+    os << ", scans " << scan.ops << " (" << scan_row.ops << " rows)";
+    os << ", checkpoints " << checkpoint.ops;
 }
 
 void Stats::final_report(std::ostream &os, timespec &totalsecs) const {
@@ -1381,8 +2351,10 @@ void Stats::final_report(std::ostream &os, timespec &totalsecs) const {
     ops += not_found.ops;
     ops += insert.ops;
     ops += update.ops;
+    ops += modify.ops;
     ops += truncate.ops;
     ops += remove.ops;
+    ops += scan.ops;
 
 #define FINAL_OUTPUT(os, field, singular, ops, totalsecs)               \
     os << "Executed " << field << " " #singular " operations ("         \
@@ -1393,8 +2365,87 @@ void Stats::final_report(std::ostream &os, timespec &totalsecs) const {
     FINAL_OUTPUT(os, not_found.ops, not found, ops, totalsecs);
     FINAL_OUTPUT(os, insert.ops, insert, ops, totalsecs);
     FINAL_OUTPUT(os, update.ops, update, ops, totalsecs);
+    FINAL_OUTPUT(os, modify.ops, modify, ops, totalsecs);
     FINAL_OUTPUT(os, truncate.ops, truncate, ops, totalsecs);
     FINAL_OUTPUT(os, remove.ops, remove, ops, totalsecs);
+    FINAL_OUTPUT(os, scan.ops, scan, ops, totalsecs);
+    os << "Scanned " << scan_row.ops << " rows, "
+       << OPS_PER_SEC(scan_row.ops, totalsecs) << " rows/sec" << std::endl;
+    os << "Executed " << checkpoint.ops << " checkpoint operations"
+       << std::endl;
+}
+
+// Write a line in HdrHistogram log format for each operation type with
+// latencies recorded in the histogram.
+void Stats::hdr_log(std::ostream &os, const std::string &prefix, double start,
+  double length) const {
+#define HDR_LOG_OUTPUT(os, track, name)                                 \
+    if ((track)._histogram != NULL && (track)._histogram->_total != 0)  \
+        os << "Tag=" << prefix << name << "," << start << ","           \
+           << length << "," << (double)(track).percentile(100.0) << "," \
+           << (track)._histogram->encode() << std::endl
+
+    HDR_LOG_OUTPUT(os, read, "read");
+    HDR_LOG_OUTPUT(os, not_found, "not-found");
+    HDR_LOG_OUTPUT(os, insert, "insert");
+    HDR_LOG_OUTPUT(os, update, "update");
+    HDR_LOG_OUTPUT(os, modify, "modify");
+    HDR_LOG_OUTPUT(os, truncate, "truncate");
+    HDR_LOG_OUTPUT(os, remove, "remove");
+    HDR_LOG_OUTPUT(os, scan, "scan");
+    HDR_LOG_OUTPUT(os, scan_row, "scan-row");
+    HDR_LOG_OUTPUT(os, checkpoint, "checkpoint");
+}
+
+// Write a JSON object with latency percentiles (uS) for each operation type
+// with latencies recorded in the histogram.
+void Stats::latency_json(std::ostream &os) const {
+    const char *sep = "";
+
+#define LATENCY_JSON_OUTPUT(os, track, name)                            \
+    if ((track)._histogram != NULL && (track)._histogram->_total != 0) { \
+        os << sep << "\"" name "\":{\"count\":"                         \
+           << (track)._histogram->_total                                \
+           << ",\"p50\":" << (track).percentile(50.0)                   \
+           << ",\"p90\":" << (track).percentile(90.0)                   \
+           << ",\"p99\":" << (track).percentile(99.0)                   \
+           << ",\"p99.9\":" << (track).percentile(99.9)                 \
+           << ",\"p99.99\":" << (track).percentile(99.99)               \
+           << ",\"max\":" << (track).percentile(100.0) << "}";          \
+        sep = ",";                                                      \
+    }
+
+    os << "{";
+    LATENCY_JSON_OUTPUT(os, read, "read");
+    LATENCY_JSON_OUTPUT(os, not_found, "not found");
+    LATENCY_JSON_OUTPUT(os, insert, "insert");
+    LATENCY_JSON_OUTPUT(os, update, "update");
+    LATENCY_JSON_OUTPUT(os, modify, "modify");
+    LATENCY_JSON_OUTPUT(os, truncate, "truncate");
+    LATENCY_JSON_OUTPUT(os, remove, "remove");
+    LATENCY_JSON_OUTPUT(os, scan, "scan");
+    LATENCY_JSON_OUTPUT(os, scan_row, "scan row");
+    LATENCY_JSON_OUTPUT(os, checkpoint, "checkpoint");
+    os << "}";
+}
+
+void Stats::latency_report(std::ostream &os) const {
+#define LATENCY_OUTPUT(os, track, name)                                 \
+    if ((track).latency_ops != 0)                                       \
+        os << "  " name ": average " << (track).average_latency()      \
+           << ", min " << (track).min_latency                           \
+           << ", max " << (track).max_latency                           \
+           << " (" << (track).latency_ops << " samples)" << std::endl
+
+    LATENCY_OUTPUT(os, read, "read");
+    LATENCY_OUTPUT(os, not_found, "not found");
+    LATENCY_OUTPUT(os, insert, "insert");
+    LATENCY_OUTPUT(os, update, "update");
+    LATENCY_OUTPUT(os, modify, "modify");
+    LATENCY_OUTPUT(os, truncate, "truncate");
+    LATENCY_OUTPUT(os, remove, "remove");
+    LATENCY_OUTPUT(os, scan, "scan");
+    LATENCY_OUTPUT(os, checkpoint, "checkpoint");
 }
 
 void Stats::report(std::ostream &os) const {
@@ -1404,33 +2455,61 @@ void Stats::report(std::ostream &os) const {
     }
     os << ", " << insert.ops << " inserts, ";
     os << update.ops << " updates, ";
+    os << modify.ops << " modifies, ";
     os << truncate.ops << " truncates, ";
-    os << remove.ops << " removes";
+    os << remove.ops << " removes, ";
+    os << scan.ops << " scans (" << scan_row.ops << " rows), ";
+    os << checkpoint.ops << " checkpoints";
 }
 
 void Stats::smooth(const Stats &other) {
+    checkpoint.smooth(other.checkpoint);
     insert.smooth(other.insert);
+    modify.smooth(other.modify);
     not_found.smooth(other.not_found);
     read.smooth(other.read);
     remove.smooth(other.remove);
+    scan.smooth(other.scan);
+    scan_row.smooth(other.scan_row);
     update.smooth(other.update);
     truncate.smooth(other.truncate);
 }
 
 void Stats::subtract(const Stats &other) {
+    checkpoint.subtract(other.checkpoint);
     insert.subtract(other.insert);
+    modify.subtract(other.modify);
     not_found.subtract(other.not_found);
     read.subtract(other.read);
     remove.subtract(other.remove);
+    scan.subtract(other.scan);
+    scan_row.subtract(other.scan_row);
     update.subtract(other.update);
     truncate.subtract(other.truncate);
 }
 
+void Stats::track_histogram(int precision) {
+    checkpoint.track_histogram(precision);
+    insert.track_histogram(precision);
+    modify.track_histogram(precision);
+    not_found.track_histogram(precision);
+    read.track_histogram(precision);
+    remove.track_histogram(precision);
+    scan.track_histogram(precision);
+    scan_row.track_histogram(precision);
+    update.track_histogram(precision);
+    truncate.track_histogram(precision);
+}
+
 void Stats::track_latency(bool latency) {
+    checkpoint.track_latency(latency);
     insert.track_latency(latency);
+    modify.track_latency(latency);
     not_found.track_latency(latency);
     read.track_latency(latency);
     remove.track_latency(latency);
+    scan.track_latency(latency);
+    scan_row.track_latency(latency);
     update.track_latency(latency);
     truncate.track_latency(latency);
 }
@@ -1477,13 +2556,35 @@ TableInternal::TableInternal(const TableInternal &other) : _tint(other._tint),
     _context_count(other._context_count) {}
 TableInternal::~TableInternal() {}
 
-WorkloadOptions::WorkloadOptions() : max_latency(0),
-    report_file("workload.stat"), report_interval(0), run_time(0),
-    sample_file("sample.json"), sample_interval(0), sample_rate(1), warmup(0),
-    _options() {
+WorkloadOptions::WorkloadOptions() : latency_hdr_file("latency.hlog"),
+    latency_json_file("latency.json"), latency_precision(0), max_latency(0),
+    open_loop(false), report_file("workload.stat"), report_interval(0),
+    run_time(0), sample_file("sample.json"), sample_interval(0),
+    sample_rate(1), warmup(0), _options() {
+    _options.add_string("latency_hdr_file", latency_hdr_file,
+      "file name for latency histograms of each sample_interval in "
+      "HdrHistogram log format, enabled by the latency_precision option. "
+      "The file name is relative to the connection's home directory. "
+      "When set to the empty string, no log is emitted.");
+    _options.add_string("latency_json_file", latency_json_file,
+      "file name for the latency percentiles of each operation type at the "
+      "end of the run, in JSON format, enabled by the latency_precision "
+      "option. The file name is relative to the connection's home "
+      "directory. When set to the empty string, no JSON is emitted.");
+    _options.add_int("latency_precision", latency_precision,
+      "record sampled latencies in log-linear (HDR) histograms to this "
+      "number of significant digits, between 1 and 5, 0 to disable. "
+      "Requires sample_interval to be configured.");
     _options.add_int("max_latency", max_latency,
       "prints warning if any latency measured exceeds this number of "
       "milliseconds. Requires sample_interval to be configured.");
+    _options.add_bool("open_loop", open_loop,
+      "start each operation of a throttled thread at the time set by its "
+      "throttle, whether or not earlier operations have finished in time. "
+      "Latency is measured from the actual start in Workload.stats "
+      "(service time) and from the scheduled start in "
+      "Workload.response_stats (response time). "
+      "Requires sample_interval to be configured.");
     _options.add_int("report_interval", report_interval,
       "output throughput information every interval seconds, 0 to disable");
     _options.add_string("report_file", report_file,
@@ -1507,34 +2608,127 @@ WorkloadOptions::WorkloadOptions() : max_latency(0),
 }
 
 WorkloadOptions::WorkloadOptions(const WorkloadOptions &other) :
-    max_latency(other.max_latency), report_interval(other.report_interval),
+    latency_hdr_file(other.latency_hdr_file),
+    latency_json_file(other.latency_json_file),
+    latency_precision(other.latency_precision),
+    max_latency(other.max_latency), open_loop(other.open_loop),
+    report_interval(other.report_interval),
     run_time(other.run_time), sample_interval(other.sample_interval),
     sample_rate(other.sample_rate), _options(other._options) {}
 WorkloadOptions::~WorkloadOptions() {}
 
+PhaseOptions::PhaseOptions() : name(), run_time(0), throttle_schedule(),
+    _options() {
+    _options.add_string("name", name, "name of the phase");
+    _options.add_int("run_time", run_time,
+      "phase seconds, 0 to run each thread's operations once");
+    _options.add_string("throttle_schedule", throttle_schedule,
+      "how the throttle of each thread changes during the phase, "
+      "one of ramp(start,end), sine(mean,amplitude,period_secs), "
+      "step(secs:factor,...) or trace(filename), where the values are "
+      "factors applied to the throttle.  A trace file has a "
+      "\"secs factor\" pair on each line.");
+}
+PhaseOptions::PhaseOptions(const PhaseOptions &other) :
+    name(other.name), run_time(other.run_time),
+    throttle_schedule(other.throttle_schedule), _options(other._options) {}
+PhaseOptions::~PhaseOptions() {}
+
+void
+PhaseListWrapper::extend(const PhaseListWrapper &other) {
+    for (std::vector<Phase>::const_iterator i = other._phases.begin();
+         i != other._phases.end(); i++)
+        _phases.push_back(*i);
+}
+
+void
+PhaseListWrapper::append(const Phase &p) {
+    _phases.push_back(p);
+}
+
+void
+PhaseListWrapper::multiply(const int n) {
+    if (n == 0) {
+        _phases.clear();
+    } else {
+        std::vector<Phase> copy(_phases);
+        for (int cnt = 1; cnt < n; cnt++)
+            extend(copy);
+    }
+}
+
+Phase::Phase() : options(), stats(), response_stats(), _threads() {}
+Phase::Phase(const ThreadListWrapper &tlw) : options(), stats(),
+    response_stats(), _threads(tlw._threads) {}
+Phase::Phase(const Thread &thread) : options(), stats(), response_stats(),
+    _threads() {
+    _threads.push_back(thread);
+}
+Phase::Phase(const Phase &other) : options(other.options),
+    stats(other.stats), response_stats(other.response_stats),
+    _threads(other._threads) {}
+Phase::~Phase() {}
+
+Phase& Phase::operator=(const Phase &other) {
+    options = other.options;
+    stats.assign(other.stats);
+    response_stats.assign(other.response_stats);
+    _threads = other._threads;
+    return (*this);
+}
+
+void Phase::describe(std::ostream &os) const {
+    os << "Phase: " << options.name << ", ";
+    options.describe(os);
+    os << ", [" << std::endl;
+    for (std::vector<Thread>::const_iterator i = _threads.begin();
+         i != _threads.end(); i++) {
+        os << "    "; i->describe(os); os << std::endl;
+    }
+    os << "  ]";
+}
+
 Workload::Workload(Context *context, const ThreadListWrapper &tlw) :
-    options(), stats(), _context(context), _threads(tlw._threads) {
+    options(), stats(), response_stats(), _context(context), _threads(tlw._threads),
+    _phases() {
     if (context == NULL)
         THROW("Workload contructor requires a Context");
 }
 
 Workload::Workload(Context *context, const Thread &thread) :
-    options(), stats(), _context(context), _threads() {
+    options(), stats(), response_stats(), _context(context), _threads(), _phases() {
     if (context == NULL)
         THROW("Workload contructor requires a Context");
     _threads.push_back(thread);
 }
 
+Workload::Workload(Context *context, const PhaseListWrapper &plw) :
+    options(), stats(), response_stats(), _context(context), _threads(),
+    _phases(plw._phases) {
+    if (context == NULL)
+        THROW("Workload contructor requires a Context");
+}
+
+Workload::Workload(Context *context, const Phase &phase) :
+    options(), stats(), response_stats(), _context(context), _threads(), _phases() {
+    if (context == NULL)
+        THROW("Workload contructor requires a Context");
+    _phases.push_back(phase);
+}
+
 Workload::Workload(const Workload &other) :
-    options(other.options), stats(other.stats), _context(other._context),
-    _threads(other._threads) {}
+    options(other.options), stats(other.stats),
+    response_stats(other.response_stats), _context(other._context),
+    _threads(other._threads), _phases(other._phases) {}
 Workload::~Workload() {}
 
 Workload& Workload::operator=(const Workload &other) {
     options = other.options;
     stats.assign(other.stats);
+    response_stats.assign(other.response_stats);
     *_context = *other._context;
     _threads = other._threads;
+    _phases = other._phases;
     return (*this);
 }
 
@@ -1545,35 +2739,118 @@ int Workload::run(WT_CONNECTION *conn) {
 }
 
 WorkloadRunner::WorkloadRunner(Workload *workload) :
-    _workload(workload), _trunners(workload->_threads.size()),
-    _report_out(&std::cout), _start() {
+    _workload(workload), _phase(NULL), _phase_number(0), _schedule(NULL),
+    _trunners(), _report_out(&std::cout), _monitor_out(), _monitor_json(),
+    _monitor_hdr(), _start(), _hdr_start() {
     ts_clear(_start);
+    ts_clear(_hdr_start);
 }
 WorkloadRunner::~WorkloadRunner() {}
 
 int WorkloadRunner::run(WT_CONNECTION *conn) {
     WT_DECL_RET;
     WorkloadOptions *options = &_workload->options;
+    std::vector<ThrottleSchedule> schedules(_workload->_phases.size());
     std::ofstream report_out;
+    timespec start, now;
 
     _wt_home = conn->get_home(conn);
     if (options->sample_interval > 0 && options->sample_rate <= 0)
         THROW("Workload.options.sample_rate must be positive");
+    if (options->latency_precision < 0 || options->latency_precision > 5)
+        THROW("Workload.options.latency_precision must be between 0 and 5");
+    if (options->latency_precision > 0 && options->sample_interval == 0)
+        THROW("Workload.options.latency_precision requires "
+          "Workload.options.sample_interval");
+
+    // Check every phase's configuration before running any of them.
+    for (size_t i = 0; i < _workload->_phases.size(); i++) {
+        PhaseOptions *phase_options = &_workload->_phases[i].options;
+        if (phase_options->name.empty()) {
+            std::stringstream sstm;
+            sstm << "phase" << i;
+            phase_options->name = sstm.str();
+        }
+        schedules[i].parse(phase_options->throttle_schedule,
+          phase_options->run_time);
+    }
+
     if (!options->report_file.empty()) {
         open_report_file(report_out, options->report_file.c_str(),
           "Workload.options.report_file");
         _report_out = &report_out;
     }
-    WT_ERR(create_all(conn, _workload->_context));
-    WT_ERR(open_all());
-    WT_ERR(ThreadRunner::cross_check(_trunners));
-    WT_ERR(run_all());
+    if (options->sample_interval > 0) {
+        open_report_file(_monitor_out, "monitor", "monitor output file");
+        if (!options->sample_file.empty())
+            open_report_file(_monitor_json, options->sample_file.c_str(),
+              "sample JSON output file");
+        if (options->latency_precision > 0 &&
+          !options->latency_hdr_file.empty()) {
+            char time_buf[64];
+            struct tm _tm;
+
+            open_report_file(_monitor_hdr, options->latency_hdr_file.c_str(),
+              "latency HdrHistogram log file");
+            workgen_epoch(&_hdr_start);
+            (void)strftime(time_buf, sizeof(time_buf),
+              "%a %b %d %H:%M:%S %Z %Y", localtime_r(&_hdr_start.tv_sec, &_tm));
+            _monitor_hdr << "#[Histogram log format version 1.3]"
+                         << std::endl << std::fixed << std::setprecision(3)
+                         << "#[StartTime: " << (double)_hdr_start.tv_sec +
+                            _hdr_start.tv_nsec / 1.0e9
+                         << " (seconds since epoch), " << time_buf << "]"
+                         << std::endl
+                         << "#[Latency values are in microseconds]"
+                         << std::endl
+                         << "\"StartTimestamp\",\"Interval_Length\","
+                         << "\"Interval_Max\",\"Interval_Compressed_Histogram\""
+                         << std::endl;
+        }
+    }
+    if (_workload->_phases.empty())
+        WT_ERR(run_phase(conn, NULL, options->run_time));
+    else {
+        workgen_epoch(&start);
+        for (size_t i = 0; i < _workload->_phases.size(); i++) {
+            Phase *phase = &_workload->_phases[i];
+            _phase_number = (int)i;
+            _schedule = (schedules[i]._shape == ThrottleSchedule::CONSTANT) ?
+              NULL : &schedules[i];
+            WT_ERR(run_phase(conn, phase, phase->options.run_time));
+        }
+        _phase = NULL;
+        workgen_epoch(&now);
+        timespec totalsecs = now - start;
+        final_report(totalsecs);
+    }
   err:
     //TODO: (void)close_all();
+    _phase = NULL;
+    _schedule = NULL;
+    if (_monitor_out.is_open())
+        _monitor_out.close();
+    if (_monitor_json.is_open())
+        _monitor_json.close();
+    if (_monitor_hdr.is_open())
+        _monitor_hdr.close();
     _report_out = &std::cout;
     return (ret);
 }
 
+// Run the threads of one phase, or of the workload if it has no phases.
+int WorkloadRunner::run_phase(WT_CONNECTION *conn, Phase *phase,
+  int run_time) {
+    _phase = phase;
+    _trunners.clear();
+    _trunners.resize(phase == NULL ?
+      _workload->_threads.size() : phase->_threads.size());
+    WT_RET(create_all(conn, _workload->_context));
+    WT_RET(open_all());
+    WT_RET(ThreadRunner::cross_check(_trunners));
+    return (run_all(run_time));
+}
+
 int WorkloadRunner::open_all() {
     for (size_t i = 0; i < _trunners.size(); i++) {
         WT_RET(_trunners[i].open_all());
@@ -1595,10 +2872,13 @@ void WorkloadRunner::open_report_file(std::ofstream &of, const char *filename,
 }
 
 int WorkloadRunner::create_all(WT_CONNECTION *conn, Context *context) {
+    std::vector<Thread> &threads =
+      (_phase == NULL) ? _workload->_threads : _phase->_threads;
+
     for (size_t i = 0; i < _trunners.size(); i++) {
         ThreadRunner *runner = &_trunners[i];
         std::stringstream sstm;
-        Thread *thread = &_workload->_threads[i];
+        Thread *thread = &threads[i];
         if (thread->options.name.empty()) {
             sstm << "thread" << i;
             thread->options.name = sstm.str();
@@ -1623,9 +2903,12 @@ int WorkloadRunner::close_all() {
     return (0);
 }
 
-void WorkloadRunner::get_stats(Stats *result) {
-    for (size_t i = 0; i < _trunners.size(); i++)
+void WorkloadRunner::get_stats(Stats *result, Stats *response_result) {
+    for (size_t i = 0; i < _trunners.size(); i++) {
         result->add(_trunners[i]._stats);
+        if (response_result != NULL)
+            response_result->add(_trunners[i]._response_stats);
+    }
 }
 
 void WorkloadRunner::report(time_t interval, time_t totalsecs,
@@ -1633,7 +2916,7 @@ void WorkloadRunner::report(time_t interval, time_t totalsecs,
     std::ostream &out = *_report_out;
     Stats new_totals(prev_totals->track_latency());
 
-    get_stats(&new_totals);
+    get_stats(&new_totals, NULL);
     Stats diff(new_totals);
     diff.subtract(*prev_totals);
     prev_totals->assign(new_totals);
@@ -1642,51 +2925,123 @@ void WorkloadRunner::report(time_t interval, time_t totalsecs,
         << totalsecs << " total secs)" << std::endl;
 }
 
+// Report on the phase that just finished.  With phases, this is called again
+// once they have all finished, to report the totals for the workload.
 void WorkloadRunner::final_report(timespec &totalsecs) {
     std::ostream &out = *_report_out;
-    Stats *stats = &_workload->stats;
+    Stats *stats = (_phase == NULL) ? &_workload->stats : &_phase->stats;
+    Stats *response_stats = (_phase == NULL) ?
+      &_workload->response_stats : &_phase->response_stats;
+    bool latency = _workload->options.sample_interval > 0;
 
     stats->clear();
-    stats->track_latency(_workload->options.sample_interval > 0);
-
-    get_stats(stats);
+    stats->track_latency(latency);
+    stats->track_histogram(_workload->options.latency_precision);
+    response_stats->clear();
+    response_stats->track_latency(latency);
+    response_stats->track_histogram(_workload->options.open_loop ?
+      _workload->options.latency_precision : 0);
+
+    if (_phase != NULL || _workload->_phases.empty())
+        get_stats(stats, response_stats);
+    else {
+        out << "Workload totals, " << _workload->_phases.size()
+            << " phases:" << std::endl;
+        for (size_t i = 0; i < _workload->_phases.size(); i++) {
+            stats->add(_workload->_phases[i].stats);
+            response_stats->add(_workload->_phases[i].response_stats);
+        }
+    }
     stats->final_report(out, totalsecs);
-    out << "Run completed: " << totalsecs << " seconds" << std::endl;
+    if (_workload->options.open_loop && latency) {
+        out << "Service time latency (us), from the actual start:"
+            << std::endl;
+        stats->latency_report(out);
+        out << "Response time latency (us), from the scheduled start:"
+            << std::endl;
+        response_stats->latency_report(out);
+    }
+    if (_phase != NULL)
+        out << "Phase " << _phase->options.name << " completed: "
+            << totalsecs << " seconds" << std::endl;
+    else {
+        out << "Run completed: " << totalsecs << " seconds" << std::endl;
+        if (_workload->options.latency_precision > 0 &&
+          !_workload->options.latency_json_file.empty())
+            latency_json();
+    }
+}
+
+// Append the latency percentiles of the run as a single line of JSON,
+// including those of each phase.
+void WorkloadRunner::latency_json() {
+    std::ofstream of;
+    char version[100];
+    bool open_loop = _workload->options.open_loop;
+
+    open_report_file(of, _workload->options.latency_json_file.c_str(),
+      "latency JSON output file");
+    workgen_version(version, sizeof(version));
+    of << "{\"version\":\"" << version << "\",\"units\":\"us\""
+       << ",\"workgen\":";
+    _workload->stats.latency_json(of);
+    if (open_loop) {
+        of << ",\"response\":";
+        _workload->response_stats.latency_json(of);
+    }
+    if (!_workload->_phases.empty()) {
+        of << ",\"phases\":[";
+        for (size_t i = 0; i < _workload->_phases.size(); i++) {
+            Phase *phase = &_workload->_phases[i];
+            of << (i == 0 ? "" : ",") << "{\"name\":\""
+               << phase->options.name << "\",\"workgen\":";
+            phase->stats.latency_json(of);
+            if (open_loop) {
+                of << ",\"response\":";
+                phase->response_stats.latency_json(of);
+            }
+            of << "}";
+        }
+        of << "]";
+    }
+    of << "}" << std::endl;
 }
 
-int WorkloadRunner::run_all() {
+int WorkloadRunner::run_all(int run_time) {
     void *status;
     std::vector<pthread_t> thread_handles;
     Stats counts(false);
     WorkgenException *exception;
     WorkloadOptions *options = &_workload->options;
     Monitor monitor(*this);
-    std::ofstream monitor_out;
-    std::ofstream monitor_json;
     std::ostream &out = *_report_out;
+    int warmup;
     WT_DECL_RET;
 
     for (size_t i = 0; i < _trunners.size(); i++)
         _trunners[i].get_static_counts(counts);
-    out << "Starting workload: " << _trunners.size() << " threads, ";
+    if (_phase != NULL)
+        out << "Starting phase " << _phase->options.name << ": ";
+    else
+        out << "Starting workload: ";
+    out << _trunners.size() << " threads, ";
     counts.report(out);
     out << std::endl;
 
+    // The warmup only delays reporting at the start of the workload.
+    warmup = (_phase_number == 0) ? options->warmup : 0;
     workgen_epoch(&_start);
-    timespec end = _start + options->run_time;
+    timespec end = _start + run_time;
     timespec next_report = _start +
-      ((options->warmup > 0) ? options->warmup : options->report_interval);
+      ((warmup > 0) ? warmup : options->report_interval);
 
     // Start all threads
     if (options->sample_interval > 0) {
-        open_report_file(monitor_out, "monitor", "monitor output file");
-        monitor._out = &monitor_out;
-
-        if (!options->sample_file.empty()) {
-            open_report_file(monitor_json, options->sample_file.c_str(),
-              "sample JSON output file");
-            monitor._json = &monitor_json;
-        }
+        monitor._out = &_monitor_out;
+        if (_monitor_json.is_open())
+            monitor._json = &_monitor_json;
+        if (_monitor_hdr.is_open())
+            monitor._hdr = &_monitor_hdr;
 
         if ((ret = pthread_create(&monitor._handle, NULL, monitor_main,
           &monitor)) != 0) {
@@ -1699,7 +3054,7 @@ int WorkloadRunner::run_all() {
         pthread_t thandle;
         ThreadRunner *runner = &_trunners[i];
         runner->_stop = false;
-        runner->_repeat = (options->run_time != 0);
+        runner->_repeat = (run_time != 0);
         if ((ret = pthread_create(&thandle, NULL, thread_runner_main,
           runner)) != 0) {
             std::cerr << "pthread_create failed err=" << ret << std::endl;
@@ -1713,6 +3068,7 @@ int WorkloadRunner::run_all() {
         }
         thread_handles.push_back(thandle);
         runner->_stats.clear();
+        runner->_response_stats.clear();
     }
 
     // Let the test run, reporting as needed.
@@ -1741,7 +3097,7 @@ int WorkloadRunner::run_all() {
     }
 
     // signal all threads to stop
-    if (options->run_time != 0)
+    if (run_time != 0)
         for (size_t i = 0; i < _trunners.size(); i++)
             _trunners[i]._stop = true;
     if (options->sample_interval > 0)
@@ -1768,10 +3124,6 @@ int WorkloadRunner::run_all() {
                       << std::endl;
         if (exception == NULL && !monitor._exception._str.empty())
             exception = &monitor._exception;
-
-        monitor_out.close();
-        if (!options->sample_file.empty())
-            monitor_json.close();
     }
 
     // issue the final report
@@ -33,7 +33,9 @@
 namespace workgen {
 
 struct ContextInternal;
+struct LatencyHistogram;
 struct OperationInternal;
+struct Phase;
 struct TableInternal;
 struct Thread;
 struct Transaction;
@@ -90,6 +92,11 @@ struct Track {
     uint32_t min_latency;                // Minimum latency (uS)
     uint32_t max_latency;                // Maximum latency (uS)
 
+#ifndef SWIG
+    // See WorkloadOptions.latency_precision.
+    LatencyHistogram *_histogram;
+#endif
+
     Track(bool latency_tracking = false);
     Track(const Track &other);
     ~Track();
@@ -100,8 +107,10 @@ struct Track {
     void clear();
     void incr();
     void incr_with_latency(uint64_t usecs);
+    uint64_t percentile(double pct) const;
     void smooth(const Track&);
     void subtract(const Track&);
+    void track_histogram(int precision);
     void track_latency(bool);
     bool track_latency() const { return (us != NULL); }
 
@@ -119,10 +128,14 @@ private:
 };
 
 struct Stats {
+    Track checkpoint;
     Track insert;
+    Track modify;
     Track not_found;
     Track read;
     Track remove;
+    Track scan;
+    Track scan_row;                      // each row visited by a scan
     Track update;
     Track truncate;
 
@@ -136,10 +149,15 @@ struct Stats {
     void describe(std::ostream &os) const;
 #ifndef SWIG
     void final_report(std::ostream &os, timespec &totalsecs) const;
+    void hdr_log(std::ostream &os, const std::string &prefix, double start,
+      double length) const;
+    void latency_json(std::ostream &os) const;
+    void latency_report(std::ostream &os) const;
     void report(std::ostream &os) const;
 #endif
     void smooth(const Stats&);
     void subtract(const Stats&);
+    void track_histogram(int precision);
     void track_latency(bool);
     bool track_latency() const { return (insert.track_latency()); }
 
@@ -274,7 +292,8 @@ struct Value {
 
 struct Operation {
     enum OpType {
-	OP_NONE, OP_INSERT, OP_REMOVE, OP_SEARCH, OP_UPDATE };
+	OP_NONE, OP_INSERT, OP_REMOVE, OP_SEARCH, OP_UPDATE,
+	OP_CHECKPOINT, OP_MODIFY, OP_SLEEP, OP_TRUNCATE, OP_SCAN };
     OpType _optype;
 
     Table _table;
@@ -287,18 +306,32 @@ struct Operation {
 
 #ifndef SWIG
 #define	WORKGEN_OP_REOPEN		0x0001 // reopen cursor for each op
+#define	WORKGEN_OP_SCAN_BACKWARD	0x0002 // scan using prev
     uint32_t _flags;
 
     int _keysize;    // derived from Key._size and Table.options.key_size
     int _valuesize;
     uint64_t _keymax;
     uint64_t _valuemax;
+
+    // Derived from _config for OP_MODIFY, OP_SCAN, OP_SLEEP and OP_TRUNCATE.
+    int _modify_delta;          // change in value length per modify
+    int _modify_max;            // value length the delta won't grow past
+    int _modify_min;            // value length the delta won't shrink past
+    uint64_t _scan_length;      // rows visited after the search_near
+    uint64_t _scan_length_max;  // if larger, lengths are distributed
+    int _scan_pareto;           // pareto parameter for the distribution
+    uint64_t _sleep_us;
+    uint64_t _truncate_count;   // entries kept by count based truncate
+    uint64_t _truncate_pct;     // percent of count removed per truncate
+    uint64_t _truncate_range;   // entries removed by range based truncate
 #endif
 
     Operation();
     Operation(OpType optype, Table table, Key key, Value value);
     Operation(OpType optype, Table table, Key key);
     Operation(OpType optype, Table table);
+    Operation(OpType optype, const char *config);
     Operation(const Operation &other);
     ~Operation();
 
@@ -393,7 +426,11 @@ struct Transaction {
 // properties are prevented, only existing properties can be set.
 //
 struct WorkloadOptions {
+    std::string latency_hdr_file;
+    std::string latency_json_file;
+    int latency_precision;
     int max_latency;
+    bool open_loop;
     std::string report_file;
     int report_interval;
     int run_time;
@@ -421,14 +458,83 @@ private:
     OptionsList _options;
 };
 
+// To prevent silent errors, this class is set up in Python so that new
+// properties are prevented, only existing properties can be set.
+//
+struct PhaseOptions {
+    std::string name;
+    int run_time;
+    std::string throttle_schedule;
+
+    PhaseOptions();
+    PhaseOptions(const PhaseOptions &other);
+    ~PhaseOptions();
+
+    void describe(std::ostream &os) const {
+	os << "run_time " << run_time;
+	if (!throttle_schedule.empty())
+	    os << ", throttle_schedule " << throttle_schedule;
+    }
+
+    std::string help() const { return _options.help(); }
+    std::string help_description(const char *option_name) const {
+	return _options.help_description(option_name); }
+    std::string help_type(const char *option_name) const {
+	return _options.help_type(option_name); }
+
+private:
+    OptionsList _options;
+};
+
+// This is a list of phases, which may be used in the Workload constructor.
+// Like ThreadListWrapper, Python operators added to Phase allow Phases to be
+// composed using '+' and repeated using '*'.
+struct PhaseListWrapper {
+    std::vector<Phase> _phases;
+
+    PhaseListWrapper() : _phases() {}
+    PhaseListWrapper(const PhaseListWrapper &other) :
+	_phases(other._phases) {}
+    PhaseListWrapper(const std::vector<Phase> &phases) : _phases(phases) {}
+    void extend(const PhaseListWrapper &);
+    void append(const Phase &);
+    void multiply(const int);
+};
+
+// A phase of a workload runs its own set of threads for its run time.  The
+// phases of a workload run one after another on the same connection, with
+// statistics gathered for each.
+struct Phase {
+    PhaseOptions options;
+    Stats stats;
+    Stats response_stats;
+    std::vector<Thread> _threads;
+
+    Phase();
+    Phase(const ThreadListWrapper &threadlist);
+    Phase(const Thread &thread);
+    Phase(const Phase &other);
+    ~Phase();
+
+#ifndef SWIG
+    Phase& operator=(const Phase &other);
+#endif
+
+    void describe(std::ostream &os) const;
+};
+
 struct Workload {
     WorkloadOptions options;
     Stats stats;
+    Stats response_stats;              // with open_loop, from scheduled start
     Context *_context;
     std::vector<Thread> _threads;
+    std::vector<Phase> _phases;
 
     Workload(Context *context, const ThreadListWrapper &threadlist);
     Workload(Context *context, const Thread &thread);
+    Workload(Context *context, const PhaseListWrapper &phaselist);
+    Workload(Context *context, const Phase &phase);
     Workload(const Workload &other);
     ~Workload();
 
@@ -445,6 +551,9 @@ struct Workload {
 	for (std::vector<Thread>::const_iterator i = _threads.begin(); i != _threads.end(); i++) {
 	    os << "  "; i->describe(os); os << std::endl;
 	}
+	for (std::vector<Phase>::const_iterator i = _phases.begin(); i != _phases.end(); i++) {
+	    os << "  "; i->describe(os); os << std::endl;
+	}
 	os << "]";
     }
     int run(WT_CONNECTION *conn);
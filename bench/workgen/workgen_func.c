@@ -49,6 +49,12 @@ workgen_atomic_add64(uint64_t *vp, uint64_t v)
 	return (__wt_atomic_add64(vp, v));
 }
 
+bool
+workgen_atomic_cas64(uint64_t *vp, uint64_t oldv, uint64_t newv)
+{
+	return (__wt_atomic_cas64(vp, oldv, newv));
+}
+
 void
 workgen_epoch(struct timespec *tsp)
 {
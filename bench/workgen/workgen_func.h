@@ -31,6 +31,8 @@ extern uint32_t
 workgen_atomic_add32(uint32_t *vp, uint32_t v);
 extern uint64_t
 workgen_atomic_add64(uint64_t *vp, uint64_t v);
+extern bool
+workgen_atomic_cas64(uint64_t *vp, uint64_t oldv, uint64_t newv);
 extern void
 workgen_epoch(struct timespec *tsp);
 extern uint32_t
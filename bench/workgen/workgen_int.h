@@ -25,6 +25,7 @@
  * ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
  * OTHER DEALINGS IN THE SOFTWARE.
  */
+#include <fstream>
 #include <ostream>
 #include <string>
 #include <vector>
@@ -67,10 +68,64 @@ struct WorkgenException {
     ~WorkgenException() {}
 };
 
+// A log-linear histogram of latencies in microseconds, compatible with
+// HdrHistogram: each value is recorded to the given number of significant
+// digits.  Values above LATENCY_HISTOGRAM_MAX are recorded as the maximum.
+#define	LATENCY_HISTOGRAM_MAX	3600000000ULL   // one hour
+struct LatencyHistogram {
+    int _precision;                                // significant digits
+    int _sub_bucket_half_count_magnitude;
+    uint64_t _sub_bucket_half_count;
+    uint64_t _sub_bucket_mask;
+    int _counts_len;
+    uint64_t *_counts;
+    uint64_t _total;
+
+    LatencyHistogram(int precision);
+    LatencyHistogram(const LatencyHistogram &other);
+    ~LatencyHistogram();
+
+    void add(const LatencyHistogram &other);
+    void assign(const LatencyHistogram &other);
+    void clear();
+    // The counts in the compressed, base64 form used by HdrHistogram logs.
+    std::string encode() const;
+    uint64_t percentile(double pct) const;
+    void record(uint64_t value);
+    void subtract(const LatencyHistogram &other);
+
+private:
+    int bucket_index(uint64_t value) const;
+    uint64_t highest_equivalent(uint64_t value) const;
+    uint64_t index_value(int index) const;
+    LatencyHistogram& operator=(const LatencyHistogram &other);  // disallowed
+};
+
+// A throttle schedule, parsed from PhaseOptions.throttle_schedule, gives
+// the factor applied to each thread's throttle at a time within the phase.
+struct ThrottleSchedule {
+    typedef enum { CONSTANT, RAMP, SINE, STEP } Shape;
+    Shape _shape;
+    std::vector<double> _args;                     // ramp and sine arguments
+    std::vector<std::pair<double, double> > _points; // step: (secs, factor)
+    int _run_time;
+
+    ThrottleSchedule();
+    ~ThrottleSchedule();
+
+    double factor(double secs) const;
+    void parse(const std::string &spec, int run_time);
+private:
+    void parse_point(const std::string &spec, const std::string &point);
+    void read_trace(const std::string &spec, const std::string &filename);
+};
+
 struct Throttle {
     ThreadRunner &_runner;
     double _throttle;
     double _burst;
+    const ThrottleSchedule *_schedule;
+    timespec _next_start;       // open loop: scheduled start of next op
     timespec _next_div;
     int64_t _ops_delta;
     uint64_t _ops_prev;         // previously returned value
@@ -78,13 +133,21 @@ struct Throttle {
     uint64_t _ms_per_div;       // statically calculated.
     bool _started;
 
-    Throttle(ThreadRunner &runner, double throttle, double burst);
+    Throttle(ThreadRunner &runner, double throttle, double burst,
+      const ThrottleSchedule *schedule);
     ~Throttle();
 
     // Called with the number of operations since the last throttle.
     // Sleeps for any needed amount and returns the number operations the
     // caller should perform before the next call to throttle.
     int throttle(uint64_t op_count, uint64_t *op_limit);
+
+    // For an open loop, returns the scheduled start of the next operation,
+    // waiting until then if requested.
+    void next_start(bool wait, timespec *start);
+
+private:
+    double schedule_factor(timespec &now, bool *waited);
 };
 
 // There is one of these per Thread object.  It exists for the duration of a
@@ -102,8 +165,10 @@ struct ThreadRunner {
     uint64_t _throttle_ops;
     uint64_t _throttle_limit;
     bool _in_transaction;
+    volatile bool _in_checkpoint;                  // read by the Monitor
     uint32_t _number;
     Stats _stats;
+    Stats _response_stats;                         // with open_loop
 
     typedef enum {
 	USAGE_READ = 0x1, USAGE_WRITE = 0x2, USAGE_MIXED = 0x4 } Usage;
@@ -129,8 +194,15 @@ struct ThreadRunner {
 
     void op_create_all(Operation *, size_t &keysize, size_t &valuesize);
     uint64_t op_get_key_recno(Operation *, uint64_t range, tint_t tint);
+    uint64_t op_get_scan_length(Operation *);
+    uint64_t op_get_truncate_recno(Operation *, tint_t tint,
+      uint64_t *lastp);
     void op_get_static_counts(Operation *, Stats &, int);
+    int op_modify(Operation *, WT_CURSOR *);
     int op_run(Operation *);
+    int op_scan(Operation *, WT_CURSOR *);
+    void op_sleep(Operation *);
+    int op_truncate(Operation *, WT_CURSOR *, uint64_t last);
 
 #ifdef _DEBUG
     std::stringstream _debug_messages;
@@ -149,6 +221,7 @@ struct Monitor {
     pthread_t _handle;
     std::ostream *_out;
     std::ostream *_json;
+    std::ostream *_hdr;
 
     Monitor(WorkloadRunner &wrunner);
     ~Monitor();
@@ -157,9 +230,10 @@ struct Monitor {
 
 struct TableRuntime {
     uint64_t _max_recno;                           // highest recno allocated
+    uint64_t _truncate_recno;                      // highest recno truncated
     bool _disjoint;                                // does key space have holes?
 
-    TableRuntime() : _max_recno(0), _disjoint(0) {}
+    TableRuntime() : _max_recno(0), _truncate_recno(0), _disjoint(0) {}
 };
 
 struct ContextInternal {
@@ -189,10 +263,17 @@ struct TableInternal {
 // Workload::run() method.
 struct WorkloadRunner {
     Workload *_workload;
+    Phase *_phase;                     // current phase, NULL without phases
+    int _phase_number;
+    const ThrottleSchedule *_schedule; // current schedule, NULL if constant
     std::vector<ThreadRunner> _trunners;
     std::ostream *_report_out;
+    std::ofstream _monitor_out;
+    std::ofstream _monitor_json;
+    std::ofstream _monitor_hdr;
     std::string _wt_home;
     timespec _start;
+    timespec _hdr_start;               // StartTime of the latency_hdr_file
 
     WorkloadRunner(Workload *);
     ~WorkloadRunner();
@@ -202,11 +283,13 @@ private:
     int close_all();
     int create_all(WT_CONNECTION *conn, Context *context);
     void final_report(timespec &);
-    void get_stats(Stats *stats);
+    void get_stats(Stats *stats, Stats *response_stats);
+    void latency_json();
     int open_all();
     void open_report_file(std::ofstream &, const char *, const char *);
     void report(time_t, time_t, Stats *stats);
-    int run_all();
+    int run_all(int run_time);
+    int run_phase(WT_CONNECTION *conn, Phase *phase, int run_time);
 
     WorkloadRunner(const WorkloadRunner &);                 // disallowed
     WorkloadRunner& operator=(const WorkloadRunner &other); // disallowed
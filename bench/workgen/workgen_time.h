@@ -168,6 +168,20 @@ ts_add_ms(const timespec &lhs, const uint64_t n)
     return (ts);
 }
 
+inline timespec
+ts_add_ns(const timespec &lhs, const uint64_t n)
+{
+    timespec ts;
+
+    ts.tv_sec = lhs.tv_sec + ns_to_sec(n);
+    ts.tv_nsec = lhs.tv_nsec + n % BILLION;
+    while ((unsigned long)ts.tv_nsec >= NSEC_PER_SEC) {
+	ts.tv_nsec -= NSEC_PER_SEC;
+	ts.tv_sec++;
+    }
+    return (ts);
+}
+
 inline void
 ts_assign(timespec &lhs, const timespec &rhs)
 {
@@ -62,6 +62,7 @@ class Translator:
         self.opts_used = {}
         self.options = lambda: None   # options behaves as an attribute dict
         self.has_error = False
+        self.modify_table = False     # tables need value_format=u
 
     def error_file_line(self, fname, linenum, msg):
         self.has_error = True
@@ -76,14 +77,16 @@ class Translator:
         self.error(msg)
         raise TranslateException(errtype)
 
-    supported_opt_list = [ 'close_conn', 'compression', 'compact',
+    supported_opt_list = [ 'checkpoint_interval', 'checkpoint_threads',
+                           'close_conn', 'compression', 'compact',
                            'conn_config', 'create', 'icount',
                            'key_sz', 'log_like_table', 'pareto',
                            'populate_ops_per_txn', 'populate_threads',
                            'random_range', 'random_value', 'range_partition',
                            'readonly', 'reopen_connection', 'run_ops',
                            'sess_config', 'table_config', 'table_count',
-                           'threads', 'transaction_config', 'value_sz' ]
+                           'threads', 'transaction_config', 'value_sz',
+                           'value_sz_max', 'value_sz_min' ]
 
     def set_opt(self, optname, val):
         if optname not in self.supported_opt_list:
@@ -172,19 +175,29 @@ class Translator:
     def assign_str(self, left, right):
         return left + '=' + str(right) + '\n'
 
-    def add_operation_str(self, count, opname, multi, pareto):
+    def add_operation_str(self, count, opname, multi, pareto, value_size = 0,
+                          config = ''):
         result = ''
         tablename = 'tables[0]' if multi else 'table'
         if count > 1:
             result += str(count) + ' * '
         if count > 0:
+            if config != '':
+                result += 'op_config('
             result += 'Operation(Operation.' + opname + ', ' + tablename
             if pareto > 0:
                 result += ', Key(Key.KEYGEN_PARETO, 0, ParetoOptions(' + \
                           str(pareto) + '))'
             elif opname == 'OP_INSERT' and self.options.random_range != 0:
                 result += ', Key(Key.KEYGEN_UNIFORM)'
-            result += ') + \\\n'
+            elif value_size > 0:
+                result += ', Key()'
+            if value_size > 0:
+                result += ', Value(' + str(value_size) + ')'
+            result += ')'
+            if config != '':
+                result += ', "' + config + '")'
+            result += ' + \\\n'
             result += '      '
         return result
 
@@ -246,9 +259,14 @@ class Translator:
             topts.inserts = 0
             topts.ops_per_txn = 0
             topts.read = 0
+            topts.read_range = 0
             topts.reads = 0
             topts.throttle = 0
+            topts.truncate = 0
+            topts.truncate_count = 0
+            topts.truncate_pct = 10
             topts.update = 0
+            topts.update_delta = 0
             topts.updates = 0
             topts.random_range = 0
 
@@ -268,17 +286,60 @@ class Translator:
             if topts.count == 0:
                 continue
 
-            if topts.inserts + topts.reads + topts.updates == 0:
+            if topts.inserts + topts.reads + topts.updates + \
+               topts.truncate == 0:
                 self.fatal_error('need read/insert/update/...',
                                  'thread config error')
 
-            tdecls += 'ops = '
+            # Truncate threads remove the oldest entries once the table
+            # holds more than truncate_count, the same as wtperf.
+            if topts.truncate != 0:
+                if topts.inserts + topts.reads + topts.updates != 0:
+                    self.fatal_error('truncate cannot be combined with ' +
+                                     'other operations', 'thread config error')
+                if multi:
+                    self.fatal_error('truncate requires a single table',
+                                     'thread config error')
+                if topts.truncate_count == 0:
+                    self.fatal_error('truncate requires truncate_count',
+                                     'thread config error')
+                tdecls += 'ops = op_config(' + \
+                          'Operation(Operation.OP_TRUNCATE, table), ' + \
+                          '"truncate_count=' + str(topts.truncate_count) + \
+                          ',truncate_pct=' + str(topts.truncate_pct) + '")\n'
+                tdecls += '# Pause between truncate attempts, as wtperf does.\n'
+                tdecls += 'ops = ops + Operation(Operation.OP_SLEEP, "0.001")\n'
+
+            # Delta updates are modify operations that grow or shrink the
+            # value, bounded by the value_sz_max and value_sz_min options.
+            if topts.update_delta != 0:
+                self.modify_table = True
+                update_op = 'OP_MODIFY'
+                update_size = abs(topts.update_delta)
+                update_config = 'modify_delta=' + str(topts.update_delta) + \
+                    ',modify_max=' + str(opts.value_sz_max) + \
+                    ',modify_min=' + str(opts.value_sz_min)
+            else:
+                update_op = 'OP_UPDATE'
+                update_size = 0
+                update_config = ''
+
+            # Range reads search and then call next read_range times.
+            if topts.read_range != 0:
+                read_op = 'OP_SCAN'
+                read_config = 'scan_length=' + str(topts.read_range)
+            else:
+                read_op = 'OP_SEARCH'
+                read_config = ''
+
+            if topts.truncate == 0:
+                tdecls += 'ops = '
             tdecls += self.add_operation_str(topts.inserts, 'OP_INSERT',
                 multi, opts.pareto)
-            tdecls += self.add_operation_str(topts.reads, 'OP_SEARCH',
-                multi, opts.pareto)
-            tdecls += self.add_operation_str(topts.updates, 'OP_UPDATE',
-                multi, opts.pareto)
+            tdecls += self.add_operation_str(topts.reads, read_op,
+                multi, opts.pareto, 0, read_config)
+            tdecls += self.add_operation_str(topts.updates, update_op,
+                multi, opts.pareto, update_size, update_config)
             tdecls = tdecls.rstrip(' \n\\+') + '\n'
             range_partition = opts.range_partition
 
@@ -317,6 +378,19 @@ class Translator:
                 tnames += str(topts.count) + ' * '
             tnames += thread_name + ' + '
 
+        # Checkpoint threads sleep for the interval, then checkpoint.
+        if opts.checkpoint_threads != 0:
+            tdecls += 'ckpt_ops = Operation(Operation.OP_SLEEP, "' + \
+                      str(opts.checkpoint_interval) + '") + \\\n'
+            tdecls += '    Operation(Operation.OP_CHECKPOINT, "")\n'
+            tdecls += 'ckpt_thread = Thread(ckpt_ops)\n'
+            tdecls += self.assign_str('ckpt_thread.options.name',
+                                      '"checkpoint"')
+            tdecls += '\n'
+            if opts.checkpoint_threads > 1:
+                tnames += str(opts.checkpoint_threads) + ' * '
+            tnames += 'ckpt_thread'
+
         tnames = tnames.rstrip(' +')
         return (tdecls, tnames)
 
@@ -340,7 +414,9 @@ class Translator:
     def translate_table_create(self):
         opts = self.options
         s = ''
-        s += 'wtperf_table_config = "key_format=S,value_format=S,type=lsm," +\\\n'
+        value_format = 'u' if self.modify_table else 'S'
+        s += 'wtperf_table_config = "key_format=S,value_format=' + \
+             value_format + ',type=lsm," +\\\n'
         s += '    "exclusive=true,allocation_size=4kb," +\\\n'
         s += '    "internal_page_max=64kb,leaf_page_max=4kb,split_pct=100,"\n'
         if opts.compression != '':
@@ -485,6 +561,10 @@ class Translator:
         self.get_string_opt('table_config', '')
         self.get_int_opt('key_sz', 20)
         self.get_int_opt('value_sz', 100)
+        self.get_int_opt('value_sz_max', 1000)
+        self.get_int_opt('value_sz_min', 1)
+        self.get_int_opt('checkpoint_interval', 120)
+        self.get_int_opt('checkpoint_threads', 0)
         self.get_int_opt('icount', 0)
         self.get_int_opt('populate_threads', 1)
         self.get_int_opt('populate_ops_per_txn', 0)
@@ -547,13 +627,16 @@ class Translator:
              '", "create," + conn_config)\n'
         s += 's = conn.open_session("' + sess_config + '")\n'
         s += '\n'
+
+        # The threads are translated first, they determine the table format.
+        thread_config = self.get_string_opt('threads', '')
+        if thread_config != '':
+            (t_create, t_var) = self.parse_threads(thread_config)
         s += self.translate_table_create()
         if create:
             s += self.translate_populate()
 
-        thread_config = self.get_string_opt('threads', '')
         if thread_config != '':
-            (t_create, t_var) = self.parse_threads(thread_config)
             s += '\n' + t_create
             if reopen_connection:
                 s += '\n# reopen the connection\n'
@@ -25,6 +25,9 @@
 /* Define to 1 if you have the `clock_gettime' function. */
 /* #undef HAVE_CLOCK_GETTIME */
 
+/* Define to 1 if you have the `copy_file_range' function. */
+/* #undef HAVE_COPY_FILE_RANGE */
+
 /* Define to 1 to enable CRC32 hardware support. */
 /* #undef HAVE_CRC32_HARDWARE */
 
@@ -283,18 +283,21 @@ for name in sorted(api_data.methods.keys()):
     'name' : name
 })
 
-    # Write the checks reference, or NULL if no related checks structure.
+    # Write the checks reference, or NULL if no related checks structure,
+    # and whether the method's configuration can be compiled.
     tfile.write('\n\t  ')
     if ctype:
         tfile.write(
             'confchk_' + name.replace('.', '_') + ', ' + str(len(ctype)))
     else:
         tfile.write('NULL, 0')
+    tfile.write(', ' +
+        ('true' if api_data.methods[name].compilable else 'false'))
 
     tfile.write('\n\t},')
 
 # Write a NULL as a terminator for iteration.
-tfile.write('\n\t{ NULL, NULL, NULL, 0 }')
+tfile.write('\n\t{ NULL, NULL, NULL, 0, false }')
 tfile.write('\n};\n')
 
 # Write the routine that connects the WT_CONNECTION_IMPL structure to the list
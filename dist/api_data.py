@@ -1,8 +1,11 @@
 # This file is a python script that describes the WiredTiger API.
 
+# Methods flagged compilable accept configurations compiled by
+# WT_CONNECTION::compile_configuration in place of a string.
 class Method:
-    def __init__(self, config):
+    def __init__(self, config, compilable=False):
         self.config = config
+        self.compilable = compilable
 
 class Config:
     def __init__(self, name, default, desc, subconfig=None, **flags):
@@ -532,10 +535,14 @@ connection_runtime_config = [
         be cleared).   When "clear" is configured for the database,
         gathered statistics are reset each time a statistics cursor
         is used to gather statistics, as well as each time statistics
-        are logged using the \c statistics_log configuration.  See
-        @ref statistics for more information''',
+        are logged using the \c statistics_log configuration.  The
+        "latency" configuration times cursor, commit and page read
+        operations into histograms returned by \c statistics:latency
+        cursors, and implies "fast".  See @ref statistics for more
+        information''',
         type='list',
-        choices=['all', 'cache_walk', 'fast', 'none', 'clear', 'tree_walk']),
+        choices=['all', 'cache_walk', 'fast', 'none', 'clear', 'latency',
+            'tree_walk']),
     Config('timing_stress_for_test', '', r'''
         enable code that interrupts the usual timing of operations with a
         goal of uncovering race conditions and unexpected blocking.
@@ -636,6 +643,13 @@ wiredtiger_open_log_configuration = [
 
 # wiredtiger_open and WT_CONNECTION.reconfigure statistics log configurations.
 statistics_log_configuration_common = [
+    Config('binary', 'false', r'''
+        encode statistics in a compact binary format: each statistic's
+        description is written once per log file, followed by a record
+        for each interval holding the changes in the statistics since the
+        previous interval.  The \c timestamp configuration is ignored, see
+        @ref statistics_log for more information''',
+        type='boolean'),
     Config('json', 'false', r'''
         encode statistics in JSON format''',
         type='boolean'),
@@ -683,6 +697,12 @@ wiredtiger_open_statistics_log_configuration = [
 ]
 
 session_config = [
+    Config('cache_cursors', 'false', r'''
+        enable caching of cursors for reuse.  Closing a cursor on a file or
+        simple table resets it and keeps it in the session, and a later call
+        to WT_SESSION::open_cursor with the same URI and configuration
+        returns it rather than opening a new cursor''',
+        type='boolean'),
     Config('ignore_cache_size', 'false', r'''
         when set, operations performed by this session ignore the cache size
         and are not blocked when the cache is full.  Note that use of this
@@ -1048,7 +1068,7 @@ methods = {
         if non-empty, backup the list of objects; valid only for a
         backup data source''',
         type='list'),
-]),
+], compilable=True),
 
 'WT_SESSION.rebalance' : Method([]),
 'WT_SESSION.rename' : Method([]),
@@ -1058,6 +1078,11 @@ methods = {
         force salvage even of files that do not appear to be WiredTiger
         files''',
         type='boolean'),
+    Config('threads', '1', r'''
+        the number of threads used to read the file.  The file is divided
+        into ranges that are scanned for valid blocks in parallel, the
+        blocks are then processed in file order''',
+        min='1', max='64'),
 ]),
 'WT_SESSION.strerror' : Method([]),
 'WT_SESSION.transaction_sync' : Method([
@@ -1097,7 +1122,13 @@ methods = {
         Treat any verification problem as an error; by default, verify will
         warn, but not fail, in the case of errors that won't affect future
         behavior (for example, a leaked block)''',
-        type='boolean')
+        type='boolean'),
+    Config('threads', '1', r'''
+        the number of threads used to verify the file.  The subtrees of the
+        root page are divided among the threads, and the checks spanning
+        subtrees are done when the threads complete.  Ignored if any of the
+        dump options are configured''',
+        min='1', max='64'),
 ]),
 
 'WT_SESSION.begin_transaction' : Method([
@@ -1126,7 +1157,7 @@ methods = {
         whether to sync log records when the transaction commits,
         inherited from ::wiredtiger_open \c transaction_sync''',
         type='boolean'),
-]),
+], compilable=True),
 
 'WT_SESSION.commit_transaction' : Method([
     Config('commit_timestamp', '', r'''
@@ -1144,7 +1175,7 @@ methods = {
         wait for record to be written or synchronized.  The
         \c on setting forces log records to be written to the storage device''',
         choices=['background', 'off', 'on']),
-]),
+], compilable=True),
 
 'WT_SESSION.timestamp_transaction' : Method([
     Config('commit_timestamp', '', r'''
@@ -1153,7 +1184,7 @@ methods = {
         current transaction.  The value should also not be older than the
         current oldest and stable timestamps.  See
         @ref transaction_timestamps'''),
-]),
+], compilable=True),
 
 'WT_SESSION.rollback_transaction' : Method([]),
 
@@ -123,6 +123,7 @@ flags = {
         'CONN_WAS_BACKUP',
     ],
     'session' : [
+        'SESSION_CACHE_CURSORS',
         'SESSION_CAN_WAIT',
         'SESSION_INTERNAL',
         'SESSION_IGNORE_CACHE_SIZE',
@@ -147,12 +148,14 @@ flags = {
         'SESSION_SERVER_ASYNC',
     ],
     'stat' : [
+        'STAT_BINARY',
         'STAT_CLEAR',
         'STAT_JSON',
         'STAT_ON_CLOSE',
         'STAT_TYPE_ALL',
         'STAT_TYPE_CACHE_WALK',
         'STAT_TYPE_FAST',
+        'STAT_TYPE_LATENCY',
         'STAT_TYPE_SIZE',
         'STAT_TYPE_TREE_WALK',
     ],
@@ -277,6 +277,10 @@ connection_stats = [
     ##########################################
     # Cursor operations
     ##########################################
+    CursorStat('cursor_cache', 'cursors currently cached', 'no_clear,no_scale'),
+    CursorStat('cursor_cache_discard', 'cached cursors discarded'),
+    CursorStat('cursor_cache_hit', 'cursor cache hits'),
+    CursorStat('cursor_cache_miss', 'cursor cache misses'),
     CursorStat('cursor_create', 'cursor create calls'),
     CursorStat('cursor_insert', 'cursor insert calls'),
     CursorStat('cursor_modify', 'cursor modify calls'),
@@ -295,7 +299,14 @@ connection_stats = [
     # Dhandle statistics
     ##########################################
     DhandleStat('dh_conn_handle_count', 'connection data handles currently active', 'no_clear,no_scale'),
+    DhandleStat('dh_conn_hash_buckets', 'connection data handle hash buckets', 'no_clear,no_scale'),
+    DhandleStat('dh_conn_hash_lookup', 'connection data handle hash lookups'),
+    DhandleStat('dh_conn_hash_resize', 'connection data handle hash resizes'),
+    DhandleStat('dh_conn_hash_walk', 'connection data handle hash entries walked by lookups'),
     DhandleStat('dh_session_handles', 'session dhandles swept'),
+    DhandleStat('dh_session_hash_lookup', 'session data handle hash lookups'),
+    DhandleStat('dh_session_hash_resize', 'session data handle hash resizes'),
+    DhandleStat('dh_session_hash_walk', 'session data handle hash entries walked by lookups'),
     DhandleStat('dh_session_sweeps', 'session sweep attempts'),
     DhandleStat('dh_sweep_close', 'connection sweep dhandles closed'),
     DhandleStat('dh_sweep_ref', 'connection sweep candidate became referenced'),
@@ -900,6 +900,25 @@ transaction_ops(WT_SESSION *session_arg)
 	error_check(session->commit_transaction(session, NULL));
 	/*! [transaction isolation] */
 
+	{
+	/*! [transaction compiled configuration] */
+	/*
+	 * Compile a configuration once, then pass the returned handle in place
+	 * of the configuration string on each call.
+	 */
+	const char *snapshot_config;
+
+	error_check(conn->compile_configuration(conn,
+	    "WT_SESSION.begin_transaction", "isolation=snapshot",
+	    &snapshot_config));
+	error_check(session->begin_transaction(session, snapshot_config));
+	cursor->set_key(cursor, "some-key");
+	cursor->set_value(cursor, "another-value");
+	error_check(cursor->update(cursor));
+	error_check(session->commit_transaction(session, NULL));
+	/*! [transaction compiled configuration] */
+	}
+
 	/*! [session isolation configuration] */
 	/* Open a session configured for read-uncommitted isolation. */
 	error_check(conn->open_session(
@@ -55,6 +55,7 @@ def main():
     print_file_stats(session)
     print_overflow_pages(session)
     print_derived_stats(session)
+    print_snapshot_rates(session)
     conn.close()
 
 def print_database_stats(session):
@@ -92,6 +93,21 @@ def print_derived_stats(session):
         print "Write amplification is " + '{:.2f}'.format(fs_writes / (app_insert + app_remove + app_update))
     dstatcursor.close()
 
+def print_snapshot_rates(session):
+    # Read all of the connection statistics in a single call before and
+    # after some inserts, and print the rate of inserts in between.
+    statcursor = session.open_cursor("statistics:")
+    before = statcursor.stat_snapshot()
+    cursor = session.open_cursor('table:access', None)
+    for i in range(1000):
+        cursor['key%d' % i] = 'value'
+    cursor.close()
+    after = statcursor.stat_snapshot()
+    statcursor.close()
+    inserts = (after - before)[stat.conn.cursor_insert]
+    rate = after.rate(before)[stat.conn.cursor_insert]
+    print "%d inserts, %.0f per second" % (inserts, rate)
+
 def print_cursor(mycursor):
     while mycursor.next() == 0:
         val = mycursor.get_value()
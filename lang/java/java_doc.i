@@ -72,6 +72,7 @@ COPYDOC(__wt_connection, WT_CONNECTION, add_compressor)
 COPYDOC(__wt_connection, WT_CONNECTION, add_encryptor)
 COPYDOC(__wt_connection, WT_CONNECTION, add_extractor)
 COPYDOC(__wt_connection, WT_CONNECTION, set_file_system)
+COPYDOC(__wt_connection, WT_CONNECTION, compile_configuration)
 COPYDOC(__wt_config_parser, WT_CONFIG_PARSER, close)
 COPYDOC(__wt_config_parser, WT_CONFIG_PARSER, next)
 COPYDOC(__wt_config_parser, WT_CONFIG_PARSER, get)
@@ -2125,6 +2125,8 @@ static void modify_impl_release(WT_MODIFY_IMPL *impl) {
 REQUIRE_WRAP(::wiredtiger_open, wiredtiger_open, open)
 REQUIRE_WRAP(WT_CONNECTION::async_new_op,
     __wt_connection::async_new_op, async_new_op)
+REQUIRE_WRAP(WT_CONNECTION::compile_configuration,
+    __wt_connection::compile_configuration, compile_configuration)
 REQUIRE_WRAP(WT_CONNECTION::open_session,
     __wt_connection::open_session, open_session)
 REQUIRE_WRAP(WT_SESSION::transaction_pinned_range,
@@ -2230,6 +2232,23 @@ err:		if (ret != 0)
 	}
 }
 
+/*
+ * Java configuration strings are copied on each call, so a compiled handle
+ * can't be passed back: check the configuration and return it unchanged.
+ */
+%extend __wt_connection {
+	const char *compile_configuration_wrap(JNIEnv *jenv,
+	    const char *method, const char *config) {
+		const char *compiled = NULL;
+		int ret;
+
+		if ((ret = $self->compile_configuration(
+		    $self, method, config, &compiled)) != 0)
+			throwWiredTigerException(jenv, ret);
+		return (compiled);
+	}
+}
+
 %extend __wt_connection {
 	WT_SESSION *open_session_wrap(JNIEnv *jenv, const char *config) {
 		extern WT_EVENT_HANDLER javaApiEventHandler;
@@ -0,0 +1,575 @@
+/*-
+ * Public Domain 2014-2017 MongoDB, Inc.
+ * Public Domain 2008-2014 WiredTiger, Inc.
+ *
+ * This is free and unencumbered software released into the public domain.
+ *
+ * Anyone is free to copy, modify, publish, use, compile, sell, or
+ * distribute this software, either in source code form or as a compiled
+ * binary, for any purpose, commercial or non-commercial, and by any
+ * means.
+ *
+ * In jurisdictions that recognize copyright laws, the author or authors
+ * of this software dedicate any and all copyright interest in the
+ * software to the public domain. We make this dedication for the benefit
+ * of the public at large and to the detriment of our heirs and
+ * successors. We intend this dedication to be an overt act of
+ * relinquishment in perpetuity of all present and future rights to this
+ * software under copyright law.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+ * IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+ * OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ * ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+ * OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+/*
+ * packing.c
+ *	The _packing extension: a C implementation of the pack and unpack
+ * functions in wiredtiger/packing.py.  The format is walked with the same
+ * iterator used by wiredtiger_struct_pack, and values are written with the
+ * same encoding routines, so the results are byte-for-byte identical to
+ * the C API.  Where the Python module is more forgiving than the C API
+ * (short fixed-length strings, negative values in unsigned formats), the
+ * Python behavior is preserved.
+ */
+#include <Python.h>
+
+#include "src/include/wt_internal.h"
+
+#if PY_MAJOR_VERSION >= 3
+#define	PyInt_FromLong			PyLong_FromLong
+#define	PyInt_FromSsize_t		PyLong_FromSsize_t
+#define	PyString_AsStringAndSize	PyBytes_AsStringAndSize
+#define	PyString_AS_STRING		PyBytes_AS_STRING
+#define	PyString_FromStringAndSize	PyBytes_FromStringAndSize
+#endif
+
+
+/* The number of fields we can handle without allocating memory. */
+#define	PACKING_STACK_FIELDS	32
+
+/*
+ * A field to be packed: the value from the format iterator, plus a reference
+ * to any temporary object holding the field's bytes.
+ */
+typedef struct {
+	WT_PACK_VALUE pv;
+	PyObject *tmp;		/* Encoded copy of a unicode value */
+	bool negative;		/* Integer written with the signed encoding */
+} PACKING_FIELD;
+
+/*
+ * packing_error --
+ *	Raise a Python exception for a WiredTiger error, unless one has already
+ * been set.
+ */
+static PyObject *
+packing_error(int ret, const char *fmt)
+{
+	if (PyErr_Occurred() == NULL)
+		PyErr_Format(PyExc_ValueError,
+		    "format '%s': %s", fmt, wiredtiger_strerror(ret));
+	return (NULL);
+}
+
+/*
+ * packing_format --
+ *	Return the format string with any type prefix skipped, or NULL if the
+ * prefix isn't supported.
+ */
+static const char *
+packing_format(PyObject *fmtobj)
+{
+	const char *fmt;
+
+#if PY_MAJOR_VERSION >= 3
+	if ((fmt = PyUnicode_AsUTF8(fmtobj)) == NULL)
+		return (NULL);
+#else
+	if ((fmt = PyString_AsString(fmtobj)) == NULL)
+		return (NULL);
+#endif
+	/* Variable-sized encoding is the default (and only supported). */
+	if (*fmt == '@' || *fmt == '<' || *fmt == '>') {
+		PyErr_SetString(PyExc_ValueError,
+		    "Only variable-length encoding is currently supported");
+		return (NULL);
+	}
+	if (*fmt == '.')
+		++fmt;
+	return (fmt);
+}
+
+/*
+ * packing_get_int --
+ *	Convert a Python integer for packing.  The pure-Python packer writes
+ * any negative value with the signed encoding regardless of the format (for
+ * non-negative values the signed and unsigned encodings are identical), and
+ * we do the same.
+ */
+static int
+packing_get_int(PyObject *obj, PACKING_FIELD *field)
+{
+	PyObject *index;
+	int overflow;
+
+	if ((index = PyNumber_Index(obj)) == NULL)
+		return (-1);
+	field->pv.u.i = PyLong_AsLongLongAndOverflow(index, &overflow);
+	if (overflow > 0)
+		field->pv.u.u = PyLong_AsUnsignedLongLong(index);
+	else if (overflow < 0)
+		PyErr_SetString(PyExc_OverflowError,
+		    "value too small to pack in 64 bits");
+	field->negative = overflow == 0 && field->pv.u.i < 0;
+	Py_DECREF(index);
+	return (PyErr_Occurred() != NULL ? -1 : 0);
+}
+
+/*
+ * packing_get_bytes --
+ *	Get the bytes of a string value.
+ */
+static int
+packing_get_bytes(PyObject *obj, PACKING_FIELD *field)
+{
+	Py_ssize_t len;
+	char *data;
+
+	if (PyUnicode_Check(obj)) {
+		if ((field->tmp = PyUnicode_AsASCIIString(obj)) == NULL)
+			return (-1);
+		obj = field->tmp;
+	}
+	if (PyString_AsStringAndSize(obj, &data, &len) != 0)
+		return (-1);
+	field->pv.u.item.data = data;
+	field->pv.u.item.size = (size_t)len;
+	return (0);
+}
+
+/*
+ * packing_size --
+ *	Convert a field's value and return its packed size.
+ */
+static int
+packing_size(PACKING_FIELD *field, PyObject *val, size_t *sizep)
+{
+	WT_PACK_VALUE *pv;
+	int64_t v;
+
+	pv = &field->pv;
+	switch (pv->type) {
+	case 's':
+		if (packing_get_bytes(val, field) != 0)
+			return (-1);
+		*sizep = pv->size;
+		return (0);
+	case 'S':
+		/*
+		 * Strings are NUL terminated by Python, and __pack_write stops
+		 * at the first NUL, the same as the pure-Python packer.
+		 */
+		if (packing_get_bytes(val, field) != 0)
+			return (-1);
+		pv->u.s = pv->u.item.data;
+		*sizep = __pack_size(NULL, pv);
+		return (0);
+	case 'u':
+	case 'U':
+		if (packing_get_bytes(val, field) != 0)
+			return (-1);
+		*sizep = __pack_size(NULL, pv);
+		return (0);
+	case 'b':
+	case 'B':
+	case 't':
+		if (packing_get_int(val, field) != 0)
+			return (-1);
+		v = field->negative || pv->u.u <= INT64_MAX ?
+		    pv->u.i : INT64_MAX;
+		if (pv->type == 'b')
+			v += 0x80;
+		if (v < 0 || v > UINT8_MAX ||
+		    (pv->type == 't' && (v >> pv->size) != 0)) {
+			PyErr_Format(PyExc_ValueError,
+			    "value out of range for '%c' encoding", pv->type);
+			return (-1);
+		}
+		*sizep = 1;
+		return (0);
+	case 'R':
+		if (packing_get_int(val, field) != 0)
+			return (-1);
+		*sizep = sizeof(uint64_t);
+		return (0);
+	default:
+		if (packing_get_int(val, field) != 0)
+			return (-1);
+		*sizep = field->negative ?
+		    __wt_vsize_int(pv->u.i) : __wt_vsize_uint(pv->u.u);
+		return (0);
+	}
+}
+
+/*
+ * packing_write --
+ *	Write a field into the packed buffer.
+ */
+static int
+packing_write(PACKING_FIELD *field, uint8_t **pp, size_t maxlen)
+{
+	WT_PACK_VALUE *pv;
+	size_t len;
+
+	pv = &field->pv;
+	switch (pv->type) {
+	case 's':
+		/*
+		 * The C API copies the full size from the caller's buffer, the
+		 * Python API pads short strings.
+		 */
+		len = WT_MIN(pv->u.item.size, pv->size);
+		if (len > 0)
+			memcpy(*pp, pv->u.item.data, len);
+		if (len < pv->size)
+			memset(*pp + len, 0, pv->size - len);
+		*pp += pv->size;
+		return (0);
+	case 'b':
+	case 'B':
+	case 't':
+	case 'R':
+	case 'x':
+	case 'S':
+	case 'u':
+	case 'U':
+		return (__pack_write(NULL, pv, pp, maxlen));
+	default:
+		return (field->negative ?
+		    __wt_vpack_int(pp, maxlen, pv->u.i) :
+		    __wt_vpack_uint(pp, maxlen, pv->u.u));
+	}
+}
+
+/*
+ * packing_pack_args --
+ *	Pack the values in args following the format and the first value at
+ * index first.  If buf is NULL, return a new string, otherwise write into the
+ * bytearray buf, growing it if it is too small, and return the packed size.
+ */
+static PyObject *
+packing_pack_args(PyObject *args, Py_ssize_t first, PyObject *buf)
+{
+	PACKING_FIELD *field, *fields, stackfields[PACKING_STACK_FIELDS];
+	PyObject *result;
+	WT_DECL_RET;
+	WT_PACK pack;
+	Py_ssize_t i, nargs, nfields;
+	size_t maxfields, size, total;
+	uint8_t *p, *end;
+	const char *fmt;
+
+	result = NULL;
+	fields = stackfields;
+	nfields = 0;
+
+	nargs = PyTuple_GET_SIZE(args);
+	if ((fmt = packing_format(PyTuple_GET_ITEM(args, 0))) == NULL)
+		return (NULL);
+	if (*fmt == '\0')
+		return (buf == NULL ? PyTuple_New(0) : PyInt_FromLong(0));
+
+	/*
+	 * Every field either consumes a value or appears in the format as
+	 * padding, which bounds the number of fields we can see.
+	 */
+	maxfields = (size_t)nargs + strlen(fmt);
+	if (maxfields > PACKING_STACK_FIELDS &&
+	    (fields = PyMem_New(PACKING_FIELD, maxfields)) == NULL)
+		return (PyErr_NoMemory());
+
+	/* First pass: convert the values and calculate the packed size. */
+	WT_ERR(__pack_init(NULL, &pack, fmt));
+	for (i = first, total = 0;; total += size) {
+		field = &fields[nfields];
+		field->tmp = NULL;
+		field->negative = false;
+		if ((ret = __pack_next(&pack, &field->pv)) != 0)
+			break;
+		++nfields;
+		if (field->pv.type == 'x') {
+			size = field->pv.size;
+			continue;
+		}
+		if (i >= nargs) {
+			PyErr_SetString(PyExc_IndexError,
+			    "not enough values for format");
+			goto err;
+		}
+		if (packing_size(field, PyTuple_GET_ITEM(args, i++), &size) != 0)
+			goto err;
+	}
+	WT_ERR_NOTFOUND_OK(ret);
+
+	/*
+	 * Second pass: write the fields.  A bytearray is never shrunk, so one
+	 * that is reused stops allocating once it fits the largest value.
+	 */
+	if (buf == NULL) {
+		if ((result = PyString_FromStringAndSize(
+		    NULL, (Py_ssize_t)total)) == NULL)
+			goto err;
+		p = (uint8_t *)PyString_AS_STRING(result);
+	} else {
+		if (PyByteArray_GET_SIZE(buf) < (Py_ssize_t)total &&
+		    PyByteArray_Resize(buf, (Py_ssize_t)total) != 0)
+			goto err;
+		if ((result = PyInt_FromSsize_t((Py_ssize_t)total)) == NULL)
+			goto err;
+		p = (uint8_t *)PyByteArray_AS_STRING(buf);
+	}
+	end = p + total;
+	for (i = 0; i < nfields; ++i)
+		if ((ret = packing_write(
+		    &fields[i], &p, (size_t)(end - p))) != 0) {
+			Py_CLEAR(result);
+			break;
+		}
+
+err:	for (i = 0; i < nfields; ++i)
+		Py_XDECREF(fields[i].tmp);
+	if (fields != stackfields)
+		PyMem_Free(fields);
+	if (ret != 0)
+		return (packing_error(ret, fmt));
+	return (result);
+}
+
+/*
+ * packing_pack --
+ *	pack(fmt, *values) -> str
+ */
+static PyObject *
+packing_pack(PyObject *self, PyObject *args)
+{
+	WT_UNUSED(self);
+
+	if (PyTuple_GET_SIZE(args) < 1) {
+		PyErr_SetString(PyExc_TypeError,
+		    "pack() requires a format argument");
+		return (NULL);
+	}
+	return (packing_pack_args(args, 1, NULL));
+}
+
+/*
+ * packing_pack_into --
+ *	pack_into(fmt, buf, *values) -> int
+ */
+static PyObject *
+packing_pack_into(PyObject *self, PyObject *args)
+{
+	PyObject *buf;
+
+	WT_UNUSED(self);
+
+	if (PyTuple_GET_SIZE(args) < 2) {
+		PyErr_SetString(PyExc_TypeError,
+		    "pack_into() requires format and buffer arguments");
+		return (NULL);
+	}
+	buf = PyTuple_GET_ITEM(args, 1);
+	if (!PyByteArray_Check(buf)) {
+		PyErr_SetString(PyExc_TypeError,
+		    "pack_into() requires a bytearray buffer");
+		return (NULL);
+	}
+	return (packing_pack_args(args, 2, buf));
+}
+
+/*
+ * packing_int --
+ *	Return a Python object for a signed value.
+ */
+static PyObject *
+packing_int(int64_t v)
+{
+	if (v >= LONG_MIN && v <= LONG_MAX)
+		return (PyInt_FromLong((long)v));
+	return (PyLong_FromLongLong(v));
+}
+
+/*
+ * packing_uint --
+ *	Return a Python object for an unsigned value.
+ */
+static PyObject *
+packing_uint(uint64_t v)
+{
+	if (v <= LONG_MAX)
+		return (PyInt_FromLong((long)v));
+	return (PyLong_FromUnsignedLongLong(v));
+}
+
+/*
+ * packing_unpack_buf --
+ *	Unpack a buffer into a list of Python objects.
+ */
+static PyObject *
+packing_unpack_buf(const char *fmt, const uint8_t *p, const uint8_t *end)
+{
+	PyObject *result, *val;
+	WT_DECL_PACK_VALUE(pv);
+	WT_DECL_RET;
+	WT_PACK pack;
+	int64_t i;
+	uint64_t u;
+	size_t need;
+	const uint8_t *nul;
+
+	if ((result = PyList_New(0)) == NULL)
+		return (NULL);
+
+	WT_ERR(__pack_init(NULL, &pack, fmt));
+	while ((ret = __pack_next(&pack, &pv)) == 0) {
+		/*
+		 * The low-level routines treat a zero length as unchecked, so
+		 * check there are bytes remaining for anything that needs them.
+		 */
+		need = pv.type == 'u' ?
+		    (pv.havesize ? pv.size : 0) :
+		    (pv.type == 's' || pv.type == 'x' ||
+		    (pv.type == 'S' && pv.havesize) ? pv.size : 1);
+		if (need > (size_t)(end - p))
+			WT_ERR(EINVAL);
+
+		switch (pv.type) {
+		case 'x':
+			p += pv.size;
+			continue;
+		case 's':
+		case 'S':
+			if (pv.type == 'S' && !pv.havesize) {
+				if ((nul = memchr(p, '\0', (size_t)(end - p))) ==
+				    NULL)
+					WT_ERR(EINVAL);
+				need = (size_t)(nul - p);
+			}
+			val = PyString_FromStringAndSize(
+			    (const char *)p, (Py_ssize_t)need);
+			p += pv.type == 'S' && !pv.havesize ? need + 1 : need;
+			break;
+		case 'u':
+		case 'U':
+		case 'b':
+		case 'B':
+		case 't':
+		case 'R':
+			WT_ERR(__unpack_read(NULL, &pv, &p, (size_t)(end - p)));
+			/* The size prefix isn't included in the 'U' check. */
+			if (p > end)
+				WT_ERR(EINVAL);
+			if (pv.type == 'u' || pv.type == 'U')
+				val = PyString_FromStringAndSize(
+				    pv.u.item.data, (Py_ssize_t)pv.u.item.size);
+			else if (pv.type == 'b')
+				val = packing_int(pv.u.i);
+			else
+				val = packing_uint(pv.u.u);
+			break;
+		default:
+			/* Decode using the encoding the value was packed with. */
+			if (*p >= POS_1BYTE_MARKER) {
+				WT_ERR(__wt_vunpack_uint(
+				    &p, (size_t)(end - p), &u));
+				val = packing_uint(u);
+			} else {
+				WT_ERR(__wt_vunpack_int(
+				    &p, (size_t)(end - p), &i));
+				val = packing_int(i);
+			}
+			break;
+		}
+		if (val == NULL || PyList_Append(result, val) != 0) {
+			Py_XDECREF(val);
+			goto err;
+		}
+		Py_DECREF(val);
+	}
+	WT_ERR_NOTFOUND_OK(ret);
+	return (result);
+
+err:	Py_DECREF(result);
+	return (packing_error(ret == 0 ? EINVAL : ret, fmt));
+}
+
+/*
+ * packing_unpack --
+ *	unpack(fmt, s) -> list
+ */
+static PyObject *
+packing_unpack(PyObject *self, PyObject *args)
+{
+	Py_buffer view;
+	PyObject *bufobj, *fmtobj, *result;
+	const char *fmt;
+
+	WT_UNUSED(self);
+
+	if (!PyArg_ParseTuple(args, "OO:unpack", &fmtobj, &bufobj))
+		return (NULL);
+	if ((fmt = packing_format(fmtobj)) == NULL)
+		return (NULL);
+	if (*fmt == '\0')
+		return (PyTuple_New(0));
+
+	/* A WT_ITEM with a NULL data field will appear as None. */
+	if (bufobj == Py_None)
+		return (packing_unpack_buf(fmt, NULL, NULL));
+
+	if (PyObject_GetBuffer(bufobj, &view, PyBUF_SIMPLE) != 0)
+		return (NULL);
+	result = packing_unpack_buf(fmt, view.buf,
+	    (const uint8_t *)view.buf + view.len);
+	PyBuffer_Release(&view);
+	return (result);
+}
+
+static PyMethodDef packing_methods[] = {
+	{ "pack", packing_pack, METH_VARARGS,
+	    "pack(fmt, *values) -> str\n\n"
+	    "Pack values into a string using a WiredTiger format." },
+	{ "pack_into", packing_pack_into, METH_VARARGS,
+	    "pack_into(fmt, buf, *values) -> int\n\n"
+	    "Pack values into the start of a bytearray, growing it if\n"
+	    "needed, and return the packed size." },
+	{ "unpack", packing_unpack, METH_VARARGS,
+	    "unpack(fmt, s) -> list\n\n"
+	    "Unpack a string packed using a WiredTiger format." },
+	{ NULL, NULL, 0, NULL }
+};
+
+#define	PACKING_DOC	"C implementation of the wiredtiger.packing module"
+
+#if PY_MAJOR_VERSION >= 3
+static struct PyModuleDef packing_module = {
+	PyModuleDef_HEAD_INIT, "_packing", PACKING_DOC, -1, packing_methods
+};
+
+PyMODINIT_FUNC
+PyInit__packing(void)
+{
+	return (PyModule_Create(&packing_module));
+}
+#else
+PyMODINIT_FUNC
+init_packing(void)
+{
+	(void)Py_InitModule3("_packing", packing_methods, PACKING_DOC);
+}
+#endif
@@ -53,6 +53,10 @@ setup(name='wiredtiger', version=wt_ver,
                 [os.path.join(dir, 'wiredtiger_wrap.c')],
         libraries=['wiredtiger'],
         extra_compile_args=extra_cflags,
+    ), Extension('_packing',
+                [os.path.join(dir, 'packing.c')],
+        libraries=['wiredtiger'],
+        extra_compile_args=extra_cflags,
     )],
     package_dir={'' : dir},
     packages=['wiredtiger'],
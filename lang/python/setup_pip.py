@@ -333,7 +333,16 @@ wt_ext = Extension('_wiredtiger',
     include_dirs = inc_paths,
     library_dirs = lib_paths,
 )
-extensions = [ wt_ext ]
+packing_ext = Extension('_packing',
+    sources = [ os.path.join(python_rel_dir, 'packing.c') ],
+    extra_compile_args = cflags + cppflags,
+    extra_link_args = ldflags,
+    libraries = builtin_libraries,
+    extra_objects = [ os.path.join(build_dir, '.libs', 'libwiredtiger.a') ],
+    include_dirs = inc_paths,
+    library_dirs = lib_paths,
+)
+extensions = [ wt_ext, packing_ext ]
 env = { "CFLAGS" : ' '.join(cflags),
         "CPPFLAGS" : ' '.join(cppflags),
         "LDFLAGS" : ' '.join(ldflags),
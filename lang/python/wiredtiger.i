@@ -48,7 +48,8 @@ This provides an API similar to the C API, with the following modifications:
 %feature("autodoc", "0");
 
 %pythoncode %{
-from packing import pack, unpack
+from array import array
+from packing import compile_format, numpy_types, pack, unpack
 ## @endcond
 %}
 
@@ -151,74 +152,6 @@ from packing import pack, unpack
 	}
 }
 
-%typemap(in) WT_MODIFY * (int len, WT_MODIFY *modarray, int i) {
-	len = PyList_Size($input);
-	/*
-	 * We allocate an extra cleared WT_MODIFY struct, the first
-	 * entry will be used solely to transmit the array length to
-	 * the call site.
-	 */
-	if (__wt_calloc_def(NULL, (size_t)len + 1, &modarray) != 0)
-		SWIG_exception_fail(SWIG_MemoryError, "WT calloc failed");
-	modarray[0].size = (size_t)len;
-	for (i = 1; i <= len; i++) {
-		PyObject *dataobj, *modobj, *offsetobj, *sizeobj;
-		char *datadata;
-		long offset, size;
-		Py_ssize_t datasize;
-
-		if ((modobj = PySequence_GetItem($input, i - 1)) == NULL)
-			SWIG_exception_fail(SWIG_IndexError,
-			    "Modify sequence failed");
-
-		WT_GETATTR(dataobj, modobj, "data");
-		if (PyString_AsStringAndSize(dataobj, &datadata,
-		    &datasize) < 0) {
-			Py_DECREF(dataobj);
-			Py_DECREF(modobj);
-			SWIG_exception_fail(SWIG_AttributeError,
-			    "Modify.data bad value");
-		}
-		modarray[i].data.data = malloc(datasize);
-		memcpy(modarray[i].data.data, datadata, datasize);
-		modarray[i].data.size = datasize;
-		Py_DECREF(dataobj);
-
-		WT_GETATTR(offsetobj, modobj, "offset");
-		if ((offset = PyInt_AsLong(offsetobj)) < 0) {
-			Py_DECREF(offsetobj);
-			Py_DECREF(modobj);
-			SWIG_exception_fail(SWIG_RuntimeError,
-			    "Modify.offset bad value");
-		}
-		modarray[i].offset = offset;
-		Py_DECREF(offsetobj);
-
-		WT_GETATTR(sizeobj, modobj, "size");
-		if ((size = PyInt_AsLong(sizeobj)) < 0) {
-			Py_DECREF(sizeobj);
-			Py_DECREF(modobj);
-			SWIG_exception_fail(SWIG_RuntimeError,
-			    "Modify.size bad value");
-		}
-		modarray[i].size = size;
-		Py_DECREF(sizeobj);
-		Py_DECREF(modobj);
-	}
-	$1 = modarray;
-}
-
-%typemap(freearg) WT_MODIFY * {
-	/* The WT_MODIFY arg is in position 2.  Is there a better way? */
-	WT_MODIFY *modarray = modarray2;
-	size_t i, len;
-
-	len = modarray[0].size;
-	for (i = 1; i <= len; i++)
-		__wt_free(NULL, modarray[i].data.data);
-	__wt_free(NULL, modarray);
-}
-
 /* 64 bit typemaps. */
 %typemap(in) uint64_t {
 	$1 = PyLong_AsUnsignedLongLong($input);
@@ -245,6 +178,24 @@ DESTRUCTOR(__wt_connection, close)
 DESTRUCTOR(__wt_cursor, close)
 DESTRUCTOR(__wt_session, close)
 
+/*
+ * Cursor key and value formats don't change: compile them when the cursor
+ * is opened, rather than parsing them on every get or set.
+ */
+%feature("shadow") __wt_session::open_cursor %{
+	def open_cursor(self, *args):
+		'''open_cursor(self, uri, to_dup, config) -> Cursor
+
+		@copydoc WT_SESSION::open_cursor'''
+		cursor = $action(self, *args)
+		if not cursor.is_json:
+			cursor._key_plan = compile_format(cursor.key_format)
+			cursor._value_plan = compile_format(cursor.value_format)
+			cursor._key_buf = bytearray()
+			cursor._value_buf = bytearray()
+		return cursor
+%}
+
 /*
  * OVERRIDE_METHOD must be used when overriding or extending an existing
  * method in the C interface.  It creates Python method() that calls
@@ -267,6 +218,35 @@ DESTRUCTOR(__wt_session, close)
 
 /* Don't require empty config strings. */
 %typemap(default) const char *config { $1 = NULL; }
+
+/*
+ * Configuration strings can also be compiled configurations returned by
+ * Connection.compile_configuration: pass the compiled handle through so
+ * WiredTiger recognizes it.
+ */
+%{
+typedef struct __py_compiled_config {
+	const char *config;		/* Handle from compile_configuration */
+} PY_COMPILED_CONFIG;
+%}
+%typemap(in) const char *config
+    (void *argp = NULL, char *buf = NULL, int alloc = 0, int res = 0) {
+	if ($input != Py_None &&
+	    !PyString_Check($input) && !PyUnicode_Check($input) &&
+	    SWIG_IsOK(SWIG_ConvertPtr($input, &argp,
+	    $descriptor(struct __py_compiled_config *), 0)) && argp != NULL)
+		$1 = ((PY_COMPILED_CONFIG *)argp)->config;
+	else {
+		res = SWIG_AsCharPtrAndSize($input, &buf, NULL, &alloc);
+		if (!SWIG_IsOK(res))
+			%argument_fail(res, "$type", $symname, $argnum);
+		$1 = buf;
+	}
+}
+%typemap(freearg) const char *config {
+	if (alloc$argnum == SWIG_NEWOBJ)
+		%delete_array(buf$argnum);
+}
 %typemap(default) WT_CURSOR *to_dup { $1 = NULL; }
 
 /* 
@@ -296,29 +276,1170 @@ DESTRUCTOR(__wt_session, close)
 #define WT_CONNECTION_CLOSED		WT_CONNECTION
 
 /*
- * For Connections, Sessions and Cursors created in Python, each of
- * WT_CONNECTION_IMPL, WT_SESSION_IMPL and WT_CURSOR have a
- * lang_private field that store a pointer to a PY_CALLBACK, alloced
- * during the various open calls.  {conn,session,cursor}CloseHandler()
- * functions reach into the associated Python object, set the 'this'
- * asttribute to None, and free the PY_CALLBACK.
+ * For Connections, Sessions and Cursors created in Python, each of
+ * WT_CONNECTION_IMPL, WT_SESSION_IMPL and WT_CURSOR have a
+ * lang_private field that store a pointer to a PY_CALLBACK, alloced
+ * during the various open calls.  {conn,session,cursor}CloseHandler()
+ * functions reach into the associated Python object, set the 'this'
+ * asttribute to None, and free the PY_CALLBACK.
+ */
+typedef struct {
+	PyObject *pyobj;	/* the python Session/Cursor/AsyncOp object */
+	PyObject *pyasynccb;	/* the callback to use for AsyncOp */
+	uint64_t generation;	/* Session/Cursor calls, for item views */
+} PY_CALLBACK;
+
+/*
+ * Count a call that may move or change a cursor, or reset a session's
+ * cursors: views of cursor keys and values made before it are invalid.
+ */
+#define	PY_GENERATION_BUMP(lang_private) do {				\
+	if ((lang_private) != NULL)					\
+		++((PY_CALLBACK *)(lang_private))->generation;		\
+} while (0)
+
+static PyObject *wtError;
+
+static int sessionFreeHandler(WT_SESSION *session_arg);
+static int cursorFreeHandler(WT_CURSOR *cursor_arg);
+static struct __py_async_queue *aioQueueOpen(WT_CONNECTION *conn);
+
+/*
+ * A read-only buffer over a cursor's key or value, without copying it.
+ * WiredTiger only keeps the data in place until the next operation on the
+ * cursor, or until its session's transaction ends or the session is reset.
+ * The view records the cursor and session generations when it is made, and
+ * every access through it checks them, raising WiredTigerError once the
+ * data may have moved.
+ */
+typedef struct {
+	PyObject_HEAD
+	PyObject *cursor;	/* The Python Cursor */
+	const void *data;	/* Key or value, owned by the cursor */
+	Py_ssize_t size;
+	uint64_t cursor_gen;	/* Cursor generation when made */
+	uint64_t session_gen;	/* Session generation when made */
+} PY_ITEM_VIEW;
+
+static uint64_t
+itemViewGeneration(void *lang_private)
+{
+	return (lang_private == NULL ?
+	    0 : ((PY_CALLBACK *)lang_private)->generation);
+}
+
+/* Check a view is still valid: -1 means a Python exception is set. */
+static int
+itemViewCheck(PY_ITEM_VIEW *view)
+{
+	WT_CURSOR *cursor;
+	void *argp;
+
+	/* A closed cursor's Python object no longer refers to it. */
+	if (SWIG_IsOK(SWIG_ConvertPtr(
+	    view->cursor, &argp, SWIGTYPE_p___wt_cursor, 0)) &&
+	    (cursor = argp) != NULL &&
+	    itemViewGeneration(cursor->lang_private) == view->cursor_gen &&
+	    itemViewGeneration(((WT_SESSION_IMPL *)
+	    cursor->session)->lang_private) == view->session_gen)
+		return (0);
+	PyErr_SetString(wtError,
+	    "view is no longer valid: the cursor has moved, been reset or "
+	    "been closed");
+	return (-1);
+}
+
+static void
+itemViewDealloc(PyObject *self)
+{
+	Py_XDECREF(((PY_ITEM_VIEW *)self)->cursor);
+	PyObject_Del(self);
+}
+
+static Py_ssize_t
+itemViewLength(PyObject *self)
+{
+	PY_ITEM_VIEW *view;
+
+	view = (PY_ITEM_VIEW *)self;
+	return (itemViewCheck(view) != 0 ? -1 : view->size);
+}
+
+static Py_ssize_t
+itemViewReadBuffer(PyObject *self, Py_ssize_t segment, void **ptrp)
+{
+	PY_ITEM_VIEW *view;
+
+	view = (PY_ITEM_VIEW *)self;
+	if (segment != 0) {
+		PyErr_SetString(PyExc_SystemError,
+		    "accessing non-existent view segment");
+		return (-1);
+	}
+	if (itemViewCheck(view) != 0)
+		return (-1);
+	*ptrp = (void *)view->data;
+	return (view->size);
+}
+
+static Py_ssize_t
+itemViewSegCount(PyObject *self, Py_ssize_t *lenp)
+{
+	if (lenp != NULL)
+		*lenp = ((PY_ITEM_VIEW *)self)->size;
+	return (1);
+}
+
+static int
+itemViewGetBuffer(PyObject *self, Py_buffer *buf, int flags)
+{
+	PY_ITEM_VIEW *view;
+
+	view = (PY_ITEM_VIEW *)self;
+	if (itemViewCheck(view) != 0)
+		return (-1);
+	return (PyBuffer_FillInfo(
+	    buf, self, (void *)view->data, view->size, 1, flags));
+}
+
+static PyObject *
+itemViewToBytes(PyObject *self, PyObject *unused)
+{
+	PY_ITEM_VIEW *view;
+
+	WT_UNUSED(unused);
+	view = (PY_ITEM_VIEW *)self;
+	if (itemViewCheck(view) != 0)
+		return (NULL);
+	return (PyBytes_FromStringAndSize(
+	    (const char *)view->data, view->size));
+}
+
+static PySequenceMethods itemViewSequence = {
+	itemViewLength,			/* sq_length */
+};
+
+static PyBufferProcs itemViewBuffer = {
+	itemViewReadBuffer,		/* bf_getreadbuffer */
+	NULL,				/* bf_getwritebuffer */
+	itemViewSegCount,		/* bf_getsegcount */
+	(charbufferproc)itemViewReadBuffer,	/* bf_getcharbuffer */
+	itemViewGetBuffer,		/* bf_getbuffer */
+	NULL,				/* bf_releasebuffer */
+};
+
+static PyMethodDef itemViewMethods[] = {
+	{ "tobytes", itemViewToBytes, METH_NOARGS,
+	    "tobytes() -> str\n\nReturn a copy of the data." },
+	{ NULL, NULL, 0, NULL }
+};
+
+static PyTypeObject itemViewType = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	"wiredtiger.ItemView",		/* tp_name */
+	sizeof(PY_ITEM_VIEW),		/* tp_basicsize */
+	0,				/* tp_itemsize */
+	itemViewDealloc,		/* tp_dealloc */
+	0,				/* tp_print */
+	0,				/* tp_getattr */
+	0,				/* tp_setattr */
+	0,				/* tp_compare */
+	0,				/* tp_repr */
+	0,				/* tp_as_number */
+	&itemViewSequence,		/* tp_as_sequence */
+	0,				/* tp_as_mapping */
+	0,				/* tp_hash */
+	0,				/* tp_call */
+	0,				/* tp_str */
+	0,				/* tp_getattro */
+	0,				/* tp_setattro */
+	&itemViewBuffer,		/* tp_as_buffer */
+	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_NEWBUFFER,	/* tp_flags */
+	"Read-only view of a cursor key or value",	/* tp_doc */
+	0,				/* tp_traverse */
+	0,				/* tp_clear */
+	0,				/* tp_richcompare */
+	0,				/* tp_weaklistoffset */
+	0,				/* tp_iter */
+	0,				/* tp_iternext */
+	itemViewMethods,		/* tp_methods */
+};
+
+/* Return a view of a cursor's key or value. */
+static PyObject *
+itemView(WT_CURSOR *cursor, const void *data, size_t size)
+{
+	PY_CALLBACK *pcb;
+	PY_ITEM_VIEW *view;
+
+	if ((pcb = cursor->lang_private) == NULL) {
+		PyErr_SetString(wtError, "cursor has no Python object");
+		return (NULL);
+	}
+	if ((view = PyObject_New(PY_ITEM_VIEW, &itemViewType)) == NULL)
+		return (NULL);
+	Py_INCREF(pcb->pyobj);
+	view->cursor = pcb->pyobj;
+	view->data = data;
+	view->size = (Py_ssize_t)size;
+	view->cursor_gen = pcb->generation;
+	view->session_gen = itemViewGeneration(
+	    ((WT_SESSION_IMPL *)cursor->session)->lang_private);
+	return ((PyObject *)view);
+}
+
+/*
+ * Append a key or value to a batch buffer, and its end offset to the matching
+ * offsets buffer.
+ */
+static int
+batchAppend(WT_SESSION_IMPL *session,
+    WT_ITEM *buf, WT_ITEM *offsets, const void *data, size_t size)
+{
+	uint32_t off;
+
+	if (buf->size + size > UINT32_MAX)
+		return (EFBIG);
+	if (size != 0) {
+		WT_RET(__wt_buf_extend(session, buf, buf->size + size));
+		memcpy((uint8_t *)buf->mem + buf->size, data, size);
+		buf->size += size;
+	}
+	off = (uint32_t)buf->size;
+	WT_RET(__wt_buf_extend(session, offsets, offsets->size + sizeof(off)));
+	memcpy((uint8_t *)offsets->mem + offsets->size, &off, sizeof(off));
+	offsets->size += sizeof(off);
+	return (0);
+}
+
+/*
+ * Step a cursor up to n times, copying the raw keys and values into the batch
+ * buffers.  Called without the GIL, so it must not touch any Python objects.
+ */
+static int
+batchStep(WT_CURSOR *cursor, int n, int forward, WT_ITEM *keys,
+    WT_ITEM *key_offsets, WT_ITEM *values, WT_ITEM *value_offsets, int *rowsp)
+{
+	WT_DECL_RET;
+	WT_ITEM k, v;
+	WT_SESSION_IMPL *session;
+
+	session = (WT_SESSION_IMPL *)cursor->session;
+
+	/* Each offsets buffer starts with a zero, the start of the first row. */
+	WT_RET(batchAppend(session, keys, key_offsets, NULL, 0));
+	WT_RET(batchAppend(session, values, value_offsets, NULL, 0));
+
+	for (*rowsp = 0; *rowsp < n; ++*rowsp) {
+		ret = forward ? cursor->next(cursor) : cursor->prev(cursor);
+		if (ret == WT_NOTFOUND)
+			return (0);
+		WT_RET(ret);
+		WT_RET(cursor->get_key(cursor, &k));
+		WT_RET(cursor->get_value(cursor, &v));
+		WT_RET(batchAppend(session, keys, key_offsets, k.data, k.size));
+		WT_RET(batchAppend(
+		    session, values, value_offsets, v.data, v.size));
+	}
+	return (0);
+}
+
+/*
+ * Decode one row of a batch, returning a list of the key columns followed by
+ * the value columns, the same as iterating over the cursor.
+ */
+static PyObject *
+batchRow(PyObject *key_unpack, PyObject *value_unpack, WT_ITEM *keys,
+    const uint32_t *key_offsets, WT_ITEM *values, const uint32_t *value_offsets,
+    int i)
+{
+	PyObject *k, *kcols, *row, *v, *vcols;
+
+	row = NULL;
+	kcols = vcols = NULL;
+	k = PyString_FromStringAndSize((char *)keys->mem + key_offsets[i],
+	    (Py_ssize_t)(key_offsets[i + 1] - key_offsets[i]));
+	v = PyString_FromStringAndSize((char *)values->mem + value_offsets[i],
+	    (Py_ssize_t)(value_offsets[i + 1] - value_offsets[i]));
+	if (k == NULL || v == NULL)
+		goto err;
+	if ((kcols = PyObject_CallFunctionObjArgs(key_unpack, k, NULL)) ==
+	    NULL ||
+	    (vcols = PyObject_CallFunctionObjArgs(value_unpack, v, NULL)) ==
+	    NULL)
+		goto err;
+	if ((row = PySequence_List(kcols)) != NULL && PyList_SetSlice(
+	    row, PY_SSIZE_T_MAX, PY_SSIZE_T_MAX, vcols) != 0) {
+		Py_DECREF(row);
+		row = NULL;
+	}
+
+err:	Py_XDECREF(k);
+	Py_XDECREF(v);
+	Py_XDECREF(kcols);
+	Py_XDECREF(vcols);
+	return (row);
+}
+
+/* Copy a batch buffer into a Python string. */
+static PyObject *
+batchString(WT_ITEM *buf)
+{
+	return (PyString_FromStringAndSize(
+	    (char *)buf->mem, (Py_ssize_t)buf->size));
+}
+
+/*
+ * Step a cursor up to n times with the GIL released, then build the result
+ * while holding the GIL once.  If key_unpack is None, the result is a tuple
+ * of the packed keys, their offsets, the packed values and their offsets;
+ * otherwise it is a list of decoded rows.  NULL means a Python exception is
+ * set.
+ */
+static PyObject *
+cursorBatch(WT_CURSOR *cursor, int n, int forward,
+    PyObject *key_unpack, PyObject *value_unpack)
+{
+	WT_DECL_ITEM(key_offsets);
+	WT_DECL_ITEM(keys);
+	WT_DECL_ITEM(value_offsets);
+	WT_DECL_ITEM(values);
+	WT_DECL_RET;
+	WT_SESSION_IMPL *session;
+	PyObject *result, *row;
+	int i, rows;
+
+	session = (WT_SESSION_IMPL *)cursor->session;
+	result = NULL;
+	rows = 0;
+
+	if (n < 0) {
+		SWIG_SetErrorMsg(PyExc_ValueError, "batch size must be >= 0");
+		return (NULL);
+	}
+	if ((ret = __wt_scr_alloc(session, 0, &keys)) == 0 &&
+	    (ret = __wt_scr_alloc(session, 0, &key_offsets)) == 0 &&
+	    (ret = __wt_scr_alloc(session, 0, &values)) == 0 &&
+	    (ret = __wt_scr_alloc(session, 0, &value_offsets)) == 0) {
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		ret = batchStep(cursor, n, forward,
+		    keys, key_offsets, values, value_offsets, &rows);
+		SWIG_PYTHON_THREAD_END_ALLOW;
+	}
+	if (ret != 0) {
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		goto err;
+	}
+
+	if (key_unpack == Py_None) {
+		if ((result = PyTuple_New(4)) == NULL)
+			goto err;
+		PyTuple_SET_ITEM(result, 0, batchString(keys));
+		PyTuple_SET_ITEM(result, 1, batchString(key_offsets));
+		PyTuple_SET_ITEM(result, 2, batchString(values));
+		PyTuple_SET_ITEM(result, 3, batchString(value_offsets));
+		for (i = 0; i < 4; i++)
+			if (PyTuple_GET_ITEM(result, i) == NULL) {
+				Py_DECREF(result);
+				result = NULL;
+				break;
+			}
+		goto err;
+	}
+
+	if ((result = PyList_New(rows)) == NULL)
+		goto err;
+	for (i = 0; i < rows; i++) {
+		if ((row = batchRow(key_unpack, value_unpack,
+		    keys, key_offsets->mem, values, value_offsets->mem, i)) ==
+		    NULL) {
+			Py_DECREF(result);
+			result = NULL;
+			break;
+		}
+		PyList_SET_ITEM(result, i, row);
+	}
+
+err:	__wt_scr_free(session, &keys);
+	__wt_scr_free(session, &key_offsets);
+	__wt_scr_free(session, &values);
+	__wt_scr_free(session, &value_offsets);
+	return (result);
+}
+
+/*
+ * Insert a batch of packed keys and values with the GIL released.  A row
+ * whose insert fails is recorded and the batch goes on, except after
+ * WT_ROLLBACK or a panic: the transaction can't go on, the batch stops at
+ * that row.  Returns the number of failed rows.
+ */
+static Py_ssize_t
+batchInsert(WT_CURSOR *cursor, WT_ITEM *keys, WT_ITEM *values,
+    Py_ssize_t n, Py_ssize_t *failed, int *rets)
+{
+	Py_ssize_t i, nfailed;
+	int ret;
+
+	for (i = nfailed = 0; i < n; i++) {
+		cursor->set_key(cursor, &keys[i]);
+		cursor->set_value(cursor, &values[i]);
+		if ((ret = cursor->insert(cursor)) == 0)
+			continue;
+		failed[nfailed] = i;
+		rets[nfailed++] = ret;
+		if (ret == WT_ROLLBACK || ret == WT_PANIC)
+			break;
+	}
+	return (nfailed);
+}
+
+/*
+ * Insert lists of packed keys and values, returning a list of (index, error)
+ * pairs for the rows whose insert failed.  If the last error is WT_ROLLBACK
+ * or WT_PANIC, the rows after it were not inserted.  NULL means a Python
+ * exception is set.
+ */
+static PyObject *
+cursorInsertBatch(WT_CURSOR *cursor, PyObject *keylist, PyObject *valuelist)
+{
+	WT_DECL_RET;
+	WT_ITEM *keys, *values;
+	WT_SESSION_IMPL *session;
+	PyObject *pair, *result;
+	Py_ssize_t *failed, i, n, nfailed, size;
+	int *rets;
+	char *data;
+
+	session = (WT_SESSION_IMPL *)cursor->session;
+	keys = values = NULL;
+	failed = NULL;
+	rets = NULL;
+	result = NULL;
+
+	if (!PyList_Check(keylist) || !PyList_Check(valuelist) ||
+	    PyList_GET_SIZE(keylist) != PyList_GET_SIZE(valuelist)) {
+		SWIG_SetErrorMsg(PyExc_TypeError,
+		    "keys and values must be lists of the same length");
+		return (NULL);
+	}
+	n = PyList_GET_SIZE(keylist);
+	if ((ret = __wt_calloc_def(session, (size_t)n, &keys)) != 0 ||
+	    (ret = __wt_calloc_def(session, (size_t)n, &values)) != 0 ||
+	    (ret = __wt_calloc_def(session, (size_t)n, &failed)) != 0 ||
+	    (ret = __wt_calloc_def(session, (size_t)n, &rets)) != 0) {
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		goto err;
+	}
+
+	/* The lists hold references to the strings until we return. */
+	for (i = 0; i < n; i++) {
+		if (PyString_AsStringAndSize(
+		    PyList_GET_ITEM(keylist, i), &data, &size) < 0)
+			goto err;
+		keys[i].data = data;
+		keys[i].size = (size_t)size;
+		if (PyString_AsStringAndSize(
+		    PyList_GET_ITEM(valuelist, i), &data, &size) < 0)
+			goto err;
+		values[i].data = data;
+		values[i].size = (size_t)size;
+	}
+
+	{
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		nfailed = batchInsert(cursor, keys, values, n, failed, rets);
+		SWIG_PYTHON_THREAD_END_ALLOW;
+	}
+
+	if ((result = PyList_New(nfailed)) == NULL)
+		goto err;
+	for (i = 0; i < nfailed; i++) {
+		if ((pair = Py_BuildValue("(ni)", failed[i], rets[i])) == NULL) {
+			Py_CLEAR(result);
+			goto err;
+		}
+		PyList_SET_ITEM(result, i, pair);
+	}
+
+err:	__wt_free(session, keys);
+	__wt_free(session, values);
+	__wt_free(session, failed);
+	__wt_free(session, rets);
+	return (result);
+}
+
+/*
+ * Point an item at the first size bytes of a bytearray.  Returns non-zero
+ * with a Python exception set if they aren't there.
+ */
+static int
+cursorItemBuf(PyObject *buf, long size, WT_ITEM *item)
+{
+	if (!PyByteArray_Check(buf)) {
+		SWIG_SetErrorMsg(PyExc_TypeError, "expected a bytearray");
+		return (-1);
+	}
+	if (size < 0 || size > PyByteArray_GET_SIZE(buf) ||
+	    (uint64_t)size > UINT32_MAX) {
+		SWIG_SetErrorMsg(PyExc_ValueError, "invalid buffer size");
+		return (-1);
+	}
+	item->data = PyByteArray_AS_STRING(buf);
+	item->size = (uint32_t)size;
+	return (0);
+}
+
+/*
+ * NumPy support: rows are read into and packed from structured arrays with a
+ * fixed-width field per column.  The NumPy dtype is built in Python, which
+ * passes the byte offset of each field; the field widths here must match the
+ * types from packing.numpy_types.
+ */
+static int
+numpyField(WT_PACK_VALUE *pv, size_t *widthp)
+{
+	switch (pv->type) {
+	case 'b':
+	case 'B':
+	case 't':
+		*widthp = 1;
+		return (0);
+	case 'h':
+	case 'H':
+		*widthp = 2;
+		return (0);
+	case 'i':
+	case 'I':
+	case 'l':
+	case 'L':
+		*widthp = 4;
+		return (0);
+	case 'q':
+	case 'Q':
+	case 'r':
+		*widthp = 8;
+		return (0);
+	case 's':
+		*widthp = pv->size;
+		return (0);
+	}
+	return (ENOTSUP);
+}
+
+/* Unpack a key or value into fields of a NumPy record. */
+static int
+numpyUnpack(WT_SESSION_IMPL *session, const char *fmt, const WT_ITEM *item,
+    uint8_t *row, const size_t *offsets, size_t noffsets, size_t *fieldp)
+{
+	WT_DECL_PACK_VALUE(pv);
+	WT_DECL_RET;
+	WT_PACK pack;
+	const uint8_t *p, *end;
+	uint8_t *dst;
+	size_t need, width;
+	int8_t i8;
+	int16_t i16;
+	int32_t i32;
+	uint8_t u8;
+	uint16_t u16;
+	uint32_t u32;
+
+	p = item->data;
+	end = p + item->size;
+	WT_RET(__pack_init(session, &pack, fmt));
+	while ((ret = __pack_next(&pack, &pv)) == 0) {
+		/* Check there's data, an empty maxlen isn't checked. */
+		need = pv.type == 's' || pv.type == 'x' ? pv.size : 1;
+		if (need > (size_t)(end - p))
+			return (EINVAL);
+		WT_RET(__unpack_read(session, &pv, &p, (size_t)(end - p)));
+		if (pv.type == 'x')
+			continue;
+		WT_RET(numpyField(&pv, &width));
+		if (*fieldp >= noffsets)
+			return (EINVAL);
+		dst = row + offsets[(*fieldp)++];
+
+		if (pv.type == 's') {
+			memcpy(dst, pv.u.s, pv.size);
+			continue;
+		}
+		switch (width) {
+		case 1:
+			if (pv.type == 'b') {
+				i8 = (int8_t)pv.u.i;
+				memcpy(dst, &i8, 1);
+			} else {
+				u8 = (uint8_t)pv.u.u;
+				memcpy(dst, &u8, 1);
+			}
+			break;
+		case 2:
+			if (pv.type == 'h') {
+				i16 = (int16_t)pv.u.i;
+				memcpy(dst, &i16, 2);
+			} else {
+				u16 = (uint16_t)pv.u.u;
+				memcpy(dst, &u16, 2);
+			}
+			break;
+		case 4:
+			if (pv.type == 'i' || pv.type == 'l') {
+				i32 = (int32_t)pv.u.i;
+				memcpy(dst, &i32, 4);
+			} else {
+				u32 = (uint32_t)pv.u.u;
+				memcpy(dst, &u32, 4);
+			}
+			break;
+		case 8:
+			if (pv.type == 'q')
+				memcpy(dst, &pv.u.i, 8);
+			else
+				memcpy(dst, &pv.u.u, 8);
+			break;
+		}
+	}
+	return (ret == WT_NOTFOUND ? 0 : ret);
+}
+
+/*
+ * Pack fields of a NumPy record into a key or value.  The first pass sizes
+ * the result, the second writes it.
+ */
+static int
+numpyPack(WT_SESSION_IMPL *session, const char *fmt, const uint8_t *row,
+    const size_t *offsets, size_t noffsets, size_t *fieldp, WT_ITEM *buf)
+{
+	WT_DECL_PACK_VALUE(pv);
+	WT_DECL_RET;
+	WT_PACK pack;
+	const uint8_t *src;
+	uint8_t *p;
+	size_t field, size, width;
+	int pass;
+	int8_t i8;
+	int16_t i16;
+	int32_t i32;
+	uint8_t u8;
+	uint16_t u16;
+	uint32_t u32;
+
+	p = NULL;
+	size = 0;
+	for (pass = 0; pass < 2; pass++) {
+		if (pass == 1) {
+			WT_RET(__wt_buf_init(session, buf, size));
+			p = buf->mem;
+		}
+		field = *fieldp;
+		WT_RET(__pack_init(session, &pack, fmt));
+		while ((ret = __pack_next(&pack, &pv)) == 0) {
+			if (pv.type != 'x') {
+				WT_RET(numpyField(&pv, &width));
+				if (field >= noffsets)
+					return (EINVAL);
+				src = row + offsets[field++];
+				switch (pv.type) {
+				case 'b':
+					memcpy(&i8, src, 1);
+					pv.u.i = i8;
+					break;
+				case 'h':
+					memcpy(&i16, src, 2);
+					pv.u.i = i16;
+					break;
+				case 'i':
+				case 'l':
+					memcpy(&i32, src, 4);
+					pv.u.i = i32;
+					break;
+				case 'q':
+					memcpy(&pv.u.i, src, 8);
+					break;
+				case 'B':
+				case 't':
+					memcpy(&u8, src, 1);
+					pv.u.u = u8;
+					break;
+				case 'H':
+					memcpy(&u16, src, 2);
+					pv.u.u = u16;
+					break;
+				case 'I':
+				case 'L':
+					memcpy(&u32, src, 4);
+					pv.u.u = u32;
+					break;
+				case 'Q':
+				case 'r':
+					memcpy(&pv.u.u, src, 8);
+					break;
+				case 's':
+					pv.u.s = (const char *)src;
+					break;
+				}
+			}
+			if (pass == 0)
+				size += __pack_size(session, &pv);
+			else
+				WT_RET(__pack_write(session, &pv, &p,
+				    (size_t)((uint8_t *)buf->mem + size - p)));
+		}
+		WT_RET_NOTFOUND_OK(ret);
+	}
+	buf->size = size;
+	*fieldp = field;
+	return (0);
+}
+
+/* Read rows into a NumPy array, called without the GIL. */
+static int
+numpyFill(WT_CURSOR *cursor, uint8_t *data, Py_ssize_t nrows,
+    Py_ssize_t itemsize, const size_t *offsets, size_t noffsets,
+    Py_ssize_t *rowsp)
+{
+	WT_DECL_RET;
+	WT_ITEM k, v;
+	WT_SESSION_IMPL *session;
+	size_t field;
+	uint8_t *row;
+
+	session = (WT_SESSION_IMPL *)cursor->session;
+	for (*rowsp = 0; *rowsp < nrows; ++*rowsp) {
+		if ((ret = cursor->next(cursor)) == WT_NOTFOUND)
+			return (0);
+		WT_RET(ret);
+		WT_RET(cursor->get_key(cursor, &k));
+		WT_RET(cursor->get_value(cursor, &v));
+		row = data + *rowsp * itemsize;
+		field = 0;
+		WT_RET(numpyUnpack(session,
+		    cursor->key_format, &k, row, offsets, noffsets, &field));
+		WT_RET(numpyUnpack(session,
+		    cursor->value_format, &v, row, offsets, noffsets, &field));
+		if (field != noffsets)
+			return (EINVAL);
+	}
+	return (0);
+}
+
+/*
+ * Insert rows from a NumPy array, called without the GIL.  Record the return
+ * of each insert rather than stopping at the first failure, except after
+ * WT_ROLLBACK or a panic: the transaction can't go on, the insert stops at
+ * that row.
+ */
+static int
+numpyInsert(WT_CURSOR *cursor, const uint8_t *data, Py_ssize_t nrows,
+    Py_ssize_t itemsize, const size_t *offsets, size_t noffsets, int *rets)
+{
+	WT_DECL_ITEM(key);
+	WT_DECL_ITEM(value);
+	WT_DECL_RET;
+	WT_SESSION_IMPL *session;
+	Py_ssize_t i;
+	size_t field;
+	const uint8_t *row;
+
+	session = (WT_SESSION_IMPL *)cursor->session;
+	WT_ERR(__wt_scr_alloc(session, 0, &key));
+	WT_ERR(__wt_scr_alloc(session, 0, &value));
+	for (i = 0; i < nrows; i++) {
+		row = data + i * itemsize;
+		field = 0;
+		if ((ret = numpyPack(session, cursor->key_format,
+		    row, offsets, noffsets, &field, key)) == 0 &&
+		    (ret = numpyPack(session, cursor->value_format,
+		    row, offsets, noffsets, &field, value)) == 0 &&
+		    (ret = field == noffsets ? 0 : EINVAL) == 0) {
+			cursor->set_key(cursor, key);
+			cursor->set_value(cursor, value);
+			ret = cursor->insert(cursor);
+		}
+		if ((rets[i] = ret) == WT_ROLLBACK || ret == WT_PANIC)
+			break;
+	}
+	ret = 0;
+
+err:	__wt_scr_free(session, &key);
+	__wt_scr_free(session, &value);
+	return (ret);
+}
+
+/*
+ * Check the fields of a key or value format fit in a NumPy record: there must
+ * be an offset for each, and the field must end within the record.
+ */
+static int
+numpyCheck(WT_SESSION_IMPL *session, const char *fmt, const size_t *offsets,
+    size_t noffsets, Py_ssize_t itemsize, size_t *fieldp)
+{
+	WT_DECL_PACK_VALUE(pv);
+	WT_DECL_RET;
+	WT_PACK pack;
+	size_t width;
+
+	WT_RET(__pack_init(session, &pack, fmt));
+	while ((ret = __pack_next(&pack, &pv)) == 0) {
+		if (pv.type == 'x')
+			continue;
+		WT_RET(numpyField(&pv, &width));
+		if (*fieldp >= noffsets ||
+		    width > (size_t)itemsize - offsets[*fieldp])
+			return (EINVAL);
+		++*fieldp;
+	}
+	return (ret == WT_NOTFOUND ? 0 : ret);
+}
+
+/*
+ * Convert a list of field offsets for the NumPy functions, checking they
+ * match the cursor's key and value formats.
+ */
+static int
+numpyOffsets(WT_CURSOR *cursor, PyObject *list,
+    Py_ssize_t itemsize, size_t **offsetsp, size_t *noffsetsp)
+{
+	WT_SESSION_IMPL *session;
+	Py_ssize_t i, n, offset;
+	size_t field, *offsets;
+	int ret;
+
+	session = (WT_SESSION_IMPL *)cursor->session;
+
+	if (!PyList_Check(list)) {
+		SWIG_SetErrorMsg(PyExc_TypeError, "offsets must be a list");
+		return (-1);
+	}
+	n = PyList_GET_SIZE(list);
+	if ((ret = __wt_calloc_def(session, (size_t)n + 1, &offsets)) != 0) {
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		return (-1);
+	}
+	for (i = 0; i < n; i++) {
+		offset = PyInt_AsSsize_t(PyList_GET_ITEM(list, i));
+		if (offset == -1 && PyErr_Occurred()) {
+			__wt_free(session, offsets);
+			return (-1);
+		}
+		/* Every field is at least a byte wide. */
+		if (offset < 0 || offset >= itemsize) {
+			__wt_free(session, offsets);
+			SWIG_SetErrorMsg(
+			    PyExc_ValueError, "field offset out of range");
+			return (-1);
+		}
+		offsets[i] = (size_t)offset;
+	}
+	field = 0;
+	if (numpyCheck(session, cursor->key_format,
+	    offsets, (size_t)n, itemsize, &field) != 0 ||
+	    numpyCheck(session, cursor->value_format,
+	    offsets, (size_t)n, itemsize, &field) != 0 ||
+	    field != (size_t)n) {
+		__wt_free(session, offsets);
+		SWIG_SetErrorMsg(PyExc_ValueError,
+		    "fields do not match the cursor's formats");
+		return (-1);
+	}
+	*offsetsp = offsets;
+	*noffsetsp = (size_t)n;
+	return (0);
+}
+
+/*
+ * Read up to nrows rows into the buffer of a NumPy array, or if insert is set,
+ * insert the array's rows.  Returns the number of rows read, or a list of
+ * (index, error) pairs for the rows that failed to insert.  NULL means a
+ * Python exception is set.
+ */
+static PyObject *
+cursorNumpy(WT_CURSOR *cursor, PyObject *array, Py_ssize_t nrows,
+    Py_ssize_t itemsize, PyObject *offsetlist, int insert)
+{
+	Py_buffer view;
+	WT_DECL_RET;
+	WT_SESSION_IMPL *session;
+	PyObject *failure, *result;
+	Py_ssize_t i, rows;
+	size_t *offsets, noffsets;
+	int *rets;
+
+	session = (WT_SESSION_IMPL *)cursor->session;
+	result = NULL;
+	rets = NULL;
+	rows = 0;
+
+	if (nrows < 0 || itemsize <= 0) {
+		SWIG_SetErrorMsg(PyExc_ValueError, "invalid array shape");
+		return (NULL);
+	}
+	if (numpyOffsets(cursor, offsetlist, itemsize,
+	    &offsets, &noffsets) != 0)
+		return (NULL);
+	if (PyObject_GetBuffer(array, &view,
+	    insert ? PyBUF_SIMPLE : PyBUF_WRITABLE) != 0) {
+		__wt_free(session, offsets);
+		return (NULL);
+	}
+	if (view.len < nrows * itemsize) {
+		SWIG_SetErrorMsg(PyExc_ValueError, "array is too small");
+		goto err;
+	}
+	if (insert &&
+	    (ret = __wt_calloc_def(session, (size_t)nrows + 1, &rets)) != 0) {
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		goto err;
+	}
+
+	{
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		if (insert)
+			ret = numpyInsert(cursor, view.buf,
+			    nrows, itemsize, offsets, noffsets, rets);
+		else
+			ret = numpyFill(cursor, view.buf,
+			    nrows, itemsize, offsets, noffsets, &rows);
+		SWIG_PYTHON_THREAD_END_ALLOW;
+	}
+	if (ret != 0) {
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		goto err;
+	}
+	if (!insert) {
+		result = PyInt_FromSsize_t(rows);
+		goto err;
+	}
+
+	if ((result = PyList_New(0)) == NULL)
+		goto err;
+	for (i = 0; i < nrows; i++) {
+		if (rets[i] == 0)
+			continue;
+		if ((failure = Py_BuildValue("(ni)", i, rets[i])) == NULL ||
+		    PyList_Append(result, failure) != 0) {
+			Py_XDECREF(failure);
+			Py_DECREF(result);
+			result = NULL;
+			goto err;
+		}
+		Py_DECREF(failure);
+	}
+
+err:	PyBuffer_Release(&view);
+	__wt_free(session, offsets);
+	__wt_free(session, rets);
+	return (result);
+}
+
+/*
+ * Return (base, values) for a statistics cursor: the key of its first
+ * statistic and a string of all of its values as native 64-bit integers.
+ * The cursor is reset, so the next call reads fresh statistics.  NULL means
+ * a Python exception is set.
+ */
+static PyObject *
+cursorStatSnapshot(WT_CURSOR *cursor)
+{
+	WT_CURSOR_STAT *cst;
+	PyObject *result;
+	int ret;
+
+	if (!WT_PREFIX_MATCH(cursor->uri, "statistics:") ||
+	    strcmp(cursor->uri, "statistics:join") == 0) {
+		SWIG_SetErrorMsg(PyExc_TypeError,
+		    "snapshots require a statistics cursor");
+		return (NULL);
+	}
+	cst = (WT_CURSOR_STAT *)cursor;
+
+	/* A reset statistics cursor is refreshed when it's next positioned. */
+	ret = 0;
+	if (cst->notinitialized) {
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		ret = cursor->next(cursor);
+		SWIG_PYTHON_THREAD_END_ALLOW;
+	}
+	if (ret != 0) {
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		return (NULL);
+	}
+
+	result = Py_BuildValue("(iN)", cst->stats_base,
+	    PyString_FromStringAndSize((const char *)cst->stats,
+	    (Py_ssize_t)cst->stats_count * (Py_ssize_t)sizeof(int64_t)));
+	if ((ret = cursor->reset(cursor)) != 0 && result != NULL) {
+		Py_DECREF(result);
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		return (NULL);
+	}
+	return (result);
+}
+
+/*
+ * Support for WT_CURSOR.modify.  Modifications refer to their data through
+ * buffer views rather than copies, the views keep the data alive while the
+ * GIL is released.  A ModifyVector holds modifications converted once, to
+ * be applied any number of times.
+ */
+#define	PY_MODIFY_STACK	16
+
+typedef struct __py_modify_vector {
+	WT_MODIFY *entries;
+	Py_buffer *views;		/* Views of the entries' data */
+	size_t count, capacity;
+	size_t entries_allocated, views_allocated;
+	u_int busy;			/* Modify calls using the entries */
+} PY_MODIFY_VECTOR;
+
+/*
+ * Check a ModifyVector can be changed: modify calls use its entries with the
+ * GIL released.  Returns -1 with a Python exception set if it can't.
+ */
+static int
+modifyVectorCheck(PY_MODIFY_VECTOR *vector)
+{
+	if (vector->busy == 0)
+		return (0);
+	SWIG_SetErrorMsg(PyExc_RuntimeError,
+	    "ModifyVector can't be changed while a modify call uses it");
+	return (-1);
+}
+
+/* Fill in a modification, taking a view of its data. */
+static int
+modifyEntry(WT_MODIFY *entry, Py_buffer *view,
+    PyObject *data, long offset, long size)
+{
+	if (offset < 0 || size < 0) {
+		SWIG_SetErrorMsg(PyExc_ValueError,
+		    "modify offset and size must not be negative");
+		return (-1);
+	}
+	if (PyObject_GetBuffer(data, view, PyBUF_SIMPLE) != 0)
+		return (-1);
+	entry->data.data = view->buf;
+	entry->data.size = (size_t)view->len;
+	entry->offset = (size_t)offset;
+	entry->size = (size_t)size;
+	return (0);
+}
+
+/*
+ * Convert an element of a modify list: an (offset, size, data) tuple, or a
+ * Modify object, whose fields are plain Python attributes.
+ */
+static int
+modifyConvert(PyObject *obj, WT_MODIFY *entry, Py_buffer *view)
+{
+	PyObject *data, *offsetobj, *sizeobj;
+	long offset, size;
+	int ret;
+
+	if (PyTuple_Check(obj)) {
+		if (PyTuple_GET_SIZE(obj) != 3) {
+			SWIG_SetErrorMsg(PyExc_TypeError,
+			    "modify tuples must be (offset, size, data)");
+			return (-1);
+		}
+		if (((offset = PyInt_AsLong(PyTuple_GET_ITEM(obj, 0))) == -1 ||
+		    (size = PyInt_AsLong(PyTuple_GET_ITEM(obj, 1))) == -1) &&
+		    PyErr_Occurred())
+			return (-1);
+		return (modifyEntry(
+		    entry, view, PyTuple_GET_ITEM(obj, 2), offset, size));
+	}
+
+	ret = -1;
+	offsetobj = sizeobj = NULL;
+	if ((data = PyObject_GetAttrString(obj, "data")) == NULL ||
+	    (offsetobj = PyObject_GetAttrString(obj, "offset")) == NULL ||
+	    (sizeobj = PyObject_GetAttrString(obj, "size")) == NULL)
+		goto err;
+	if (((offset = PyInt_AsLong(offsetobj)) == -1 ||
+	    (size = PyInt_AsLong(sizeobj)) == -1) && PyErr_Occurred())
+		goto err;
+	ret = modifyEntry(entry, view, data, offset, size);
+
+err:	Py_XDECREF(data);
+	Py_XDECREF(offsetobj);
+	Py_XDECREF(sizeobj);
+	return (ret);
+}
+
+/*
+ * Modify the cursor's value with a ModifyVector or a sequence of
+ * modifications.  Short sequences are converted on the stack.  Returns -1
+ * with a Python exception set if the modifications can't be converted.
  */
-typedef struct {
-	PyObject *pyobj;	/* the python Session/Cursor/AsyncOp object */
-	PyObject *pyasynccb;	/* the callback to use for AsyncOp */
-} PY_CALLBACK;
+static int
+cursorModify(WT_CURSOR *cursor, PyObject *mods)
+{
+	Py_buffer *views, stackviews[PY_MODIFY_STACK];
+	PY_MODIFY_VECTOR *vector;
+	PyObject *seq;
+	WT_MODIFY *entries, stackentries[PY_MODIFY_STACK];
+	WT_SESSION_IMPL *session;
+	Py_ssize_t converted, n;
+	int ret;
 
-static PyObject *wtError;
+	/* Check for the list and tuple first, converting them is cheaper. */
+	if (!PyList_Check(mods) && !PyTuple_Check(mods) &&
+	    SWIG_IsOK(SWIG_ConvertPtr(mods,
+	    (void **)&vector, SWIGTYPE_p___py_modify_vector, 0))) {
+		/*
+		 * Other threads can run while the GIL is released: the vector
+		 * can't be changed until the call is done.  The caller holds a
+		 * reference to it, so it can't be freed.
+		 */
+		++vector->busy;
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		ret = cursor->modify(
+		    cursor, vector->entries, (int)vector->count);
+		SWIG_PYTHON_THREAD_END_ALLOW;
+		--vector->busy;
+		return (ret);
+	}
 
-static int sessionFreeHandler(WT_SESSION *session_arg);
-static int cursorFreeHandler(WT_CURSOR *cursor_arg);
+	if ((seq = PySequence_Fast(mods,
+	    "modify requires a sequence or a ModifyVector")) == NULL)
+		return (-1);
+	session = (WT_SESSION_IMPL *)cursor->session;
+	n = PySequence_Fast_GET_SIZE(seq);
+	entries = stackentries;
+	views = stackviews;
+	converted = 0;
+	ret = -1;
+	if (n > PY_MODIFY_STACK) {
+		if ((ret = __wt_calloc_def(session, (size_t)n, &entries)) != 0 ||
+		    (ret = __wt_calloc_def(session, (size_t)n, &views)) != 0) {
+			SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+			ret = -1;
+			goto err;
+		}
+		ret = -1;
+	}
+	for (; converted < n; converted++)
+		if (modifyConvert(PySequence_Fast_GET_ITEM(seq, converted),
+		    &entries[converted], &views[converted]) != 0)
+			goto err;
+
+	{
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		ret = cursor->modify(cursor, entries, (int)n);
+		SWIG_PYTHON_THREAD_END_ALLOW;
+	}
 
-#define WT_GETATTR(var, parent, name)					\
-	do if ((var = PyObject_GetAttrString(parent, name)) == NULL) {	\
-		Py_DECREF(parent);					\
-		SWIG_exception_fail(SWIG_AttributeError,		\
-		    "Modify." #name " get failed");			\
-	} while(0)
+err:	while (converted > 0)
+		PyBuffer_Release(&views[--converted]);
+	if (entries != stackentries)
+		__wt_free(session, entries);
+	if (views != stackviews)
+		__wt_free(session, views);
+	Py_DECREF(seq);
+	return (ret);
+}
 %}
 
 %init %{
@@ -332,6 +1453,10 @@ static int cursorFreeHandler(WT_CURSOR *cursor_arg);
 	wtError = PyErr_NewException("_wiredtiger.WiredTigerError", NULL, NULL);
 	Py_INCREF(wtError);
 	PyModule_AddObject(m, "WiredTigerError", wtError);
+
+	/* Cursor key and value views. */
+	if (PyType_Ready(&itemViewType) < 0)
+		return;
 %}
 
 %pythoncode %{
@@ -411,6 +1536,17 @@ SELFHELPER(struct __wt_async_op, op)
 SELFHELPER(struct __wt_session, session)
 SELFHELPER(struct __wt_cursor, cursor)
 
+/*
+ * Any call through a cursor method may move or change the cursor: count it,
+ * so views of the cursor's key and value can tell (see itemView).
+ */
+%typemap(in) (struct __wt_cursor *self, struct __wt_cursor *cursor)
+    (void *argp = 0, int res = 0) {
+	CONVERT_WITH_NULLCHECK(argp, res)
+	$2 = $1 = ($ltype)(argp);
+	PY_GENERATION_BUMP($1->lang_private);
+}
+
  /*
   * Create an error exception if it has not already
   * been done.
@@ -464,6 +1600,15 @@ retry:
 }
 %enddef
 
+/* Methods returning a Python object set an exception on failure. */
+%define PYOBJECT_OK(m)
+%exception m {
+	$action
+	if (result == NULL)
+		SWIG_fail;
+}
+%enddef
+
 /* Cursor compare can return any of -1, 0, 1. */
 %define COMPARE_OK(m)
 %exception m {
@@ -482,6 +1627,19 @@ retry:
 }
 %enddef
 
+/*
+ * Ending a transaction or resetting a session resets the session's cursors:
+ * count the call, so views of their keys and values can tell.
+ */
+%define CURSORS_RESET(m)
+%exception m {
+	PY_GENERATION_BUMP(((WT_SESSION_IMPL *)arg1)->lang_private);
+	$action
+	if (result != 0)
+		SWIG_ERROR_IF_NOT_SET(result);
+}
+%enddef
+
 EBUSY_OK(__wt_connection::async_new_op)
 ANY_OK(__wt_async_op::get_type)
 NOTFOUND_OK(__wt_cursor::next)
@@ -493,20 +1651,124 @@ NOTFOUND_OK(__wt_cursor::_modify)
 ANY_OK(__wt_modify::__wt_modify)
 ANY_OK(__wt_modify::~__wt_modify)
 
+PYOBJECT_OK(__wt_cursor::_get_key_view)
+PYOBJECT_OK(__wt_cursor::_get_value_view)
+PYOBJECT_OK(__wt_cursor::_batch)
+PYOBJECT_OK(__wt_cursor::_insert_batch)
+PYOBJECT_OK(__wt_cursor::_numpy)
+PYOBJECT_OK(__wt_cursor::_set_key_buf)
+PYOBJECT_OK(__wt_cursor::_set_value_buf)
+PYOBJECT_OK(__wt_cursor::_stat_snapshot)
+PYOBJECT_OK(__wt_connection::_async_queue)
+PYOBJECT_OK(__py_async_queue::_submit)
+PYOBJECT_OK(__py_async_queue::_drain)
+PYOBJECT_OK(__py_modify_vector::__py_modify_vector)
+PYOBJECT_OK(__py_modify_vector::append)
+PYOBJECT_OK(__py_modify_vector::clear)
+PYOBJECT_OK(__wt_connection::_compile_configuration)
+
+/*
+ * GIL policy.  The module is built with -threads, so by default the GIL is
+ * released around every call into WiredTiger, letting other Python threads
+ * run while the call works or blocks.  That is what we want for anything
+ * that may do I/O, wait on a lock or run for a long time: opening, closing
+ * and reconfiguring handles, schema operations, checkpoint, compact,
+ * verify, salvage, rebalance, transaction boundaries (which may wait for
+ * the log) and cursor positioning and update calls (which may read pages
+ * or wait on eviction).  Event handler and async callbacks re-acquire the
+ * GIL before touching Python.
+ *
+ * Releasing the GIL isn't free, and with several threads each release can
+ * hand the interpreter to another thread, so calls that only copy to or
+ * from memory the handle already owns keep it.  Methods that build Python
+ * objects must keep it, and release it themselves around engine calls.
+ */
+%nothreadallow __py_async_queue::~__py_async_queue;
+%nothreadallow __py_async_queue::_drain;
+%nothreadallow __py_async_queue::_submit;
+%nothreadallow __py_async_queue::fileno;
+%nothreadallow __py_compiled_config::__str__;
+%nothreadallow __py_compiled_config::~__py_compiled_config;
+%nothreadallow __py_modify_vector::__len__;
+%nothreadallow __py_modify_vector::__py_modify_vector;
+%nothreadallow __py_modify_vector::~__py_modify_vector;
+%nothreadallow __py_modify_vector::append;
+%nothreadallow __py_modify_vector::clear;
+%nothreadallow __wt_async_op::_freecb;
+%nothreadallow __wt_async_op::connection;
+%nothreadallow __wt_async_op::_get_key;
+%nothreadallow __wt_async_op::_get_recno;
+%nothreadallow __wt_async_op::_get_value;
+%nothreadallow __wt_async_op::_set_key;
+%nothreadallow __wt_async_op::_set_recno;
+%nothreadallow __wt_async_op::_set_value;
+%nothreadallow __wt_async_op::get_id;
+%nothreadallow __wt_async_op::get_type;
+%nothreadallow __wt_connection::_async_queue;
+%nothreadallow __wt_connection::_compile_configuration;
+%nothreadallow __wt_connection::_freecb;
+%nothreadallow __wt_connection::get_home;
+%nothreadallow __wt_connection::is_new;
+%nothreadallow __wt_cursor::_batch;
+%nothreadallow __wt_cursor::_compare;
+%nothreadallow __wt_cursor::_equals;
+%nothreadallow __wt_cursor::_freecb;
+%nothreadallow __wt_cursor::_get_json_key;
+%nothreadallow __wt_cursor::_get_json_value;
+%nothreadallow __wt_cursor::_get_key;
+%nothreadallow __wt_cursor::_get_key_view;
+%nothreadallow __wt_cursor::_get_recno;
+%nothreadallow __wt_cursor::_get_value;
+%nothreadallow __wt_cursor::_get_value_view;
+%nothreadallow __wt_cursor::_insert_batch;
+%nothreadallow __wt_cursor::_modify;
+%nothreadallow __wt_cursor::_numpy;
+%nothreadallow __wt_cursor::_set_key;
+%nothreadallow __wt_cursor::_set_key_buf;
+%nothreadallow __wt_cursor::_set_key_str;
+%nothreadallow __wt_cursor::_set_recno;
+%nothreadallow __wt_cursor::_set_value;
+%nothreadallow __wt_cursor::_set_value_buf;
+%nothreadallow __wt_cursor::_set_value_str;
+%nothreadallow __wt_cursor::_stat_snapshot;
+%nothreadallow __wt_cursor::session;
+%nothreadallow __wt_cursor::uri;
+%nothreadallow __wt_session::_freecb;
+%nothreadallow __wt_session::_txn_running;
+%nothreadallow __wt_session::connection;
+%nothreadallow __wt_session::strerror;
+%nothreadallow __wt_session::transaction_pinned_range;
+%nothreadallow wiredtiger_strerror;
+%nothreadallow wiredtiger_version;
+%nothreadallow diagnostic_build;
+%nothreadallow timestamp_build;
+%nothreadallow verbose_build;
+
 COMPARE_OK(__wt_cursor::_compare)
 COMPARE_OK(__wt_cursor::_equals)
 COMPARE_NOTFOUND_OK(__wt_cursor::_search_near)
 
+CURSORS_RESET(__wt_session::commit_transaction)
+CURSORS_RESET(__wt_session::reset)
+CURSORS_RESET(__wt_session::rollback_transaction)
+
 /* Lastly, some methods need no (additional) error checking. */
 %exception __wt_connection::get_home;
 %exception __wt_connection::is_new;
 %exception __wt_connection::search_near;
+%exception __py_async_queue::~__py_async_queue;
+%exception __py_async_queue::fileno;
+%exception __py_compiled_config::__str__;
+%exception __py_compiled_config::~__py_compiled_config;
+%exception __py_modify_vector::__len__;
+%exception __py_modify_vector::~__py_modify_vector;
 %exception __wt_async_op::_set_key;
 %exception __wt_async_op::_set_value;
 %exception __wt_cursor::_set_key;
 %exception __wt_cursor::_set_key_str;
 %exception __wt_cursor::_set_value;
 %exception __wt_cursor::_set_value_str;
+%exception __wt_session::_txn_running;
 %exception wiredtiger_strerror;
 %exception wiredtiger_version;
 %exception diagnostic_build;
@@ -716,6 +1978,8 @@ typedef int int_void;
 	/* Get / set keys and values */
 	void _set_key(char *data, int size) {
 		WT_ITEM k;
+
+		PY_GENERATION_BUMP($self->lang_private);
 		k.data = data;
 		k.size = (uint32_t)size;
 		$self->set_key($self, &k);
@@ -723,6 +1987,7 @@ typedef int int_void;
 
 	/* Get / set keys and values */
 	void _set_key_str(char *str) {
+		PY_GENERATION_BUMP($self->lang_private);
 		$self->set_key($self, str);
 	}
 
@@ -731,6 +1996,8 @@ typedef int int_void;
 		uint8_t recno_buf[20];
 		size_t size;
 		int ret;
+
+		PY_GENERATION_BUMP($self->lang_private);
 		if ((ret = wiredtiger_struct_size($self->session,
 		    &size, "r", recno)) != 0 ||
 		    (ret = wiredtiger_struct_pack($self->session,
@@ -745,6 +2012,8 @@ typedef int int_void;
 
 	void _set_value(char *data, int size) {
 		WT_ITEM v;
+
+		PY_GENERATION_BUMP($self->lang_private);
 		v.data = data;
 		v.size = (uint32_t)size;
 		$self->set_value($self, &v);
@@ -752,9 +2021,36 @@ typedef int int_void;
 
 	/* Get / set keys and values */
 	void _set_value_str(char *str) {
+		PY_GENERATION_BUMP($self->lang_private);
 		$self->set_value($self, str);
 	}
 
+	/*
+	 * Set keys and values from the start of a reused bytearray, without
+	 * copying.  The packing functions check every value before writing to
+	 * the buffer, so a failed pack can't change or move a key or value the
+	 * cursor refers to.
+	 */
+	PyObject *_set_key_buf(PyObject *buf, long size) {
+		WT_ITEM k;
+
+		PY_GENERATION_BUMP($self->lang_private);
+		if (cursorItemBuf(buf, size, &k) != 0)
+			return (NULL);
+		$self->set_key($self, &k);
+		Py_RETURN_NONE;
+	}
+
+	PyObject *_set_value_buf(PyObject *buf, long size) {
+		WT_ITEM v;
+
+		PY_GENERATION_BUMP($self->lang_private);
+		if (cursorItemBuf(buf, size, &v) != 0)
+			return (NULL);
+		$self->set_value($self, &v);
+		Py_RETURN_NONE;
+	}
+
 	/* Don't return values, just throw exceptions on failure. */
 	int_void _get_key(char **datap, int *sizep) {
 		WT_ITEM k;
@@ -805,6 +2101,63 @@ typedef int int_void;
 		return (ret);
 	}
 
+	/* Views of the key or value: NULL means a Python exception is set. */
+	PyObject *_get_key_view() {
+		WT_ITEM k;
+		const char *str;
+		int ret;
+
+		if (F_ISSET($self, WT_CURSTD_DUMP_JSON)) {
+			if ((ret = $self->get_key($self, &str)) == 0)
+				return (itemView($self, str, strlen(str)));
+		} else if ((ret = $self->get_key($self, &k)) == 0)
+			return (itemView($self, k.data, k.size));
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		return (NULL);
+	}
+
+	PyObject *_get_value_view() {
+		WT_ITEM v;
+		const char *str;
+		int ret;
+
+		if (F_ISSET($self, WT_CURSTD_DUMP_JSON)) {
+			if ((ret = $self->get_value($self, &str)) == 0)
+				return (itemView($self, str, strlen(str)));
+		} else if ((ret = $self->get_value($self, &v)) == 0)
+			return (itemView($self, v.data, v.size));
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		return (NULL);
+	}
+
+	/* Batched next / prev: releases the GIL while stepping. */
+	PyObject *_batch(int n, int forward,
+	    PyObject *key_unpack, PyObject *value_unpack) {
+		PY_GENERATION_BUMP($self->lang_private);
+		return (cursorBatch(
+		    $self, n, forward, key_unpack, value_unpack));
+	}
+
+	/* Batched insert: releases the GIL while inserting. */
+	PyObject *_insert_batch(PyObject *keys, PyObject *values) {
+		PY_GENERATION_BUMP($self->lang_private);
+		return (cursorInsertBatch($self, keys, values));
+	}
+
+	/* NumPy fill and insert: release the GIL while working. */
+	PyObject *_numpy(PyObject *array,
+	    long nrows, long itemsize, PyObject *offsets, int insert) {
+		PY_GENERATION_BUMP($self->lang_private);
+		return (cursorNumpy($self, array,
+		    (Py_ssize_t)nrows, (Py_ssize_t)itemsize, offsets, insert));
+	}
+
+	/* Statistics snapshot: releases the GIL if it refreshes. */
+	PyObject *_stat_snapshot() {
+		PY_GENERATION_BUMP($self->lang_private);
+		return (cursorStatSnapshot($self));
+	}
+
 	/* compare: special handling. */
 	int _compare(WT_CURSOR *other) {
 		int cmp = 0;
@@ -851,7 +2204,10 @@ typedef int int_void;
 	/* search_near: special handling. */
 	int _search_near() {
 		int cmp = 0;
-		int ret = $self->search_near($self, &cmp);
+		int ret;
+
+		PY_GENERATION_BUMP($self->lang_private);
+		ret = $self->search_near($self, &cmp);
 		/*
 		 * Map less-than-zero to -1 and greater-than-zero to 1 to avoid
 		 * colliding with other errors.
@@ -863,13 +2219,15 @@ typedef int int_void;
 		return (cursorFreeHandler($self));
 	}
 
-	/*
-	 * modify: the size of the array was put into the first element by the
-	 * typemap.
-	 */
-	int _modify(WT_MODIFY *list) {
-		int count = (int)list[0].size;
-		return (self->modify(self, &list[1], count));
+	/* modify: release the GIL while modifying. */
+	int _modify(PyObject *mods) {
+		PY_GENERATION_BUMP($self->lang_private);
+		return (cursorModify($self, mods));
+	}
+
+	/* Copy a backup cursor's files, for wiredtiger.backup. */
+	int _backup_copy(const char *directory, const char *config) {
+		return (__wt_backup_copy($self, directory, config));
 	}
 
 %pythoncode %{
@@ -892,7 +2250,7 @@ typedef int int_void;
 		elif self.is_column:
 			return [self._get_recno(),]
 		else:
-			return unpack(self.key_format, self._get_key())
+			return self._key_plan.unpack(self._get_key())
 
 	def get_value(self):
 		'''get_value(self) -> object
@@ -911,7 +2269,78 @@ typedef int int_void;
 		if self.is_json:
 			return [self._get_json_value()]
 		else:
-			return unpack(self.value_format, self._get_value())
+			return self._value_plan.unpack(self._get_value())
+
+	def get_raw_key_view(self):
+		'''get_raw_key_view(self) -> ItemView
+
+		Return a read-only buffer over the packed key, without copying
+		it.  The view refers to memory owned by the cursor: it is only
+		valid until the next operation on the cursor, or until the
+		session's transaction ends or the session is reset, after which
+		using it raises WiredTigerError.  Buffers taken from the view,
+		for example with memoryview(view), must not be kept past that
+		point.  The view can be unpacked in place with
+		wiredtiger.unpack(cursor.key_format, view); view.tobytes()
+		returns a copy.'''
+		return self._get_key_view()
+
+	def get_raw_value_view(self):
+		'''get_raw_value_view(self) -> ItemView
+
+		Return a read-only buffer over the packed value, without copying
+		it.  The view refers to memory owned by the cursor: it is only
+		valid until the next operation on the cursor, or until the
+		session's transaction ends or the session is reset, after which
+		using it raises WiredTigerError.  Buffers taken from the view,
+		for example with memoryview(view), must not be kept past that
+		point.  The view can be unpacked in place with
+		wiredtiger.unpack(cursor.value_format, view); view.tobytes()
+		returns a copy.'''
+		return self._get_value_view()
+
+	def next_batch(self, n, raw=False):
+		'''next_batch(self, n, raw=False) -> list
+
+		Move the cursor forward up to n times in a single call.
+		Returns a list with one entry per row, holding the key columns
+		followed by the value columns, as iteration does.  Fewer than n
+		rows means the end was reached: as with WT_CURSOR::next
+		returning ::WT_NOTFOUND, the cursor is then reset.
+
+		If raw is true, returns a tuple (keys, key_offsets, values,
+		value_offsets) instead: the packed keys and values concatenated
+		into two strings, plus array('I') offsets into them, so row i
+		of the keys is keys[key_offsets[i]:key_offsets[i + 1]].'''
+		return self._step_batch(n, True, raw)
+
+	def prev_batch(self, n, raw=False):
+		'''prev_batch(self, n, raw=False) -> list
+
+		Move the cursor backward up to n times in a single call, see
+		next_batch.'''
+		return self._step_batch(n, False, raw)
+
+	def stat_snapshot(self):
+		'''stat_snapshot(self) -> StatSnapshot
+
+		Return all of the values of a statistics cursor in a single
+		call, see Session.stat_snapshot.  The cursor is reset, so
+		keeping a statistics cursor open and calling this repeatedly
+		reads fresh statistics without reopening the cursor.'''
+		base, values = self._stat_snapshot()
+		return StatSnapshot(base, values)
+
+	def _step_batch(self, n, forward, raw):
+		if self.is_json:
+			raise WiredTigerError('batches not supported on JSON cursors')
+		if raw:
+			keys, key_offsets, values, value_offsets = \
+			    self._batch(n, forward, None, None)
+			return (keys, array('I', key_offsets),
+			    values, array('I', value_offsets))
+		return self._batch(n, forward,
+		    self._key_plan.unpack, self._value_plan.unpack)
 
 	def set_key(self, *args):
 		'''set_key(self) -> None
@@ -924,9 +2353,10 @@ typedef int int_void;
 		elif self.is_json:
 			self._set_key_str(args[0])
 		else:
-			# Keep the Python string pinned
-			self._key = pack(self.key_format, *args)
-			self._set_key(self._key)
+			# Pack into the cursor's buffer, the cursor refers to it
+			# until the key is next set.
+			self._set_key_buf(self._key_buf,
+			    self._key_plan.pack_into(self._key_buf, *args))
 
 	def set_value(self, *args):
 		'''set_value(self) -> None
@@ -937,9 +2367,8 @@ typedef int int_void;
 		else:
 			if len(args) == 1 and type(args[0]) == tuple:
 				args = args[0]
-			# Keep the Python string pinned
-			self._value = pack(self.value_format, *args)
-			self._set_value(self._value)
+			self._set_value_buf(self._value_buf,
+			    self._value_plan.pack_into(self._value_buf, *args))
 
 	def __iter__(self):
 		'''Cursor objects support iteration, equivalent to calling
@@ -967,6 +2396,155 @@ typedef int int_void;
 		self.set_value(value)
 		if self.insert() != 0:
 			raise KeyError
+
+	def insert_many(self, rows, batch_size=1000):
+		'''insert_many(self, rows, batch_size=1000) -> list
+
+		Insert (key, value) pairs from any iterable, where keys and
+		values are given as for cursor[key] = value.  Rows are packed
+		and inserted batch_size at a time, with the GIL released while
+		each batch is inserted.  Works with bulk cursors as well as
+		regular ones.
+
+		Returns a list of (index, row, exception) tuples for the failed
+		rows, in order, where index is the row's position in rows.  A
+		row that can't be packed or inserted, for example because of a
+		duplicate key, is skipped and the rest are inserted.  An insert
+		that fails with WT_ROLLBACK or WT_PANIC stops insert_many, the
+		transaction can't go on: it is the last failure returned, and no
+		later rows are inserted.'''
+		if self.is_json:
+			raise WiredTigerError(
+			    'insert_many not supported on JSON cursors')
+		if batch_size < 1:
+			raise ValueError('batch_size must be at least 1')
+		failures = []
+		batch = []
+		start = 0
+		for row in rows:
+			batch.append(row)
+			if len(batch) == batch_size:
+				if not self._insert_rows(start, batch, failures):
+					return failures
+				start += len(batch)
+				batch = []
+		if batch:
+			self._insert_rows(start, batch, failures)
+		return failures
+
+	# Insert a batch of rows, returning False if insert_many must stop.
+	def _insert_rows(self, start, rows, failures):
+		first = len(failures)
+		keys = []
+		values = []
+		packed = []
+		for i, row in enumerate(rows):
+			try:
+				key, value = row
+				if type(key) != tuple:
+					key = (key,)
+				if type(value) != tuple:
+					value = (value,)
+				k = self._key_plan.pack(*key)
+				v = self._value_plan.pack(*value)
+			except Exception as e:
+				failures.append((start + i, row, e))
+				continue
+			keys.append(k)
+			values.append(v)
+			packed.append(i)
+		if not packed:
+			return True
+		failed = self._insert_batch(keys, values)
+		# Keep the Python strings pinned, the cursor may refer to them
+		self._key = keys[-1]
+		self._value = values[-1]
+		if not failed:
+			return True
+		for i, ret in failed:
+			failures.append((start + packed[i], rows[packed[i]],
+			    WiredTigerError(wiredtiger_strerror(ret))))
+		failures[first:] = sorted(failures[first:], key=lambda f: f[0])
+		if ret != WT_ROLLBACK and ret != WT_PANIC:
+			return True
+		# Rows after a WT_ROLLBACK or panic weren't inserted, whether
+		# or not they could be packed.
+		index = start + packed[i]
+		while failures[-1][0] > index:
+			failures.pop()
+		return False
+
+	def numpy_dtype(self, names=None):
+		'''numpy_dtype(self, names=None) -> numpy.dtype
+
+		Return the NumPy structured type used by to_numpy and from_numpy
+		for this cursor, with one field per key column followed by one
+		per value column.  Fields are named by names if given, otherwise
+		"key" and "value", or "key0", "key1", ..., "value0", ... when
+		there are several columns.  Raises ValueError if a column isn't
+		fixed-width: the supported formats are the integer types, 'r',
+		't' and 's' with a size.'''
+		import numpy
+		if self.is_json:
+			raise WiredTigerError('NumPy not supported on JSON cursors')
+		ktypes = numpy_types(self.key_format)
+		vtypes = numpy_types(self.value_format)
+		if names is None:
+			names = []
+			for prefix, types in (('key', ktypes), ('value', vtypes)):
+				if len(types) == 1:
+					names.append(prefix)
+				else:
+					names.extend([prefix + str(i)
+					    for i in xrange(len(types))])
+		elif len(names) != len(ktypes) + len(vtypes):
+			raise ValueError('expected %d field names' %
+			    (len(ktypes) + len(vtypes)))
+		return numpy.dtype(zip(names, ktypes + vtypes))
+
+	def to_numpy(self, max_rows, names=None):
+		'''to_numpy(self, max_rows, names=None) -> numpy.ndarray
+
+		Move the cursor forward up to max_rows times, unpacking the rows
+		directly into a NumPy structured array with the GIL released,
+		see numpy_dtype for the array's fields.  Fewer than max_rows
+		rows means the end was reached and the cursor was reset, as
+		with next_batch.'''
+		import numpy
+		dtype = self.numpy_dtype(names)
+		if max_rows < 0:
+			raise ValueError('max_rows must not be negative')
+		result = numpy.empty(max_rows, dtype)
+		rows = self._numpy(result, max_rows, dtype.itemsize,
+		    self._numpy_offsets(dtype), False)
+		return result[:rows]
+
+	def from_numpy(self, arr):
+		'''from_numpy(self, arr) -> list
+
+		Insert each row of a one-dimensional NumPy structured array,
+		packing the rows directly from the array with the GIL released.
+		The array's field types must match numpy_dtype, the field names
+		are ignored.  Works with bulk cursors as well as regular ones.
+
+		A row that fails does not stop the insert, except for an insert
+		that fails with WT_ROLLBACK or WT_PANIC: the transaction can't
+		go on, it is the last failure returned and no later rows are
+		inserted.  Returns a list of (index, exception) tuples for the
+		failed rows, in order.'''
+		import numpy
+		dtype = self.numpy_dtype()
+		arr = numpy.ascontiguousarray(arr)
+		if arr.ndim != 1 or arr.dtype.names is None or \
+		    [arr.dtype.fields[name][0] for name in arr.dtype.names] != \
+		    [dtype.fields[name][0] for name in dtype.names]:
+			raise ValueError('array type does not match %s' % dtype)
+		return [(i, WiredTigerError(wiredtiger_strerror(ret)))
+		    for i, ret in self._numpy(arr, len(arr), arr.dtype.itemsize,
+		    self._numpy_offsets(arr.dtype), True)]
+
+	def _numpy_offsets(self, dtype):
+		return [dtype.fields[name][1] for name in dtype.names]
 %}
 };
 
@@ -993,12 +2571,68 @@ typedef int int_void;
 	int _freecb() {
 		return (sessionFreeHandler(self));
 	}
+
+	/* Whether the session has a running transaction, for wiredtiger.pool. */
+	int _txn_running() {
+		return (F_ISSET(&((WT_SESSION_IMPL *)$self)->txn,
+		    WT_TXN_RUNNING) ? 1 : 0);
+	}
+
+%pythoncode %{
+	def stat_snapshot(self, uri='statistics:', config=None):
+		'''stat_snapshot(self, uri, config) -> StatSnapshot
+
+		Read the statistics for a URI in a single call, rather than a
+		row at a time from a statistics cursor.  The URI is a statistics
+		cursor URI, "statistics:" for the connection, the "statistics:"
+		prefix may be left off for data sources.  The configuration is
+		a statistics cursor configuration.'''
+		if not uri.startswith('statistics:'):
+			uri = 'statistics:' + uri
+		cursor = self.open_cursor(uri, None, config)
+		try:
+			return cursor.stat_snapshot()
+		finally:
+			cursor.close()
+%}
 };
 
+%newobject __wt_connection::_async_queue;
+%newobject __wt_connection::_compile_configuration;
 %extend __wt_connection {
 	int _freecb() {
 		return (0);
 	}
+
+	/* Create the completion queue for wiredtiger.aio. */
+	struct __py_async_queue *_async_queue() {
+		return (aioQueueOpen($self));
+	}
+
+	struct __py_compiled_config *_compile_configuration(
+	    const char *method, const char *config) {
+		PY_COMPILED_CONFIG *compiled;
+		const char *handle;
+		int ret;
+
+		if ((ret = $self->compile_configuration(
+		    $self, method, config, &handle)) == 0)
+			ret = __wt_calloc_one(NULL, &compiled);
+		if (ret != 0) {
+			SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+			return (NULL);
+		}
+		compiled->config = handle;
+		return (compiled);
+	}
+
+%pythoncode %{
+	def compile_configuration(self, method, config=None):
+		'''compile_configuration(self, method, config) -> CompiledConfiguration
+
+		@copydoc WT_CONNECTION::compile_configuration'''
+		return self._compile_configuration(method, config)
+%}
 };
 
 %{
@@ -1054,6 +2688,7 @@ int verbose_build();
 %ignore __wt_connection::add_data_source;
 %ignore __wt_connection::add_encryptor;
 %ignore __wt_connection::add_extractor;
+%ignore __wt_connection::compile_configuration;
 %ignore __wt_connection::get_extension_api;
 %ignore __wt_session::log_printf;
 
@@ -1322,7 +2957,536 @@ err:		__wt_err(session, ret, "python async callback error");
 static WT_ASYNC_CALLBACK pyApiAsyncCallback = { pythonAsyncCallback };
 %}
 
+/*
+ * Support for wiredtiger.aio.  Completions of asynchronous operations are
+ * recorded by a C callback in the worker threads, without entering Python.
+ * The first completion after the queue is drained signals an eventfd (or a
+ * pipe where eventfd isn't available) that an event loop watches, then the
+ * loop drains all queued completions in one call.
+ */
+%{
+#ifdef __linux__
+#include <sys/eventfd.h>
+#endif
+
+typedef struct {
+	uint64_t id;			/* Operation ID */
+	int ret;			/* Operation return */
+	bool has_value;			/* Search returned a value */
+	WT_ITEM value;			/* Copy of the value */
+} PY_ASYNC_RESULT;
+
+typedef struct {
+	PY_ASYNC_RESULT *results;
+	size_t count;			/* Results in the list */
+	size_t bytes;			/* Bytes allocated */
+} PY_ASYNC_LIST;
+
+typedef struct __py_async_queue {
+	WT_ASYNC_CALLBACK iface;	/* Must come first */
+
+	WT_CONNECTION *conn;
+	WT_SPINLOCK lock;		/* Protects fill and signalled */
+	PY_ASYNC_LIST fill;		/* Results being added by callbacks */
+	PY_ASYNC_LIST drain;		/* Results being returned to Python */
+	size_t outstanding;		/* Operations started, not drained */
+	size_t running;			/* Operations started, not completed */
+	bool signalled;			/* Wakeup sent since the last drain */
+	int rfd, wfd;			/* Wakeup file descriptors */
+} PY_ASYNC_QUEUE;
+
+/* Signal the event loop that completions are waiting. */
+static void
+aioWakeup(PY_ASYNC_QUEUE *q)
+{
+#ifdef __linux__
+	uint64_t one = 1;
+#else
+	char one = 1;
+#endif
+
+	/* A full pipe is already readable, so failure can be ignored. */
+	WT_IGNORE_RET(write(q->wfd, &one, sizeof(one)));
+}
+
+/* Consume any wakeups, the queue is about to be drained. */
+static void
+aioClearWakeup(PY_ASYNC_QUEUE *q)
+{
+	char buf[64];
+
+	while (read(q->rfd, buf, sizeof(buf)) > 0)
+		;
+}
+
+/*
+ * Record a completion: called from async worker threads, without the GIL.
+ * Space for the result was reserved when the operation was started.
+ */
+static int
+aioCallback(WT_ASYNC_CALLBACK *cb, WT_ASYNC_OP *asyncop, int opret,
+    uint32_t flags)
+{
+	PY_ASYNC_QUEUE *q;
+	PY_ASYNC_RESULT *result;
+	WT_ITEM value;
+	WT_SESSION_IMPL *session;
+	bool wake;
+
+	WT_UNUSED(flags);
+	q = (PY_ASYNC_QUEUE *)cb;
+	session = O2S((WT_ASYNC_OP_IMPL *)asyncop);
+
+	__wt_spin_lock(session, &q->lock);
+	result = &q->fill.results[q->fill.count++];
+	result->id = asyncop->get_id(asyncop);
+	result->ret = opret;
+	result->has_value = false;
+	if (opret == 0 && asyncop->get_type(asyncop) == WT_AOP_SEARCH) {
+		if ((result->ret = asyncop->get_value(asyncop, &value)) == 0)
+			result->ret = __wt_buf_set(session,
+			    &result->value, value.data, value.size);
+		result->has_value = result->ret == 0;
+	}
+	--q->running;
+	wake = !q->signalled;
+	q->signalled = true;
+	__wt_spin_unlock(session, &q->lock);
+
+	if (wake)
+		aioWakeup(q);
+	return (0);
+}
+
+static void
+aioListFree(PY_ASYNC_LIST *list)
+{
+	size_t i;
+
+	for (i = 0; i < list->bytes / sizeof(PY_ASYNC_RESULT); i++)
+		__wt_buf_free(NULL, &list->results[i].value);
+	__wt_free(NULL, list->results);
+}
+
+static PY_ASYNC_QUEUE *
+aioQueueOpen(WT_CONNECTION *conn)
+{
+	PY_ASYNC_QUEUE *q;
+	int fds[2], ret;
+
+	if ((ret = __wt_calloc_one(NULL, &q)) != 0) {
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		return (NULL);
+	}
+	q->iface.notify = aioCallback;
+	q->conn = conn;
+	q->rfd = q->wfd = -1;
+	if ((ret = __wt_spin_init(NULL, &q->lock, "python async queue")) != 0)
+		goto err;
+#ifdef __linux__
+	if ((q->rfd = q->wfd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC)) == -1)
+		goto syserr;
+#else
+	if (pipe(fds) != 0)
+		goto syserr;
+	q->rfd = fds[0];
+	q->wfd = fds[1];
+	if (fcntl(q->rfd, F_SETFL, O_NONBLOCK) == -1 ||
+	    fcntl(q->wfd, F_SETFL, O_NONBLOCK) == -1 ||
+	    fcntl(q->rfd, F_SETFD, FD_CLOEXEC) == -1 ||
+	    fcntl(q->wfd, F_SETFD, FD_CLOEXEC) == -1)
+		goto syserr;
+#endif
+	WT_UNUSED(fds);
+	return (q);
+
+syserr:	ret = __wt_errno();
+err:	SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+	if (q->rfd != -1)
+		(void)close(q->rfd);
+	if (q->wfd != -1 && q->wfd != q->rfd)
+		(void)close(q->wfd);
+	__wt_spin_destroy(NULL, &q->lock);
+	__wt_free(NULL, q);
+	return (NULL);
+}
+
+/*
+ * Free the queue.  Operations that haven't completed still have callbacks to
+ * come that write to it, wait for them first.  Closing the connection
+ * completes every operation, so the connection is open if any are running.
+ */
+static void
+aioQueueClose(PY_ASYNC_QUEUE *q)
+{
+	size_t running;
+
+	__wt_spin_lock(NULL, &q->lock);
+	running = q->running;
+	__wt_spin_unlock(NULL, &q->lock);
+	if (running != 0) {
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		WT_IGNORE_RET(q->conn->async_flush(q->conn));
+		SWIG_PYTHON_THREAD_END_ALLOW;
+	}
+
+	if (q->rfd != -1)
+		(void)close(q->rfd);
+	if (q->wfd != -1 && q->wfd != q->rfd)
+		(void)close(q->wfd);
+	aioListFree(&q->fill);
+	aioListFree(&q->drain);
+	__wt_spin_destroy(NULL, &q->lock);
+	__wt_free(NULL, q);
+}
+
+/*
+ * Start an operation, called without the GIL.  Reserve space for its result
+ * first, so the callback never has to allocate it.
+ */
+static int
+aioStart(PY_ASYNC_QUEUE *q, const char *uri, const char *config,
+    int optype, WT_ITEM *key, WT_ITEM *value, uint64_t *idp)
+{
+	WT_ASYNC_OP *op;
+	WT_DECL_RET;
+
+	__wt_spin_lock(NULL, &q->lock);
+	if ((ret = __wt_realloc_def(NULL,
+	    &q->fill.bytes, q->outstanding + 1, &q->fill.results)) == 0) {
+		++q->outstanding;
+		++q->running;
+	}
+	__wt_spin_unlock(NULL, &q->lock);
+	WT_RET(ret);
+
+	WT_ERR(q->conn->async_new_op(q->conn, uri, config, &q->iface, &op));
+	F_SET(&op->c, WT_CURSTD_RAW);
+	if (key != NULL)
+		op->set_key(op, key);
+	if (value != NULL)
+		op->set_value(op, value);
+	*idp = op->get_id(op);
+
+	switch (optype) {
+	case WT_AOP_COMPACT:
+		ret = op->compact(op);
+		break;
+	case WT_AOP_INSERT:
+		ret = op->insert(op);
+		break;
+	case WT_AOP_REMOVE:
+		ret = op->remove(op);
+		break;
+	case WT_AOP_SEARCH:
+		ret = op->search(op);
+		break;
+	case WT_AOP_UPDATE:
+	default:
+		ret = op->update(op);
+		break;
+	}
+
+	/* Without a callback to come, release the reservation. */
+err:	if (ret != 0) {
+		__wt_spin_lock(NULL, &q->lock);
+		--q->outstanding;
+		--q->running;
+		__wt_spin_unlock(NULL, &q->lock);
+	}
+	return (ret);
+}
+
+/*
+ * Start an operation, returning its ID, or None if all operation handles are
+ * in use.  NULL means a Python exception is set.
+ */
+static PyObject *
+aioSubmit(PY_ASYNC_QUEUE *q, const char *uri, const char *config,
+    int optype, PyObject *keyobj, PyObject *valueobj)
+{
+	WT_ITEM key, value;
+	uint64_t id;
+	Py_ssize_t size;
+	int ret;
+	char *data;
+
+	if (optype < WT_AOP_COMPACT || optype > WT_AOP_UPDATE) {
+		SWIG_SetErrorMsg(PyExc_ValueError, "unknown operation type");
+		return (NULL);
+	}
+	if (keyobj != Py_None) {
+		if (PyString_AsStringAndSize(keyobj, &data, &size) < 0)
+			return (NULL);
+		key.data = data;
+		key.size = (size_t)size;
+	}
+	if (valueobj != Py_None) {
+		if (PyString_AsStringAndSize(valueobj, &data, &size) < 0)
+			return (NULL);
+		value.data = data;
+		value.size = (size_t)size;
+	}
+
+	{
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		ret = aioStart(q, uri, config, optype,
+		    keyobj == Py_None ? NULL : &key,
+		    valueobj == Py_None ? NULL : &value, &id);
+		SWIG_PYTHON_THREAD_END_ALLOW;
+	}
+	if (ret == EBUSY)
+		Py_RETURN_NONE;
+	if (ret != 0) {
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		return (NULL);
+	}
+	return (PyLong_FromUnsignedLongLong(id));
+}
+
+/*
+ * Return a list of (id, ret, value) for the operations that have completed,
+ * value is None unless a search succeeded.  NULL means a Python exception is
+ * set.
+ */
+static PyObject *
+aioDrain(PY_ASYNC_QUEUE *q)
+{
+	PY_ASYNC_LIST tmp;
+	PY_ASYNC_RESULT *r;
+	PyObject *item, *list, *value;
+	size_t i;
+	int ret;
+
+	/* Clear the wakeup before swapping, later completions send another. */
+	aioClearWakeup(q);
+
+	/*
+	 * The empty list becomes the fill list, it needs space for every
+	 * operation that might still complete.
+	 */
+	__wt_spin_lock(NULL, &q->lock);
+	if ((ret = __wt_realloc_def(NULL,
+	    &q->drain.bytes, q->outstanding, &q->drain.results)) == 0) {
+		tmp = q->fill;
+		q->fill = q->drain;
+		q->drain = tmp;
+		q->outstanding -= q->drain.count;
+		q->signalled = false;
+	}
+	__wt_spin_unlock(NULL, &q->lock);
+	if (ret != 0) {
+		aioWakeup(q);
+		SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		return (NULL);
+	}
+
+	if ((list = PyList_New((Py_ssize_t)q->drain.count)) == NULL)
+		return (NULL);
+	for (i = 0; i < q->drain.count; i++) {
+		r = &q->drain.results[i];
+		if (r->has_value)
+			value = PyString_FromStringAndSize(
+			    r->value.data, (Py_ssize_t)r->value.size);
+		else {
+			Py_INCREF(Py_None);
+			value = Py_None;
+		}
+		if (value == NULL || (item = Py_BuildValue(
+		    "(KiN)", (unsigned PY_LONG_LONG)r->id, r->ret, value)) ==
+		    NULL) {
+			Py_XDECREF(value);
+			Py_DECREF(list);
+			list = NULL;
+			break;
+		}
+		PyList_SET_ITEM(list, (Py_ssize_t)i, item);
+	}
+	q->drain.count = 0;
+	return (list);
+}
+%}
+
+/*
+ * SWIG only sees an opaque AsyncQueue; the event loop integration is in
+ * wiredtiger.aio.
+ */
+%rename(AsyncQueue) __py_async_queue;
+struct __py_async_queue {};
+%extend __py_async_queue {
+	~__py_async_queue() {
+		aioQueueClose($self);
+	}
+
+	int fileno() {
+		return ($self->rfd);
+	}
+
+	PyObject *_submit(const char *uri, const char *config,
+	    int optype, PyObject *key, PyObject *value) {
+		return (aioSubmit($self, uri, config, optype, key, value));
+	}
+
+	PyObject *_drain() {
+		return (aioDrain($self));
+	}
+};
+
+/*
+ * A ModifyVector is built up with append(offset, size, data) and passed to
+ * Cursor.modify in place of a list, so repeated modifications are converted
+ * once.  It keeps a view of each modification's data until cleared.
+ */
+%rename(ModifyVector) __py_modify_vector;
+struct __py_modify_vector {};
+%extend __py_modify_vector {
+	__py_modify_vector() {
+		PY_MODIFY_VECTOR *vector;
+		if (__wt_calloc_one(NULL, &vector) != 0)
+			(void)PyErr_NoMemory();
+		return (vector);
+	}
+
+	~__py_modify_vector() {
+		while ($self->count > 0)
+			PyBuffer_Release(&$self->views[--$self->count]);
+		__wt_free(NULL, $self->entries);
+		__wt_free(NULL, $self->views);
+		__wt_free(NULL, $self);
+	}
+
+	PyObject *append(long offset, long size, PyObject *data) {
+		size_t capacity;
+		if (modifyVectorCheck($self) != 0)
+			return (NULL);
+		if ($self->count == $self->capacity) {
+			capacity = WT_MAX(2 * $self->capacity, PY_MODIFY_STACK);
+			if (__wt_realloc_def(NULL, &$self->entries_allocated,
+			    capacity, &$self->entries) != 0 ||
+			    __wt_realloc_def(NULL, &$self->views_allocated,
+			    capacity, &$self->views) != 0)
+				return (PyErr_NoMemory());
+			$self->capacity = capacity;
+		}
+		if (modifyEntry(&$self->entries[$self->count],
+		    &$self->views[$self->count], data, offset, size) != 0)
+			return (NULL);
+		++$self->count;
+		Py_RETURN_NONE;
+	}
+
+	PyObject *clear() {
+		if (modifyVectorCheck($self) != 0)
+			return (NULL);
+		while ($self->count > 0)
+			PyBuffer_Release(&$self->views[--$self->count]);
+		Py_RETURN_NONE;
+	}
+
+	long __len__() {
+		return ((long)$self->count);
+	}
+};
+
+/*
+ * A CompiledConfiguration can be passed wherever its method takes a
+ * configuration string.  The handle it wraps is owned by the connection.
+ */
+%rename(CompiledConfiguration) __py_compiled_config;
+struct __py_compiled_config {};
+%extend __py_compiled_config {
+	~__py_compiled_config() {
+		__wt_free(NULL, $self);
+	}
+
+	const char *__str__() {
+		return ($self->config);
+	}
+};
+
 %pythoncode %{
+import operator as _operator
+import struct as _struct
+import time as _time
+
+# Snapshots hold 64-bit values: Python 2 arrays have no 'q' type code, but
+# 'l' is 64 bits on LP64 platforms.
+try:
+	_stat_typecode = 'q'
+	array(_stat_typecode)
+except ValueError:
+	_stat_typecode = 'l' if array('l').itemsize == 8 else 'd'
+
+class StatSnapshot(array):
+	'''StatSnapshot(base, values, when=None, typecode=None)
+
+	The values of a statistics cursor, read at a single point in time, in
+	a compact array of 64-bit integers.  Indexing with a key from
+	wiredtiger.stat.conn or wiredtiger.stat.dsrc returns that statistic,
+	iteration and slicing are in key order.  The base attribute is the
+	key of the first value, and the time attribute is when the snapshot
+	was taken, in seconds since the epoch.
+
+	Subtracting snapshots of the same statistics returns a snapshot of
+	the differences, and rate returns the differences per second.
+	Statistics that aren't counters, such as sizes, aren't meaningful as
+	differences.'''
+
+	def __new__(cls, base, values=(), when=None, typecode=None):
+		self = array.__new__(cls, typecode or _stat_typecode)
+		if type(values) == str:
+			# Native 64-bit integers, from Cursor.stat_snapshot.
+			if self.itemsize == 8 and self.typecode != 'd':
+				self.fromstring(values)
+				return self
+			values = _struct.unpack('=%dq' % (len(values) // 8), values)
+		self.extend(values)
+		return self
+
+	def __init__(self, base, values=(), when=None, typecode=None):
+		self.base = base
+		self.time = _time.time() if when is None else when
+
+	def __getitem__(self, key):
+		if isinstance(key, (int, long)):
+			if key < self.base:
+				raise IndexError('statistics key out of range')
+			key -= self.base
+		return array.__getitem__(self, key)
+
+	def __reduce__(self):
+		return (self.__class__,
+		    (self.base, self.tolist(), self.time, self.typecode))
+
+	def _check(self, other):
+		if self.base != other.base or len(self) != len(other):
+			raise ValueError('snapshots are of different statistics')
+
+	def __sub__(self, other):
+		self._check(other)
+		return StatSnapshot(self.base,
+		    map(_operator.sub, self, other), self.time, self.typecode)
+
+	def delta(self, previous):
+		'''delta(self, previous) -> StatSnapshot
+
+		Return the change in each statistic since a previous snapshot,
+		the same as self - previous.'''
+		return self - previous
+
+	def rate(self, previous):
+		'''rate(self, previous) -> StatSnapshot
+
+		Return the change in each statistic per second since a previous
+		snapshot, as floating point values.'''
+		self._check(previous)
+		elapsed = float(self.time - previous.time)
+		if elapsed <= 0:
+			raise ValueError('snapshots must be taken in time order')
+		return StatSnapshot(self.base,
+		    [d / elapsed for d in map(_operator.sub, self, previous)],
+		    self.time, 'd')
+
 class stat:
 	'''keys for statistics cursors'''
 
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# WiredTiger asyncio support
+
+"""asyncio front-end for WiredTiger asynchronous operations
+
+Operations run on the engine's asynchronous worker threads, configured with
+async=(enabled=true,threads=N) in wiredtiger_open, and return asyncio futures:
+
+    aconn = wiredtiger.aio.AsyncConnection(conn)
+    table = aconn.table('table:main')
+    await table.insert('key', 'value')
+    value = await table.search('key')
+    aconn.close()
+
+Completions are recorded by the worker threads without entering Python, and
+the event loop is woken through a single file descriptor to collect all of
+the completions that are waiting in one call.  When every operation handle
+is in use (see async=(ops_max)), new operations wait in a queue until earlier
+ones complete, so any number of operations can be in flight.
+
+A search resolves to the value, a single column is returned as itself and
+multiple columns as a list, like Cursor.get_value.  A search or remove of a
+key that doesn't exist raises KeyError, other failures WiredTigerError.
+"""
+
+try:
+    import asyncio
+except ImportError:
+    try:
+        import trollius as asyncio
+    except ImportError:
+        asyncio = None
+import collections
+import wiredtiger
+from wiredtiger import WiredTigerError, compile_format
+
+class AsyncTable(object):
+    '''Asynchronous operations on a single object, see AsyncConnection.'''
+
+    def __init__(self, aconn, uri, config, key_format, value_format):
+        self.aconn = aconn
+        self.uri = uri
+        self.config = config
+        self.key_format = key_format
+        self.value_format = value_format
+        self._key_plan = compile_format(key_format)
+        self._value_plan = compile_format(value_format)
+
+    def _pack_key(self, key):
+        if type(key) != tuple:
+            key = (key,)
+        return self._key_plan.pack(*key)
+
+    def _pack_value(self, value):
+        if type(value) != tuple:
+            value = (value,)
+        return self._value_plan.pack(*value)
+
+    def _unpack_value(self, value):
+        v = self._value_plan.unpack(value)
+        if len(v) == 1:
+            return v[0]
+        return v
+
+    def search(self, key):
+        '''Return a future for the value stored for key.'''
+        return self.aconn._submit(self, wiredtiger.WT_AOP_SEARCH,
+            self._pack_key(key), None, self._unpack_value)
+
+    def insert(self, key, value):
+        '''Return a future for inserting key and value.'''
+        return self.aconn._submit(self, wiredtiger.WT_AOP_INSERT,
+            self._pack_key(key), self._pack_value(value), None)
+
+    def update(self, key, value):
+        '''Return a future for updating the value for key.'''
+        return self.aconn._submit(self, wiredtiger.WT_AOP_UPDATE,
+            self._pack_key(key), self._pack_value(value), None)
+
+    def remove(self, key):
+        '''Return a future for removing key.'''
+        return self.aconn._submit(self, wiredtiger.WT_AOP_REMOVE,
+            self._pack_key(key), None, None)
+
+    def compact(self):
+        '''Return a future for compacting the object.'''
+        return self.aconn._submit(self, wiredtiger.WT_AOP_COMPACT,
+            None, None, None)
+
+class AsyncConnection(object):
+    '''Runs asynchronous operations on a connection from an asyncio event
+    loop.  The connection must have asynchronous operations enabled, and
+    must not be closed before this object is.
+
+    Without asyncio, any event loop with the add_reader, remove_reader and
+    create_future methods of asyncio's can be given.'''
+
+    def __init__(self, conn, loop=None):
+        if loop is None:
+            if asyncio is None:
+                raise WiredTigerError(
+                    'asyncio is not available, an event loop is required')
+            loop = asyncio.get_event_loop()
+        self.conn = conn
+        self.loop = loop
+        self._queue = conn._async_queue()
+        self._futures = {}
+        self._waiting = collections.deque()
+        self._tables = {}
+        self.loop.add_reader(self._queue.fileno(), self._drain)
+
+    def table(self, uri, config=None):
+        '''Return an AsyncTable for the object, config is passed to each
+        WT_CONNECTION::async_new_op call.'''
+        if (uri, config) not in self._tables:
+            session = self.conn.open_session()
+            try:
+                cursor = session.open_cursor(uri, None, None)
+                formats = (cursor.key_format, cursor.value_format)
+            finally:
+                session.close()
+            self._tables[(uri, config)] = \
+                AsyncTable(self, uri, config, *formats)
+        return self._tables[(uri, config)]
+
+    def _submit(self, table, optype, key, value, decode):
+        if self._queue is None:
+            raise WiredTigerError('AsyncConnection is closed')
+        if hasattr(self.loop, 'create_future'):
+            future = self.loop.create_future()
+        else:
+            future = asyncio.Future(loop=self.loop)
+        request = (table, optype, key, value, decode, future)
+        if self._waiting or not self._start(request):
+            self._waiting.append(request)
+        return future
+
+    # Start an operation, return False if there is no free handle for it.
+    def _start(self, request):
+        table, optype, key, value, decode, future = request
+        try:
+            opid = self._queue._submit(
+                table.uri, table.config, optype, key, value)
+        except WiredTigerError as e:
+            future.set_exception(e)
+            return True
+        if opid is None:
+            return False
+        self._futures[opid] = (future, decode)
+        return True
+
+    def _drain(self):
+        for opid, ret, value in self._queue._drain():
+            future, decode = self._futures.pop(opid)
+            if future.cancelled():
+                continue
+            if ret == 0:
+                future.set_result(decode(value) if decode else None)
+            elif ret == wiredtiger.WT_NOTFOUND:
+                future.set_exception(KeyError())
+            else:
+                future.set_exception(
+                    WiredTigerError(wiredtiger.wiredtiger_strerror(ret)))
+        while self._waiting and self._start(self._waiting[0]):
+            self._waiting.popleft()
+
+    def pending(self):
+        '''Return the number of operations that have not completed.'''
+        return len(self._futures) + len(self._waiting)
+
+    def close(self):
+        '''Wait for all submitted operations to complete, resolving their
+        futures, and stop watching for completions.'''
+        if self._queue is None:
+            return
+        while self._futures or self._waiting:
+            self.conn.async_flush()
+            self._drain()
+        self.loop.remove_reader(self._queue.fileno())
+        self._queue = None
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""Copy the files of a hot backup
+
+A backup cursor lists the files making up a consistent copy of the database
+and holds them stable while it's open; the application copies the files.
+copy() does the copying in the WiredTiger library, with a set of threads
+that share the files in chunks, so a large backup can keep the disks busy
+rather than a single core:
+
+    wiredtiger.backup.copy(session, '/backup/dir', threads=8,
+        throttle='200MB')
+
+The files are read and written buffer_size bytes at a time, and the copy
+sleeps as necessary to stay under throttle bytes per second.  With
+zero_copy, systems that support it copy the files in the kernel rather
+than reading them into memory.  Each file is copied under a temporary name
+and renamed into place once it's been synced, as the wt backup command
+does.  The calling thread waits for the copy, without holding the Python
+interpreter lock.
+"""
+
+def _config(threads, buffer_size, throttle, zero_copy):
+    config = ['threads=' + str(threads)]
+    if buffer_size is not None:
+        config.append('buffer_size=' + str(buffer_size))
+    if throttle:
+        config.append('throttle=' + str(throttle))
+    if zero_copy:
+        config.append('zero_copy=true')
+    return ','.join(config)
+
+def copy_cursor(cursor, directory, threads=1, buffer_size=None, throttle=0,
+        zero_copy=False):
+    '''copy_cursor(cursor, directory, threads=1, buffer_size=None,
+    throttle=0, zero_copy=False)
+
+    Copy the files listed by an open backup cursor into an existing
+    directory.  The cursor's remaining files are copied; the cursor is
+    left open.  Sizes may be numbers of bytes or strings such as '4MB'.'''
+    cursor._backup_copy(
+        directory, _config(threads, buffer_size, throttle, zero_copy))
+
+def copy(session, directory, targets=None, threads=1, buffer_size=None,
+        throttle=0, zero_copy=False):
+    '''copy(session, directory, targets=None, threads=1, buffer_size=None,
+    throttle=0, zero_copy=False)
+
+    Back up the database, or the data sources in the list targets, to an
+    existing directory, opening a backup cursor on session for the
+    duration of the copy.'''
+    config = None
+    if targets:
+        config = 'target=(' + \
+            ','.join('"' + uri + '"' for uri in targets) + ')'
+    cursor = session.open_cursor('backup:', None, config)
+    try:
+        copy_cursor(cursor, directory, threads, buffer_size, throttle,
+            zero_copy)
+    finally:
+        cursor.close()
@@ -66,9 +66,9 @@ def getbits(x, start, end=0):
     '''return the least significant bits of x, from start to end'''
     return (x & ((1 << start) - 1)) >> (end)
 
-def get_int(b, size):
+def get_int(b, size, start=0):
     r = 0
-    for i in xrange(size):
+    for i in xrange(start, start + size):
         r = (r << 8) | ord(b[i])
     return r
 
@@ -100,23 +100,30 @@ def pack_int(x):
             packed = packed[1:]
         return chr(POS_MULTI_MARKER | getbits(len(packed), 4)) + packed
 
-def unpack_int(b):
-    marker = ord(b[0])
+def unpack_int_at(b, pos):
+    '''unpack an integer starting at offset pos in b, return the value
+    and the offset following it'''
+    marker = ord(b[pos])
     if marker < NEG_2BYTE_MARKER:
         sz = 8 - getbits(marker, 4)
-        return ((-1 << (sz << 3)) | get_int(b[1:], sz), b[sz+1:])
+        return ((-1 << (sz << 3)) | get_int(b, sz, pos + 1), pos + sz + 1)
     elif marker < NEG_1BYTE_MARKER:
-        return (NEG_2BYTE_MIN + ((getbits(marker, 5) << 8) | ord(b[1])), b[2:])
+        return (NEG_2BYTE_MIN + ((getbits(marker, 5) << 8) | ord(b[pos + 1])),
+            pos + 2)
     elif marker < POS_1BYTE_MARKER:
-        return (NEG_1BYTE_MIN + getbits(marker, 6), b[1:])
+        return (NEG_1BYTE_MIN + getbits(marker, 6), pos + 1)
     elif marker < POS_2BYTE_MARKER:
-        return (getbits(marker, 6), b[1:])
+        return (getbits(marker, 6), pos + 1)
     elif marker < POS_MULTI_MARKER:
         return (POS_1BYTE_MAX + 1 +
-               ((getbits(marker, 5) << 8) | ord(b[1])), b[2:])
+               ((getbits(marker, 5) << 8) | ord(b[pos + 1])), pos + 2)
     else:
         sz = getbits(marker, 4)
-        return (POS_2BYTE_MAX + 1 + get_int(b[1:], sz), b[sz+1:])
+        return (POS_2BYTE_MAX + 1 + get_int(b, sz, pos + 1), pos + sz + 1)
+
+def unpack_int(b):
+    x, pos = unpack_int_at(b, 0)
+    return (x, b[pos:])
 
 # Sanity testing
 if __name__ == '__main__':
@@ -49,9 +49,10 @@ Format  Python  Notes
   u     str     raw byte array
 """
 
-from intpacking import pack_int, unpack_int
+import functools, itertools, threading
+from intpacking import pack_int, unpack_int_at
 
-def __get_type(fmt):
+def _get_type(fmt):
     if not fmt:
         return None, fmt
     # Variable-sized encoding is the default (and only supported format in v1)
@@ -62,7 +63,7 @@ def __get_type(fmt):
         tfmt = '.'
     return tfmt, fmt
 
-def __unpack_iter_fmt(fmt):
+def _iter_fmt(fmt):
     size = 0
     havesize = 0
     for offset, char in enumerate(fmt):
@@ -76,128 +77,235 @@ def __unpack_iter_fmt(fmt):
             size = 0
             havesize = 0
 
-def unpack(fmt, s):
-    tfmt, fmt = __get_type(fmt)
-    if not fmt:
-        return ()
-    if tfmt != '.':
-        raise ValueError('Only variable-length encoding is currently supported')
-    result = []
-    for offset, havesize, size, f in __unpack_iter_fmt(fmt):
-        if f == 'x':
-            s = s[size:]
-            # Note: no value, don't increment i
-        elif f in 'SsUu':
-            if not havesize:
-                if f == 's':
-                    pass
-                elif f == 'S':
-                    size = s.find('\0')
-                elif f == 'u' and offset == len(fmt) - 1:
-                    # A WT_ITEM with a NULL data field will be appear as None.
-                    if s == None:
-                        s = ''
-                    size = len(s)
-                else:
-                    # Note: 'U' is used internally, and may be exposed to us.
-                    # It indicates that the size is always stored unless there
-                    # is a size in the format.
-                    size, s = unpack_int(s)
-            result.append(s[:size])
-            if f == 'S' and not havesize:
-                size += 1
-            s = s[size:]
-        elif f in 't':
-            # bit type, size is number of bits
-            result.append(ord(s[0:1]))
-            s = s[1:]
-        elif f in 'Bb':
-            # byte type
-            for i in xrange(size):
-                v = ord(s[0:1])
-                if f != 'B':
-                    v -= 0x80
-                result.append(v)
-                s = s[1:]
+# Each field in a format is compiled into a pair of codecs.  A pack codec
+# takes the tuple of values and returns the packed string for its field, an
+# unpack codec takes the packed string, an offset and a result list, appends
+# the field's value to the list and returns the offset following the field.
+
+def _pad_codecs(size):
+    pad = '\0' * size
+    def pack_pad(values):
+        return pad
+    def unpack_pad(s, pos, result):
+        return pos + size
+    return pack_pad, unpack_pad
+
+def _string_codecs(index, f, havesize, size, last):
+    # Note: 'U' is used internally, and may be exposed to us.  It indicates
+    # that the size is always stored unless there is a size in the format.
+    prefixed = not havesize and ((f == 'u' and not last) or f == 'U')
+    truncate = havesize or f == 's'
+    def pack_string(values):
+        val = values[index]
+        if f == 'S' and '\0' in val:
+            l = val.find('\0')
         else:
-            # integral type
-            for j in xrange(size):
-                v, s = unpack_int(s)
-                result.append(v)
-    return result
-
-def __pack_iter_fmt(fmt, values):
-    index = 0
-    for offset, havesize, size, char in __unpack_iter_fmt(fmt):
-        if char == 'x':  # padding no value
-            yield offset, havesize, size, char, None
-        elif char in 'SsUut':
-            yield offset, havesize, size, char, values[index]
-            index += 1
-        else:            # integral type
-            size = size if havesize else 1
-            for i in xrange(size):
-                value = values[index]
-                yield offset, havesize, 1, char, value
-                index = index + 1
-
-def pack(fmt, *values):
-    tfmt, fmt = __get_type(fmt)
-    if not fmt:
-        return ()
-    if tfmt != '.':
-        raise ValueError('Only variable-length encoding is currently supported')
-    result = ''
-    i = 0
-    for offset, havesize, size, f, val in __pack_iter_fmt(fmt, values):
-        if f == 'x':
-            if not havesize:
-                result += '\0'
-            else:
-                result += '\0' * size
-            # Note: no value, don't increment i
-        elif f in 'SsUu':
-            if f == 'S' and '\0' in val:
-                l = val.find('\0')
-            else:
-                l = len(val)
-            if havesize or f == 's':
-                if l > size:
-                    l = size
-            elif (f == 'u' and offset != len(fmt) - 1) or f == 'U':
-                result += pack_int(l)
-            if type(val) is unicode and f in 'Ss':
-                result += str(val[:l])
+            l = len(val)
+        if truncate and l > size:
+            l = size
+        if type(val) is unicode and f in 'Ss':
+            result = str(val[:l])
+        else:
+            result = val[:l]
+        if prefixed:
+            result = pack_int(l) + result
+        if f == 'S' and not havesize:
+            result += '\0'
+        elif size > l and havesize:
+            result += '\0' * (size - l)
+        return result
+    def unpack_string(s, pos, result):
+        if havesize or f == 's':
+            end = pos + size
+        elif f == 'S':
+            end = s.find('\0', pos)
+            if end < 0:
+                end = len(s)
+            result.append(s[pos:end])
+            return end + 1
+        elif f == 'u' and last:
+            end = len(s)
+        else:
+            l, pos = unpack_int_at(s, pos)
+            end = pos + l
+        result.append(s[pos:end])
+        return end
+    return pack_string, unpack_string
+
+def _bits_codecs(index, size):
+    # bit type, size is number of bits
+    if size > 8:
+        raise ValueError("bit count cannot be greater than 8 for 't' encoding")
+    mask = (1 << size) - 1
+    def pack_bits(values):
+        val = values[index]
+        if (mask & val) != val:
+            raise ValueError("value out of range for 't' encoding")
+        return chr(val)
+    def unpack_bits(s, pos, result):
+        result.append(ord(s[pos]))
+        return pos + 1
+    return pack_bits, unpack_bits
+
+def _byte_codecs(index, f):
+    # Translate signed bytes to maintain ordering with the sign bit.
+    offset = 0 if f == 'B' else 0x80
+    def pack_byte(values):
+        v = values[index] + offset
+        if v > 255 or v < 0:
+            raise ValueError("value out of range for 'B' encoding")
+        return chr(v)
+    def unpack_byte(s, pos, result):
+        result.append(ord(s[pos]) - offset)
+        return pos + 1
+    return pack_byte, unpack_byte
+
+def _int_codecs(index):
+    def pack_integral(values):
+        return pack_int(values[index])
+    def unpack_integral(s, pos, result):
+        v, pos = unpack_int_at(s, pos)
+        result.append(v)
+        return pos
+    return pack_integral, unpack_integral
+
+class FormatPlan:
+    '''A format string parsed once into a list of field codecs, used to
+    pack and unpack values without parsing the format again'''
+    def __init__(self, fmt):
+        tfmt, fmt = _get_type(fmt)
+        if tfmt not in (None, '.'):
+            raise ValueError(
+                'Only variable-length encoding is currently supported')
+        self.fmt = fmt
+        self._tick = 0
+        self._packers = []
+        self._unpackers = []
+        index = 0
+        for offset, havesize, size, f in _iter_fmt(fmt):
+            if f == 'x':
+                codecs = [_pad_codecs(size)]
+            elif f in 'SsUu':
+                codecs = [_string_codecs(
+                    index, f, havesize, size, offset == len(fmt) - 1)]
+                index += 1
+            elif f == 't':
+                codecs = [_bits_codecs(index, size)]
+                index += 1
+            elif f in 'Bb':
+                codecs = [_byte_codecs(index + i, f) for i in xrange(size)]
+                index += size
             else:
-                result += val[:l]
-            if f == 'S' and not havesize:
-                result += '\0'
-            elif size > l and havesize:
-                result += '\0' * (size - l)
-        elif f in 't':
-            # bit type, size is number of bits
-            if not havesize:
-                size = 1
-            if size > 8:
-                raise ValueError("bit count cannot be greater than 8 for 't' encoding")
-            mask = (1 << size) - 1
-            if (mask & val) != val:
-                raise ValueError("value out of range for 't' encoding")
-            result += chr(val)
-        elif f in 'Bb':
-            # byte type
-            if not havesize:
-                size = 1
-            for i in xrange(size):
-                if f == 'B':
-                    v = val
-                else:
-                    # Translate to maintain ordering with the sign bit.
-                    v = val + 0x80
-                if v > 255 or v < 0:
-                    raise ValueError("value out of range for 'B' encoding")
-                result += chr(v)
+                # integral type
+                codecs = [_int_codecs(index + i) for i in xrange(size)]
+                index += size
+            for packer, unpacker in codecs:
+                self._packers.append(packer)
+                self._unpackers.append(unpacker)
+        if _packing is not None:
+            self.pack = functools.partial(_packing.pack, fmt)
+            self.unpack = functools.partial(_packing.unpack, fmt)
+            self.pack_into = functools.partial(_packing.pack_into, fmt)
+
+    def pack(self, *values):
+        '''pack the values, return a string'''
+        if not self.fmt:
+            return ()
+        return ''.join([packer(values) for packer in self._packers])
+
+    def pack_into(self, buf, *values):
+        '''pack the values into the start of a bytearray, growing it if
+        needed, return the packed size'''
+        s = self.pack(*values)
+        if s == ():
+            return 0
+        buf[:len(s)] = s
+        return len(s)
+
+    def unpack(self, s):
+        '''unpack a string, return a list of values'''
+        if not self.fmt:
+            return ()
+        # A WT_ITEM with a NULL data field will be appear as None.
+        if s == None:
+            s = ''
+        elif type(s) is not str:
+            # Buffers such as memoryviews are unpacked from a copy, the C
+            # implementation unpacks them in place.
+            s = memoryview(s).tobytes()
+        result = []
+        pos = 0
+        for unpacker in self._unpackers:
+            pos = unpacker(s, pos, result)
+        return result
+
+# NumPy types for the fixed-width format characters.  Records are unpacked
+# into native byte order, the packed encoding is only used in the tree.
+_numpy_types = {
+    'b' : 'i1', 'B' : 'u1', 'h' : 'i2', 'H' : 'u2',
+    'i' : 'i4', 'I' : 'u4', 'l' : 'i4', 'L' : 'u4',
+    'q' : 'i8', 'Q' : 'u8', 'r' : 'u8', 't' : 'u1',
+}
+
+def numpy_types(fmt):
+    '''return a list of NumPy type strings, one per column of fmt, raising
+    ValueError if a column doesn't have a fixed width'''
+    tfmt, fmt = _get_type(fmt)
+    if tfmt not in (None, '.'):
+        raise ValueError(
+            'Only variable-length encoding is currently supported')
+    types = []
+    for offset, havesize, size, f in _iter_fmt(fmt or ''):
+        if f == 'x':
+            continue
+        elif f == 's':
+            types.append('S%d' % size)
+        elif f == 't':
+            types.append(_numpy_types[f])
+        elif f in _numpy_types:
+            types.extend([_numpy_types[f]] * size)
         else:
-            # integral type
-            result += pack_int(val)
-    return result
+            raise ValueError(
+                "format '%s' has no fixed-width NumPy type" % f)
+    return types
+
+# Compiled formats are kept in a cache of the most recently used plans.
+# Lookups don't take the lock, each use of a plan records a tick so the
+# least recently used plan can be found when a new plan needs room.
+PLAN_CACHE_SIZE = 256
+_plans = {}
+_plans_lock = threading.Lock()
+_plan_ticks = itertools.count()
+
+def compile_format(fmt):
+    '''return the FormatPlan for a format string'''
+    plan = _plans.get(fmt)
+    if plan is None:
+        plan = FormatPlan(fmt)
+        with _plans_lock:
+            if len(_plans) >= PLAN_CACHE_SIZE:
+                oldest = min(_plans, key=lambda f: _plans[f]._tick)
+                del _plans[oldest]
+            _plans[fmt] = plan
+    plan._tick = next(_plan_ticks)
+    return plan
+
+def _unpack_python(fmt, s):
+    return FormatPlan.unpack(compile_format(fmt), s)
+
+def _pack_python(fmt, *values):
+    return FormatPlan.pack(compile_format(fmt), *values)
+
+def _pack_into_python(fmt, buf, *values):
+    return FormatPlan.pack_into(compile_format(fmt), buf, *values)
+
+# Use the C implementation from the _packing extension if it was built, with
+# the pure-Python versions as a fallback.
+try:
+    import _packing
+    pack, unpack = _packing.pack, _packing.unpack
+    pack_into = _packing.pack_into
+except ImportError:
+    _packing = None
+    pack, unpack = _pack_python, _unpack_python
+    pack_into = _pack_into_python
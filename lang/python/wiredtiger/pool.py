@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# WiredTiger session pool
+
+"""A thread-safe pool of WiredTiger sessions
+
+Opening and closing a session for each request in a multithreaded service
+is expensive, and leaves the number of sessions in use up to the request
+load.  A SessionPool keeps sessions open between uses, each with its own
+cursors, and never has more than max_sessions sessions open:
+
+    pool = wiredtiger.pool.SessionPool(conn, max_sessions=16,
+        cursors=['table:main'])
+    with pool.checkout() as s:
+        c = s.cursor('table:main')
+        c.set_key(key)
+        ...
+
+A pooled session can be used like a WiredTiger session, and its cursor(uri)
+method returns a cursor that stays open for as long as the session does.
+The cursors listed when the pool is created are opened with each session,
+other URIs are opened on first use.  Sessions checked out when the pool is
+full wait for one to be checked in, or raise PoolTimeout if a timeout was
+given.  Waiting releases the Python interpreter lock, as do the WiredTiger
+calls themselves.
+
+When a session is checked in, a transaction left running is rolled back and
+the session's cursors are reset, so no session carries positions, snapshots
+or transactions from one use to the next.  Sessions that fail that check, or
+the caller's own check function, are closed rather than returned to the
+pool.  Sessions idle for longer than idle_timeout seconds are closed, down
+to min_sessions.
+
+The sessions count against the connection's session_max, which should allow
+for every pool's max_sessions, the application's other sessions and the
+engine's internal sessions.
+"""
+
+import threading, time
+from wiredtiger import WiredTigerError
+
+class PoolTimeout(WiredTigerError):
+    '''No session was available in the time allowed'''
+    pass
+
+class PooledSession(object):
+    '''A session checked out of a SessionPool.
+
+    Session methods and attributes are available directly, cursor(uri)
+    returns the session's cached cursor for a URI.  Used in a with
+    statement, the session is checked in when the statement ends.'''
+
+    def __init__(self, pool, session):
+        self.pool = pool
+        self.session = session
+        self.cursors = {}
+        self.idle_since = None
+        self._checked_out = False
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    def cursor(self, uri):
+        '''cursor(self, uri) -> Cursor
+
+        The session's cursor for a URI, opened with the configuration given
+        to the pool for the URI, if any.  The cursor must not be closed; it
+        is reset when the session is checked in.'''
+        cursor = self.cursors.get(uri)
+        if cursor is None:
+            cursor = self.session.open_cursor(
+                uri, None, self.pool.cursor_config.get(uri))
+            self.cursors[uri] = cursor
+        return cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.pool.checkin(self)
+
+class SessionPool(object):
+    '''SessionPool(conn, max_sessions=16, min_sessions=0, config=None,
+    cursors=None, idle_timeout=None, check=None)
+
+    A pool of up to max_sessions sessions opened on conn with the session
+    configuration config.  The cursors opened with each session are given
+    as a list of URIs, or a dictionary mapping URIs to their cursor
+    configuration.  Idle sessions are closed after idle_timeout seconds,
+    leaving at least min_sessions open; with no idle_timeout, sessions stay
+    open until the pool is closed.  The function check is called with each
+    pooled session when it's checked in, and the session is closed if it
+    returns False or raises an exception.'''
+
+    def __init__(self, conn, max_sessions=16, min_sessions=0, config=None,
+            cursors=None, idle_timeout=None, check=None):
+        if max_sessions < 1 or min_sessions < 0 or \
+            min_sessions > max_sessions:
+            raise ValueError('invalid pool size')
+        self.conn = conn
+        self.max_sessions = max_sessions
+        self.min_sessions = min_sessions
+        self.config = config
+        if cursors is None:
+            cursors = {}
+        elif not isinstance(cursors, dict):
+            cursors = dict((uri, None) for uri in cursors)
+        self.cursor_config = cursors
+        self.idle_timeout = idle_timeout
+        self.check = check
+        self.closed = False
+        self._cond = threading.Condition(threading.Lock())
+        self._idle = []
+        self._open = 0
+        self._stats = dict.fromkeys(('opened', 'closed', 'checkouts',
+            'waits', 'timeouts', 'rollbacks', 'discards'), 0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open_session(self):
+        session = self.conn.open_session(self.config)
+        try:
+            pooled = PooledSession(self, session)
+            for uri in self.cursor_config:
+                pooled.cursor(uri)
+        except:
+            session.close()
+            raise
+        return pooled
+
+    def _close_sessions(self, sessions):
+        # Closing a session can fail if the application already closed it
+        # or the connection is gone, either way it's no longer open.
+        for pooled in sessions:
+            try:
+                pooled.session.close()
+            except Exception:
+                pass
+
+    def _expired(self, now):
+        # Remove sessions idle for too long, called with the lock held.
+        # The idle list is in checkin order, so the longest idle sessions
+        # are first, and reused sessions are taken from the end.
+        if self.idle_timeout is None:
+            return []
+        limit = now - self.idle_timeout
+        n = 0
+        while n < len(self._idle) and self._open - n > self.min_sessions \
+            and self._idle[n].idle_since < limit:
+            n += 1
+        expired = self._idle[:n]
+        del self._idle[:n]
+        self._open -= n
+        self._stats['closed'] += n
+        return expired
+
+    def reap(self):
+        '''reap(self) -> int
+
+        Close the sessions that have been idle longer than idle_timeout,
+        returning the number closed.  Sessions are also reaped as they are
+        checked out and in.'''
+        with self._cond:
+            expired = self._expired(time.time())
+        self._close_sessions(expired)
+        return len(expired)
+
+    def checkout(self, timeout=None):
+        '''checkout(self, timeout=None) -> PooledSession
+
+        Take a session from the pool, opening a new one if none is idle
+        and the pool isn't full, otherwise waiting for a session to be
+        checked in.  Waits at most timeout seconds if a timeout is given,
+        then raises PoolTimeout.'''
+        deadline = None
+        expired = []
+        with self._cond:
+            while True:
+                if self.closed:
+                    raise WiredTigerError('session pool is closed')
+                expired.extend(self._expired(time.time()))
+                if self._idle:
+                    pooled = self._idle.pop()
+                    break
+                if self._open < self.max_sessions:
+                    self._open += 1
+                    self._stats['opened'] += 1
+                    pooled = None
+                    break
+                if timeout is None:
+                    remaining = None
+                else:
+                    if deadline is None:
+                        deadline = time.time() + timeout
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        self._stats['timeouts'] += 1
+                        raise PoolTimeout('no session available in the '
+                            'session pool after %g seconds' % timeout)
+                self._stats['waits'] += 1
+                self._cond.wait(remaining)
+            self._stats['checkouts'] += 1
+        self._close_sessions(expired)
+
+        if pooled is None:
+            try:
+                pooled = self._open_session()
+            except:
+                with self._cond:
+                    self._open -= 1
+                    self._stats['opened'] -= 1
+                    self._cond.notify()
+                raise
+        pooled._checked_out = True
+        return pooled
+
+    def _healthy(self, pooled):
+        session = pooled.session
+        if session._txn_running():
+            session.rollback_transaction()
+            with self._cond:
+                self._stats['rollbacks'] += 1
+        for cursor in pooled.cursors.values():
+            cursor.reset()
+        return self.check is None or self.check(pooled)
+
+    def checkin(self, pooled):
+        '''checkin(self, pooled)
+
+        Return a session to the pool, rolling back any running transaction
+        and resetting its cursors.'''
+        if pooled.pool is not self or not pooled._checked_out:
+            raise ValueError('session is not checked out of this pool')
+        pooled._checked_out = False
+        try:
+            healthy = self._healthy(pooled)
+        except Exception:
+            healthy = False
+        discard = []
+        with self._cond:
+            if healthy and not self.closed:
+                pooled.idle_since = time.time()
+                self._idle.append(pooled)
+            else:
+                discard.append(pooled)
+                self._open -= 1
+                self._stats['closed'] += 1
+                if not healthy:
+                    self._stats['discards'] += 1
+            discard.extend(self._expired(time.time()))
+            self._cond.notify()
+        self._close_sessions(discard)
+
+    def stats(self):
+        '''stats(self) -> dict
+
+        Counts of the pool's sessions: open and idle sessions, sessions
+        opened and closed, checkouts, checkouts that waited or timed out,
+        transactions rolled back at checkin and sessions discarded after
+        failing their check.'''
+        with self._cond:
+            stats = dict(self._stats)
+            stats['open'] = self._open
+            stats['idle'] = len(self._idle)
+        return stats
+
+    def close(self):
+        '''close(self)
+
+        Close the idle sessions, and sessions still checked out as they are
+        checked in.  Sessions can't be checked out of a closed pool.'''
+        with self._cond:
+            self.closed = True
+            idle = self._idle
+            self._idle = []
+            self._open -= len(idle)
+            self._stats['closed'] += len(idle)
+            self._cond.notify_all()
+        self._close_sessions(idle)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# WiredTiger binary statistics log reader
+
+"""Reader for binary statistics log files
+
+A database configured with statistics_log=(wait=N,binary=true) writes its
+statistics log in a compact binary format: the description of each statistic
+once per file, then for each interval the change in every statistic since
+the previous interval.  StatLogReader streams a log file, returning each
+interval's statistics as wiredtiger.StatSnapshot arrays, indexed by the keys
+in wiredtiger.stat.conn or wiredtiger.stat.dsrc:
+
+    for when, sources in wiredtiger.statlog.StatLogReader(path):
+        print when, sources[home][wiredtiger.stat.conn.cursor_insert]
+
+The connection's statistics are logged with the database home as their
+name, data sources with their URI.  Only the current values of each source
+are held in memory.  A log can be read while it's being written: an interval
+whose records haven't all reached the file ends the iteration without being
+returned.
+"""
+
+from wiredtiger import StatSnapshot
+from wiredtiger.intpacking import unpack_int_at
+
+# Record types, see the description in src/conn/conn_stat.c.
+REC_HEADER = 1
+REC_SCHEMA = 2
+REC_SOURCE = 3
+REC_INTERVAL = 4
+REC_VALUES = 5
+REC_END = 6
+
+MAGIC = 'WTSL'
+VERSION = 1
+
+class StatLogError(Exception):
+    '''A statistics log file that can't be read'''
+    pass
+
+class _Truncated(Exception):
+    pass
+
+class StatLogReader(object):
+    '''StatLogReader(f, chunk=65536)
+
+    Iterate over a binary statistics log, given a path or a file opened
+    for reading, returning a (time, sources) pair for each interval, where
+    sources is a dictionary mapping the name of each source logged in the
+    interval to a StatSnapshot of its statistics.  The descriptions of the
+    statistics logged for a source are available from descriptions(name),
+    and the WiredTiger version that wrote the log from the version
+    attribute.'''
+
+    def __init__(self, f, chunk=65536):
+        if isinstance(f, basestring):
+            f = open(f, 'rb')
+        self._file = f
+        self._chunk = chunk
+        self._buf = ''
+        self._pos = 0
+        self._schemas = {}
+        self._sources = {}
+        self._names = {}
+        # The interval being read, kept so iteration can resume in it.
+        self._when, self._interval = None, {}
+        self.version = None
+
+    def close(self):
+        self._file.close()
+
+    def descriptions(self, name):
+        '''descriptions(self, name) -> tuple
+
+        The descriptions of the statistics logged for a source, in key
+        order.'''
+        return self._schemas[self._names[name][1]][1]
+
+    def _fill(self, n):
+        # Make n bytes available, return False at the end of the file.
+        while len(self._buf) - self._pos < n:
+            data = self._file.read(self._chunk)
+            if not data:
+                return False
+            self._buf = self._buf[self._pos:] + data
+            self._pos = 0
+        return True
+
+    def _bytes(self, n):
+        if not self._fill(n):
+            raise _Truncated()
+        pos = self._pos
+        self._pos += n
+        return self._buf[pos:self._pos]
+
+    def _int(self):
+        self._fill(9)
+        try:
+            x, self._pos = unpack_int_at(self._buf, self._pos)
+        except IndexError:
+            raise _Truncated()
+        return x
+
+    def _str(self):
+        return self._bytes(self._int())
+
+    def _header(self):
+        if self._bytes(len(MAGIC)) != MAGIC:
+            raise StatLogError('not a binary statistics log')
+        version = self._int()
+        if version > VERSION:
+            raise StatLogError(
+                'unsupported statistics log version %d' % version)
+        self.version = self._str()
+        # Each header starts over, sources and values aren't carried over.
+        self._schemas = {}
+        self._sources = {}
+        self._names = {}
+        self._when, self._interval = None, {}
+
+    def _schema(self):
+        schema = self._int()
+        base = self._int()
+        count = self._int()
+        self._schemas[schema] = \
+            (base, tuple(self._str() for i in xrange(count)))
+
+    def _source(self):
+        source = self._int()
+        schema = self._int()
+        name = self._str()
+        if schema not in self._schemas:
+            raise StatLogError('source %s has an unknown schema' % name)
+        entry = [name, schema, [0] * len(self._schemas[schema][1])]
+        self._sources[source] = entry
+        self._names[name] = entry
+
+    def _values(self):
+        source = self._int()
+        try:
+            name, schema, values = self._sources[source]
+        except KeyError:
+            raise StatLogError('values for an unknown source')
+        # Read a whole record before updating the source's values.
+        count = len(values)
+        self._fill(count * 9)
+        buf, pos = self._buf, self._pos
+        deltas = [0] * count
+        try:
+            for i in xrange(count):
+                deltas[i], pos = unpack_int_at(buf, pos)
+        except IndexError:
+            raise _Truncated()
+        self._pos = pos
+        values[:] = [v + d for v, d in zip(values, deltas)]
+        return name, self._schemas[schema][0], values
+
+    def __iter__(self):
+        while True:
+            start = self._pos
+            if not self._fill(1):
+                break
+            rectype = ord(self._buf[self._pos])
+            self._pos += 1
+            try:
+                if rectype == REC_HEADER:
+                    self._header()
+                elif rectype == REC_SCHEMA:
+                    self._schema()
+                elif rectype == REC_SOURCE:
+                    self._source()
+                elif rectype == REC_INTERVAL:
+                    secs = self._int()
+                    self._when = secs + self._int() / 1e9
+                    self._interval = {}
+                elif rectype == REC_VALUES:
+                    if self._when is None:
+                        raise StatLogError('values outside of an interval')
+                    name, base, values = self._values()
+                    self._interval[name] = \
+                        StatSnapshot(base, values, self._when)
+                elif rectype == REC_END:
+                    if self._when is None:
+                        raise StatLogError('end outside of an interval')
+                    when, sources = self._when, self._interval
+                    self._when, self._interval = None, {}
+                    yield when, sources
+                else:
+                    raise StatLogError(
+                        'unknown statistics log record type %d' % rectype)
+            except _Truncated:
+                # The rest of the file hasn't been written yet.
+                self._pos = start
+                return
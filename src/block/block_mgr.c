@@ -390,9 +390,9 @@ __bm_salvage_next(WT_BM *bm,
  *	Start a block manager salvage.
  */
 static int
-__bm_salvage_start(WT_BM *bm, WT_SESSION_IMPL *session)
+__bm_salvage_start(WT_BM *bm, WT_SESSION_IMPL *session, const char *cfg[])
 {
-	return (__wt_block_salvage_start(session, bm->block));
+	return (__wt_block_salvage_start(session, bm->block, cfg));
 }
 
 /*
@@ -400,8 +400,11 @@ __bm_salvage_start(WT_BM *bm, WT_SESSION_IMPL *session)
  *	Start a block manager salvage; readonly version.
  */
 static int
-__bm_salvage_start_readonly(WT_BM *bm, WT_SESSION_IMPL *session)
+__bm_salvage_start_readonly(
+    WT_BM *bm, WT_SESSION_IMPL *session, const char *cfg[])
 {
+	WT_UNUSED(cfg);
+
 	return (__bm_readonly(bm, session));
 }
 
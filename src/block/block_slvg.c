@@ -8,13 +8,32 @@
 
 #include "wt_internal.h"
 
+/*
+ * There's a bunch of stuff we pass to a salvage scan thread, group it
+ * together.
+ */
+typedef struct {
+	WT_SESSION_IMPL *session;		/* Thread session */
+	WT_BLOCK *block;			/* Underlying file */
+	WT_BLOCK_SLVG_RANGE *range;		/* Range to scan */
+
+	wt_thread_t tid;			/* Thread ID */
+	bool	    tid_set;			/* Thread started */
+	volatile bool done;			/* Thread finished */
+	int	    thread_ret;			/* Thread return */
+} WT_SLVG_SCAN;
+
+static int __block_salvage_scan_start(WT_SESSION_IMPL *, WT_BLOCK *, u_int);
+
 /*
  * __wt_block_salvage_start --
  *	Start a file salvage.
  */
 int
-__wt_block_salvage_start(WT_SESSION_IMPL *session, WT_BLOCK *block)
+__wt_block_salvage_start(
+    WT_SESSION_IMPL *session, WT_BLOCK *block, const char *cfg[])
 {
+	WT_CONFIG_ITEM cval;
 	wt_off_t len;
 	uint32_t allocsize;
 
@@ -56,9 +75,236 @@ __wt_block_salvage_start(WT_SESSION_IMPL *session, WT_BLOCK *block)
 	WT_ASSERT(session, block->ckpt_state == WT_CKPT_NONE);
 	block->ckpt_state = WT_CKPT_SALVAGE;
 
+	/*
+	 * Configuration: optionally scan the file for blocks in parallel, the
+	 * results are used as the file is read in order.
+	 */
+	WT_RET(__wt_config_gets(session, cfg, "threads", &cval));
+	if (cval.val > 1)
+		WT_RET(__block_salvage_scan_start(
+		    session, block, (u_int)cval.val));
+
 	return (0);
 }
 
+/*
+ * __block_salvage_scan_range --
+ *	Scan a range of the file for blocks, the same way salvage reads through
+ * the file.
+ */
+static int
+__block_salvage_scan_range(
+    WT_SESSION_IMPL *session, WT_BLOCK *block, WT_BLOCK_SLVG_RANGE *range)
+{
+	WT_BLOCK_HEADER *blk;
+	WT_BLOCK_SLVG_BLK *sblk;
+	WT_DECL_ITEM(tmp);
+	WT_DECL_RET;
+	wt_off_t offset;
+	uint32_t allocsize, checksum, size;
+
+	allocsize = block->allocsize;
+	WT_ERR(__wt_scr_alloc(session, allocsize, &tmp));
+
+	for (offset = range->start; offset < range->stop;) {
+		/*
+		 * Read the start of a possible page and get a page length from
+		 * it, if the block size is sane and the checksum matches, it's
+		 * a block, move past it; else, move to the next allocation
+		 * sized boundary.
+		 */
+		WT_ERR(__wt_read(
+		    session, block->fh, offset, (size_t)allocsize, tmp->mem));
+		blk = WT_BLOCK_HEADER_REF(tmp->mem);
+		__wt_block_header_byteswap(blk);
+		size = blk->disk_size;
+		checksum = blk->checksum;
+
+		if (!__wt_block_offset_invalid(block, offset, size) &&
+		    __wt_block_read_off(
+		    session, block, tmp, offset, size, checksum) == 0) {
+			WT_ERR(__wt_realloc_def(session, &range->blk_allocated,
+			    range->blk_entries + 1, &range->blk));
+			sblk = &range->blk[range->blk_entries++];
+			sblk->offset = offset;
+			sblk->size = size;
+			sblk->checksum = checksum;
+			offset += size;
+		} else
+			offset += allocsize;
+		range->scanned = offset - range->start;
+	}
+	range->complete = true;
+
+err:	__wt_scr_free(session, &tmp);
+	return (ret);
+}
+
+/*
+ * __block_salvage_scan --
+ *	Salvage scan thread.
+ */
+static WT_THREAD_RET
+__block_salvage_scan(void *arg)
+{
+	WT_SLVG_SCAN *scan;
+
+	scan = arg;
+	scan->thread_ret =
+	    __block_salvage_scan_range(scan->session, scan->block, scan->range);
+	WT_PUBLISH(scan->done, true);
+	return (WT_THREAD_RET_VALUE);
+}
+
+/*
+ * __block_salvage_scan_start --
+ *	Divide the file into ranges and scan them in parallel.
+ */
+static int
+__block_salvage_scan_start(
+    WT_SESSION_IMPL *session, WT_BLOCK *block, u_int threads)
+{
+	struct timespec start, stop;
+	WT_BLOCK_SLVG_RANGE *range;
+	WT_DECL_RET;
+	WT_SESSION *wt_session;
+	WT_SLVG_SCAN *scan, *scans;
+	wt_off_t len, scanned;
+	uint64_t found, msecs;
+	u_int i;
+	bool done;
+
+	scans = NULL;
+
+	/* Each thread scans at least one allocation-size block. */
+	len = (block->size - block->allocsize) / block->allocsize;
+	if ((wt_off_t)threads > len)
+		threads = (u_int)len;
+	if (threads <= 1)
+		return (0);
+	len = (len / threads) * block->allocsize;
+
+	WT_RET(__wt_calloc_def(session, threads, &block->slvg_range));
+	block->slvg_range_cnt = threads;
+	block->slvg_range_next = 0;
+	for (i = 0; i < threads; ++i) {
+		range = &block->slvg_range[i];
+		range->start = block->allocsize + (wt_off_t)i * len;
+		range->stop =
+		    i == threads - 1 ? block->size : range->start + len;
+	}
+
+	/*
+	 * Each thread gets its own session, we expect to see corrupted blocks,
+	 * turn off read checksum error messages.
+	 */
+	WT_ERR(__wt_calloc_def(session, threads, &scans));
+	__wt_epoch(session, &start);
+	for (i = 0; i < threads; ++i) {
+		scan = &scans[i];
+		scan->block = block;
+		scan->range = &block->slvg_range[i];
+		WT_ERR(__wt_open_internal_session(S2C(session), "salvage-scan",
+		    false, WT_SESSION_QUIET_CORRUPT_FILE, &scan->session));
+		WT_ERR(__wt_thread_create(
+		    session, &scan->tid, __block_salvage_scan, scan));
+		scan->tid_set = true;
+	}
+
+	/* Report progress while waiting for the threads. */
+	for (;;) {
+		done = true;
+		for (found = 0, i = 0; i < threads; ++i) {
+			if (!scans[i].done)
+				done = false;
+			found += scans[i].range->blk_entries;
+		}
+		if (done)
+			break;
+		WT_ERR(__wt_progress(session, "salvage scan", found));
+		__wt_sleep(0, 100 * WT_THOUSAND);
+	}
+
+err:	for (i = 0; scans != NULL && i < threads; ++i) {
+		scan = &scans[i];
+		if (scan->tid_set) {
+			WT_TRET(__wt_thread_join(session, scan->tid));
+			WT_TRET(scan->thread_ret);
+		}
+		if (scan->session != NULL) {
+			wt_session = &scan->session->iface;
+			WT_TRET(wt_session->close(wt_session, NULL));
+		}
+	}
+	__wt_free(session, scans);
+	WT_RET(ret);
+
+	for (found = 0, scanned = 0, i = 0; i < threads; ++i) {
+		found += block->slvg_range[i].blk_entries;
+		scanned += block->slvg_range[i].scanned;
+	}
+	__wt_epoch(session, &stop);
+	msecs = WT_TIMEDIFF_MS(stop, start);
+	__wt_verbose(session, WT_VERB_SALVAGE,
+	    "%s: %u threads scanned %" PRIu64 "MB in %" PRIu64 "ms "
+	    "(%" PRIu64 "MB/s), found %" PRIu64 " blocks",
+	    block->name, threads, (uint64_t)scanned / WT_MEGABYTE, msecs,
+	    (uint64_t)scanned / WT_MEGABYTE * WT_THOUSAND / WT_MAX(msecs, 1),
+	    found);
+	WT_UNUSED(msecs);			/* !HAVE_VERBOSE */
+	return (0);
+}
+
+/*
+ * __block_salvage_scanned --
+ *	Return if the parallel scan checked a file offset, and if so, whether
+ * a block was found there.
+ */
+static bool
+__block_salvage_scanned(WT_BLOCK *block,
+    wt_off_t offset, bool *foundp, uint32_t *sizep, uint32_t *checksump)
+{
+	WT_BLOCK_SLVG_BLK *sblk;
+	WT_BLOCK_SLVG_RANGE *range;
+
+	*foundp = false;
+
+	/* Salvage moves forward through the file, and so do we. */
+	for (;; ++block->slvg_range_next) {
+		if (block->slvg_range_next >= block->slvg_range_cnt)
+			return (false);
+		range = &block->slvg_range[block->slvg_range_next];
+		if (offset < range->stop)
+			break;
+	}
+	if (!range->complete || offset < range->start)
+		return (false);
+
+	/* Skip blocks ending before the offset. */
+	for (; range->blk_next < range->blk_entries; ++range->blk_next) {
+		sblk = &range->blk[range->blk_next];
+		if (sblk->offset + (wt_off_t)sblk->size > offset)
+			break;
+	}
+
+	/*
+	 * If the next block starts at the offset, we found a block.  If the
+	 * offset is inside the block, the offset was never checked.  If the
+	 * offset comes before any block, it was checked and rejected.
+	 */
+	if (range->blk_next < range->blk_entries) {
+		sblk = &range->blk[range->blk_next];
+		if (sblk->offset < offset)
+			return (false);
+		if (sblk->offset == offset) {
+			*foundp = true;
+			*sizep = sblk->size;
+			*checksump = sblk->checksum;
+		}
+	}
+	return (true);
+}
+
 /*
  * __wt_block_salvage_end --
  *	End a file salvage.
@@ -66,10 +312,18 @@ __wt_block_salvage_start(WT_SESSION_IMPL *session, WT_BLOCK *block)
 int
 __wt_block_salvage_end(WT_SESSION_IMPL *session, WT_BLOCK *block)
 {
+	u_int i;
+
 	/* Salvage performs a checkpoint but doesn't start or resolve it. */
 	WT_ASSERT(session, block->ckpt_state == WT_CKPT_SALVAGE);
 	block->ckpt_state = WT_CKPT_NONE;
 
+	/* Discard the results of any parallel scan. */
+	for (i = 0; i < block->slvg_range_cnt; ++i)
+		__wt_free(session, block->slvg_range[i].blk);
+	__wt_free(session, block->slvg_range);
+	block->slvg_range_cnt = block->slvg_range_next = 0;
+
 	/* Discard the checkpoint. */
 	return (__wt_block_checkpoint_unload(session, block, false));
 }
@@ -108,6 +362,7 @@ __wt_block_salvage_next(WT_SESSION_IMPL *session,
 	wt_off_t max, offset;
 	uint32_t allocsize, checksum, size;
 	uint8_t *endp;
+	bool found;
 
 	*eofp = 0;
 
@@ -124,27 +379,38 @@ __wt_block_salvage_next(WT_SESSION_IMPL *session,
 		}
 
 		/*
-		 * Read the start of a possible page (an allocation-size block),
-		 * and get a page length from it.  Move to the next allocation
-		 * sized boundary, we'll never consider this one again.
+		 * If a parallel scan already checked this offset, use the
+		 * result rather than reading the file again.
 		 */
-		WT_ERR(__wt_read(
-		    session, fh, offset, (size_t)allocsize, tmp->mem));
-		blk = WT_BLOCK_HEADER_REF(tmp->mem);
-		__wt_block_header_byteswap(blk);
-		size = blk->disk_size;
-		checksum = blk->checksum;
+		if (__block_salvage_scanned(
+		    block, offset, &found, &size, &checksum)) {
+			if (found)
+				break;
+		} else {
+			/*
+			 * Read the start of a possible page (an allocation-size
+			 * block), and get a page length from it.  Move to the
+			 * next allocation sized boundary, we'll never consider
+			 * this one again.
+			 */
+			WT_ERR(__wt_read(
+			    session, fh, offset, (size_t)allocsize, tmp->mem));
+			blk = WT_BLOCK_HEADER_REF(tmp->mem);
+			__wt_block_header_byteswap(blk);
+			size = blk->disk_size;
+			checksum = blk->checksum;
 
-		/*
-		 * Check the block size: if it's not insane, read the block.
-		 * Reading the block validates any checksum; if reading the
-		 * block succeeds, return its address as a possible page,
-		 * otherwise, move past it.
-		 */
-		if (!__wt_block_offset_invalid(block, offset, size) &&
-		    __wt_block_read_off(
-		    session, block, tmp, offset, size, checksum) == 0)
-			break;
+			/*
+			 * Check the block size: if it's not insane, read the
+			 * block.  Reading the block validates any checksum; if
+			 * reading the block succeeds, return its address as a
+			 * possible page, otherwise, move past it.
+			 */
+			if (!__wt_block_offset_invalid(block, offset, size) &&
+			    __wt_block_read_off(
+			    session, block, tmp, offset, size, checksum) == 0)
+				break;
+		}
 
 		/* Free the allocation-size block. */
 		__wt_verbose(session, WT_VERB_SALVAGE,
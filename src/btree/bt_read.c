@@ -322,7 +322,7 @@ __page_read(WT_SESSION_IMPL *session, WT_REF *ref, uint32_t flags)
 	size_t addr_size;
 	uint32_t page_flags, new_state, previous_state;
 	const uint8_t *addr;
-	bool timer;
+	bool latency, timer;
 
 	btree = S2BT(session);
 	page = NULL;
@@ -378,14 +378,20 @@ __page_read(WT_SESSION_IMPL *session, WT_REF *ref, uint32_t flags)
 	 * in-memory version of the page.
 	 */
 	timer = !F_ISSET(session, WT_SESSION_INTERNAL);
-	if (timer)
+	latency = WT_LATENCY_ENABLED(session);
+	if (timer || latency)
 		__wt_epoch(session, &start);
 	WT_ERR(__wt_bt_read(session, &tmp, addr, addr_size));
-	if (timer) {
+	if (timer || latency) {
 		__wt_epoch(session, &stop);
-		WT_STAT_CONN_INCR(session, cache_read_app_count);
-		WT_STAT_CONN_INCRV(session, cache_read_app_time,
-		    WT_TIMEDIFF_US(stop, start));
+		if (latency)
+			__wt_latency_record(session,
+			    WT_LATENCY_READ, WT_TIMEDIFF_NS(stop, start));
+		if (timer) {
+			WT_STAT_CONN_INCR(session, cache_read_app_count);
+			WT_STAT_CONN_INCRV(session, cache_read_app_time,
+			    WT_TIMEDIFF_US(stop, start));
+		}
 	}
 
 	/*
@@ -167,8 +167,6 @@ __wt_bt_salvage(WT_SESSION_IMPL *session, WT_CKPT *ckptbase, const char *cfg[])
 	WT_STUFF *ss, stuff;
 	uint32_t i, leaf_cnt;
 
-	WT_UNUSED(cfg);
-
 	btree = S2BT(session);
 	bm = btree->bm;
 
@@ -185,7 +183,7 @@ __wt_bt_salvage(WT_SESSION_IMPL *session, WT_CKPT *ckptbase, const char *cfg[])
 	 * Step 1:
 	 * Inform the underlying block manager that we're salvaging the file.
 	 */
-	WT_ERR(bm->salvage_start(bm, session));
+	WT_ERR(bm->salvage_start(bm, session, cfg));
 
 	/*
 	 * Step 2:
@@ -473,6 +471,10 @@ __slvg_read(WT_SESSION_IMPL *session, WT_STUFF *ss)
 		}
 	}
 
+	/* Report the final count. */
+	if (ss->fcnt != 0)
+		WT_ERR(__wt_progress(session, NULL, ss->fcnt));
+
 err:	__wt_scr_free(session, &as);
 	__wt_scr_free(session, &buf);
 
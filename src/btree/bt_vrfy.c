@@ -19,6 +19,7 @@ typedef struct {
 	WT_ITEM *max_addr;			/* Largest key page */
 
 	uint64_t fcnt;				/* Progress counter */
+	uint64_t bytes;				/* Page bytes verified */
 
 #define	WT_VRFY_DUMP(vs)						\
 	((vs)->dump_address ||						\
@@ -30,10 +31,60 @@ typedef struct {
 						/* Page layout information */
 	uint64_t depth, depth_internal[100], depth_leaf[100];
 
+	u_int threads;				/* Configure: threads */
+	bool worker;				/* Worker thread */
+	WT_SPINLOCK *bm_lock;			/* Worker block manager lock */
+
 	WT_ITEM *tmp1, *tmp2, *tmp3, *tmp4;	/* Temporary buffers */
 } WT_VSTUFF;
 
+/*
+ * Parallel verification divides the root page's subtrees into chunks, and
+ * worker threads verify the chunks.  Each chunk starts with the state a
+ * depth-first traversal would have on reaching the chunk's first subtree,
+ * and saves the state it ends with, the checks spanning chunks are done as
+ * the chunks are merged in order.
+ */
+typedef struct {
+	uint32_t start, stop;			/* Root page slots */
+
+	uint64_t record_total;			/* Total record count */
+	WT_ITEM max_key;			/* Largest key */
+	WT_ITEM max_addr;			/* Largest key page */
+
+	volatile bool done;			/* Chunk verified */
+	int chunk_ret;				/* Chunk failure */
+} WT_VCHUNK;
+
+typedef struct {
+	WT_BTREE *btree;			/* Tree being verified */
+	WT_REF *ref;				/* Root page */
+
+	WT_VCHUNK *chunk;			/* Chunks */
+	uint32_t chunk_cnt;
+	volatile uint32_t chunk_next;		/* Next chunk to verify */
+	volatile bool quit;			/* A chunk failed */
+
+	WT_SPINLOCK bm_lock;			/* Block manager lock */
+} WT_VPARALLEL;
+
+typedef struct {
+	WT_VPARALLEL *vp;			/* Shared information */
+
+	WT_SESSION_IMPL *session;		/* Worker session */
+	WT_VSTUFF vs;				/* Worker verification state */
+
+	wt_thread_t tid;			/* Worker thread */
+	bool tid_set;
+	volatile bool done;			/* Worker finished */
+	int thread_ret;				/* Worker return */
+} WT_VWORKER;
+
 static void __verify_checkpoint_reset(WT_VSTUFF *);
+static int  __verify_child(
+	WT_SESSION_IMPL *, WT_PAGE *, WT_REF *, uint32_t, bool, WT_VSTUFF *);
+static int  __verify_col_int_recno(
+	WT_SESSION_IMPL *, WT_REF *, uint32_t, WT_VSTUFF *);
 static int  __verify_overflow(
 	WT_SESSION_IMPL *, const uint8_t *, size_t, WT_VSTUFF *);
 static int  __verify_overflow_cell(
@@ -43,6 +94,7 @@ static int  __verify_row_int_key_order(
 static int  __verify_row_leaf_key_order(
 	WT_SESSION_IMPL *, WT_REF *, WT_VSTUFF *);
 static int  __verify_tree(WT_SESSION_IMPL *, WT_REF *, WT_VSTUFF *);
+static int  __verify_tree_parallel(WT_SESSION_IMPL *, WT_REF *, WT_VSTUFF *);
 
 /*
  * __verify_config --
@@ -65,6 +117,13 @@ __verify_config(WT_SESSION_IMPL *session, const char *cfg[], WT_VSTUFF *vs)
 	WT_RET(__wt_config_gets(session, cfg, "dump_pages", &cval));
 	vs->dump_pages = cval.val != 0;
 
+	/*
+	 * The dump options display the tree in order, they can't be combined
+	 * with parallel verification.
+	 */
+	WT_RET(__wt_config_gets(session, cfg, "threads", &cval));
+	vs->threads = WT_VRFY_DUMP(vs) ? 1 : (u_int)cval.val;
+
 #if !defined(HAVE_DIAGNOSTIC)
 	if (vs->dump_blocks || vs->dump_pages)
 		WT_RET_MSG(session, ENOTSUP,
@@ -111,6 +170,37 @@ __verify_config_offsets(
 	return (ret == WT_NOTFOUND ? 0 : ret);
 }
 
+/*
+ * __verify_vstuff_alloc --
+ *	Allocate the verification temporary buffers.
+ */
+static int
+__verify_vstuff_alloc(WT_SESSION_IMPL *session, WT_VSTUFF *vs)
+{
+	WT_RET(__wt_scr_alloc(session, 0, &vs->max_key));
+	WT_RET(__wt_scr_alloc(session, 0, &vs->max_addr));
+	WT_RET(__wt_scr_alloc(session, 0, &vs->tmp1));
+	WT_RET(__wt_scr_alloc(session, 0, &vs->tmp2));
+	WT_RET(__wt_scr_alloc(session, 0, &vs->tmp3));
+	WT_RET(__wt_scr_alloc(session, 0, &vs->tmp4));
+	return (0);
+}
+
+/*
+ * __verify_vstuff_free --
+ *	Free the verification temporary buffers.
+ */
+static void
+__verify_vstuff_free(WT_SESSION_IMPL *session, WT_VSTUFF *vs)
+{
+	__wt_scr_free(session, &vs->max_key);
+	__wt_scr_free(session, &vs->max_addr);
+	__wt_scr_free(session, &vs->tmp1);
+	__wt_scr_free(session, &vs->tmp2);
+	__wt_scr_free(session, &vs->tmp3);
+	__wt_scr_free(session, &vs->tmp4);
+}
+
 /*
  * __verify_layout --
  *	Dump the tree shape.
@@ -154,12 +244,14 @@ __verify_layout(WT_SESSION_IMPL *session, WT_VSTUFF *vs)
 int
 __wt_verify(WT_SESSION_IMPL *session, const char *cfg[])
 {
+	struct timespec start, stop;
 	WT_BM *bm;
 	WT_BTREE *btree;
 	WT_CKPT *ckptbase, *ckpt;
 	WT_DECL_RET;
 	WT_VSTUFF *vs, _vstuff;
 	size_t root_addr_size;
+	uint64_t msecs;
 	uint8_t root_addr[WT_BTREE_MAX_ADDR_COOKIE];
 	bool bm_start, quit;
 
@@ -170,12 +262,8 @@ __wt_verify(WT_SESSION_IMPL *session, const char *cfg[])
 
 	WT_CLEAR(_vstuff);
 	vs = &_vstuff;
-	WT_ERR(__wt_scr_alloc(session, 0, &vs->max_key));
-	WT_ERR(__wt_scr_alloc(session, 0, &vs->max_addr));
-	WT_ERR(__wt_scr_alloc(session, 0, &vs->tmp1));
-	WT_ERR(__wt_scr_alloc(session, 0, &vs->tmp2));
-	WT_ERR(__wt_scr_alloc(session, 0, &vs->tmp3));
-	WT_ERR(__wt_scr_alloc(session, 0, &vs->tmp4));
+	WT_ERR(__verify_vstuff_alloc(session, vs));
+	__wt_epoch(session, &start);
 
 	/* Check configuration strings. */
 	WT_ERR(__verify_config(session, cfg, vs));
@@ -267,6 +355,21 @@ __wt_verify(WT_SESSION_IMPL *session, const char *cfg[])
 			WT_ERR(__verify_layout(session, vs));
 	}
 
+	/* Report the final page count and the verification throughput. */
+	if (vs->fcnt != 0) {
+		WT_ERR(__wt_progress(session, NULL, vs->fcnt));
+
+		__wt_epoch(session, &stop);
+		msecs = WT_TIMEDIFF_MS(stop, start);
+		__wt_verbose(session, WT_VERB_VERIFY,
+		    "%s: %u threads verified %" PRIu64 " pages (%" PRIu64 "MB) "
+		    "in %" PRIu64 "ms (%" PRIu64 "MB/s)",
+		    btree->dhandle->name, vs->threads, vs->fcnt,
+		    vs->bytes / WT_MEGABYTE, msecs,
+		    vs->bytes / WT_MEGABYTE * WT_THOUSAND / WT_MAX(msecs, 1));
+		WT_UNUSED(msecs);			/* !HAVE_VERBOSE */
+	}
+
 done:
 err:	/* Inform the underlying block manager we're done. */
 	if (bm_start)
@@ -277,12 +380,7 @@ err:	/* Inform the underlying block manager we're done. */
 		__wt_meta_ckptlist_free(session, &ckptbase);
 
 	/* Free allocated memory. */
-	__wt_scr_free(session, &vs->max_key);
-	__wt_scr_free(session, &vs->max_addr);
-	__wt_scr_free(session, &vs->tmp1);
-	__wt_scr_free(session, &vs->tmp2);
-	__wt_scr_free(session, &vs->tmp3);
-	__wt_scr_free(session, &vs->tmp4);
+	__verify_vstuff_free(session, vs);
 
 	return (ret);
 }
@@ -317,18 +415,16 @@ __verify_checkpoint_reset(WT_VSTUFF *vs)
 static int
 __verify_tree(WT_SESSION_IMPL *session, WT_REF *ref, WT_VSTUFF *vs)
 {
-	WT_BM *bm;
 	WT_CELL *cell;
 	WT_CELL_UNPACK *unpack, _unpack;
 	WT_COL *cip;
-	WT_DECL_RET;
 	WT_PAGE *page;
+	WT_PAGE_INDEX *pindex;
 	WT_REF *child_ref;
 	uint64_t recno;
 	uint32_t entry, i;
 	bool found;
 
-	bm = S2BT(session)->bm;
 	page = ref->page;
 
 	unpack = &_unpack;
@@ -376,8 +472,11 @@ __verify_tree(WT_SESSION_IMPL *session, WT_REF *ref, WT_VSTUFF *vs)
 	 * Report progress occasionally.
 	 */
 #define	WT_VERIFY_PROGRESS_INTERVAL	100
-	if (++vs->fcnt % WT_VERIFY_PROGRESS_INTERVAL == 0)
+	++vs->fcnt;
+	if (!vs->worker && vs->fcnt % WT_VERIFY_PROGRESS_INTERVAL == 0)
 		WT_RET(__wt_progress(session, NULL, vs->fcnt));
+	if (page->dsk != NULL)
+		vs->bytes += page->dsk->mem_size;
 
 #ifdef HAVE_DIAGNOSTIC
 	/* Optionally dump the blocks or page in debugging mode. */
@@ -503,45 +602,77 @@ celltype_err:			WT_RET_MSG(session, WT_ERROR,
 	/* Check tree connections and recursively descend the tree. */
 	switch (page->type) {
 	case WT_PAGE_COL_INT:
+	case WT_PAGE_ROW_INT:
+		/*
+		 * Optionally divide the root page's subtrees among worker
+		 * threads.
+		 */
+		if (vs->threads > 1 && __wt_ref_is_root(ref)) {
+			WT_INTL_INDEX_GET(session, page, pindex);
+			if (pindex->entries > 1)
+				return (__verify_tree_parallel(
+				    session, ref, vs));
+		}
+
 		/* For each entry in an internal page, verify the subtree. */
 		entry = 0;
 		WT_INTL_FOREACH_BEGIN(session, page, child_ref) {
+			WT_RET(__verify_child(
+			    session, page, child_ref, ++entry, true, vs));
+		} WT_INTL_FOREACH_END;
+		break;
+	}
+	return (0);
+}
+
+/*
+ * __verify_addr --
+ *	Inform the block manager we've verified a block; worker threads share
+ * the block manager's verification lists.
+ */
+static int
+__verify_addr(WT_SESSION_IMPL *session,
+    const uint8_t *addr, size_t addr_size, WT_VSTUFF *vs)
+{
+	WT_BM *bm;
+	WT_DECL_RET;
+
+	bm = S2BT(session)->bm;
+
+	if (vs->bm_lock == NULL)
+		return (bm->verify_addr(bm, session, addr, addr_size));
+
+	__wt_spin_lock(session, vs->bm_lock);
+	ret = bm->verify_addr(bm, session, addr, addr_size);
+	__wt_spin_unlock(session, vs->bm_lock);
+	return (ret);
+}
+
+/*
+ * __verify_child --
+ *	Check an internal page entry's connection to the tree and verify the
+ * subtree it references.  The checks against the previous entry are optional
+ * because a parallel verification does them when merging chunks.
+ */
+static int
+__verify_child(WT_SESSION_IMPL *session, WT_PAGE *parent,
+    WT_REF *child_ref, uint32_t entry, bool check, WT_VSTUFF *vs)
+{
+	WT_CELL_UNPACK unpack;
+	WT_DECL_RET;
+
+	if (check)
+		switch (parent->type) {
+		case WT_PAGE_COL_INT:
 			/*
 			 * It's a depth-first traversal: this entry's starting
 			 * record number should be 1 more than the total records
 			 * reviewed to this point.
 			 */
-			++entry;
-			if (child_ref->ref_recno != vs->record_total + 1) {
-				WT_RET_MSG(session, WT_ERROR,
-				    "the starting record number in entry %"
-				    PRIu32 " of the column internal page at "
-				    "%s is %" PRIu64 " and the expected "
-				    "starting record number is %" PRIu64,
-				    entry,
-				    __wt_page_addr_string(
-				    session, child_ref, vs->tmp1),
-				    child_ref->ref_recno,
-				    vs->record_total + 1);
-			}
-
-			/* Verify the subtree. */
-			++vs->depth;
-			WT_RET(__wt_page_in(session, child_ref, 0));
-			ret = __verify_tree(session, child_ref, vs);
-			WT_TRET(__wt_page_release(session, child_ref, 0));
-			--vs->depth;
-			WT_RET(ret);
-
-			__wt_cell_unpack(child_ref->addr, unpack);
-			WT_RET(bm->verify_addr(
-			    bm, session, unpack->data, unpack->size));
-		} WT_INTL_FOREACH_END;
-		break;
-	case WT_PAGE_ROW_INT:
-		/* For each entry in an internal page, verify the subtree. */
-		entry = 0;
-		WT_INTL_FOREACH_BEGIN(session, page, child_ref) {
+			WT_RET(__verify_col_int_recno(
+			    session, child_ref, entry, vs));
+			break;
+		case WT_PAGE_ROW_INT:
 			/*
 			 * It's a depth-first traversal: this entry's starting
 			 * key should be larger than the largest key previously
@@ -550,25 +681,294 @@ celltype_err:			WT_RET_MSG(session, WT_ERROR,
 			 * The 0th key of any internal page is magic, and we
 			 * can't test against it.
 			 */
-			++entry;
 			if (entry != 1)
 				WT_RET(__verify_row_int_key_order(
-				    session, page, child_ref, entry, vs));
-
-			/* Verify the subtree. */
-			++vs->depth;
-			WT_RET(__wt_page_in(session, child_ref, 0));
-			ret = __verify_tree(session, child_ref, vs);
-			WT_TRET(__wt_page_release(session, child_ref, 0));
-			--vs->depth;
-			WT_RET(ret);
-
-			__wt_cell_unpack(child_ref->addr, unpack);
-			WT_RET(bm->verify_addr(
-			    bm, session, unpack->data, unpack->size));
-		} WT_INTL_FOREACH_END;
-		break;
+				    session, parent, child_ref, entry, vs));
+			break;
+		}
+
+	/* Verify the subtree. */
+	++vs->depth;
+	WT_RET(__wt_page_in(session, child_ref, 0));
+	ret = __verify_tree(session, child_ref, vs);
+	WT_TRET(__wt_page_release(session, child_ref, 0));
+	--vs->depth;
+	WT_RET(ret);
+
+	__wt_cell_unpack(child_ref->addr, &unpack);
+	return (__verify_addr(session, unpack.data, unpack.size, vs));
+}
+
+/*
+ * __verify_chunk --
+ *	Verify a chunk of the root page's subtrees.
+ */
+static int
+__verify_chunk(WT_SESSION_IMPL *session,
+    WT_PAGE *page, WT_PAGE_INDEX *pindex, WT_VCHUNK *chunk, WT_VSTUFF *vs)
+{
+	WT_ITEM item;
+	WT_REF *child_ref;
+	uint32_t slot;
+
+	/*
+	 * Set up the state a depth-first traversal would have after checking
+	 * the chunk's first entry against the previous chunk: the first entry's
+	 * record number is the next record, or the first entry's key is the
+	 * largest key seen.
+	 */
+	child_ref = pindex->index[chunk->start];
+	vs->record_total = chunk->record_total;
+	vs->max_addr->size = 0;
+	if (chunk->start != 0 && page->type == WT_PAGE_ROW_INT) {
+		__wt_ref_key(page, child_ref, &item.data, &item.size);
+		WT_RET(__wt_buf_set(
+		    session, vs->max_key, item.data, item.size));
+		(void)__wt_page_addr_string(session, child_ref, vs->max_addr);
+	}
+
+	for (slot = chunk->start; slot < chunk->stop; ++slot)
+		WT_RET(__verify_child(session, page, pindex->index[slot],
+		    slot + 1, slot == 0 || slot != chunk->start, vs));
+
+	/* Save the state the next chunk is checked against. */
+	chunk->record_total = vs->record_total;
+	WT_RET(__wt_buf_set(
+	    session, &chunk->max_key, vs->max_key->data, vs->max_key->size));
+	if (vs->max_addr->size == 0)
+		chunk->max_addr.size = 0;
+	else
+		WT_RET(__wt_buf_fmt(session,
+		    &chunk->max_addr, "%s", (char *)vs->max_addr->data));
+	return (0);
+}
+
+/*
+ * __verify_worker_chunks --
+ *	Verify chunks until there are none left or a chunk fails.
+ */
+static int
+__verify_worker_chunks(WT_SESSION_IMPL *session, WT_VWORKER *w)
+{
+	WT_DECL_RET;
+	WT_PAGE *page;
+	WT_PAGE_INDEX *pindex;
+	WT_VCHUNK *chunk;
+	WT_VPARALLEL *vp;
+	uint32_t i;
+
+	vp = w->vp;
+	page = vp->ref->page;
+	WT_INTL_INDEX_GET(session, page, pindex);
+
+	while (!vp->quit &&
+	    (i = __wt_atomic_addv32(&vp->chunk_next, 1) - 1) < vp->chunk_cnt) {
+		chunk = &vp->chunk[i];
+		if ((ret = __verify_chunk(
+		    session, page, pindex, chunk, &w->vs)) != 0) {
+			chunk->chunk_ret = ret;
+			vp->quit = true;
+			return (ret);
+		}
+		WT_PUBLISH(chunk->done, true);
+	}
+	return (0);
+}
+
+/*
+ * __verify_worker --
+ *	Verify worker thread.
+ */
+static WT_THREAD_RET
+__verify_worker(void *arg)
+{
+	WT_DECL_RET;
+	WT_SESSION_IMPL *session;
+	WT_VWORKER *w;
+
+	w = arg;
+	session = w->session;
+
+	WT_WITH_BTREE(session, w->vp->btree,
+	    WT_WITH_PAGE_INDEX(session,
+	    ret = __verify_worker_chunks(session, w)));
+
+	w->thread_ret = ret;
+	WT_PUBLISH(w->done, true);
+	return (WT_THREAD_RET_VALUE);
+}
+
+/*
+ * __verify_tree_parallel --
+ *	Verify the root page's subtrees using worker threads.
+ */
+static int
+__verify_tree_parallel(WT_SESSION_IMPL *session, WT_REF *ref, WT_VSTUFF *vs)
+{
+	WT_DECL_RET;
+	WT_PAGE *page;
+	WT_PAGE_INDEX *pindex;
+	WT_SESSION *wt_session;
+	WT_VCHUNK *chunk;
+	WT_VPARALLEL *vp, _vparallel;
+	WT_VWORKER *w, *workers;
+	uint64_t fcnt, fcnt_last;
+	uint32_t entries, i, threads;
+	size_t j;
+	bool done;
+
+	page = ref->page;
+	WT_INTL_INDEX_GET(session, page, pindex);
+	entries = pindex->entries;
+	threads = WT_MIN(vs->threads, entries);
+	workers = NULL;
+
+	WT_CLEAR(_vparallel);
+	vp = &_vparallel;
+	vp->btree = S2BT(session);
+	vp->ref = ref;
+	WT_RET(__wt_spin_init(session, &vp->bm_lock, "verify"));
+
+	/*
+	 * Divide the root page's entries into more chunks than there are
+	 * threads, subtrees aren't all the same size.
+	 */
+#define	WT_VERIFY_CHUNKS_PER_THREAD	4
+	vp->chunk_cnt =
+	    WT_MIN(entries, threads * WT_VERIFY_CHUNKS_PER_THREAD);
+	WT_ERR(__wt_calloc_def(session, vp->chunk_cnt, &vp->chunk));
+	for (i = 0; i < vp->chunk_cnt; ++i) {
+		chunk = &vp->chunk[i];
+		chunk->start =
+		    (uint32_t)((uint64_t)entries * i / vp->chunk_cnt);
+		chunk->stop =
+		    (uint32_t)((uint64_t)entries * (i + 1) / vp->chunk_cnt);
+		if (chunk->start == 0)
+			chunk->record_total = vs->record_total;
+		else if (page->type == WT_PAGE_COL_INT)
+			chunk->record_total =
+			    pindex->index[chunk->start]->ref_recno - 1;
+	}
+
+	/* Each worker thread gets its own session and verification state. */
+	WT_ERR(__wt_calloc_def(session, threads, &workers));
+	for (i = 0; i < threads; ++i) {
+		w = &workers[i];
+		w->vp = vp;
+		WT_ERR(__wt_open_internal_session(
+		    S2C(session), "verify-worker", false, 0, &w->session));
+		WT_ERR(__verify_vstuff_alloc(w->session, &w->vs));
+		w->vs.threads = 1;
+		w->vs.worker = true;
+		w->vs.bm_lock = &vp->bm_lock;
+		w->vs.depth = vs->depth;
+		WT_ERR(__wt_thread_create(
+		    session, &w->tid, __verify_worker, w));
+		w->tid_set = true;
+	}
+
+	/* Report progress while waiting for the workers. */
+	for (fcnt_last = vs->fcnt;;) {
+		done = true;
+		for (fcnt = vs->fcnt, i = 0; i < threads; ++i) {
+			if (!workers[i].done)
+				done = false;
+			fcnt += workers[i].vs.fcnt;
+		}
+		if (done)
+			break;
+		if (fcnt / WT_VERIFY_PROGRESS_INTERVAL !=
+		    fcnt_last / WT_VERIFY_PROGRESS_INTERVAL)
+			WT_ERR(__wt_progress(session, NULL, fcnt));
+		fcnt_last = fcnt;
+		__wt_sleep(0, 10 * WT_THOUSAND);
+	}
+
+err:	/* Wait for the workers and gather their counters. */
+	for (i = 0; workers != NULL && i < threads; ++i) {
+		w = &workers[i];
+		if (w->tid_set) {
+			WT_TRET(__wt_thread_join(session, w->tid));
+			vs->fcnt += w->vs.fcnt;
+			vs->bytes += w->vs.bytes;
+			for (j = 0; j < WT_ELEMENTS(vs->depth_internal); ++j) {
+				vs->depth_internal[j] +=
+				    w->vs.depth_internal[j];
+				vs->depth_leaf[j] += w->vs.depth_leaf[j];
+			}
+		}
+		if (w->session != NULL) {
+			__verify_vstuff_free(w->session, &w->vs);
+			wt_session = &w->session->iface;
+			WT_TRET(wt_session->close(wt_session, NULL));
+		}
+	}
+
+	/*
+	 * Merge the chunks in order, checking each chunk's first entry against
+	 * the state the previous chunk ended with.  If a chunk failed, return
+	 * the error from the first failed chunk.
+	 */
+	for (i = 0; ret == 0 && i < vp->chunk_cnt; ++i) {
+		chunk = &vp->chunk[i];
+		if (!chunk->done) {
+			for (; i < vp->chunk_cnt; ++i)
+				if ((ret = vp->chunk[i].chunk_ret) != 0)
+					break;
+			for (i = 0; ret == 0 && i < threads; ++i)
+				ret = workers[i].thread_ret;
+			WT_ASSERT(session, ret != 0);
+			break;
+		}
+		if (chunk->start != 0)
+			switch (page->type) {
+			case WT_PAGE_COL_INT:
+				WT_TRET(__verify_col_int_recno(session,
+				    pindex->index[chunk->start],
+				    chunk->start + 1, vs));
+				break;
+			case WT_PAGE_ROW_INT:
+				WT_TRET(__verify_row_int_key_order(session,
+				    page, pindex->index[chunk->start],
+				    chunk->start + 1, vs));
+				break;
+			}
+		vs->record_total = chunk->record_total;
+		WT_TRET(__wt_buf_set(session,
+		    vs->max_key, chunk->max_key.data, chunk->max_key.size));
+		if (chunk->max_addr.size == 0)
+			vs->max_addr->size = 0;
+		else
+			WT_TRET(__wt_buf_fmt(session, vs->max_addr,
+			    "%s", (char *)chunk->max_addr.data));
+	}
+
+	for (i = 0; vp->chunk != NULL && i < vp->chunk_cnt; ++i) {
+		__wt_buf_free(session, &vp->chunk[i].max_key);
+		__wt_buf_free(session, &vp->chunk[i].max_addr);
 	}
+	__wt_free(session, vp->chunk);
+	__wt_free(session, workers);
+	__wt_spin_destroy(session, &vp->bm_lock);
+	return (ret);
+}
+
+/*
+ * __verify_col_int_recno --
+ *	Compare the starting record number of an entry on a column-store
+ * internal page to the total records reviewed so far.
+ */
+static int
+__verify_col_int_recno(
+    WT_SESSION_IMPL *session, WT_REF *ref, uint32_t entry, WT_VSTUFF *vs)
+{
+	if (ref->ref_recno != vs->record_total + 1)
+		WT_RET_MSG(session, WT_ERROR,
+		    "the starting record number in entry %" PRIu32 " of the "
+		    "column internal page at %s is %" PRIu64 " and the "
+		    "expected starting record number is %" PRIu64,
+		    entry, __wt_page_addr_string(session, ref, vs->tmp1),
+		    ref->ref_recno, vs->record_total + 1);
 	return (0);
 }
 
@@ -741,11 +1141,8 @@ static int
 __verify_overflow(WT_SESSION_IMPL *session,
     const uint8_t *addr, size_t addr_size, WT_VSTUFF *vs)
 {
-	WT_BM *bm;
 	const WT_PAGE_HEADER *dsk;
 
-	bm = S2BT(session)->bm;
-
 	/* Read and verify the overflow item. */
 	WT_RET(__wt_bt_read(session, vs->tmp1, addr, addr_size));
 
@@ -760,6 +1157,7 @@ __verify_overflow(WT_SESSION_IMPL *session,
 		    "overflow referenced page at %s is not an overflow page",
 		    __wt_addr_string(session, addr, addr_size, vs->tmp1));
 
-	WT_RET(bm->verify_addr(bm, session, addr, addr_size));
-	return (0);
+	vs->bytes += dsk->mem_size;
+
+	return (__verify_addr(session, addr, addr_size, vs));
 }
@@ -8,6 +8,18 @@
 
 #include "wt_internal.h"
 
+/*
+ * Leaf page boundaries sampled by __wt_tree_walk_boundaries.
+ */
+typedef struct {
+	WT_ITEM	*keys;				/* Sampled leaf page keys */
+	u_int	 entries;			/* Sampled keys */
+	u_int	 max;				/* Maximum sampled keys */
+
+	uint64_t leaves;			/* Leaf pages seen */
+	uint64_t stride;			/* Sample every stride leaves */
+} WT_BOUNDARY_STUFF;
+
 /*
  * __ref_index_slot --
  *      Return the page's index and slot for a reference.
@@ -736,3 +748,154 @@ __wt_tree_walk_skip(
 
 	return (0);
 }
+
+/*
+ * __tree_walk_boundary_add --
+ *	Sample the starting key of a leaf page.
+ */
+static int
+__tree_walk_boundary_add(
+    WT_SESSION_IMPL *session, WT_REF *ref, WT_BOUNDARY_STUFF *bs)
+{
+	WT_ITEM tmp;
+	size_t size;
+	uint64_t leaf;
+	u_int i;
+	uint8_t *p;
+	const void *key;
+
+	/*
+	 * The first leaf page starts the tree, it's not a boundary. Sample
+	 * every stride'th leaf page after that; when the list fills, keep
+	 * every other entry and double the stride, so the samples stay evenly
+	 * spaced across the tree no matter how many leaf pages there are.
+	 */
+	leaf = bs->leaves++;
+	if (leaf == 0 || leaf % bs->stride != 0)
+		return (0);
+
+	if (S2BT(session)->type == BTREE_ROW) {
+		WT_WITH_PAGE_INDEX(session,
+		    __wt_ref_key(ref->home, ref, &key, &size));
+		WT_RET(__wt_buf_set(
+		    session, &bs->keys[bs->entries], key, size));
+	} else {
+		WT_RET(__wt_buf_init(
+		    session, &bs->keys[bs->entries], WT_INTPACK64_MAXSIZE));
+		p = bs->keys[bs->entries].mem;
+		WT_RET(__wt_vpack_uint(&p, 0, ref->ref_recno));
+		bs->keys[bs->entries].size =
+		    WT_PTRDIFF(p, bs->keys[bs->entries].mem);
+	}
+
+	if (++bs->entries == bs->max) {
+		for (i = 0; i < bs->max / 2; ++i) {
+			tmp = bs->keys[i];
+			bs->keys[i] = bs->keys[2 * i + 1];
+			bs->keys[2 * i + 1] = tmp;
+		}
+		bs->entries = bs->max / 2;
+		bs->stride *= 2;
+	}
+	return (0);
+}
+
+/*
+ * __tree_walk_boundary_callback --
+ *	Sample leaf pages we can identify from their address without reading
+ * them, and skip them.
+ */
+static int
+__tree_walk_boundary_callback(
+    WT_SESSION_IMPL *session, WT_REF *ref, void *context, bool *skipp)
+{
+	*skipp = false;
+	if (!__ref_is_leaf(ref))
+		return (0);
+	*skipp = true;
+	return (__tree_walk_boundary_add(
+	    session, ref, (WT_BOUNDARY_STUFF *)context));
+}
+
+/*
+ * __wt_tree_walk_boundaries --
+ *	Return up to n - 1 keys dividing the tree into n ranges with similar
+ * numbers of leaf pages, in key order. The keys are taken from the internal
+ * pages, only internal pages are read. Row-store keys are internal page keys,
+ * which may be truncated and don't have to exist in the tree; column-store
+ * keys are packed record numbers.
+ */
+int
+__wt_tree_walk_boundaries(
+    WT_SESSION_IMPL *session, u_int n, WT_ITEM **keysp, u_int *entriesp)
+{
+	WT_BOUNDARY_STUFF stuff, *bs;
+	WT_DECL_RET;
+	WT_ITEM *keys;
+	WT_REF *ref;
+	uint32_t flags;
+	u_int entries, i, slot;
+
+	*keysp = NULL;
+	*entriesp = 0;
+	if (n < 2)
+		return (0);
+
+	bs = &stuff;
+	WT_CLEAR(stuff);
+	bs->max = WT_MAX(64, 16 * n);
+	bs->stride = 1;
+	WT_RET(__wt_calloc_def(session, bs->max, &bs->keys));
+
+	/*
+	 * Walk the internal pages, leaf pages with a disk address are skipped
+	 * by the callback. Leaf pages that have never been written are read
+	 * by the walk, they're already in memory.
+	 */
+	flags = WT_READ_NO_GEN | WT_READ_SKIP_INTL | WT_READ_WONT_NEED;
+	for (ref = NULL;;) {
+		WT_ERR(__wt_tree_walk_custom_skip(session,
+		    &ref, __tree_walk_boundary_callback, bs, flags));
+		if (ref == NULL)
+			break;
+		WT_ERR(__tree_walk_boundary_add(session, ref, bs));
+	}
+
+	/*
+	 * Take n - 1 evenly spaced keys from the sample, moving them out of the
+	 * sample so it can be freed.
+	 */
+	entries = WT_MIN(n - 1, bs->entries);
+	if (entries != 0) {
+		WT_ERR(__wt_calloc_def(session, entries, &keys));
+		for (i = 0; i < entries; ++i) {
+			slot = (i + 1) * bs->entries / (entries + 1);
+			keys[i] = bs->keys[slot];
+			WT_CLEAR(bs->keys[slot]);
+		}
+		*keysp = keys;
+		*entriesp = entries;
+	}
+
+err:	if (ref != NULL)
+		WT_TRET(__wt_page_release(session, ref, flags));
+	__wt_tree_walk_boundaries_free(session, bs->keys, bs->max);
+	return (ret);
+}
+
+/*
+ * __wt_tree_walk_boundaries_free --
+ *	Free keys returned by __wt_tree_walk_boundaries.
+ */
+void
+__wt_tree_walk_boundaries_free(
+    WT_SESSION_IMPL *session, WT_ITEM *keys, u_int entries)
+{
+	u_int i;
+
+	if (keys == NULL)
+		return;
+	for (i = 0; i < entries; ++i)
+		__wt_buf_free(session, &keys[i]);
+	__wt_free(session, keys);
+}
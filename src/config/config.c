@@ -619,6 +619,44 @@ __config_getraw(
 	return (0);
 }
 
+/*
+ * __config_compiled_get --
+ *	Find a key's value in a compiled configuration, optionally only if the
+ *	application set it.  Returns -1 if the key can't be looked up in the
+ *	compiled values and the configuration must be parsed.
+ */
+static int
+__config_compiled_get(WT_CONFIG_COMPILED *compiled,
+    WT_CONFIG_ITEM *key, bool app_only, WT_CONFIG_ITEM *value)
+{
+	const WT_CONFIG_CHECK *checks;
+	u_int base, indx, limit;
+	int cmp;
+
+	/* Values are resolved for top-level keys. */
+	if (memchr(key->str, '.', key->len) != NULL)
+		return (-1);
+
+	/* Checks are sorted, as in __wt_config_check. */
+	checks = compiled->entry->checks;
+	for (base = 0, limit = compiled->entry->checks_entries;
+	    limit != 0; limit >>= 1) {
+		indx = base + (limit >> 1);
+		cmp = strncmp(checks[indx].name, key->str, key->len);
+		if (cmp == 0 && checks[indx].name[key->len] == '\0') {
+			if (app_only && !compiled->set[indx])
+				return (WT_NOTFOUND);
+			*value = compiled->values[indx];
+			return (0);
+		}
+		if (cmp < 0) {
+			base = indx + 1;
+			--limit;
+		}
+	}
+	return (WT_NOTFOUND);
+}
+
 /*
  * __wt_config_get --
  *	Given a NULL-terminated list of configuration strings, find
@@ -629,12 +667,23 @@ __wt_config_get(WT_SESSION_IMPL *session,
     const char **cfg_arg, WT_CONFIG_ITEM *key, WT_CONFIG_ITEM *value)
 {
 	WT_CONFIG cparser;
+	WT_CONFIG_COMPILED *compiled;
 	WT_DECL_RET;
 	const char **cfg;
 
 	if (cfg_arg[0] == NULL)
 		return (WT_NOTFOUND);
 
+	/*
+	 * A method's base configuration and a configuration compiled for it
+	 * have been resolved already.
+	 */
+	if (cfg_arg[1] != NULL && cfg_arg[2] == NULL &&
+	    (compiled = __wt_config_compiled(session, cfg_arg[1])) != NULL &&
+	    compiled->entry->base == cfg_arg[0] &&
+	    (ret = __config_compiled_get(compiled, key, false, value)) != -1)
+		return (ret);
+
 	/*
 	 * Search the strings in reverse order, that way the first hit wins
 	 * and we don't search the base set until there's no other choice.
@@ -747,6 +796,9 @@ __wt_config_gets_def(WT_SESSION_IMPL *session,
 	static const WT_CONFIG_ITEM false_value = {
 		"", 0, 0, WT_CONFIG_ITEM_NUM
 	};
+	WT_CONFIG_COMPILED *compiled;
+	WT_CONFIG_ITEM key_item = { NULL, 0, 0, WT_CONFIG_ITEM_STRING };
+	WT_DECL_RET;
 
 	*value = false_value;
 	value->val = def;
@@ -755,6 +807,16 @@ __wt_config_gets_def(WT_SESSION_IMPL *session,
 		return (0);
 
 	if (cfg[2] == NULL) {
+		compiled = __wt_config_compiled(session, cfg[1]);
+		if (compiled != NULL) {
+			key_item.str = key;
+			key_item.len = strlen(key);
+			if ((ret = __config_compiled_get(
+			    compiled, &key_item, true, value)) != -1) {
+				WT_RET_NOTFOUND_OK(ret);
+				return (0);
+			}
+		}
 		WT_RET_NOTFOUND_OK(
 		    __wt_config_getones(session, cfg[1], key, value));
 		return (0);
@@ -158,6 +158,127 @@ wiredtiger_config_validate(WT_SESSION *wt_session,
 	return (__wt_config_check(session, ep, config, 0));
 }
 
+/*
+ * __wt_config_compile --
+ *	Check a configuration string for a method once and return a handle
+ *	the method can use in its place without parsing or checking it again.
+ */
+int
+__wt_config_compile(WT_SESSION_IMPL *session,
+    const char *method, const char *config, const char **compiledp)
+{
+	WT_CONFIG_COMPILED *compiled;
+	WT_CONFIG_COMPILED_CHUNK *chunk;
+	WT_CONFIG_ITEM cval;
+	WT_CONNECTION_IMPL *conn;
+	WT_DECL_RET;
+	const WT_CONFIG_ENTRY *ep, **epp;
+	size_t chunk_size, len, size;
+	u_int i, entries;
+	char *copy;
+	const char *cfg[3];
+
+	*compiledp = NULL;
+	conn = S2C(session);
+
+	if (method == NULL)
+		WT_RET_MSG(session, EINVAL, "no method specified");
+	if (config == NULL)
+		config = "";
+
+	ep = NULL;
+	for (epp = conn->config_entries;
+	    *epp != NULL && (*epp)->method != NULL; ++epp)
+		if (strcmp((*epp)->method, method) == 0) {
+			ep = *epp;
+			break;
+		}
+	if (ep == NULL)
+		WT_RET_MSG(session, EINVAL,
+		    "unknown or unsupported configuration API: %s", method);
+	if (!ep->compilable || ep->checks_entries == 0)
+		WT_RET_MSG(session, ENOTSUP,
+		    "%s configurations cannot be compiled", method);
+
+	WT_RET(__wt_config_check(session, ep, config, 0));
+
+	/*
+	 * A compiled configuration is the structure, then a copy of the
+	 * string (the handle returned to the application), then a value and
+	 * a flag per key in the method's check table.  Everything is aligned
+	 * so the handle can be recognized by its address.
+	 */
+	entries = ep->checks_entries;
+	len = WT_ALIGN(strlen(config) + 1, sizeof(void *));
+	size = sizeof(WT_CONFIG_COMPILED) + len +
+	    entries * sizeof(WT_CONFIG_ITEM) +
+	    WT_ALIGN(entries, sizeof(void *));
+
+	/*
+	 * Add a chunk to the arena if the newest one is full.  Lookups don't
+	 * lock the arena, publish the chunk once it's initialized.
+	 */
+	__wt_spin_lock(session, &conn->api_lock);
+	chunk = conn->config_compiled;
+	if (chunk == NULL || chunk->used + size > chunk->size) {
+		chunk_size = WT_MAX(size, WT_CONFIG_COMPILED_CHUNK_SIZE);
+		WT_ERR(__wt_calloc(session, 1,
+		    sizeof(WT_CONFIG_COMPILED_CHUNK) + chunk_size, &chunk));
+		chunk->next = conn->config_compiled;
+		chunk->mem = (uint8_t *)(chunk + 1);
+		chunk->size = chunk_size;
+		WT_PUBLISH(conn->config_compiled, chunk);
+	}
+
+	compiled = (WT_CONFIG_COMPILED *)(chunk->mem + chunk->used);
+	copy = (char *)compiled + sizeof(WT_CONFIG_COMPILED);
+	memcpy(copy, config, strlen(config) + 1);
+	compiled->values = (WT_CONFIG_ITEM *)(copy + len);
+	compiled->set = (uint8_t *)(compiled->values + entries);
+
+	/*
+	 * Resolve every key against the method's defaults now, the handle
+	 * isn't visible yet so the lookups parse the copied string.
+	 */
+	cfg[0] = ep->base;
+	cfg[1] = copy;
+	cfg[2] = NULL;
+	for (i = 0; i < entries; ++i) {
+		WT_ERR(__wt_config_gets(
+		    session, cfg, ep->checks[i].name, &compiled->values[i]));
+		ret = __wt_config_getones(
+		    session, copy, ep->checks[i].name, &cval);
+		compiled->set[i] = ret == 0 ? 1 : 0;
+		WT_ERR_NOTFOUND_OK(ret);
+	}
+	compiled->entry = ep;
+	compiled->config = copy;
+
+	/* Publish the handle once it's complete. */
+	WT_PUBLISH(chunk->used, chunk->used + size);
+	*compiledp = copy;
+
+err:	__wt_spin_unlock(session, &conn->api_lock);
+	return (ret);
+}
+
+/*
+ * __wt_config_compiled_discard --
+ *	Free the connection's compiled configurations.
+ */
+void
+__wt_config_compiled_discard(WT_SESSION_IMPL *session)
+{
+	WT_CONFIG_COMPILED_CHUNK *chunk;
+	WT_CONNECTION_IMPL *conn;
+
+	conn = S2C(session);
+	while ((chunk = conn->config_compiled) != NULL) {
+		conn->config_compiled = chunk->next;
+		__wt_free(session, chunk);
+	}
+}
+
 /*
  * __conn_foc_add --
  *	Add a new entry into the connection's free-on-close list.
@@ -311,6 +432,7 @@ __wt_configure_method(WT_SESSION_IMPL *session,
 	WT_ERR(__wt_strdup(session, check, &newcheck->checks));
 	entry->checks = checks;
 	entry->checks_entries = 0;
+	entry->compilable = false;	/* Compiling requires sorted checks */
 
 	/*
 	 * Confirm the configuration string passes the new set of
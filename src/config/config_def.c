@@ -34,6 +34,7 @@ static const WT_CONFIG_CHECK confchk_WT_CONNECTION_load_extension[] = {
 };
 
 static const WT_CONFIG_CHECK confchk_WT_CONNECTION_open_session[] = {
+	{ "cache_cursors", "boolean", NULL, NULL, NULL, 0 },
 	{ "ignore_cache_size", "boolean", NULL, NULL, NULL, 0 },
 	{ "isolation", "string",
 	    NULL, "choices=[\"read-uncommitted\",\"read-committed\","
@@ -117,6 +118,7 @@ static const WT_CONFIG_CHECK
 
 static const WT_CONFIG_CHECK
     confchk_WT_CONNECTION_reconfigure_statistics_log_subconfigs[] = {
+	{ "binary", "boolean", NULL, NULL, NULL, 0 },
 	{ "json", "boolean", NULL, NULL, NULL, 0 },
 	{ "on_close", "boolean", NULL, NULL, NULL, 0 },
 	{ "sources", "list", NULL, NULL, NULL, 0 },
@@ -167,11 +169,11 @@ static const WT_CONFIG_CHECK confchk_WT_CONNECTION_reconfigure[] = {
 	    confchk_wiredtiger_open_shared_cache_subconfigs, 5 },
 	{ "statistics", "list",
 	    NULL, "choices=[\"all\",\"cache_walk\",\"fast\",\"none\","
-	    "\"clear\",\"tree_walk\"]",
+	    "\"clear\",\"latency\",\"tree_walk\"]",
 	    NULL, 0 },
 	{ "statistics_log", "category",
 	    NULL, NULL,
-	    confchk_WT_CONNECTION_reconfigure_statistics_log_subconfigs, 5 },
+	    confchk_WT_CONNECTION_reconfigure_statistics_log_subconfigs, 6 },
 	{ "timing_stress_for_test", "list",
 	    NULL, "choices=[\"checkpoint_slow\",\"internal_page_split_race\""
 	    ",\"page_split_race\"]",
@@ -420,6 +422,7 @@ static const WT_CONFIG_CHECK confchk_WT_SESSION_open_cursor[] = {
 };
 
 static const WT_CONFIG_CHECK confchk_WT_SESSION_reconfigure[] = {
+	{ "cache_cursors", "boolean", NULL, NULL, NULL, 0 },
 	{ "ignore_cache_size", "boolean", NULL, NULL, NULL, 0 },
 	{ "isolation", "string",
 	    NULL, "choices=[\"read-uncommitted\",\"read-committed\","
@@ -430,6 +433,7 @@ static const WT_CONFIG_CHECK confchk_WT_SESSION_reconfigure[] = {
 
 static const WT_CONFIG_CHECK confchk_WT_SESSION_salvage[] = {
 	{ "force", "boolean", NULL, NULL, NULL, 0 },
+	{ "threads", "int", NULL, "min=1,max=64", NULL, 0 },
 	{ NULL, NULL, NULL, NULL, NULL, 0 }
 };
 
@@ -468,6 +472,7 @@ static const WT_CONFIG_CHECK confchk_WT_SESSION_verify[] = {
 	{ "dump_offsets", "list", NULL, NULL, NULL, 0 },
 	{ "dump_pages", "boolean", NULL, NULL, NULL, 0 },
 	{ "strict", "boolean", NULL, NULL, NULL, 0 },
+	{ "threads", "int", NULL, "min=1,max=64", NULL, 0 },
 	{ NULL, NULL, NULL, NULL, NULL, 0 }
 };
 
@@ -735,6 +740,7 @@ static const WT_CONFIG_CHECK
 
 static const WT_CONFIG_CHECK
     confchk_wiredtiger_open_statistics_log_subconfigs[] = {
+	{ "binary", "boolean", NULL, NULL, NULL, 0 },
 	{ "json", "boolean", NULL, NULL, NULL, 0 },
 	{ "on_close", "boolean", NULL, NULL, NULL, 0 },
 	{ "path", "string", NULL, NULL, NULL, 0 },
@@ -818,11 +824,11 @@ static const WT_CONFIG_CHECK confchk_wiredtiger_open[] = {
 	    confchk_wiredtiger_open_shared_cache_subconfigs, 5 },
 	{ "statistics", "list",
 	    NULL, "choices=[\"all\",\"cache_walk\",\"fast\",\"none\","
-	    "\"clear\",\"tree_walk\"]",
+	    "\"clear\",\"latency\",\"tree_walk\"]",
 	    NULL, 0 },
 	{ "statistics_log", "category",
 	    NULL, NULL,
-	    confchk_wiredtiger_open_statistics_log_subconfigs, 6 },
+	    confchk_wiredtiger_open_statistics_log_subconfigs, 7 },
 	{ "timing_stress_for_test", "list",
 	    NULL, "choices=[\"checkpoint_slow\",\"internal_page_split_race\""
 	    ",\"page_split_race\"]",
@@ -913,11 +919,11 @@ static const WT_CONFIG_CHECK confchk_wiredtiger_open_all[] = {
 	    confchk_wiredtiger_open_shared_cache_subconfigs, 5 },
 	{ "statistics", "list",
 	    NULL, "choices=[\"all\",\"cache_walk\",\"fast\",\"none\","
-	    "\"clear\",\"tree_walk\"]",
+	    "\"clear\",\"latency\",\"tree_walk\"]",
 	    NULL, 0 },
 	{ "statistics_log", "category",
 	    NULL, NULL,
-	    confchk_wiredtiger_open_statistics_log_subconfigs, 6 },
+	    confchk_wiredtiger_open_statistics_log_subconfigs, 7 },
 	{ "timing_stress_for_test", "list",
 	    NULL, "choices=[\"checkpoint_slow\",\"internal_page_split_race\""
 	    ",\"page_split_race\"]",
@@ -1005,11 +1011,11 @@ static const WT_CONFIG_CHECK confchk_wiredtiger_open_basecfg[] = {
 	    confchk_wiredtiger_open_shared_cache_subconfigs, 5 },
 	{ "statistics", "list",
 	    NULL, "choices=[\"all\",\"cache_walk\",\"fast\",\"none\","
-	    "\"clear\",\"tree_walk\"]",
+	    "\"clear\",\"latency\",\"tree_walk\"]",
 	    NULL, 0 },
 	{ "statistics_log", "category",
 	    NULL, NULL,
-	    confchk_wiredtiger_open_statistics_log_subconfigs, 6 },
+	    confchk_wiredtiger_open_statistics_log_subconfigs, 7 },
 	{ "timing_stress_for_test", "list",
 	    NULL, "choices=[\"checkpoint_slow\",\"internal_page_split_race\""
 	    ",\"page_split_race\"]",
@@ -1095,11 +1101,11 @@ static const WT_CONFIG_CHECK confchk_wiredtiger_open_usercfg[] = {
 	    confchk_wiredtiger_open_shared_cache_subconfigs, 5 },
 	{ "statistics", "list",
 	    NULL, "choices=[\"all\",\"cache_walk\",\"fast\",\"none\","
-	    "\"clear\",\"tree_walk\"]",
+	    "\"clear\",\"latency\",\"tree_walk\"]",
 	    NULL, 0 },
 	{ "statistics_log", "category",
 	    NULL, NULL,
-	    confchk_wiredtiger_open_statistics_log_subconfigs, 6 },
+	    confchk_wiredtiger_open_statistics_log_subconfigs, 7 },
 	{ "timing_stress_for_test", "list",
 	    NULL, "choices=[\"checkpoint_slow\",\"internal_page_split_race\""
 	    ",\"page_split_race\"]",
@@ -1126,49 +1132,50 @@ static const WT_CONFIG_CHECK confchk_wiredtiger_open_usercfg[] = {
 static const WT_CONFIG_ENTRY config_entries[] = {
 	{ "WT_CONNECTION.add_collator",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_CONNECTION.add_compressor",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_CONNECTION.add_data_source",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_CONNECTION.add_encryptor",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_CONNECTION.add_extractor",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_CONNECTION.async_new_op",
 	  "append=false,overwrite=true,raw=false,timeout=1200",
-	  confchk_WT_CONNECTION_async_new_op, 4
+	  confchk_WT_CONNECTION_async_new_op, 4, false
 	},
 	{ "WT_CONNECTION.close",
 	  "leak_memory=false",
-	  confchk_WT_CONNECTION_close, 1
+	  confchk_WT_CONNECTION_close, 1, false
 	},
 	{ "WT_CONNECTION.debug_info",
 	  "cache=false,cursors=false,handles=false,log=false,sessions=false"
 	  ",txn=false",
-	  confchk_WT_CONNECTION_debug_info, 6
+	  confchk_WT_CONNECTION_debug_info, 6, false
 	},
 	{ "WT_CONNECTION.load_extension",
 	  "config=,early_load=false,entry=wiredtiger_extension_init,"
 	  "terminate=wiredtiger_extension_terminate",
-	  confchk_WT_CONNECTION_load_extension, 4
+	  confchk_WT_CONNECTION_load_extension, 4, false
 	},
 	{ "WT_CONNECTION.open_session",
-	  "ignore_cache_size=false,isolation=read-committed",
-	  confchk_WT_CONNECTION_open_session, 2
+	  "cache_cursors=false,ignore_cache_size=false,"
+	  "isolation=read-committed",
+	  confchk_WT_CONNECTION_open_session, 3, false
 	},
 	{ "WT_CONNECTION.query_timestamp",
 	  "get=all_committed",
-	  confchk_WT_CONNECTION_query_timestamp, 1
+	  confchk_WT_CONNECTION_query_timestamp, 1, false
 	},
 	{ "WT_CONNECTION.reconfigure",
 	  "async=(enabled=false,ops_max=1024,threads=2),cache_overhead=8,"
@@ -1181,57 +1188,57 @@ static const WT_CONFIG_ENTRY config_entries[] = {
 	  "close_scan_interval=10),log=(archive=true,prealloc=true,"
 	  "zero_fill=false),lsm_manager=(merge=true,worker_thread_max=4),"
 	  "lsm_merge=true,shared_cache=(chunk=10MB,name=,quota=0,reserve=0,"
-	  "size=500MB),statistics=none,statistics_log=(json=false,"
-	  "on_close=false,sources=,timestamp=\"%b %d %H:%M:%S\",wait=0),"
-	  "timing_stress_for_test=,verbose=",
-	  confchk_WT_CONNECTION_reconfigure, 21
+	  "size=500MB),statistics=none,statistics_log=(binary=false,"
+	  "json=false,on_close=false,sources=,timestamp=\"%b %d %H:%M:%S\","
+	  "wait=0),timing_stress_for_test=,verbose=",
+	  confchk_WT_CONNECTION_reconfigure, 21, false
 	},
 	{ "WT_CONNECTION.rollback_to_stable",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_CONNECTION.set_file_system",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_CONNECTION.set_timestamp",
 	  "commit_timestamp=,force=false,oldest_timestamp=,"
 	  "stable_timestamp=",
-	  confchk_WT_CONNECTION_set_timestamp, 4
+	  confchk_WT_CONNECTION_set_timestamp, 4, false
 	},
 	{ "WT_CURSOR.close",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_CURSOR.reconfigure",
 	  "append=false,overwrite=true",
-	  confchk_WT_CURSOR_reconfigure, 2
+	  confchk_WT_CURSOR_reconfigure, 2, false
 	},
 	{ "WT_SESSION.alter",
 	  "access_pattern_hint=none,assert=(commit_timestamp=none,"
 	  "read_timestamp=none),cache_resident=false,log=(enabled=true)",
-	  confchk_WT_SESSION_alter, 4
+	  confchk_WT_SESSION_alter, 4, false
 	},
 	{ "WT_SESSION.begin_transaction",
 	  "isolation=,name=,priority=0,read_timestamp=,"
 	  "round_to_oldest=false,snapshot=,sync=",
-	  confchk_WT_SESSION_begin_transaction, 7
+	  confchk_WT_SESSION_begin_transaction, 7, true
 	},
 	{ "WT_SESSION.checkpoint",
 	  "drop=,force=false,name=,target=,use_timestamp=true",
-	  confchk_WT_SESSION_checkpoint, 5
+	  confchk_WT_SESSION_checkpoint, 5, false
 	},
 	{ "WT_SESSION.close",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_SESSION.commit_transaction",
 	  "commit_timestamp=,sync=",
-	  confchk_WT_SESSION_commit_transaction, 2
+	  confchk_WT_SESSION_commit_transaction, 2, true
 	},
 	{ "WT_SESSION.compact",
 	  "timeout=1200",
-	  confchk_WT_SESSION_compact, 1
+	  confchk_WT_SESSION_compact, 1, false
 	},
 	{ "WT_SESSION.create",
 	  "access_pattern_hint=none,allocation_size=4KB,app_metadata=,"
@@ -1251,90 +1258,91 @@ static const WT_CONFIG_ENTRY config_entries[] = {
 	  "os_cache_dirty_max=0,os_cache_max=0,prefix_compression=false,"
 	  "prefix_compression_min=4,source=,split_deepen_min_child=0,"
 	  "split_deepen_per_child=0,split_pct=90,type=file,value_format=u",
-	  confchk_WT_SESSION_create, 43
+	  confchk_WT_SESSION_create, 43, false
 	},
 	{ "WT_SESSION.drop",
 	  "checkpoint_wait=true,force=false,lock_wait=true,"
 	  "remove_files=true",
-	  confchk_WT_SESSION_drop, 4
+	  confchk_WT_SESSION_drop, 4, false
 	},
 	{ "WT_SESSION.join",
 	  "bloom_bit_count=16,bloom_false_positives=false,"
 	  "bloom_hash_count=8,compare=\"eq\",count=,operation=\"and\","
 	  "strategy=",
-	  confchk_WT_SESSION_join, 7
+	  confchk_WT_SESSION_join, 7, false
 	},
 	{ "WT_SESSION.log_flush",
 	  "sync=on",
-	  confchk_WT_SESSION_log_flush, 1
+	  confchk_WT_SESSION_log_flush, 1, false
 	},
 	{ "WT_SESSION.log_printf",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_SESSION.open_cursor",
 	  "append=false,bulk=false,checkpoint=,checkpoint_wait=true,dump=,"
 	  "next_random=false,next_random_sample_size=0,overwrite=true,"
 	  "raw=false,readonly=false,skip_sort_check=false,statistics=,"
 	  "target=",
-	  confchk_WT_SESSION_open_cursor, 13
+	  confchk_WT_SESSION_open_cursor, 13, true
 	},
 	{ "WT_SESSION.rebalance",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_SESSION.reconfigure",
-	  "ignore_cache_size=false,isolation=read-committed",
-	  confchk_WT_SESSION_reconfigure, 2
+	  "cache_cursors=false,ignore_cache_size=false,"
+	  "isolation=read-committed",
+	  confchk_WT_SESSION_reconfigure, 3, false
 	},
 	{ "WT_SESSION.rename",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_SESSION.reset",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_SESSION.rollback_transaction",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_SESSION.salvage",
-	  "force=false",
-	  confchk_WT_SESSION_salvage, 1
+	  "force=false,threads=1",
+	  confchk_WT_SESSION_salvage, 2, false
 	},
 	{ "WT_SESSION.snapshot",
 	  "drop=(all=false,before=,names=,to=),include_updates=false,name=",
-	  confchk_WT_SESSION_snapshot, 3
+	  confchk_WT_SESSION_snapshot, 3, false
 	},
 	{ "WT_SESSION.strerror",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_SESSION.timestamp_transaction",
 	  "commit_timestamp=",
-	  confchk_WT_SESSION_timestamp_transaction, 1
+	  confchk_WT_SESSION_timestamp_transaction, 1, true
 	},
 	{ "WT_SESSION.transaction_sync",
 	  "timeout_ms=1200000",
-	  confchk_WT_SESSION_transaction_sync, 1
+	  confchk_WT_SESSION_transaction_sync, 1, false
 	},
 	{ "WT_SESSION.truncate",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_SESSION.upgrade",
 	  "",
-	  NULL, 0
+	  NULL, 0, false
 	},
 	{ "WT_SESSION.verify",
 	  "dump_address=false,dump_blocks=false,dump_layout=false,"
-	  "dump_offsets=,dump_pages=false,strict=false",
-	  confchk_WT_SESSION_verify, 6
+	  "dump_offsets=,dump_pages=false,strict=false,threads=1",
+	  confchk_WT_SESSION_verify, 7, false
 	},
 	{ "colgroup.meta",
 	  "app_metadata=,collator=,columns=,source=,type=file",
-	  confchk_colgroup_meta, 5
+	  confchk_colgroup_meta, 5, false
 	},
 	{ "file.config",
 	  "access_pattern_hint=none,allocation_size=4KB,app_metadata=,"
@@ -1350,7 +1358,7 @@ static const WT_CONFIG_ENTRY config_entries[] = {
 	  "os_cache_dirty_max=0,os_cache_max=0,prefix_compression=false,"
 	  "prefix_compression_min=4,split_deepen_min_child=0,"
 	  "split_deepen_per_child=0,split_pct=90,value_format=u",
-	  confchk_file_config, 36
+	  confchk_file_config, 36, false
 	},
 	{ "file.meta",
 	  "access_pattern_hint=none,allocation_size=4KB,app_metadata=,"
@@ -1367,12 +1375,12 @@ static const WT_CONFIG_ENTRY config_entries[] = {
 	  "os_cache_max=0,prefix_compression=false,prefix_compression_min=4"
 	  ",split_deepen_min_child=0,split_deepen_per_child=0,split_pct=90,"
 	  "value_format=u,version=(major=0,minor=0)",
-	  confchk_file_meta, 40
+	  confchk_file_meta, 40, false
 	},
 	{ "index.meta",
 	  "app_metadata=,collator=,columns=,extractor=,immutable=false,"
 	  "index_key_columns=,key_format=u,source=,type=file,value_format=u",
-	  confchk_index_meta, 10
+	  confchk_index_meta, 10, false
 	},
 	{ "lsm.meta",
 	  "access_pattern_hint=none,allocation_size=4KB,app_metadata=,"
@@ -1392,12 +1400,12 @@ static const WT_CONFIG_ENTRY config_entries[] = {
 	  "os_cache_dirty_max=0,os_cache_max=0,prefix_compression=false,"
 	  "prefix_compression_min=4,split_deepen_min_child=0,"
 	  "split_deepen_per_child=0,split_pct=90,value_format=u",
-	  confchk_lsm_meta, 40
+	  confchk_lsm_meta, 40, false
 	},
 	{ "table.meta",
 	  "app_metadata=,colgroups=,collator=,columns=,key_format=u,"
 	  "value_format=u",
-	  confchk_table_meta, 6
+	  confchk_table_meta, 6, false
 	},
 	{ "wiredtiger_open",
 	  "async=(enabled=false,ops_max=1024,threads=2),buffer_alignment=-1"
@@ -1416,12 +1424,13 @@ static const WT_CONFIG_ENTRY config_entries[] = {
 	  "lsm_manager=(merge=true,worker_thread_max=4),lsm_merge=true,"
 	  "mmap=true,multiprocess=false,readonly=false,session_max=100,"
 	  "session_scratch_max=2MB,shared_cache=(chunk=10MB,name=,quota=0,"
-	  "reserve=0,size=500MB),statistics=none,statistics_log=(json=false"
-	  ",on_close=false,path=\".\",sources=,timestamp=\"%b %d %H:%M:%S\""
-	  ",wait=0),timing_stress_for_test=,transaction_sync=(enabled=false"
-	  ",method=fsync),use_environment=true,use_environment_priv=false,"
+	  "reserve=0,size=500MB),statistics=none,"
+	  "statistics_log=(binary=false,json=false,on_close=false,"
+	  "path=\".\",sources=,timestamp=\"%b %d %H:%M:%S\",wait=0),"
+	  "timing_stress_for_test=,transaction_sync=(enabled=false,"
+	  "method=fsync),use_environment=true,use_environment_priv=false,"
 	  "verbose=,write_through=",
-	  confchk_wiredtiger_open, 42
+	  confchk_wiredtiger_open, 42, false
 	},
 	{ "wiredtiger_open_all",
 	  "async=(enabled=false,ops_max=1024,threads=2),buffer_alignment=-1"
@@ -1440,12 +1449,13 @@ static const WT_CONFIG_ENTRY config_entries[] = {
 	  "lsm_manager=(merge=true,worker_thread_max=4),lsm_merge=true,"
 	  "mmap=true,multiprocess=false,readonly=false,session_max=100,"
 	  "session_scratch_max=2MB,shared_cache=(chunk=10MB,name=,quota=0,"
-	  "reserve=0,size=500MB),statistics=none,statistics_log=(json=false"
-	  ",on_close=false,path=\".\",sources=,timestamp=\"%b %d %H:%M:%S\""
-	  ",wait=0),timing_stress_for_test=,transaction_sync=(enabled=false"
-	  ",method=fsync),use_environment=true,use_environment_priv=false,"
+	  "reserve=0,size=500MB),statistics=none,"
+	  "statistics_log=(binary=false,json=false,on_close=false,"
+	  "path=\".\",sources=,timestamp=\"%b %d %H:%M:%S\",wait=0),"
+	  "timing_stress_for_test=,transaction_sync=(enabled=false,"
+	  "method=fsync),use_environment=true,use_environment_priv=false,"
 	  "verbose=,version=(major=0,minor=0),write_through=",
-	  confchk_wiredtiger_open_all, 43
+	  confchk_wiredtiger_open_all, 43, false
 	},
 	{ "wiredtiger_open_basecfg",
 	  "async=(enabled=false,ops_max=1024,threads=2),buffer_alignment=-1"
@@ -1462,11 +1472,12 @@ static const WT_CONFIG_ENTRY config_entries[] = {
 	  "lsm_manager=(merge=true,worker_thread_max=4),lsm_merge=true,"
 	  "mmap=true,multiprocess=false,readonly=false,session_max=100,"
 	  "session_scratch_max=2MB,shared_cache=(chunk=10MB,name=,quota=0,"
-	  "reserve=0,size=500MB),statistics=none,statistics_log=(json=false"
-	  ",on_close=false,path=\".\",sources=,timestamp=\"%b %d %H:%M:%S\""
-	  ",wait=0),timing_stress_for_test=,transaction_sync=(enabled=false"
-	  ",method=fsync),verbose=,version=(major=0,minor=0),write_through=",
-	  confchk_wiredtiger_open_basecfg, 37
+	  "reserve=0,size=500MB),statistics=none,"
+	  "statistics_log=(binary=false,json=false,on_close=false,"
+	  "path=\".\",sources=,timestamp=\"%b %d %H:%M:%S\",wait=0),"
+	  "timing_stress_for_test=,transaction_sync=(enabled=false,"
+	  "method=fsync),verbose=,version=(major=0,minor=0),write_through=",
+	  confchk_wiredtiger_open_basecfg, 37, false
 	},
 	{ "wiredtiger_open_usercfg",
 	  "async=(enabled=false,ops_max=1024,threads=2),buffer_alignment=-1"
@@ -1483,13 +1494,14 @@ static const WT_CONFIG_ENTRY config_entries[] = {
 	  "lsm_manager=(merge=true,worker_thread_max=4),lsm_merge=true,"
 	  "mmap=true,multiprocess=false,readonly=false,session_max=100,"
 	  "session_scratch_max=2MB,shared_cache=(chunk=10MB,name=,quota=0,"
-	  "reserve=0,size=500MB),statistics=none,statistics_log=(json=false"
-	  ",on_close=false,path=\".\",sources=,timestamp=\"%b %d %H:%M:%S\""
-	  ",wait=0),timing_stress_for_test=,transaction_sync=(enabled=false"
-	  ",method=fsync),verbose=,write_through=",
-	  confchk_wiredtiger_open_usercfg, 36
+	  "reserve=0,size=500MB),statistics=none,"
+	  "statistics_log=(binary=false,json=false,on_close=false,"
+	  "path=\".\",sources=,timestamp=\"%b %d %H:%M:%S\",wait=0),"
+	  "timing_stress_for_test=,transaction_sync=(enabled=false,"
+	  "method=fsync),verbose=,write_through=",
+	  confchk_wiredtiger_open_usercfg, 36, false
 	},
-	{ NULL, NULL, NULL, 0 }
+	{ NULL, NULL, NULL, 0, false }
 };
 
 int
@@ -771,6 +771,7 @@ __conn_get_extension_api(WT_CONNECTION *wt_conn)
 	conn->extension_api.transaction_oldest = __wt_ext_transaction_oldest;
 	conn->extension_api.transaction_visible = __wt_ext_transaction_visible;
 	conn->extension_api.version = wiredtiger_version;
+	conn->extension_api.dump_split = __wt_ext_dump_split;
 
 	/* Streaming pack/unpack API */
 	conn->extension_api.pack_start = __wt_ext_pack_start;
@@ -1021,6 +1022,26 @@ __conn_configure_method(WT_CONNECTION *wt_conn, const char *method,
 err:	API_END_RET_NOTFOUND_MAP(session, ret);
 }
 
+/*
+ * __conn_compile_configuration --
+ *	WT_CONNECTION.compile_configuration method.
+ */
+static int
+__conn_compile_configuration(WT_CONNECTION *wt_conn,
+    const char *method, const char *config, const char **compiledp)
+{
+	WT_CONNECTION_IMPL *conn;
+	WT_DECL_RET;
+	WT_SESSION_IMPL *session;
+
+	conn = (WT_CONNECTION_IMPL *)wt_conn;
+	CONNECTION_API_CALL_NOCONF(conn, session, compile_configuration);
+
+	ret = __wt_config_compile(session, method, config, compiledp);
+
+err:	API_END_RET_NOTFOUND_MAP(session, ret);
+}
+
 /*
  * __conn_is_new --
  *	WT_CONNECTION->is_new method.
@@ -2266,7 +2287,8 @@ wiredtiger_open(const char *home, WT_EVENT_HANDLER *event_handler,
 		__conn_add_encryptor,
 		__conn_add_extractor,
 		__conn_set_file_system,
-		__conn_get_extension_api
+		__conn_get_extension_api,
+		__conn_compile_configuration
 	};
 	static const WT_NAME_FLAG file_types[] = {
 		{ "checkpoint",	WT_DIRECT_IO_CHECKPOINT },
@@ -112,6 +112,49 @@ __conn_dhandle_destroy(WT_SESSION_IMPL *session, WT_DATA_HANDLE *dhandle)
 	return (ret);
 }
 
+/*
+ * __conn_dhandle_hash_grow --
+ *	Double the size of the connection's data handle hash table.
+ */
+static int
+__conn_dhandle_hash_grow(WT_SESSION_IMPL *session)
+{
+	struct __wt_dhhash *dhhash;
+	WT_CONNECTION_IMPL *conn;
+	WT_DATA_HANDLE *dhandle;
+	u_int i, size;
+
+	conn = S2C(session);
+
+	WT_ASSERT(session,
+	    F_ISSET(session, WT_SESSION_LOCKED_HANDLE_LIST_WRITE));
+
+	size = conn->dhhash_size * 2;
+	WT_RET(__wt_calloc(session, size, sizeof(*dhhash), &dhhash));
+	for (i = 0; i < size; i++)
+		TAILQ_INIT(&dhhash[i]);
+
+	/*
+	 * Move the handles to their new buckets, appending them so that handles
+	 * with the same name stay in the same order.  Threads walking a bucket
+	 * with the handle list lock released (see __wt_conn_btree_apply) hold
+	 * a reference to their current handle, and will continue from it along
+	 * its new bucket, seeing the same handles they would have seen before.
+	 */
+	for (i = 0; i < conn->dhhash_size; i++)
+		while ((dhandle = TAILQ_FIRST(&conn->dhhash[i])) != NULL) {
+			TAILQ_REMOVE(&conn->dhhash[i], dhandle, hashq);
+			TAILQ_INSERT_TAIL(
+			    &dhhash[dhandle->name_hash % size], dhandle, hashq);
+		}
+
+	__wt_free(session, conn->dhhash);
+	conn->dhhash = dhhash;
+	conn->dhhash_size = size;
+	WT_STAT_CONN_INCR(session, dh_conn_hash_resize);
+	return (0);
+}
+
 /*
  * __wt_conn_dhandle_alloc --
  *	Allocate a new data handle and return it linked into the connection's
@@ -122,11 +165,14 @@ __wt_conn_dhandle_alloc(
     WT_SESSION_IMPL *session, const char *uri, const char *checkpoint)
 {
 	WT_BTREE *btree;
+	WT_CONNECTION_IMPL *conn;
 	WT_DATA_HANDLE *dhandle;
 	WT_DECL_RET;
 	WT_TABLE *table;
 	uint64_t bucket;
 
+	conn = S2C(session);
+
 	/*
 	 * Ensure no one beat us to creating the handle now that we hold the
 	 * write lock.
@@ -176,9 +222,13 @@ __wt_conn_dhandle_alloc(
 	/*
 	 * Prepend the handle to the connection list, assuming we're likely to
 	 * need new files again soon, until they are cached by all sessions.
+	 * Grow the hash table first if its chains are getting long: failing
+	 * to grow it isn't an error, lookups are only slower.
 	 */
-	bucket = dhandle->name_hash % WT_HASH_ARRAY_SIZE;
-	WT_CONN_DHANDLE_INSERT(S2C(session), dhandle, bucket);
+	if (conn->dhandle_count >= conn->dhhash_size * WT_DHANDLE_HASH_LOAD)
+		WT_IGNORE_RET(__conn_dhandle_hash_grow(session));
+	bucket = dhandle->name_hash % conn->dhhash_size;
+	WT_CONN_DHANDLE_INSERT(conn, dhandle, bucket);
 
 	session->dhandle = dhandle;
 	return (0);
@@ -197,37 +247,37 @@ __wt_conn_dhandle_find(
 {
 	WT_CONNECTION_IMPL *conn;
 	WT_DATA_HANDLE *dhandle;
-	uint64_t bucket;
+	uint64_t bucket, hash, walked;
 
 	conn = S2C(session);
 
 	/* We must be holding the handle list lock at a higher level. */
 	WT_ASSERT(session, F_ISSET(session, WT_SESSION_LOCKED_HANDLE_LIST));
 
-	bucket = __wt_hash_city64(uri, strlen(uri)) % WT_HASH_ARRAY_SIZE;
-	if (checkpoint == NULL) {
-		TAILQ_FOREACH(dhandle, &conn->dhhash[bucket], hashq) {
-			if (F_ISSET(dhandle, WT_DHANDLE_DEAD))
-				continue;
+	hash = __wt_hash_city64(uri, strlen(uri));
+	bucket = hash % conn->dhhash_size;
+	walked = 0;
+	TAILQ_FOREACH(dhandle, &conn->dhhash[bucket], hashq) {
+		++walked;
+		if (dhandle->name_hash != hash ||
+		    F_ISSET(dhandle, WT_DHANDLE_DEAD))
+			continue;
+		if (checkpoint == NULL) {
 			if (dhandle->checkpoint == NULL &&
-			    strcmp(uri, dhandle->name) == 0) {
-				session->dhandle = dhandle;
-				return (0);
-			}
-		}
-	} else
-		TAILQ_FOREACH(dhandle, &conn->dhhash[bucket], hashq) {
-			if (F_ISSET(dhandle, WT_DHANDLE_DEAD))
-				continue;
-			if (dhandle->checkpoint != NULL &&
-			    strcmp(uri, dhandle->name) == 0 &&
-			    strcmp(checkpoint, dhandle->checkpoint) == 0) {
-				session->dhandle = dhandle;
-				return (0);
-			}
-		}
+			    strcmp(uri, dhandle->name) == 0)
+				break;
+		} else if (dhandle->checkpoint != NULL &&
+		    strcmp(uri, dhandle->name) == 0 &&
+		    strcmp(checkpoint, dhandle->checkpoint) == 0)
+			break;
+	}
 
-	return (WT_NOTFOUND);
+	WT_STAT_CONN_INCR(session, dh_conn_hash_lookup);
+	WT_STAT_CONN_INCRV(session, dh_conn_hash_walk, walked);
+	if (dhandle == NULL)
+		return (WT_NOTFOUND);
+	session->dhandle = dhandle;
+	return (0);
 }
 
 /*
@@ -538,22 +588,23 @@ __wt_conn_btree_apply(WT_SESSION_IMPL *session, const char *uri,
 	WT_CONNECTION_IMPL *conn;
 	WT_DATA_HANDLE *dhandle;
 	WT_DECL_RET;
-	uint64_t bucket;
+	uint64_t hash;
 
 	conn = S2C(session);
 
 	/*
 	 * If we're given a URI, then we walk only the hash list for that
 	 * name.  If we don't have a URI we walk the entire dhandle list.
+	 * The hash table can be resized while we aren't holding the handle
+	 * list lock, choose the bucket with the lock held.
 	 */
 	if (uri != NULL) {
-		bucket =
-		    __wt_hash_city64(uri, strlen(uri)) % WT_HASH_ARRAY_SIZE;
+		hash = __wt_hash_city64(uri, strlen(uri));
 
 		for (dhandle = NULL;;) {
 			WT_WITH_HANDLE_LIST_READ_LOCK(session,
 			    WT_DHANDLE_NEXT(session, dhandle,
-			    &conn->dhhash[bucket], hashq));
+			    &conn->dhhash[hash % conn->dhhash_size], hashq));
 			if (dhandle == NULL)
 				return (0);
 
@@ -657,7 +708,7 @@ __wt_conn_dhandle_close_all(
 	 */
 	WT_ERR(__conn_dhandle_close_one(session, uri, NULL, mark_dead));
 
-	bucket = __wt_hash_city64(uri, strlen(uri)) % WT_HASH_ARRAY_SIZE;
+	bucket = __wt_hash_city64(uri, strlen(uri)) % conn->dhhash_size;
 	TAILQ_FOREACH(dhandle, &conn->dhhash[bucket], hashq) {
 		if (strcmp(dhandle->name, uri) != 0 ||
 		    dhandle->checkpoint == NULL ||
@@ -685,7 +736,7 @@ __conn_dhandle_remove(WT_SESSION_IMPL *session, bool final)
 
 	conn = S2C(session);
 	dhandle = session->dhandle;
-	bucket = dhandle->name_hash % WT_HASH_ARRAY_SIZE;
+	bucket = dhandle->name_hash % conn->dhhash_size;
 
 	WT_ASSERT(session,
 	    F_ISSET(session, WT_SESSION_LOCKED_HANDLE_LIST_WRITE));
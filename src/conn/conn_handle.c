@@ -20,6 +20,9 @@ __wt_connection_init(WT_CONNECTION_IMPL *conn)
 
 	session = conn->default_session;
 
+	WT_RET(__wt_calloc(session, WT_HASH_ARRAY_SIZE,
+	    sizeof(struct __wt_dhhash), &conn->dhhash));
+	conn->dhhash_size = WT_HASH_ARRAY_SIZE;
 	for (i = 0; i < WT_HASH_ARRAY_SIZE; i++) {
 		TAILQ_INIT(&conn->dhhash[i]);	/* Data handle hash lists */
 		TAILQ_INIT(&conn->fhhash[i]);	/* File handle hash lists */
@@ -117,6 +120,8 @@ __wt_connection_destroy(WT_CONNECTION_IMPL *conn)
 
 	__wt_conn_foc_discard(session);			/* free-on-close */
 
+	__wt_config_compiled_discard(session);		/* compiled */
+
 	__wt_spin_destroy(session, &conn->api_lock);
 	__wt_spin_destroy(session, &conn->block_lock);
 	__wt_spin_destroy(session, &conn->checkpoint_lock);
@@ -132,6 +137,7 @@ __wt_connection_destroy(WT_CONNECTION_IMPL *conn)
 
 	/* Free allocated memory. */
 	__wt_free(session, conn->cfg);
+	__wt_free(session, conn->dhhash);
 	__wt_free(session, conn->home);
 	__wt_free(session, conn->error_prefix);
 	__wt_free(session, conn->sessions);
@@ -169,6 +169,8 @@ __wt_connection_close(WT_CONNECTION_IMPL *conn)
 		if ((s = conn->sessions) != NULL)
 			for (i = 0; i < conn->session_size; ++s, ++i) {
 				__wt_free(session, s->dhhash);
+				__wt_free(session, s->cursor_cache);
+				__wt_free(session, s->latency);
 				__wt_stash_discard_all(session, s);
 				__wt_free(session, s->hazard);
 			}
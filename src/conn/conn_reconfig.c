@@ -127,6 +127,15 @@ __wt_conn_statistics_config(WT_SESSION_IMPL *session, const char *cfg[])
 		LF_SET(WT_STAT_TYPE_FAST | WT_STAT_TYPE_TREE_WALK);
 	WT_RET_NOTFOUND_OK(ret);
 
+	if ((ret = __wt_config_subgets(
+	    session, &cval, "latency", &sval)) == 0 && sval.val != 0)
+		/*
+		 * Configuring latency histograms implies fast statistics, the
+		 * histograms are returned by statistics cursors.
+		 */
+		LF_SET(WT_STAT_TYPE_FAST | WT_STAT_TYPE_LATENCY);
+	WT_RET_NOTFOUND_OK(ret);
+
 	if ((ret = __wt_config_subgets(
 	    session, &cval, "clear", &sval)) == 0 && sval.val != 0) {
 		if (!LF_ISSET(WT_STAT_TYPE_ALL | WT_STAT_TYPE_CACHE_WALK |
@@ -35,6 +35,154 @@ __stat_sources_free(WT_SESSION_IMPL *session, char ***sources)
 	}
 }
 
+/*
+ * __wt_latency_record --
+ *	Record an operation's latency in the session's histograms.
+ */
+void
+__wt_latency_record(WT_SESSION_IMPL *session, u_int type, uint64_t ns)
+{
+	WT_LATENCY_HIST *hist;
+	WT_LATENCY_STATS *latency;
+	uint64_t v;
+	u_int bits, bucket;
+
+	/*
+	 * The histograms are only summed for sessions in the connection's
+	 * session array, there's nowhere to record anything else.
+	 */
+	if (session == &S2C(session)->dummy_session)
+		return;
+
+	/* Allocate the session's histograms on first use. */
+	if ((latency = session->latency) == NULL) {
+		if (__wt_calloc_one(session, &latency) != 0)
+			return;
+		WT_PUBLISH(session->latency, latency);
+	}
+
+	/*
+	 * The bucket is the number of significant bits past the sub-bucket
+	 * bits, followed by the sub-bucket bits following the most significant
+	 * bit.
+	 */
+	for (bits = 0, v = ns >> WT_LATENCY_SUB_BITS; v != 0; v >>= 1)
+		++bits;
+	if (bits == 0)
+		bucket = (u_int)ns;
+	else if (bits > WT_LATENCY_MAX_BITS - WT_LATENCY_SUB_BITS)
+		bucket = WT_LATENCY_BUCKETS - 1;
+	else
+		bucket = bits << WT_LATENCY_SUB_BITS | (u_int)((ns >>
+		    (bits - 1)) & ((1U << WT_LATENCY_SUB_BITS) - 1));
+
+	hist = &latency->hist[type];
+	++hist->count;
+	hist->total += (int64_t)ns;
+	if ((int64_t)ns > hist->max)
+		hist->max = (int64_t)ns;
+	++hist->bucket[bucket];
+}
+
+/*
+ * __wt_latency_aggregate --
+ *	Sum the latency histograms of all of the sessions, optionally clearing
+ * them.
+ */
+void
+__wt_latency_aggregate(
+    WT_SESSION_IMPL *session, WT_LATENCY_STATS *stats, bool clear)
+{
+	WT_CONNECTION_IMPL *conn;
+	WT_LATENCY_HIST *from, *to;
+	WT_LATENCY_STATS *latency;
+	WT_SESSION_IMPL *s;
+	uint32_t i, session_cnt;
+	u_int j, type;
+
+	conn = S2C(session);
+
+	/*
+	 * Like other statistics, the histograms are read without locking and
+	 * may be inconsistent with operations being recorded.
+	 */
+	memset(stats, 0, sizeof(*stats));
+	WT_ORDERED_READ(session_cnt, conn->session_cnt);
+	for (s = conn->sessions, i = 0; i < session_cnt; ++s, ++i) {
+		if ((latency = s->latency) == NULL)
+			continue;
+		for (type = 0; type < WT_LATENCY_TYPES; ++type) {
+			from = &latency->hist[type];
+			to = &stats->hist[type];
+			to->count += from->count;
+			to->total += from->total;
+			to->max = WT_MAX(to->max, from->max);
+			for (j = 0; j < WT_LATENCY_BUCKETS; ++j)
+				to->bucket[j] += from->bucket[j];
+		}
+		if (clear)
+			memset(latency, 0, sizeof(*latency));
+	}
+}
+
+/*
+ * The binary statistics log is a sequence of records, each a single type
+ * byte followed by WiredTiger packed integers (see intpack.i), and strings
+ * stored as a packed length followed by the bytes:
+ *
+ *	header:   "WTSL", format version, WiredTiger version string
+ *	schema:   schema, key of the first statistic, count, descriptions
+ *	source:   source, schema, name
+ *	interval: seconds and nanoseconds since the epoch
+ *	values:   source, the change in each statistic since the previous
+ *		  values record for the source
+ *	end:      the end of the interval, no fields
+ *
+ * Each interval's records are followed by an end record, so a reader of a
+ * log that is still being written can tell a complete interval from one
+ * whose records have only partly reached the file.
+ *
+ * A header is written each time a log file is opened, and the schema and
+ * source records following it are written before their first use: readers
+ * discard everything they know when they see a header, and values records
+ * start again from zero.
+ */
+#define	WT_STATLOG_BINARY_MAGIC		"WTSL"
+#define	WT_STATLOG_BINARY_VERSION	1
+
+#define	WT_STATLOG_REC_HEADER		1
+#define	WT_STATLOG_REC_SCHEMA		2
+#define	WT_STATLOG_REC_SOURCE		3
+#define	WT_STATLOG_REC_INTERVAL		4
+#define	WT_STATLOG_REC_VALUES		5
+#define	WT_STATLOG_REC_END		6
+
+#define	WT_STATLOG_SCHEMA_CONN		0	/* Connection statistics */
+#define	WT_STATLOG_SCHEMA_DSRC		1	/* Data source statistics */
+#define	WT_STATLOG_SCHEMA_LATENCY	2	/* Latency histograms */
+
+/*
+ * __statlog_binary_discard --
+ *	Discard the binary statistics log's schemas and sources.
+ */
+static void
+__statlog_binary_discard(WT_SESSION_IMPL *session)
+{
+	WT_CONNECTION_IMPL *conn;
+	u_int i;
+
+	conn = S2C(session);
+
+	for (i = 0; i < conn->stat_bin_entries; ++i) {
+		__wt_free(session, conn->stat_bin[i].name);
+		__wt_free(session, conn->stat_bin[i].values);
+	}
+	__wt_free(session, conn->stat_bin);
+	conn->stat_bin_allocated = 0;
+	conn->stat_bin_entries = conn->stat_bin_next = 0;
+	conn->stat_bin_schemas = 0;
+}
+
 /*
  * __stat_config_discard --
  *	Discard all statistics-log configuration.
@@ -55,6 +203,7 @@ __stat_config_discard(WT_SESSION_IMPL *session)
 	ret = __wt_fclose(session, &conn->stat_fs);
 	__wt_free(session, conn->stat_path);
 	__stat_sources_free(session, &conn->stat_sources);
+	__statlog_binary_discard(session);
 	conn->stat_stamp = NULL;
 	conn->stat_usecs = 0;
 	return (ret);
@@ -82,6 +231,7 @@ __wt_conn_stat_init(WT_SESSION_IMPL *session)
 	WT_STAT_SET(session,
 	    stats, session_cursor_open, conn->open_cursor_count);
 	WT_STAT_SET(session, stats, dh_conn_handle_count, conn->dhandle_count);
+	WT_STAT_SET(session, stats, dh_conn_hash_buckets, conn->dhhash_size);
 	WT_STAT_SET(session,
 	    stats, rec_split_stashed_objects, conn->stashed_objects);
 	WT_STAT_SET(session,
@@ -129,12 +279,21 @@ __statlog_config(WT_SESSION_IMPL *session, const char **cfg, bool *runp)
 	conn->stat_usecs = (uint64_t)cval.val * WT_MILLION;
 
 	/*
-	 * Only set the JSON flag when stats are enabled, otherwise setting
-	 * this flag can implicitly enable statistics gathering.
+	 * Only set the binary and JSON flags when stats are enabled, otherwise
+	 * setting these flags can implicitly enable statistics gathering.
 	 */
+	FLD_CLR(conn->stat_flags, WT_STAT_BINARY | WT_STAT_JSON);
+	WT_RET(__wt_config_gets(session, cfg, "statistics_log.binary", &cval));
+	if (cval.val != 0 && WT_STAT_ENABLED(session))
+		FLD_SET(conn->stat_flags, WT_STAT_BINARY);
 	WT_RET(__wt_config_gets(session, cfg, "statistics_log.json", &cval));
 	if (cval.val != 0 && WT_STAT_ENABLED(session))
 		FLD_SET(conn->stat_flags, WT_STAT_JSON);
+	if (FLD_ISSET(conn->stat_flags, WT_STAT_BINARY) &&
+	    FLD_ISSET(conn->stat_flags, WT_STAT_JSON))
+		WT_RET_MSG(session, EINVAL,
+		    "statistics_log binary and json configurations are "
+		    "incompatible");
 
 	WT_RET(__wt_config_gets(
 	    session, cfg, "statistics_log.on_close", &cval));
@@ -224,17 +383,223 @@ err:	__stat_sources_free(session, &sources);
 	return (ret);
 }
 
+/*
+ * __statlog_pack_str --
+ *	Append a string to a binary statistics log record.
+ */
+static int
+__statlog_pack_str(WT_SESSION_IMPL *session, WT_ITEM *buf, const char *str)
+{
+	size_t len;
+	uint8_t *p;
+
+	len = strlen(str);
+	WT_RET(__wt_buf_extend(
+	    session, buf, buf->size + WT_INTPACK64_MAXSIZE + len));
+	p = (uint8_t *)buf->mem + buf->size;
+	WT_RET(__wt_vpack_uint(&p, 0, (uint64_t)len));
+	memcpy(p, str, len);
+	buf->size = WT_PTRDIFF(p + len, buf->mem);
+	return (0);
+}
+
+/*
+ * __statlog_binary_start --
+ *	Start a binary statistics log file.
+ */
+static int
+__statlog_binary_start(WT_SESSION_IMPL *session)
+{
+	WT_CONNECTION_IMPL *conn;
+	WT_DECL_ITEM(tmp);
+	WT_DECL_RET;
+	uint8_t *p;
+
+	conn = S2C(session);
+
+	if (!FLD_ISSET(conn->stat_flags, WT_STAT_BINARY))
+		return (0);
+
+	/* Schemas and sources are written again in each file. */
+	__statlog_binary_discard(session);
+
+	WT_RET(__wt_scr_alloc(session, 64, &tmp));
+	p = tmp->mem;
+	*p++ = WT_STATLOG_REC_HEADER;
+	memcpy(p, WT_STATLOG_BINARY_MAGIC, strlen(WT_STATLOG_BINARY_MAGIC));
+	p += strlen(WT_STATLOG_BINARY_MAGIC);
+	WT_ERR(__wt_vpack_uint(&p, 0, WT_STATLOG_BINARY_VERSION));
+	tmp->size = WT_PTRDIFF(p, tmp->mem);
+	WT_ERR(__statlog_pack_str(session, tmp, WIREDTIGER_VERSION_STRING));
+	WT_ERR(__wt_fwrite(session, conn->stat_fs, tmp->data, tmp->size));
+
+err:	__wt_scr_free(session, &tmp);
+	return (ret);
+}
+
+/*
+ * __statlog_binary_schema --
+ *	Append a schema record for a statistics cursor's statistics.
+ */
+static int
+__statlog_binary_schema(WT_SESSION_IMPL *session,
+    WT_ITEM *buf, u_int schema, WT_CURSOR_STAT *cst)
+{
+	int i;
+	uint8_t *p;
+	const char *desc;
+
+	WT_RET(__wt_buf_extend(
+	    session, buf, buf->size + 1 + 3 * WT_INTPACK64_MAXSIZE));
+	p = (uint8_t *)buf->mem + buf->size;
+	*p++ = WT_STATLOG_REC_SCHEMA;
+	WT_RET(__wt_vpack_uint(&p, 0, schema));
+	WT_RET(__wt_vpack_int(&p, 0, cst->stats_base));
+	WT_RET(__wt_vpack_uint(&p, 0, (uint64_t)cst->stats_count));
+	buf->size = WT_PTRDIFF(p, buf->mem);
+
+	for (i = 0; i < cst->stats_count; ++i) {
+		WT_RET(cst->stats_desc(cst, i, &desc));
+		WT_RET(__statlog_pack_str(session, buf, desc));
+	}
+	return (0);
+}
+
+/*
+ * __statlog_binary_source --
+ *	Find a source in the binary statistics log, appending a source record
+ * for a new source.
+ */
+static int
+__statlog_binary_source(WT_SESSION_IMPL *session, WT_ITEM *buf,
+    const char *name, u_int schema, int count, WT_STATLOG_SOURCE **srcp)
+{
+	WT_CONNECTION_IMPL *conn;
+	WT_DECL_RET;
+	WT_STATLOG_SOURCE *src;
+	int64_t *values;
+	u_int id;
+	uint8_t *p;
+
+	conn = S2C(session);
+
+	/*
+	 * Sources are usually logged in the same order each interval, check
+	 * the one following the last source before searching the list.
+	 */
+	id = conn->stat_bin_next;
+	if (id >= conn->stat_bin_entries ||
+	    strcmp(conn->stat_bin[id].name, name) != 0)
+		for (id = 0; id < conn->stat_bin_entries; ++id)
+			if (strcmp(conn->stat_bin[id].name, name) == 0)
+				break;
+
+	if (id == conn->stat_bin_entries) {
+		WT_RET(__wt_realloc_def(session,
+		    &conn->stat_bin_allocated, id + 1, &conn->stat_bin));
+		src = &conn->stat_bin[id];
+		WT_RET(__wt_calloc_def(session, (size_t)count, &values));
+		if ((ret = __wt_strdup(session, name, &src->name)) != 0) {
+			__wt_free(session, values);
+			return (ret);
+		}
+		src->values = values;
+		src->schema = schema;
+		++conn->stat_bin_entries;
+
+		WT_RET(__wt_buf_extend(
+		    session, buf, buf->size + 1 + 2 * WT_INTPACK64_MAXSIZE));
+		p = (uint8_t *)buf->mem + buf->size;
+		*p++ = WT_STATLOG_REC_SOURCE;
+		WT_RET(__wt_vpack_uint(&p, 0, id));
+		WT_RET(__wt_vpack_uint(&p, 0, schema));
+		buf->size = WT_PTRDIFF(p, buf->mem);
+		WT_RET(__statlog_pack_str(session, buf, name));
+	}
+
+	conn->stat_bin_next = id + 1;
+	*srcp = &conn->stat_bin[id];
+	return (0);
+}
+
+/*
+ * __statlog_binary_dump --
+ *	Write a statistics cursor's values to the binary statistics log.
+ */
+static int
+__statlog_binary_dump(WT_SESSION_IMPL *session,
+    WT_ITEM *buf, const char *name, WT_CURSOR_STAT *cst)
+{
+	WT_CONNECTION_IMPL *conn;
+	WT_STATLOG_SOURCE *src;
+	int64_t v;
+	int i;
+	u_int schema;
+	uint8_t *p;
+
+	conn = S2C(session);
+
+	switch (cst->stats_base) {
+	case WT_CONNECTION_STATS_BASE:
+		schema = WT_STATLOG_SCHEMA_CONN;
+		break;
+	case WT_LATENCY_STATS_BASE:
+		schema = WT_STATLOG_SCHEMA_LATENCY;
+		break;
+	default:
+		schema = WT_STATLOG_SCHEMA_DSRC;
+		break;
+	}
+
+	WT_RET(__wt_buf_init(session, buf, 0));
+	if (!FLD_ISSET(conn->stat_bin_schemas, 1U << schema)) {
+		WT_RET(__statlog_binary_schema(session, buf, schema, cst));
+		FLD_SET(conn->stat_bin_schemas, 1U << schema);
+	}
+	WT_RET(__statlog_binary_source(
+	    session, buf, name, schema, cst->stats_count, &src));
+
+	/*
+	 * Most statistics don't change from one interval to the next, write
+	 * the differences so they pack into a single byte.
+	 */
+	WT_RET(__wt_buf_extend(session, buf, buf->size +
+	    1 + WT_INTPACK64_MAXSIZE * (size_t)(cst->stats_count + 1)));
+	p = (uint8_t *)buf->mem + buf->size;
+	*p++ = WT_STATLOG_REC_VALUES;
+	WT_RET(__wt_vpack_uint(&p, 0, (uint64_t)(src - conn->stat_bin)));
+	for (i = 0; i < cst->stats_count; ++i) {
+		v = cst->stats[i];
+		WT_RET(__wt_vpack_int(&p, 0,
+		    (int64_t)((uint64_t)v - (uint64_t)src->values[i])));
+		src->values[i] = v;
+	}
+	buf->size = WT_PTRDIFF(p, buf->mem);
+
+	return (__wt_fwrite(session, conn->stat_fs, buf->data, buf->size));
+}
+
 /*
  * __statlog_print_header --
- *	Write the header for statistics when running in JSON mode.
+ *	Write the header for statistics when running in binary or JSON mode.
  */
 static int
-__statlog_print_header(WT_SESSION_IMPL *session)
+__statlog_print_header(WT_SESSION_IMPL *session, struct timespec *ts)
 {
 	WT_CONNECTION_IMPL *conn;
+	uint8_t *p, rec[1 + 2 * WT_INTPACK64_MAXSIZE];
 
 	conn = S2C(session);
 
+	if (FLD_ISSET(conn->stat_flags, WT_STAT_BINARY)) {
+		p = rec;
+		*p++ = WT_STATLOG_REC_INTERVAL;
+		WT_RET(__wt_vpack_uint(&p, 0, (uint64_t)ts->tv_sec));
+		WT_RET(__wt_vpack_uint(&p, 0, (uint64_t)ts->tv_nsec));
+		return (__wt_fwrite(
+		    session, conn->stat_fs, rec, WT_PTRDIFF(p, rec)));
+	}
+
 	if (!FLD_ISSET(conn->stat_flags, WT_STAT_JSON))
 		return (0);
 
@@ -301,15 +666,21 @@ __statlog_print_table_name(
 
 /*
  * __statlog_print_footer --
- *	Write the footer for statistics when running in JSON mode.
+ *	Write the footer for statistics when running in binary or JSON mode.
  */
 static int
 __statlog_print_footer(WT_SESSION_IMPL *session)
 {
 	WT_CONNECTION_IMPL *conn;
+	uint8_t rec;
 
 	conn = S2C(session);
 
+	if (FLD_ISSET(conn->stat_flags, WT_STAT_BINARY)) {
+		rec = WT_STATLOG_REC_END;
+		return (__wt_fwrite(session, conn->stat_fs, &rec, 1));
+	}
+
 	if (!FLD_ISSET(conn->stat_flags, WT_STAT_JSON))
 		return (0);
 
@@ -366,6 +737,13 @@ __statlog_dump(WT_SESSION_IMPL *session, const char *name, bool conn_stats)
 		goto err;
 	}
 
+	/* The binary format writes the statistics without the cursor. */
+	if (FLD_ISSET(conn->stat_flags, WT_STAT_BINARY)) {
+		ret = __statlog_binary_dump(
+		    session, tmp, name, (WT_CURSOR_STAT *)cursor);
+		goto err;
+	}
+
 	WT_ERR(__statlog_print_table_name(session, name, conn_stats));
 	while ((ret = cursor->next(cursor)) == 0) {
 		WT_ERR(cursor->get_value(cursor, &desc, &valstr, &val));
@@ -503,7 +881,6 @@ __statlog_log_one(WT_SESSION_IMPL *session, WT_ITEM *path, WT_ITEM *tmp)
 	struct timespec ts;
 	struct tm *tm, _tm;
 	WT_CONNECTION_IMPL *conn;
-	WT_FSTREAM *log_stream;
 
 	conn = S2C(session);
 
@@ -516,26 +893,30 @@ __statlog_log_one(WT_SESSION_IMPL *session, WT_ITEM *path, WT_ITEM *tmp)
 		WT_RET_MSG(session, ENOMEM, "strftime path conversion");
 
 	/* If the path has changed, cycle the log file. */
-	if ((log_stream = conn->stat_fs) == NULL ||
+	if (conn->stat_fs == NULL ||
 	    path == NULL || strcmp(tmp->mem, path->mem) != 0) {
 		WT_RET(__wt_fclose(session, &conn->stat_fs));
 		if (path != NULL)
 			(void)strcpy(path->mem, tmp->mem);
 		WT_RET(__wt_fopen(session, tmp->mem,
 		    WT_FS_OPEN_CREATE | WT_FS_OPEN_FIXED, WT_STREAM_APPEND,
-		    &log_stream));
+		    &conn->stat_fs));
+		WT_RET(__statlog_binary_start(session));
 	}
-	conn->stat_fs = log_stream;
 
 	/* Create the entry prefix for this time of day. */
 	if (strftime(tmp->mem, tmp->memsize, conn->stat_format, tm) == 0)
 		WT_RET_MSG(session, ENOMEM, "strftime timestamp conversion");
 	conn->stat_stamp = tmp->mem;
-	WT_RET(__statlog_print_header(session));
+	WT_RET(__statlog_print_header(session, &ts));
 
 	/* Dump the connection statistics. */
 	WT_RET(__statlog_dump(session, conn->home, true));
 
+	/* Dump the latency histograms. */
+	if (WT_LATENCY_ENABLED(session))
+		WT_RET(__statlog_dump(session, "latency", false));
+
 	/*
 	 * Lock the schema and walk the list of open handles, dumping
 	 * any that match the list of object sources.
@@ -8,6 +8,55 @@
 
 #include "wt_internal.h"
 
+/*
+ * A file copied by __wt_backup_copy. Files are copied in chunks so threads
+ * can share a large file: the thread copying the last of a file's chunks
+ * syncs the copy and renames it into place.
+ */
+typedef struct {
+	char *name;				/* Source file */
+	char *to;				/* Target file */
+	char *tmp;				/* Temporary target file */
+	WT_FH *ffh, *tfh;			/* Source, temporary handles */
+	wt_off_t size;				/* Source file size */
+	uint32_t chunk_cnt;			/* Chunks, 0 until opened */
+	uint32_t chunk_next;			/* Next chunk to copy */
+	volatile uint32_t chunk_done;		/* Chunks copied */
+} WT_BACKUP_COPY_FILE;
+
+/*
+ * The state shared by the threads of a backup copy.
+ */
+typedef struct {
+	WT_BACKUP_COPY_FILE *file;		/* Files to copy */
+	u_int file_cnt;
+	u_int file_next;			/* Next file to copy */
+	WT_SPINLOCK lock;			/* Chunk assignment lock */
+
+	size_t buffer_size;			/* Read and write size */
+	wt_off_t chunk_size;			/* Chunk size */
+	uint64_t throttle;			/* Bytes per second limit */
+	bool zero_copy;				/* Copy in the kernel */
+
+	struct timespec start;			/* Copy start */
+	volatile uint64_t bytes;		/* Bytes copied */
+	volatile bool quit;			/* Stop after an error */
+} WT_BACKUP_COPY;
+
+/*
+ * A backup copy thread.
+ */
+typedef struct {
+	WT_BACKUP_COPY *bc;
+	WT_SESSION_IMPL *session;		/* Thread's session */
+	wt_thread_t tid;
+	bool tid_set;
+	volatile bool done;			/* Thread finished */
+	int thread_ret;				/* Thread's error */
+} WT_BACKUP_COPY_THREAD;
+
+#define	WT_BACKUP_COPY_CHUNK	64		/* Buffers per chunk */
+
 static int __backup_all(WT_SESSION_IMPL *);
 static int __backup_list_append(
     WT_SESSION_IMPL *, WT_CURSOR_BACKUP *, const char *);
@@ -529,3 +578,341 @@ __backup_list_append(
 	++cb->list_next;
 	return (0);
 }
+
+/*
+ * __backup_copy_config --
+ *	Parse the configuration of a backup copy.
+ */
+static int
+__backup_copy_config(WT_SESSION_IMPL *session,
+    WT_BACKUP_COPY *bc, const char *config, u_int *threadsp)
+{
+	WT_CONFIG parser;
+	WT_CONFIG_ITEM k, v;
+	WT_DECL_RET;
+
+	*threadsp = 1;
+	bc->buffer_size = WT_MEGABYTE;
+	bc->throttle = 0;
+	bc->zero_copy = false;
+
+	if (config != NULL) {
+		__wt_config_init(session, &parser, config);
+		while ((ret = __wt_config_next(&parser, &k, &v)) == 0)
+			if (WT_STRING_MATCH("buffer_size", k.str, k.len)) {
+				if (v.type != WT_CONFIG_ITEM_NUM ||
+				    v.val < 4 * WT_KILOBYTE ||
+				    v.val > WT_GIGABYTE)
+					WT_RET_MSG(session, EINVAL,
+					    "backup copy buffer_size must be "
+					    "between 4KB and 1GB");
+				bc->buffer_size =
+				    (size_t)WT_ALIGN(v.val, 4 * WT_KILOBYTE);
+			} else if (WT_STRING_MATCH("threads", k.str, k.len)) {
+				if (v.type != WT_CONFIG_ITEM_NUM ||
+				    v.val < 1 || v.val > 64)
+					WT_RET_MSG(session, EINVAL,
+					    "backup copy threads must be "
+					    "between 1 and 64");
+				*threadsp = (u_int)v.val;
+			} else if (WT_STRING_MATCH("throttle", k.str, k.len)) {
+				if (v.type != WT_CONFIG_ITEM_NUM || v.val < 0)
+					WT_RET_MSG(session, EINVAL,
+					    "backup copy throttle must be a "
+					    "number of bytes per second");
+				bc->throttle = (uint64_t)v.val;
+			} else if (WT_STRING_MATCH("zero_copy", k.str, k.len))
+				bc->zero_copy = v.val != 0;
+			else
+				WT_RET_MSG(session, EINVAL,
+				    "unknown backup copy configuration key "
+				    "'%.*s'", (int)k.len, k.str);
+		WT_RET_NOTFOUND_OK(ret);
+	}
+
+	/* Chunks are a multiple of the buffer size, so reads stay aligned. */
+	bc->chunk_size = (wt_off_t)(WT_BACKUP_COPY_CHUNK * bc->buffer_size);
+	return (0);
+}
+
+/*
+ * __backup_copy_open --
+ *	Open a file for copying.
+ */
+static int
+__backup_copy_open(WT_SESSION_IMPL *session,
+    WT_BACKUP_COPY *bc, WT_BACKUP_COPY_FILE *f)
+{
+	/*
+	 * Copy into a temporary file and rename it into place when it's
+	 * complete, see __wt_copy_and_sync for the reasoning.
+	 */
+	WT_RET(__wt_remove_if_exists(session, f->to, false));
+	WT_RET(__wt_remove_if_exists(session, f->tmp, false));
+
+	WT_RET(__wt_open(
+	    session, f->name, WT_FS_OPEN_FILE_TYPE_REGULAR, 0, &f->ffh));
+	WT_RET(__wt_open(session, f->tmp, WT_FS_OPEN_FILE_TYPE_REGULAR,
+	    WT_FS_OPEN_CREATE | WT_FS_OPEN_EXCLUSIVE, &f->tfh));
+
+	/*
+	 * Files are copied as they were when they were opened: the backup
+	 * cursor guarantees the data we need isn't changing.
+	 */
+	WT_RET(__wt_filesize(session, f->ffh, &f->size));
+	f->chunk_cnt = (uint32_t)WT_MAX(1,
+	    (f->size + bc->chunk_size - 1) / bc->chunk_size);
+	return (0);
+}
+
+/*
+ * __backup_copy_next --
+ *	Find the next chunk to copy, opening its file if it's the first chunk
+ * of the file.
+ */
+static int
+__backup_copy_next(WT_SESSION_IMPL *session,
+    WT_BACKUP_COPY *bc, WT_BACKUP_COPY_FILE **filep, uint32_t *chunkp)
+{
+	WT_BACKUP_COPY_FILE *f;
+	WT_DECL_RET;
+
+	*filep = NULL;
+	*chunkp = 0;
+
+	/*
+	 * Files are opened while holding the lock, it's only once per file and
+	 * it keeps the threads working through the files in order.
+	 */
+	__wt_spin_lock(session, &bc->lock);
+	for (; !bc->quit && bc->file_next < bc->file_cnt; ++bc->file_next) {
+		f = &bc->file[bc->file_next];
+		if (f->chunk_cnt == 0)
+			WT_ERR(__backup_copy_open(session, bc, f));
+		if (f->chunk_next < f->chunk_cnt) {
+			*filep = f;
+			*chunkp = f->chunk_next++;
+			break;
+		}
+	}
+err:	__wt_spin_unlock(session, &bc->lock);
+	return (ret);
+}
+
+/*
+ * __backup_copy_throttle --
+ *	Count bytes copied, sleeping if the copy is ahead of its throttle.
+ */
+static void
+__backup_copy_throttle(WT_SESSION_IMPL *session, WT_BACKUP_COPY *bc, size_t n)
+{
+	struct timespec now;
+	uint64_t bytes, msecs, target;
+
+	bytes = __wt_atomic_addv64(&bc->bytes, n);
+	if (bc->throttle == 0)
+		return;
+
+	/* Sleep until the bytes copied so far are within the limit. */
+	target = bytes * WT_THOUSAND / bc->throttle;
+	__wt_epoch(session, &now);
+	msecs = WT_TIMEDIFF_MS(now, bc->start);
+	if (target > msecs)
+		__wt_sleep(0, (target - msecs) * WT_THOUSAND);
+}
+
+/*
+ * __backup_copy_chunk --
+ *	Copy a chunk of a file, and if it's the last chunk of the file to be
+ * copied, finish the file.
+ */
+static int
+__backup_copy_chunk(WT_SESSION_IMPL *session, WT_BACKUP_COPY *bc,
+    WT_BACKUP_COPY_FILE *f, uint32_t chunk, WT_ITEM *buf, bool *zero_copyp)
+{
+	WT_DECL_RET;
+	wt_off_t offset, stop;
+	size_t n;
+
+	offset = (wt_off_t)chunk * bc->chunk_size;
+	stop = WT_MIN(offset + bc->chunk_size, f->size);
+	for (; offset < stop; offset += (wt_off_t)n) {
+		if (bc->quit)
+			return (0);
+
+		n = (size_t)WT_MIN(stop - offset, (wt_off_t)bc->buffer_size);
+		if (*zero_copyp) {
+			ret = __wt_file_copy_range(
+			    session, f->ffh, f->tfh, offset, n);
+			if (ret == ENOTSUP) {
+				*zero_copyp = false;
+				ret = 0;
+			}
+			WT_RET(ret);
+		}
+		if (!*zero_copyp) {
+			WT_RET(__wt_buf_init(session, buf, bc->buffer_size));
+			WT_RET(__wt_read(session, f->ffh, offset, n, buf->mem));
+			WT_RET(
+			    __wt_write(session, f->tfh, offset, n, buf->mem));
+		}
+		__backup_copy_throttle(session, bc, n);
+	}
+
+	if (__wt_atomic_addv32(&f->chunk_done, 1) != f->chunk_cnt)
+		return (0);
+
+	/* Close the source, then swap the temporary file into place. */
+	WT_RET(__wt_close(session, &f->ffh));
+	WT_RET(__wt_fsync(session, f->tfh, true));
+	WT_RET(__wt_close(session, &f->tfh));
+	return (__wt_fs_rename(session, f->tmp, f->to, true));
+}
+
+/*
+ * __backup_copy_thread --
+ *	Backup copy thread: copy chunks until there are none left.
+ */
+static WT_THREAD_RET
+__backup_copy_thread(void *arg)
+{
+	WT_BACKUP_COPY *bc;
+	WT_BACKUP_COPY_FILE *f;
+	WT_BACKUP_COPY_THREAD *t;
+	WT_DECL_RET;
+	WT_ITEM buf;
+	WT_SESSION_IMPL *session;
+	uint32_t chunk;
+	bool zero_copy;
+
+	t = arg;
+	bc = t->bc;
+	session = t->session;
+
+	/* Aligned buffers, in case direct I/O is configured. */
+	WT_CLEAR(buf);
+	F_SET(&buf, WT_ITEM_ALIGNED);
+	zero_copy = bc->zero_copy;
+
+	for (;;) {
+		WT_ERR(__backup_copy_next(session, bc, &f, &chunk));
+		if (f == NULL)
+			break;
+		WT_ERR(__backup_copy_chunk(
+		    session, bc, f, chunk, &buf, &zero_copy));
+	}
+
+err:	if (ret != 0)
+		bc->quit = true;
+	__wt_buf_free(session, &buf);
+	t->thread_ret = ret;
+	WT_PUBLISH(t->done, true);
+	return (WT_THREAD_RET_VALUE);
+}
+
+/*
+ * __wt_backup_copy --
+ *	Copy the files listed by a backup cursor into a directory using a set
+ * of threads; here to support the wt utility and the Python API.
+ *
+ * The configuration is a string of "threads" (the number of copy threads,
+ * default 1), "buffer_size" (the size of each read and write, default 1MB),
+ * "throttle" (a limit on the bytes copied per second, default none) and
+ * "zero_copy" (copy in the kernel where the system supports it, default
+ * false).
+ */
+int
+__wt_backup_copy(WT_CURSOR *cursor, const char *directory, const char *config)
+    WT_GCC_FUNC_ATTRIBUTE((visibility("default")))
+{
+	WT_BACKUP_COPY _bc, *bc;
+	WT_BACKUP_COPY_FILE *f;
+	WT_BACKUP_COPY_THREAD *t, *thread;
+	WT_CURSOR_BACKUP *cb;
+	WT_DECL_RET;
+	WT_SESSION_IMPL *session;
+	size_t allocated, len;
+	u_int i, threads;
+	const char *name;
+	bool done;
+
+	session = (WT_SESSION_IMPL *)cursor->session;
+	bc = &_bc;
+	WT_CLEAR(*bc);
+	thread = NULL;
+	allocated = 0;
+
+	if (!WT_PREFIX_MATCH(cursor->uri, "backup:"))
+		WT_RET_MSG(session, EINVAL,
+		    "%s: not a backup cursor", cursor->uri);
+	WT_RET(__backup_copy_config(session, bc, config, &threads));
+	WT_RET(__wt_spin_init(session, &bc->lock, "backup copy"));
+
+	/*
+	 * List the files to copy: the cursor's remaining files, read from its
+	 * list so raw cursors (used by the Python API) work too.
+	 */
+	cb = (WT_CURSOR_BACKUP *)cursor;
+	while (cb->list != NULL && cb->list[cb->next] != NULL) {
+		name = cb->list[cb->next++];
+		WT_ERR(__wt_realloc_def(
+		    session, &allocated, bc->file_cnt + 1, &bc->file));
+		f = &bc->file[bc->file_cnt++];
+		WT_ERR(__wt_strdup(session, name, &f->name));
+		len = strlen(directory) + strlen(name) + 10;
+		WT_ERR(__wt_malloc(session, len, &f->to));
+		WT_ERR(__wt_snprintf(f->to, len, "%s/%s", directory, name));
+		WT_ERR(__wt_malloc(session, len, &f->tmp));
+		WT_ERR(__wt_snprintf(f->tmp, len, "%s.copy", f->to));
+	}
+
+	WT_ERR(__wt_calloc_def(session, threads, &thread));
+	__wt_epoch(session, &bc->start);
+	for (i = 0; i < threads; ++i) {
+		t = &thread[i];
+		t->bc = bc;
+		WT_ERR(__wt_open_internal_session(
+		    S2C(session), "backup-copy", false, 0, &t->session));
+		WT_ERR(__wt_thread_create(
+		    session, &t->tid, __backup_copy_thread, t));
+		t->tid_set = true;
+	}
+
+	/* Wait for the threads, reporting progress as bytes copied. */
+	for (done = false; !done;) {
+		__wt_sleep(0, 10 * WT_THOUSAND);
+		for (done = true, i = 0; i < threads; ++i)
+			if (!thread[i].done)
+				done = false;
+		WT_ERR(__wt_progress(session, "backup copy", bc->bytes));
+	}
+
+err:	if (ret != 0)
+		bc->quit = true;
+	if (thread != NULL) {
+		for (i = 0; i < threads; ++i) {
+			t = &thread[i];
+			if (t->tid_set) {
+				WT_TRET(__wt_thread_join(session, t->tid));
+				WT_TRET(t->thread_ret);
+			}
+			if (t->session != NULL)
+				WT_TRET(t->session->iface.close(
+				    &t->session->iface, NULL));
+		}
+		__wt_free(session, thread);
+	}
+	for (i = 0; i < bc->file_cnt; ++i) {
+		f = &bc->file[i];
+		WT_TRET(__wt_close(session, &f->ffh));
+		WT_TRET(__wt_close(session, &f->tfh));
+		if (ret != 0 && f->chunk_cnt != 0)
+			WT_TRET(__wt_remove_if_exists(session, f->tmp, false));
+		__wt_free(session, f->name);
+		__wt_free(session, f->to);
+		__wt_free(session, f->tmp);
+	}
+	__wt_free(session, bc->file);
+	__wt_spin_destroy(session, &bc->lock);
+	return (ret);
+}
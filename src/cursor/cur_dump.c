@@ -413,3 +413,99 @@ err:		WT_TRET(__curdump_close(cursor));
 	}
 	return (ret);
 }
+
+/*
+ * __wt_ext_dump_split --
+ *	WT_EXTENSION_API.dump_split method: return up to n - 1 keys in a dump
+ * cursor's format dividing its object into n ranges at leaf page boundaries,
+ * for dumping the ranges in parallel. Each key is the first key of its range,
+ * and exists in the object. The keys are returned in a NULL-terminated array,
+ * the caller frees the keys and the array with free.
+ */
+int
+__wt_ext_dump_split(WT_EXTENSION_API *wt_api,
+    WT_CURSOR *cursor, uint32_t n, char ***splitsp)
+{
+	WT_CURSOR *child, *primary;
+	WT_DECL_RET;
+	WT_ITEM *keys;
+	WT_SESSION_IMPL *session;
+	uint64_t recno;
+	u_int entries, i, next;
+	int exact;
+	const uint8_t *p;
+	const char *key;
+	char **splits;
+
+	WT_UNUSED(wt_api);
+
+	child = NULL;
+	keys = NULL;
+	entries = next = 0;
+	splits = NULL;
+	*splitsp = NULL;
+
+	CURSOR_API_CALL(cursor, session, split, NULL);
+
+	if (cursor->close != __curdump_close)
+		WT_ERR_MSG(session, EINVAL, "not a dump cursor");
+	child = ((WT_CURSOR_DUMP *)cursor)->child;
+
+	/*
+	 * The ranges are taken from the tree of a file, or a table's primary
+	 * column group if it's a file.
+	 */
+	primary = NULL;
+	if (WT_PREFIX_MATCH(child->internal_uri, "file:"))
+		primary = child;
+	else if (WT_PREFIX_MATCH(child->internal_uri, "table:"))
+		primary = WT_CURSOR_PRIMARY(child);
+	if (primary == NULL ||
+	    !WT_PREFIX_MATCH(primary->internal_uri, "file:"))
+		WT_ERR(ENOTSUP);
+
+	WT_WITH_BTREE(session, ((WT_CURSOR_BTREE *)primary)->btree,
+	    ret = __wt_tree_walk_boundaries(session, n, &keys, &entries));
+	WT_ERR(ret);
+
+	/*
+	 * The boundaries are internal page keys, find the first key in the
+	 * object at or after each one. Boundaries without a key between them
+	 * collapse into a single range.
+	 */
+	WT_ERR(__wt_calloc_def(session, entries + 1, &splits));
+	for (i = 0; i < entries; ++i) {
+		if (WT_CURSOR_RECNO(cursor)) {
+			p = keys[i].data;
+			WT_ERR(__wt_vunpack_uint(&p, keys[i].size, &recno));
+			child->set_key(child, recno);
+		} else
+			__wt_cursor_set_raw_key(child, &keys[i]);
+		if ((ret = child->search_near(child, &exact)) == 0 &&
+		    exact < 0)
+			ret = child->next(child);
+		if (ret == WT_NOTFOUND) {
+			ret = 0;
+			break;
+		}
+		WT_ERR(ret);
+
+		WT_ERR(cursor->get_key(cursor, &key));
+		if (next > 0 && strcmp(splits[next - 1], key) == 0)
+			continue;
+		WT_ERR(__wt_strdup(session, key, &splits[next]));
+		++next;
+	}
+	*splitsp = splits;
+	splits = NULL;
+
+err:	if (splits != NULL) {
+		for (i = 0; i < next; ++i)
+			__wt_free(session, splits[i]);
+		__wt_free(session, splits);
+	}
+	__wt_tree_walk_boundaries_free(session, keys, entries);
+	if (child != NULL)
+		WT_TRET(child->reset(child));
+	API_END_RET(session, ret);
+}
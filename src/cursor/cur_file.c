@@ -184,7 +184,9 @@ __curfile_search(WT_CURSOR *cursor)
 	CURSOR_API_CALL(cursor, session, search, cbt->btree);
 	WT_ERR(__cursor_checkkey(cursor));
 
-	WT_ERR(__wt_btcur_search(cbt));
+	WT_WITH_LATENCY(session, WT_LATENCY_CURSOR_SEARCH,
+	    ret = __wt_btcur_search(cbt));
+	WT_ERR(ret);
 
 	/* Search maintains a position, key and value. */
 	WT_ASSERT(session,
@@ -237,7 +239,9 @@ __curfile_insert(WT_CURSOR *cursor)
 		WT_ERR(__cursor_checkkey(cursor));
 	WT_ERR(__cursor_checkvalue(cursor));
 
-	WT_ERR(__wt_btcur_insert(cbt));
+	WT_WITH_LATENCY(session, WT_LATENCY_CURSOR_INSERT,
+	    ret = __wt_btcur_insert(cbt));
+	WT_ERR(ret);
 
 	/*
 	 * Insert maintains no position, key or value (except for column-store
@@ -330,7 +334,9 @@ __curfile_update(WT_CURSOR *cursor)
 	WT_ERR(__cursor_checkkey(cursor));
 	WT_ERR(__cursor_checkvalue(cursor));
 
-	WT_ERR(__wt_btcur_update(cbt));
+	WT_WITH_LATENCY(session, WT_LATENCY_CURSOR_UPDATE,
+	    ret = __wt_btcur_update(cbt));
+	WT_ERR(ret);
 
 	/* Update maintains a position, key and value. */
 	WT_ASSERT(session,
@@ -356,7 +362,9 @@ __curfile_remove(WT_CURSOR *cursor)
 	CURSOR_REMOVE_API_CALL(cursor, session, cbt->btree);
 	WT_ERR(__cursor_checkkey(cursor));
 
-	WT_ERR(__wt_btcur_remove(cbt));
+	WT_WITH_LATENCY(session, WT_LATENCY_CURSOR_REMOVE,
+	    ret = __wt_btcur_remove(cbt));
+	WT_ERR(ret);
 
 	/*
 	 * Remove with a search-key is fire-and-forget, no position and no key.
@@ -414,6 +422,46 @@ err:	CURSOR_UPDATE_API_END(session, ret);
 	return (ret == 0 ? cursor->search(cursor) : ret);
 }
 
+/*
+ * __curfile_cache --
+ *	Park a reset btree cursor in the session's cursor cache, releasing its
+ *	hold on the data handle.
+ */
+static int
+__curfile_cache(WT_SESSION_IMPL *session, WT_CURSOR_BTREE *cbt)
+{
+	WT_CURSOR *cursor;
+	WT_DECL_RET;
+	uint64_t bucket;
+
+	cursor = &cbt->iface;
+
+	/* The cursor is no longer open, take it off the session's list. */
+	TAILQ_REMOVE(&session->cursors, cursor, q);
+	(void)__wt_atomic_sub32(&S2C(session)->open_cursor_count, 1);
+	WT_STAT_DATA_DECR(session, session_cursor_open);
+	F_CLR(cursor, WT_CURSTD_OPEN);
+
+	/*
+	 * Release the data handle: a cached cursor doesn't keep the handle
+	 * open or locked, so sweep, drop and other exclusive operations are
+	 * free to proceed.  The cursor holds a reference to the handle
+	 * itself, so its memory isn't discarded from under us.
+	 *
+	 * Releasing the handle unlocks it even if it fails, so cache the
+	 * cursor regardless: it no longer holds the handle, and returning
+	 * it to the close path would release the handle a second time.
+	 */
+	__wt_cursor_dhandle_decr_use(session);
+	ret = __wt_session_release_dhandle(session);
+
+	bucket = cbt->cache_hash % WT_HASH_ARRAY_SIZE;
+	TAILQ_INSERT_HEAD(&session->cursor_cache[bucket], cbt, cacheq);
+	++session->ncursors_cached;
+	WT_STAT_CONN_INCR(session, cursor_cache);
+	return (ret);
+}
+
 /*
  * __curfile_close --
  *	WT_CURSOR->close method for the btree cursor type.
@@ -428,6 +476,18 @@ __curfile_close(WT_CURSOR *cursor)
 
 	cbt = (WT_CURSOR_BTREE *)cursor;
 	CURSOR_API_CALL(cursor, session, close, cbt->btree);
+
+	/* If the session is caching cursors, park the cursor for reuse. */
+	if (cbt->cache_config != NULL) {
+		if (F_ISSET(session, WT_SESSION_CACHE_CURSORS) &&
+		    (ret = __wt_btcur_reset(cbt)) == 0) {
+			ret = __curfile_cache(session, cbt);
+			goto err;
+		}
+		__wt_free(session, cbt->cache_config);
+		WT_DHANDLE_RELEASE(cbt->btree->dhandle);
+	}
+
 	if (F_ISSET(cursor, WT_CURSTD_BULK)) {
 		/* Free the bulk-specific resources. */
 		cbulk = (WT_CURSOR_BULK *)cbt;
@@ -660,3 +720,193 @@ err:	/* If the cursor could not be opened, release the handle. */
 	WT_TRET(__wt_session_release_dhandle(session));
 	return (ret);
 }
+
+/*
+ * __wt_curfile_cache_config --
+ *	Make a newly opened cursor cacheable if it's a plain btree cursor,
+ *	remembering the configuration it was opened with.
+ */
+int
+__wt_curfile_cache_config(
+    WT_SESSION_IMPL *session, WT_CURSOR *cursor, const char *config)
+{
+	WT_BTREE *btree;
+	WT_CURSOR_BTREE *cbt;
+
+	/*
+	 * Bulk, checkpoint and metadata cursors aren't cached, nor are other
+	 * cursor types wrapping a btree cursor (such as dump cursors).
+	 */
+	if (cursor->close != __curfile_close ||
+	    F_ISSET(cursor, WT_CURSTD_BULK))
+		return (0);
+	cbt = (WT_CURSOR_BTREE *)cursor;
+	btree = cbt->btree;
+	if (btree->dhandle->checkpoint != NULL ||
+	    WT_IS_METADATA(btree->dhandle))
+		return (0);
+
+	WT_RET(__wt_strdup(
+	    session, config == NULL ? "" : config, &cbt->cache_config));
+	cbt->cache_hash = __wt_hash_city64(cursor->uri, strlen(cursor->uri));
+	cbt->cache_gen = S2C(session)->cursor_cache_gen;
+	cbt->cache_flags = cursor->flags;
+	WT_DHANDLE_ACQUIRE(btree->dhandle);
+	return (0);
+}
+
+/*
+ * __curfile_reopen --
+ *	Reacquire the data handle for a cached cursor.
+ */
+static int
+__curfile_reopen(WT_SESSION_IMPL *session, WT_CURSOR_BTREE *cbt)
+{
+	WT_BTREE *btree;
+	WT_CURSOR *cursor;
+	WT_DATA_HANDLE *dhandle;
+	WT_DECL_RET;
+	bool is_dead;
+
+	cursor = &cbt->iface;
+	btree = cbt->btree;
+	dhandle = btree->dhandle;
+
+	/*
+	 * Schema changes may have changed what the URI refers to, and the
+	 * handle may have been closed while the cursor was cached (by sweep,
+	 * or a drop, rename or verify): in both cases, open a new cursor.
+	 */
+	if (cbt->cache_gen != S2C(session)->cursor_cache_gen ||
+	    F_ISSET(dhandle, WT_DHANDLE_DEAD) ||
+	    !F_ISSET(dhandle, WT_DHANDLE_OPEN))
+		return (WT_NOTFOUND);
+
+	session->dhandle = dhandle;
+	WT_ERR(__wt_session_lock_dhandle(session, 0, &is_dead));
+	if (is_dead)
+		WT_ERR(WT_NOTFOUND);
+
+	/*
+	 * If the handle was closed before we locked it, we hold it exclusive
+	 * so it can be opened: leave that to a full cursor open.
+	 */
+	if (!F_ISSET(dhandle, WT_DHANDLE_OPEN)) {
+		WT_TRET(__wt_session_release_dhandle(session));
+		return (ret == 0 ? WT_NOTFOUND : ret);
+	}
+	__wt_cursor_dhandle_incr_use(session);
+
+	/* The handle may have been reopened, refresh anything it owns. */
+	cursor->internal_uri = dhandle->name;
+	cursor->key_format = btree->key_format;
+	cursor->value_format = btree->value_format;
+	cursor->flags = cbt->cache_flags;
+
+	TAILQ_INSERT_HEAD(&session->cursors, cursor, q);
+	(void)__wt_atomic_add32(&S2C(session)->open_cursor_count, 1);
+	WT_STAT_DATA_INCR(session, session_cursor_open);
+	return (0);
+
+err:	session->dhandle = NULL;
+	return (ret);
+}
+
+/*
+ * __curfile_cache_discard --
+ *	Free a cached cursor.
+ */
+static void
+__curfile_cache_discard(WT_SESSION_IMPL *session, WT_CURSOR_BTREE *cbt)
+{
+	WT_CURSOR *cursor;
+	WT_DATA_HANDLE *dhandle;
+
+	cursor = &cbt->iface;
+	dhandle = cbt->btree->dhandle;
+
+	/* The cursor was reset when it was cached, there's nothing to undo. */
+	WT_IGNORE_RET(__wt_btcur_close(cbt, true));
+	cursor->internal_uri = NULL;
+	__wt_free(session, cbt->cache_config);
+	WT_IGNORE_RET(__wt_cursor_close(cursor));
+
+	WT_DHANDLE_RELEASE(dhandle);
+	WT_STAT_CONN_INCR(session, cursor_cache_discard);
+}
+
+/*
+ * __wt_curfile_cache_get --
+ *	Return a cached cursor opened with the given URI and configuration.
+ */
+int
+__wt_curfile_cache_get(WT_SESSION_IMPL *session,
+    const char *uri, const char *config, WT_CURSOR **cursorp)
+{
+	WT_CURSOR_BTREE *cbt;
+	uint64_t bucket, hash;
+
+	*cursorp = NULL;
+
+	if (session->ncursors_cached == 0) {
+		WT_STAT_CONN_INCR(session, cursor_cache_miss);
+		return (WT_NOTFOUND);
+	}
+	if (config == NULL)
+		config = "";
+
+	hash = __wt_hash_city64(uri, strlen(uri));
+	bucket = hash % WT_HASH_ARRAY_SIZE;
+	TAILQ_FOREACH(cbt, &session->cursor_cache[bucket], cacheq) {
+		if (cbt->cache_hash != hash ||
+		    strcmp(cbt->iface.uri, uri) != 0 ||
+		    strcmp(cbt->cache_config, config) != 0)
+			continue;
+
+		TAILQ_REMOVE(&session->cursor_cache[bucket], cbt, cacheq);
+		--session->ncursors_cached;
+		WT_STAT_CONN_DECR(session, cursor_cache);
+
+		if (__curfile_reopen(session, cbt) == 0) {
+			WT_STAT_CONN_INCR(session, cursor_cache_hit);
+			*cursorp = &cbt->iface;
+			return (0);
+		}
+		__curfile_cache_discard(session, cbt);
+		break;
+	}
+
+	WT_STAT_CONN_INCR(session, cursor_cache_miss);
+	return (WT_NOTFOUND);
+}
+
+/*
+ * __wt_curfile_cache_discard --
+ *	Discard a session's cached cursors: all of them, or those that can no
+ *	longer be reopened, so their handles can be swept.
+ */
+void
+__wt_curfile_cache_discard(WT_SESSION_IMPL *session, bool all)
+{
+	WT_CURSOR_BTREE *cbt, *cbt_tmp;
+	WT_DATA_HANDLE *dhandle;
+	uint64_t gen;
+	u_int i;
+
+	gen = S2C(session)->cursor_cache_gen;
+	for (i = 0;
+	    session->ncursors_cached > 0 && i < WT_HASH_ARRAY_SIZE; ++i)
+		TAILQ_FOREACH_SAFE(cbt,
+		    &session->cursor_cache[i], cacheq, cbt_tmp) {
+			dhandle = cbt->btree->dhandle;
+			if (!all && cbt->cache_gen == gen &&
+			    !F_ISSET(dhandle, WT_DHANDLE_DEAD) &&
+			    F_ISSET(dhandle, WT_DHANDLE_OPEN))
+				continue;
+
+			TAILQ_REMOVE(&session->cursor_cache[i], cbt, cacheq);
+			--session->ncursors_cached;
+			WT_STAT_CONN_DECR(session, cursor_cache);
+			__curfile_cache_discard(session, cbt);
+		}
+}
@@ -512,6 +512,94 @@ __curstat_join_init(WT_SESSION_IMPL *session,
 	return (0);
 }
 
+/*
+ * __curstat_latency_desc --
+ *	Assemble the description of a latency histogram statistic.
+ */
+static int
+__curstat_latency_desc(WT_CURSOR_STAT *cst, int slot, const char **resultp)
+{
+	static const char * const names[WT_LATENCY_TYPES] = {
+	    "cursor search",
+	    "cursor insert",
+	    "cursor update",
+	    "cursor remove",
+	    "transaction commit",
+	    "page read"
+	};
+	WT_SESSION_IMPL *session;
+	uint64_t high, low;
+	u_int bits, bucket, field, sub;
+	const char *name;
+
+	session = (WT_SESSION_IMPL *)cst->iface.session;
+
+	name = names[(u_int)slot /
+	    (sizeof(WT_LATENCY_HIST) / sizeof(int64_t))];
+	field = (u_int)slot % (sizeof(WT_LATENCY_HIST) / sizeof(int64_t));
+	WT_RET(__wt_realloc(session, NULL, 128, &cst->desc_buf));
+	switch (field) {
+	case 0:
+		WT_RET(__wt_snprintf(
+		    cst->desc_buf, 128, "%s: latency operations", name));
+		break;
+	case 1:
+		WT_RET(__wt_snprintf(
+		    cst->desc_buf, 128, "%s: latency total (ns)", name));
+		break;
+	case 2:
+		WT_RET(__wt_snprintf(
+		    cst->desc_buf, 128, "%s: latency maximum (ns)", name));
+		break;
+	default:
+		/* The inverse of the bucket calculation in the recording. */
+		bucket = field - 3;
+		bits = bucket >> WT_LATENCY_SUB_BITS;
+		sub = bucket & ((1U << WT_LATENCY_SUB_BITS) - 1);
+		if (bits == 0) {
+			low = bucket;
+			high = bucket + 1;
+		} else {
+			low = (uint64_t)((1U << WT_LATENCY_SUB_BITS) + sub) <<
+			    (bits - 1);
+			high = (uint64_t)((1U << WT_LATENCY_SUB_BITS) + sub +
+			    1) << (bits - 1);
+		}
+		if (bucket == WT_LATENCY_BUCKETS - 1)
+			WT_RET(__wt_snprintf(cst->desc_buf, 128,
+			    "%s: latency %" PRIu64 "ns and over", name, low));
+		else
+			WT_RET(__wt_snprintf(cst->desc_buf, 128,
+			    "%s: latency %" PRIu64 "-%" PRIu64 "ns",
+			    name, low, high - 1));
+		break;
+	}
+	*resultp = cst->desc_buf;
+	return (0);
+}
+
+/*
+ * __curstat_latency_init --
+ *	Initialize the latency histogram statistics.
+ */
+static int
+__curstat_latency_init(WT_SESSION_IMPL *session, WT_CURSOR_STAT *cst)
+{
+	if (!WT_LATENCY_ENABLED(session))
+		WT_RET_MSG(session, EINVAL,
+		    "statistics:latency cursors require the database "
+		    "statistics configuration to include latency");
+
+	__wt_latency_aggregate(
+	    session, &cst->u.latency_stats, F_ISSET(cst, WT_STAT_CLEAR));
+
+	cst->stats = (int64_t *)&cst->u.latency_stats;
+	cst->stats_base = WT_LATENCY_STATS_BASE;
+	cst->stats_count = sizeof(WT_LATENCY_STATS) / sizeof(int64_t);
+	cst->stats_desc = __curstat_latency_desc;
+	return (0);
+}
+
 /*
  * __wt_curstat_init --
  *	Initialize a statistics cursor.
@@ -532,6 +620,9 @@ __wt_curstat_init(WT_SESSION_IMPL *session,
 	if (WT_STREQ(dsrc_uri, "join"))
 		WT_RET(__curstat_join_init(session, curjoin, cfg, cst));
 
+	else if (WT_STREQ(dsrc_uri, "latency"))
+		WT_RET(__curstat_latency_init(session, cst));
+
 	else if (WT_PREFIX_MATCH(dsrc_uri, "colgroup:"))
 		WT_RET(
 		    __wt_curstat_colgroup_init(session, dsrc_uri, cfg, cst));
@@ -51,7 +51,8 @@
 	const char *(cfg)[] =						\
 	    { WT_CONFIG_BASE(s, h##_##n), config, NULL };		\
 	API_SESSION_INIT(s, h, n, dh);					\
-	if ((config) != NULL)						\
+	if ((config) != NULL && !__wt_config_compiled_for((s),		\
+	    WT_CONFIG_REF(session, h##_##n), (config)))			\
 		WT_ERR(__wt_config_check((s),				\
 		    WT_CONFIG_REF(session, h##_##n), (config), 0))
 
@@ -183,7 +183,7 @@ struct __wt_bm {
 	int (*salvage_end)(WT_BM *, WT_SESSION_IMPL *);
 	int (*salvage_next)
 	    (WT_BM *, WT_SESSION_IMPL *, uint8_t *, size_t *, bool *);
-	int (*salvage_start)(WT_BM *, WT_SESSION_IMPL *);
+	int (*salvage_start)(WT_BM *, WT_SESSION_IMPL *, const char *[]);
 	int (*salvage_valid)
 	    (WT_BM *, WT_SESSION_IMPL *, uint8_t *, size_t, bool);
 	int (*size)(WT_BM *, WT_SESSION_IMPL *, wt_off_t *);
@@ -262,6 +262,9 @@ struct __wt_block {
 
 				/* Salvage support */
 	wt_off_t	slvg_off;	/* Salvage file offset */
+	WT_BLOCK_SLVG_RANGE *slvg_range;/* Ranges scanned in parallel */
+	u_int		slvg_range_cnt;
+	u_int		slvg_range_next;/* Current range */
 
 				/* Verification support */
 	bool	   verify;		/* If performing verification */
@@ -274,6 +277,36 @@ struct __wt_block {
 	uint8_t   *fragckpt;		/* Per-checkpoint frag tracking list */
 };
 
+/*
+ * WT_BLOCK_SLVG_BLK --
+ *	A block found by a salvage scan of the file.
+ */
+struct __wt_block_slvg_blk {
+	wt_off_t offset;		/* Block offset */
+	uint32_t size;			/* Block size */
+	uint32_t checksum;		/* Block checksum */
+};
+
+/*
+ * WT_BLOCK_SLVG_RANGE --
+ *	Salvage scans ranges of the file in parallel before the file is read in
+ * order.  Each range lists the blocks found in it: offsets in the range that
+ * aren't inside a found block were checked and rejected, offsets inside a
+ * found block weren't checked at all.
+ */
+struct __wt_block_slvg_range {
+	wt_off_t start;			/* Range start offset */
+	wt_off_t stop;			/* Range stop offset */
+
+	WT_BLOCK_SLVG_BLK *blk;		/* Blocks found, in file order */
+	size_t	 blk_allocated;
+	size_t	 blk_entries;
+	size_t	 blk_next;		/* Next block to check */
+
+	volatile wt_off_t scanned;	/* Bytes scanned, for progress */
+	volatile bool	  complete;	/* Range was entirely scanned */
+};
+
 /*
  * WT_BLOCK_DESC --
  *	The file's description.
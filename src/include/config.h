@@ -35,6 +35,39 @@ struct __wt_config_entry {
 
 	const WT_CONFIG_CHECK *checks;		/* check array */
 	u_int checks_entries;
+
+	bool compilable;			/* can be compiled */
+};
+
+/*
+ * WT_CONFIG_COMPILED --
+ *	A configuration string compiled for a method by
+ * WT_CONNECTION::compile_configuration: checked once, with the final value of
+ * each of the method's keys resolved against the method's defaults.  Compiled
+ * configurations are packed into an arena owned by the connection, each one
+ * followed by a copy of its string.  The copy is the application's handle, so
+ * a handle can be used anywhere a configuration string is expected.
+ */
+struct __wt_config_compiled {
+	const WT_CONFIG_ENTRY *entry;		/* method */
+	const char *config;			/* handle: the string copy */
+
+	WT_CONFIG_ITEM *values;			/* resolved value per check */
+	uint8_t *set;				/* value set by application */
+};
+
+/*
+ * WT_CONFIG_COMPILED_CHUNK --
+ *	A chunk of the compiled configuration arena.  The arena grows by adding
+ * chunks to the head of a list, and is freed when the connection is closed.
+ */
+#define	WT_CONFIG_COMPILED_CHUNK_SIZE	(64 * WT_KILOBYTE)
+struct __wt_config_compiled_chunk {
+	WT_CONFIG_COMPILED_CHUNK *next;		/* older chunk */
+
+	uint8_t *mem;				/* memory, follows the chunk */
+	size_t	 size;				/* memory size */
+	size_t	 used;				/* memory in use */
 };
 
 struct __wt_config_parser_impl {
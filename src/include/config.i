@@ -0,0 +1,59 @@
+/*-
+ * Copyright (c) 2014-2017 MongoDB, Inc.
+ * Copyright (c) 2008-2014 WiredTiger, Inc.
+ *	All rights reserved.
+ *
+ * See the file LICENSE for redistribution information.
+ */
+
+/*
+ * __wt_config_compiled --
+ *	Return the compiled configuration for a handle returned by
+ *	WT_CONNECTION::compile_configuration, or NULL if the configuration
+ *	is an ordinary string.
+ */
+static inline WT_CONFIG_COMPILED *
+__wt_config_compiled(WT_SESSION_IMPL *session, const char *config)
+{
+	WT_CONFIG_COMPILED *compiled;
+	WT_CONFIG_COMPILED_CHUNK *chunk;
+	uintptr_t p, start;
+
+	if (config == NULL)
+		return (NULL);
+
+	/*
+	 * Handles are aligned and immediately follow their structure in the
+	 * arena.  A string from the application can only be in the arena if
+	 * it points into a handle, check the structure refers back to it.
+	 */
+	p = (uintptr_t)config;
+	for (chunk = S2C(session)->config_compiled;
+	    chunk != NULL; chunk = chunk->next) {
+		start = (uintptr_t)chunk->mem;
+		if (p < start + sizeof(WT_CONFIG_COMPILED) ||
+		    p >= start + chunk->used)
+			continue;
+		if (p % sizeof(void *) != 0)
+			return (NULL);
+		compiled =
+		    (WT_CONFIG_COMPILED *)(p - sizeof(WT_CONFIG_COMPILED));
+		return (compiled->config == config ? compiled : NULL);
+	}
+	return (NULL);
+}
+
+/*
+ * __wt_config_compiled_for --
+ *	Return if a configuration was compiled, and so already checked, for a
+ *	method.
+ */
+static inline bool
+__wt_config_compiled_for(WT_SESSION_IMPL *session,
+    const WT_CONFIG_ENTRY *entry, const char *config)
+{
+	WT_CONFIG_COMPILED *compiled;
+
+	compiled = __wt_config_compiled(session, config);
+	return (compiled != NULL && compiled->entry == entry);
+}
@@ -12,6 +12,12 @@
  */
 #define	WT_HASH_ARRAY_SIZE	512
 
+/*
+ * The data handle hash tables start at the default size and double whenever
+ * they average more than this many handles per bucket.
+ */
+#define	WT_DHANDLE_HASH_LOAD	2
+
 /*******************************************
  * Global per-process structure.
  *******************************************/
@@ -103,6 +109,16 @@ struct __wt_named_extractor {
 	TAILQ_ENTRY(__wt_named_extractor) q;	/* Linked list of extractors */
 };
 
+/*
+ * WT_STATLOG_SOURCE --
+ *	A source of statistics written to the binary statistics log.
+ */
+struct __wt_statlog_source {
+	char	*name;			/* Source name */
+	int64_t	*values;		/* Previous values written */
+	u_int	 schema;		/* Statistics schema */
+};
+
 /*
  * Allocate some additional slots for internal sessions so the user cannot
  * configure too few sessions for us to run.
@@ -191,6 +207,7 @@ struct __wt_connection_impl {
 
 					/* Configuration */
 	const WT_CONFIG_ENTRY **config_entries;
+	WT_CONFIG_COMPILED_CHUNK *config_compiled;
 
 	void  **foc;			/* Free-on-close array */
 	size_t  foc_cnt;		/* Array entries */
@@ -202,10 +219,12 @@ struct __wt_connection_impl {
 	 * The connection keeps a cache of data handles. The set of handles
 	 * can grow quite large so we maintain both a simple list and a hash
 	 * table of lists. The hash table key is based on a hash of the table
-	 * URI.
+	 * URI.  The hash table grows with the number of handles, it's resized
+	 * while holding the handle list write lock.
 	 */
 					/* Locked: data handle hash array */
-	TAILQ_HEAD(__wt_dhhash, __wt_data_handle) dhhash[WT_HASH_ARRAY_SIZE];
+	TAILQ_HEAD(__wt_dhhash, __wt_data_handle) *dhhash;
+	u_int dhhash_size;		/* Locked: data handle hash buckets */
 					/* Locked: data handle list */
 	TAILQ_HEAD(__wt_dhandle_qh, __wt_data_handle) dhqh;
 					/* Locked: LSM handle list. */
@@ -225,6 +244,7 @@ struct __wt_connection_impl {
 	uint32_t next_file_id;		/* Locked: file ID counter */
 	uint32_t open_file_count;	/* Atomic: open file handle count */
 	uint32_t open_cursor_count;	/* Atomic: open cursor handle count */
+	uint64_t cursor_cache_gen;	/* Atomic: cached cursor generation */
 
 	/*
 	 * WiredTiger allocates space for 50 simultaneous sessions (threads of
@@ -311,6 +331,12 @@ struct __wt_connection_impl {
 	char	       **stat_sources;	/* Statistics log list of objects */
 	const char	*stat_stamp;	/* Statistics log entry timestamp */
 	uint64_t	 stat_usecs;	/* Statistics log period */
+					/* Statistics log binary sources */
+	WT_STATLOG_SOURCE *stat_bin;
+	size_t		 stat_bin_allocated;
+	u_int		 stat_bin_entries;
+	u_int		 stat_bin_next;	/* Next source expected */
+	uint32_t	 stat_bin_schemas;/* Schemas written to the log */
 
 #define	WT_CONN_LOG_ARCHIVE		0x001	/* Archive is enabled */
 #define	WT_CONN_LOG_DOWNGRADED		0x002	/* Running older version */
@@ -63,6 +63,13 @@
 	0				/* uint32_t flags */		\
 }
 
+/*
+ * Schema changes can change what a URI refers to (for example, an index added
+ * to a simple table), invalidate cursors cached by all sessions.
+ */
+#define	WT_CURSOR_CACHE_INVALIDATE(s)					\
+	(void)__wt_atomic_add64(&S2C(s)->cursor_cache_gen, 1)
+
 struct __wt_cursor_backup {
 	WT_CURSOR iface;
 
@@ -203,6 +210,17 @@ struct __wt_cursor_btree {
 
 	uint8_t	append_tree;		/* Cursor appended to the tree */
 
+	/*
+	 * Cursors that can be cached by their session remember how they were
+	 * opened: a closed cursor is reused by an open with the same URI and
+	 * configuration.
+	 */
+	TAILQ_ENTRY(__wt_cursor_btree) cacheq;
+	char	 *cache_config;		/* Configuration, if cacheable */
+	uint64_t  cache_hash;		/* Hash of the URI */
+	uint64_t  cache_gen;		/* Connection generation at open */
+	uint32_t  cache_flags;		/* Cursor flags at open */
+
 #ifdef HAVE_DIAGNOSTIC
 	/* Check that cursor next/prev never returns keys out-of-order. */
 	WT_ITEM *lastkey, _lastkey;
@@ -460,6 +478,7 @@ struct __wt_cursor_stat {
 		WT_DSRC_STATS dsrc_stats;
 		WT_CONNECTION_STATS conn_stats;
 		WT_JOIN_STATS_GROUP join_stats_group;
+		WT_LATENCY_STATS latency_stats;
 	} u;
 
 	const char **cfg;		/* Original cursor configuration */
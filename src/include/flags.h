@@ -52,36 +52,39 @@
 #define	WT_REC_UPDATE_RESTORE				0x00000020
 #define	WT_REC_VISIBILITY_ERR				0x00000040
 #define	WT_REC_VISIBLE_ALL				0x00000080
-#define	WT_SESSION_CAN_WAIT				0x00000001
-#define	WT_SESSION_IGNORE_CACHE_SIZE			0x00000002
-#define	WT_SESSION_INTERNAL				0x00000004
-#define	WT_SESSION_LOCKED_CHECKPOINT			0x00000008
-#define	WT_SESSION_LOCKED_HANDLE_LIST_READ		0x00000010
-#define	WT_SESSION_LOCKED_HANDLE_LIST_WRITE		0x00000020
-#define	WT_SESSION_LOCKED_METADATA			0x00000040
-#define	WT_SESSION_LOCKED_PASS				0x00000080
-#define	WT_SESSION_LOCKED_SCHEMA			0x00000100
-#define	WT_SESSION_LOCKED_SLOT				0x00000200
-#define	WT_SESSION_LOCKED_TABLE_READ			0x00000400
-#define	WT_SESSION_LOCKED_TABLE_WRITE			0x00000800
-#define	WT_SESSION_LOCKED_TURTLE			0x00001000
-#define	WT_SESSION_LOGGING_INMEM			0x00002000
-#define	WT_SESSION_LOOKASIDE_CURSOR			0x00004000
-#define	WT_SESSION_NO_DATA_HANDLES			0x00008000
-#define	WT_SESSION_NO_LOGGING				0x00010000
-#define	WT_SESSION_NO_RECONCILE				0x00020000
-#define	WT_SESSION_NO_SCHEMA_LOCK			0x00040000
-#define	WT_SESSION_QUIET_CORRUPT_FILE			0x00080000
-#define	WT_SESSION_READ_WONT_NEED			0x00100000
-#define	WT_SESSION_SERVER_ASYNC				0x00200000
-#define	WT_STAT_CLEAR					0x00000001
-#define	WT_STAT_JSON					0x00000002
-#define	WT_STAT_ON_CLOSE				0x00000004
-#define	WT_STAT_TYPE_ALL				0x00000008
-#define	WT_STAT_TYPE_CACHE_WALK				0x00000010
-#define	WT_STAT_TYPE_FAST				0x00000020
-#define	WT_STAT_TYPE_SIZE				0x00000040
-#define	WT_STAT_TYPE_TREE_WALK				0x00000080
+#define	WT_SESSION_CACHE_CURSORS			0x00000001
+#define	WT_SESSION_CAN_WAIT				0x00000002
+#define	WT_SESSION_IGNORE_CACHE_SIZE			0x00000004
+#define	WT_SESSION_INTERNAL				0x00000008
+#define	WT_SESSION_LOCKED_CHECKPOINT			0x00000010
+#define	WT_SESSION_LOCKED_HANDLE_LIST_READ		0x00000020
+#define	WT_SESSION_LOCKED_HANDLE_LIST_WRITE		0x00000040
+#define	WT_SESSION_LOCKED_METADATA			0x00000080
+#define	WT_SESSION_LOCKED_PASS				0x00000100
+#define	WT_SESSION_LOCKED_SCHEMA			0x00000200
+#define	WT_SESSION_LOCKED_SLOT				0x00000400
+#define	WT_SESSION_LOCKED_TABLE_READ			0x00000800
+#define	WT_SESSION_LOCKED_TABLE_WRITE			0x00001000
+#define	WT_SESSION_LOCKED_TURTLE			0x00002000
+#define	WT_SESSION_LOGGING_INMEM			0x00004000
+#define	WT_SESSION_LOOKASIDE_CURSOR			0x00008000
+#define	WT_SESSION_NO_DATA_HANDLES			0x00010000
+#define	WT_SESSION_NO_LOGGING				0x00020000
+#define	WT_SESSION_NO_RECONCILE				0x00040000
+#define	WT_SESSION_NO_SCHEMA_LOCK			0x00080000
+#define	WT_SESSION_QUIET_CORRUPT_FILE			0x00100000
+#define	WT_SESSION_READ_WONT_NEED			0x00200000
+#define	WT_SESSION_SERVER_ASYNC				0x00400000
+#define	WT_STAT_BINARY					0x00000001
+#define	WT_STAT_CLEAR					0x00000002
+#define	WT_STAT_JSON					0x00000004
+#define	WT_STAT_ON_CLOSE				0x00000008
+#define	WT_STAT_TYPE_ALL				0x00000010
+#define	WT_STAT_TYPE_CACHE_WALK				0x00000020
+#define	WT_STAT_TYPE_FAST				0x00000040
+#define	WT_STAT_TYPE_LATENCY				0x00000080
+#define	WT_STAT_TYPE_SIZE				0x00000100
+#define	WT_STAT_TYPE_TREE_WALK				0x00000200
 #define	WT_TIMING_STRESS_CHECKPOINT_SLOW		0x00000001
 #define	WT_TIMING_STRESS_INTERNAL_PAGE_SPLIT_RACE	0x00000002
 #define	WT_TIMING_STRESS_PAGE_SPLIT_RACE		0x00000004
@@ -165,4 +165,6 @@ struct __wt_fstream {
 	int (*fstr_getline)(WT_SESSION_IMPL *, WT_FSTREAM *, WT_ITEM *);
 	int (*fstr_printf)(
 	    WT_SESSION_IMPL *, WT_FSTREAM *, const char *, va_list);
+	int (*fstr_write)(
+	    WT_SESSION_IMPL *, WT_FSTREAM *, const void *, size_t);
 };
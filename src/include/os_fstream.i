@@ -80,6 +80,17 @@ __wt_fprintf(WT_SESSION_IMPL *session, WT_FSTREAM *fstr, const char *fmt, ...)
 	return (ret);
 }
 
+/*
+ * __wt_fwrite --
+ *	ANSI C fwrite.
+ */
+static inline int
+__wt_fwrite(
+    WT_SESSION_IMPL *session, WT_FSTREAM *fstr, const void *buf, size_t len)
+{
+	return (fstr->fstr_write(session, fstr, buf, len));
+}
+
 /*
  * __wt_sync_and_rename --
  *	Flush and close a stream, then swap it into place.
@@ -65,11 +65,13 @@ struct __wt_session_impl {
 	 */
 					/* Session handle reference list */
 	TAILQ_HEAD(__dhandles, __wt_data_handle_cache) dhandles;
+	u_int	ndhandles;		/* Count of cached handles */
 	time_t last_sweep;		/* Last sweep for dead handles */
 	struct timespec last_epoch;	/* Last epoch time returned */
 
 					/* Cursors closed with the session */
 	TAILQ_HEAD(__cursors, __wt_cursor) cursors;
+	u_int	ncursors_cached;	/* Count of cached cursors */
 
 	WT_CURSOR_BACKUP *bkp_cursor;	/* Hot backup cursor */
 
@@ -165,6 +167,12 @@ struct __wt_session_impl {
 
 					/* Hashed handle reference list array */
 	TAILQ_HEAD(__dhandles_hash, __wt_data_handle_cache) *dhhash;
+	u_int dhhash_size;		/* Handle reference hash buckets */
+
+					/* Hashed cached cursor list array */
+	TAILQ_HEAD(__cursor_cache, __wt_cursor_btree) *cursor_cache;
+
+	WT_LATENCY_STATS *latency;	/* Latency histograms */
 
 					/* Generations manager */
 #define	WT_GEN_CHECKPOINT	0	/* Checkpoint generation */
@@ -389,6 +389,9 @@ struct __wt_connection_stats {
 	int64_t fsync_io;
 	int64_t read_io;
 	int64_t write_io;
+	int64_t cursor_cache_discard;
+	int64_t cursor_cache_hit;
+	int64_t cursor_cache_miss;
 	int64_t cursor_create;
 	int64_t cursor_insert;
 	int64_t cursor_modify;
@@ -401,13 +404,21 @@ struct __wt_connection_stats {
 	int64_t cursor_search;
 	int64_t cursor_search_near;
 	int64_t cursor_update;
+	int64_t cursor_cache;
 	int64_t cursor_truncate;
+	int64_t dh_conn_hash_buckets;
+	int64_t dh_conn_hash_walk;
+	int64_t dh_conn_hash_lookup;
+	int64_t dh_conn_hash_resize;
 	int64_t dh_conn_handle_count;
 	int64_t dh_sweep_ref;
 	int64_t dh_sweep_close;
 	int64_t dh_sweep_remove;
 	int64_t dh_sweep_tod;
 	int64_t dh_sweeps;
+	int64_t dh_session_hash_walk;
+	int64_t dh_session_hash_lookup;
+	int64_t dh_session_hash_resize;
 	int64_t dh_session_handles;
 	int64_t dh_session_sweeps;
 	int64_t lock_checkpoint_count;
@@ -709,3 +720,62 @@ struct __wt_join_stats {
 };
 
 /* Statistics section: END */
+
+/*
+ * Latency histograms:
+ *
+ * When latency statistics are configured, sessions time a set of operations
+ * and record them in histograms of their own, so recording a latency doesn't
+ * write cache lines shared with other threads.  The histograms persist past
+ * session close, a statistics:latency cursor sums the histograms of all of
+ * the session slots when it's opened.
+ *
+ * Histogram buckets are log-linear, in the style of HdrHistogram: each power
+ * of two is divided into 2^WT_LATENCY_SUB_BITS buckets, so a bucket is never
+ * more than 25% wider than its smallest value.  Latencies are recorded in
+ * nanoseconds, latencies of 2^WT_LATENCY_MAX_BITS nanoseconds (about 68
+ * seconds) or more are counted in the last bucket.
+ */
+#define	WT_LATENCY_CURSOR_SEARCH	0	/* WT_CURSOR::search */
+#define	WT_LATENCY_CURSOR_INSERT	1	/* WT_CURSOR::insert */
+#define	WT_LATENCY_CURSOR_UPDATE	2	/* WT_CURSOR::update */
+#define	WT_LATENCY_CURSOR_REMOVE	3	/* WT_CURSOR::remove */
+#define	WT_LATENCY_COMMIT		4	/* Transaction commit */
+#define	WT_LATENCY_READ			5	/* Page read from disk */
+#define	WT_LATENCY_TYPES		6
+
+#define	WT_LATENCY_SUB_BITS		2
+#define	WT_LATENCY_MAX_BITS		36
+#define	WT_LATENCY_BUCKETS						\
+	((WT_LATENCY_MAX_BITS - WT_LATENCY_SUB_BITS + 1) << WT_LATENCY_SUB_BITS)
+
+struct __wt_latency_hist {
+	int64_t count;				/* Operations */
+	int64_t total;				/* Total nanoseconds */
+	int64_t max;				/* Maximum nanoseconds */
+	int64_t bucket[WT_LATENCY_BUCKETS];	/* Histogram */
+};
+
+#define	WT_LATENCY_STATS_BASE	4000
+struct __wt_latency_stats {
+	WT_LATENCY_HIST hist[WT_LATENCY_TYPES];
+};
+
+#define	WT_LATENCY_ENABLED(session)					\
+	FLD_ISSET(S2C(session)->stat_flags, WT_STAT_TYPE_LATENCY)
+
+/*
+ * WT_WITH_LATENCY --
+ *	Perform an operation, recording its latency if configured.
+ */
+#define	WT_WITH_LATENCY(session, type, op) do {				\
+	struct timespec __start, __stop;				\
+	if (WT_LATENCY_ENABLED(session)) {				\
+		__wt_epoch(session, &__start);				\
+		op;							\
+		__wt_epoch(session, &__stop);				\
+		__wt_latency_record(session,				\
+		    type, WT_TIMEDIFF_NS(__stop, __start));		\
+	} else								\
+		op;							\
+} while (0)
@@ -544,6 +544,25 @@ struct __wt_extension_api {
 	 * @copydoc wiredtiger_version
 	 */
 	const char *(*version)(int *majorp, int *minorp, int *patchp);
+
+	/*!
+	 * Return keys dividing the object a dump cursor is open on into
+	 * ranges with similar numbers of leaf pages, for dumping the ranges
+	 * in parallel.  Each key is the first key of its range, in the
+	 * cursor's dump format.
+	 *
+	 * @param wt_api the extension handle
+	 * @param cursor a cursor opened with the \c dump configuration
+	 * @param n the number of ranges
+	 * @param [out] splitsp a NULL-terminated array of up to \c n - 1
+	 * keys in key order, the caller frees the keys and the array with
+	 * the C library's free function
+	 * @errors
+	 * ENOTSUP is returned for objects that can't be divided, such as LSM
+	 * trees.
+	 */
+	int (*dump_split)(WT_EXTENSION_API *wt_api,
+	    WT_CURSOR *cursor, uint32_t n, char ***splitsp);
 };
 
 /*!
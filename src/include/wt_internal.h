@@ -84,6 +84,10 @@ struct __wt_block_desc;
     typedef struct __wt_block_desc WT_BLOCK_DESC;
 struct __wt_block_header;
     typedef struct __wt_block_header WT_BLOCK_HEADER;
+struct __wt_block_slvg_blk;
+    typedef struct __wt_block_slvg_blk WT_BLOCK_SLVG_BLK;
+struct __wt_block_slvg_range;
+    typedef struct __wt_block_slvg_range WT_BLOCK_SLVG_RANGE;
 struct __wt_bloom;
     typedef struct __wt_bloom WT_BLOOM;
 struct __wt_bloom_hash;
@@ -118,6 +122,10 @@ struct __wt_config;
     typedef struct __wt_config WT_CONFIG;
 struct __wt_config_check;
     typedef struct __wt_config_check WT_CONFIG_CHECK;
+struct __wt_config_compiled;
+    typedef struct __wt_config_compiled WT_CONFIG_COMPILED;
+struct __wt_config_compiled_chunk;
+    typedef struct __wt_config_compiled_chunk WT_CONFIG_COMPILED_CHUNK;
 struct __wt_config_entry;
     typedef struct __wt_config_entry WT_CONFIG_ENTRY;
 struct __wt_config_parser_impl;
@@ -202,6 +210,10 @@ struct __wt_join_stats_group;
     typedef struct __wt_join_stats_group WT_JOIN_STATS_GROUP;
 struct __wt_keyed_encryptor;
     typedef struct __wt_keyed_encryptor WT_KEYED_ENCRYPTOR;
+struct __wt_latency_hist;
+    typedef struct __wt_latency_hist WT_LATENCY_HIST;
+struct __wt_latency_stats;
+    typedef struct __wt_latency_stats WT_LATENCY_STATS;
 struct __wt_log;
     typedef struct __wt_log WT_LOG;
 struct __wt_log_desc;
@@ -286,6 +298,8 @@ struct __wt_spinlock;
     typedef struct __wt_spinlock WT_SPINLOCK;
 struct __wt_stash;
     typedef struct __wt_stash WT_STASH;
+struct __wt_statlog_source;
+    typedef struct __wt_statlog_source WT_STATLOG_SOURCE;
 struct __wt_table;
     typedef struct __wt_table WT_TABLE;
 struct __wt_thread;
@@ -385,6 +399,7 @@ union __wt_rand_state;
 #include "btree.i"			/* required by cursor.i */
 #include "btree_cmp.i"
 #include "column.i"
+#include "config.i"
 #include "cursor.i"
 #include "log.i"
 #include "misc.i"
@@ -170,6 +170,39 @@ __fstream_printf_notsup(
 	WT_RET_MSG(session, ENOTSUP, "%s: printf", fstr->name);
 }
 
+/*
+ * __fstream_write --
+ *	ANSI C fwrite.
+ */
+static int
+__fstream_write(
+    WT_SESSION_IMPL *session, WT_FSTREAM *fstr, const void *data, size_t len)
+{
+	WT_ITEM *buf;
+
+	buf = &fstr->buf;
+
+	WT_RET(__wt_buf_extend(session, buf, buf->size + len));
+	memcpy((uint8_t *)buf->mem + buf->size, data, len);
+	buf->size += len;
+
+	return (buf->size >= WT_STREAM_BUFSIZE ?
+	    __wt_fflush(session, fstr) : 0);
+}
+
+/*
+ * __fstream_write_notsup --
+ *	ANSI C fwrite unsupported.
+ */
+static int
+__fstream_write_notsup(
+    WT_SESSION_IMPL *session, WT_FSTREAM *fstr, const void *data, size_t len)
+{
+	WT_UNUSED(data);
+	WT_UNUSED(len);
+	WT_RET_MSG(session, ENOTSUP, "%s: write", fstr->name);
+}
+
 /*
  * __wt_fopen --
  *	Open a stream handle.
@@ -202,11 +235,13 @@ __wt_fopen(WT_SESSION_IMPL *session,
 		fstr->fstr_flush = __fstream_flush;
 		fstr->fstr_getline = __fstream_getline_notsup;
 		fstr->fstr_printf = __fstream_printf;
+		fstr->fstr_write = __fstream_write;
 	} else {
 		WT_ASSERT(session, LF_ISSET(WT_STREAM_READ));
 		fstr->fstr_flush = __fstream_flush_notsup;
 		fstr->fstr_getline = __fstream_getline;
 		fstr->fstr_printf = __fstream_printf_notsup;
+		fstr->fstr_write = __fstream_write_notsup;
 	}
 	*fstrp = fstr;
 	return (0);
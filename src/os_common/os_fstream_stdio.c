@@ -54,6 +54,19 @@ __stdio_printf(
 	WT_RET_MSG(session, EIO, "%s: printf", fs->name);
 }
 
+/*
+ * __stdio_write --
+ *	ANSI C fwrite.
+ */
+static int
+__stdio_write(
+    WT_SESSION_IMPL *session, WT_FSTREAM *fs, const void *buf, size_t len)
+{
+	if (fwrite(buf, 1, len, fs->fp) == len)
+		return (0);
+	WT_RET_MSG(session, EIO, "%s: write", fs->name);
+}
+
 /*
  * __stdio_init --
  *	Initialize stdio functions.
@@ -68,6 +81,7 @@ __stdio_init(WT_FSTREAM *fs, const char *name, FILE *fp)
 	fs->fstr_flush = __stdio_flush;
 	fs->fstr_getline = __stdio_getline;
 	fs->fstr_printf = __stdio_printf;
+	fs->fstr_write = __stdio_write;
 }
 
 /*
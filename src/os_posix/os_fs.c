@@ -531,6 +531,64 @@ __posix_file_write(WT_FILE_HANDLE *file_handle, WT_SESSION *wt_session,
 	return (0);
 }
 
+/*
+ * __wt_file_copy_range --
+ *	Copy a range of one file to the same offset in another without
+ * reading it into memory, returning ENOTSUP if the file handles or the
+ * system don't support it.
+ */
+int
+__wt_file_copy_range(WT_SESSION_IMPL *session,
+    WT_FH *from, WT_FH *to, wt_off_t offset, size_t len)
+{
+#if defined(HAVE_COPY_FILE_RANGE)
+	WT_DECL_RET;
+	WT_FILE_HANDLE_POSIX *pfrom, *pto;
+	loff_t in, out;
+	ssize_t nw;
+
+	/* Only handles from the POSIX file system have descriptors. */
+	if (from->handle->fh_read != __posix_file_read ||
+	    to->handle->fh_write != __posix_file_write)
+		return (ENOTSUP);
+	pfrom = (WT_FILE_HANDLE_POSIX *)from->handle;
+	pto = (WT_FILE_HANDLE_POSIX *)to->handle;
+
+	for (in = out = offset; len > 0; len -= (size_t)nw) {
+		if ((nw = copy_file_range(
+		    pfrom->fd, &in, pto->fd, &out, len, 0)) > 0)
+			continue;
+		if (nw == 0)
+			WT_RET_MSG(session, WT_ERROR,
+			    "%s: handle-copy: copy_file_range: unexpected end "
+			    "of file at offset %" PRIuMAX,
+			    from->name, (uintmax_t)in);
+
+		/*
+		 * Older kernels and some file systems can't copy in the
+		 * kernel, or can't copy between file systems: the caller
+		 * falls back to reading and writing.
+		 */
+		ret = __wt_errno();
+		if (ret == ENOSYS || ret == EXDEV ||
+		    ret == EINVAL || ret == EOPNOTSUPP)
+			return (ENOTSUP);
+		WT_RET_MSG(session, ret,
+		    "%s: handle-copy: copy_file_range: failed to copy %"
+		    WT_SIZET_FMT " bytes at offset %" PRIuMAX,
+		    from->name, len, (uintmax_t)in);
+	}
+	return (0);
+#else
+	WT_UNUSED(session);
+	WT_UNUSED(from);
+	WT_UNUSED(to);
+	WT_UNUSED(offset);
+	WT_UNUSED(len);
+	return (ENOTSUP);
+#endif
+}
+
 /*
  * __posix_open_file_cloexec --
  *	Prevent child access to file handles.
@@ -455,6 +455,24 @@ __win_file_write(WT_FILE_HANDLE *file_handle,
 	return (0);
 }
 
+/*
+ * __wt_file_copy_range --
+ *	Copy a range of one file to another without reading it into memory:
+ * not supported on Windows, the caller reads and writes.
+ */
+int
+__wt_file_copy_range(WT_SESSION_IMPL *session,
+    WT_FH *from, WT_FH *to, wt_off_t offset, size_t len)
+{
+	WT_UNUSED(session);
+	WT_UNUSED(from);
+	WT_UNUSED(to);
+	WT_UNUSED(offset);
+	WT_UNUSED(len);
+
+	return (ENOTSUP);
+}
+
 /*
  * __win_open_file --
  *	Open a file handle.
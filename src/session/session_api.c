@@ -164,7 +164,8 @@ __session_close(WT_SESSION *wt_session, const char *config)
 	if (conn->txn_global.states != NULL)
 		__wt_txn_release_snapshot(session);
 
-	/* Close all open cursors. */
+	/* Close all open cursors, without caching them. */
+	F_CLR(session, WT_SESSION_CACHE_CURSORS);
 	WT_TAILQ_SAFE_REMOVE_BEGIN(cursor, &session->cursors, q, cursor_tmp) {
 		/*
 		 * Notify the user that we are closing the cursor handle
@@ -179,7 +180,8 @@ __session_close(WT_SESSION *wt_session, const char *config)
 
 	WT_ASSERT(session, session->ncursors == 0);
 
-	/* Discard cached handles. */
+	/* Discard cached cursors and handles. */
+	__wt_curfile_cache_discard(session, true);
 	__wt_session_close_cache(session);
 
 	/* Confirm we're not holding any hazard pointers. */
@@ -256,6 +258,17 @@ __session_reconfigure(WT_SESSION *wt_session, const char *config)
 
 	WT_ERR(__wt_txn_reconfigure(session, config));
 
+	ret = __wt_config_getones(session, config, "cache_cursors", &cval);
+	if (ret == 0) {
+		if (cval.val)
+			F_SET(session, WT_SESSION_CACHE_CURSORS);
+		else {
+			F_CLR(session, WT_SESSION_CACHE_CURSORS);
+			__wt_curfile_cache_discard(session, true);
+		}
+	}
+	WT_ERR_NOTFOUND_OK(ret);
+
 	ret = __wt_config_getones(session, config, "ignore_cache_size", &cval);
 	if (ret == 0) {
 		if (cval.val)
@@ -404,7 +417,7 @@ __session_open_cursor(WT_SESSION *wt_session,
 	WT_CURSOR *cursor;
 	WT_DECL_RET;
 	WT_SESSION_IMPL *session;
-	bool statjoin;
+	bool cache, statjoin;
 
 	cursor = *cursorp = NULL;
 
@@ -431,12 +444,28 @@ __session_open_cursor(WT_SESSION *wt_session,
 			WT_ERR(__wt_bad_object_type(session, uri));
 	}
 
+	/*
+	 * If the session caches cursors, look for a cached cursor opened with
+	 * the same URI and configuration, and make new cursors cacheable.
+	 * Only file and table cursors can be cached.
+	 */
+	cache = F_ISSET(session, WT_SESSION_CACHE_CURSORS) && to_dup == NULL &&
+	    (WT_PREFIX_MATCH(uri, "file:") || WT_PREFIX_MATCH(uri, "table:"));
+	if (cache) {
+		if ((ret = __wt_curfile_cache_get(
+		    session, uri, config, &cursor)) == 0)
+			goto done;
+		WT_ERR_NOTFOUND_OK(ret);
+	}
+
 	WT_ERR(__session_open_cursor_int(session, uri, NULL,
 	    statjoin ? to_dup : NULL, cfg, &cursor));
 	if (to_dup != NULL && !statjoin)
 		WT_ERR(__wt_cursor_dup_position(to_dup, cursor));
+	if (cache)
+		WT_ERR(__wt_curfile_cache_config(session, cursor, config));
 
-	*cursorp = cursor;
+done:	*cursorp = cursor;
 
 	if (0) {
 err:		if (cursor != NULL)
@@ -488,6 +517,7 @@ __session_alter(WT_SESSION *wt_session, const char *uri, const char *config)
 	    WT_WITH_SCHEMA_LOCK(session,
 		ret = __wt_schema_worker(session, uri, __wt_alter, NULL, cfg,
 		WT_BTREE_ALTER | WT_DHANDLE_EXCLUSIVE)));
+	WT_CURSOR_CACHE_INVALIDATE(session);
 
 err:	if (ret != 0)
 		WT_STAT_CONN_INCR(session, session_table_alter_fail);
@@ -579,6 +609,9 @@ __session_create(WT_SESSION *wt_session, const char *uri, const char *config)
 	}
 
 	ret = __wt_session_create(session, uri, config);
+	if (WT_PREFIX_MATCH(uri, "colgroup:") ||
+	    WT_PREFIX_MATCH(uri, "index:"))
+		WT_CURSOR_CACHE_INVALIDATE(session);
 
 err:	if (ret != 0)
 		WT_STAT_CONN_INCR(session, session_table_create_fail);
@@ -782,6 +815,7 @@ __session_rename(WT_SESSION *wt_session,
 	    WT_WITH_SCHEMA_LOCK(session,
 		WT_WITH_TABLE_WRITE_LOCK(session,
 		    ret = __wt_schema_rename(session, uri, newuri, cfg))));
+	WT_CURSOR_CACHE_INVALIDATE(session);
 
 err:	if (ret != 0)
 		WT_STAT_CONN_INCR(session, session_table_rename_fail);
@@ -886,6 +920,7 @@ __session_drop(WT_SESSION *wt_session, const char *uri, const char *config)
 			    WT_WITH_TABLE_WRITE_LOCK_NOWAIT(session, ret,
 				ret = __wt_schema_drop(session, uri, cfg)));
 	}
+	WT_CURSOR_CACHE_INVALIDATE(session);
 
 err:	if (ret != 0)
 		WT_STAT_CONN_INCR(session, session_table_drop_fail);
@@ -1446,7 +1481,8 @@ __session_commit_transaction(WT_SESSION *wt_session, const char *config)
 		    "failed transaction requires rollback");
 
 	if (ret == 0)
-		ret = __wt_txn_commit(session, cfg);
+		WT_WITH_LATENCY(session, WT_LATENCY_COMMIT,
+		    ret = __wt_txn_commit(session, cfg));
 	else {
 		WT_TRET(__wt_session_reset_cursors(session, false));
 		WT_TRET(__wt_txn_rollback(session, cfg));
@@ -1878,11 +1914,18 @@ __open_session(WT_CONNECTION_IMPL *conn,
 	 * If we don't have one, allocate the dhandle hash array.
 	 * Allocate the table hash array as well.
 	 */
-	if (session_ret->dhhash == NULL)
+	if (session_ret->dhhash == NULL) {
 		WT_ERR(__wt_calloc(session, WT_HASH_ARRAY_SIZE,
 		    sizeof(struct __dhandles_hash), &session_ret->dhhash));
-	for (i = 0; i < WT_HASH_ARRAY_SIZE; i++)
+		session_ret->dhhash_size = WT_HASH_ARRAY_SIZE;
+	}
+	for (i = 0; i < session_ret->dhhash_size; i++)
 		TAILQ_INIT(&session_ret->dhhash[i]);
+	if (session_ret->cursor_cache == NULL)
+		WT_ERR(__wt_calloc(session, WT_HASH_ARRAY_SIZE,
+		    sizeof(struct __cursor_cache), &session_ret->cursor_cache));
+	for (i = 0; i < WT_HASH_ARRAY_SIZE; i++)
+		TAILQ_INIT(&session_ret->cursor_cache[i]);
 
 	/* Initialize transaction support: default to read-committed. */
 	session_ret->isolation = WT_ISO_READ_COMMITTED;
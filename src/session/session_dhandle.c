@@ -8,6 +8,38 @@
 
 #include "wt_internal.h"
 
+/*
+ * __session_dhandle_hash_grow --
+ *	Double the size of the session's handle cache hash table.
+ */
+static int
+__session_dhandle_hash_grow(WT_SESSION_IMPL *session)
+{
+	struct __dhandles_hash *dhhash;
+	WT_DATA_HANDLE_CACHE *dhandle_cache;
+	u_int i, size;
+
+	size = session->dhhash_size * 2;
+	WT_RET(__wt_calloc(session, size, sizeof(*dhhash), &dhhash));
+	for (i = 0; i < size; i++)
+		TAILQ_INIT(&dhhash[i]);
+
+	for (i = 0; i < session->dhhash_size; i++)
+		while ((dhandle_cache =
+		    TAILQ_FIRST(&session->dhhash[i])) != NULL) {
+			TAILQ_REMOVE(&session->dhhash[i], dhandle_cache, hashq);
+			TAILQ_INSERT_TAIL(&dhhash[
+			    dhandle_cache->dhandle->name_hash % size],
+			    dhandle_cache, hashq);
+		}
+
+	__wt_free(session, session->dhhash);
+	session->dhhash = dhhash;
+	session->dhhash_size = size;
+	WT_STAT_CONN_INCR(session, dh_session_hash_resize);
+	return (0);
+}
+
 /*
  * __session_add_dhandle --
  *	Add a handle to the session's cache.
@@ -18,14 +50,22 @@ __session_add_dhandle(WT_SESSION_IMPL *session)
 	WT_DATA_HANDLE_CACHE *dhandle_cache;
 	uint64_t bucket;
 
+	/*
+	 * Grow the hash table if its chains are getting long: failing to grow
+	 * it isn't an error, lookups are only slower.
+	 */
+	if (session->ndhandles >= session->dhhash_size * WT_DHANDLE_HASH_LOAD)
+		WT_IGNORE_RET(__session_dhandle_hash_grow(session));
+
 	/* Allocate a handle cache entry. */
 	WT_RET(__wt_calloc_one(session, &dhandle_cache));
 
 	dhandle_cache->dhandle = session->dhandle;
 
-	bucket = dhandle_cache->dhandle->name_hash % WT_HASH_ARRAY_SIZE;
+	bucket = dhandle_cache->dhandle->name_hash % session->dhhash_size;
 	TAILQ_INSERT_HEAD(&session->dhandles, dhandle_cache, q);
 	TAILQ_INSERT_HEAD(&session->dhhash[bucket], dhandle_cache, hashq);
+	++session->ndhandles;
 
 	return (0);
 }
@@ -40,9 +80,10 @@ __session_discard_dhandle(
 {
 	uint64_t bucket;
 
-	bucket = dhandle_cache->dhandle->name_hash % WT_HASH_ARRAY_SIZE;
+	bucket = dhandle_cache->dhandle->name_hash % session->dhhash_size;
 	TAILQ_REMOVE(&session->dhandles, dhandle_cache, q);
 	TAILQ_REMOVE(&session->dhhash[bucket], dhandle_cache, hashq);
+	--session->ndhandles;
 
 	WT_DHANDLE_RELEASE(dhandle_cache->dhandle);
 	__wt_overwrite_and_free(session, dhandle_cache);
@@ -59,12 +100,15 @@ __session_find_dhandle(WT_SESSION_IMPL *session,
 {
 	WT_DATA_HANDLE *dhandle;
 	WT_DATA_HANDLE_CACHE *dhandle_cache;
-	uint64_t bucket;
+	uint64_t bucket, hash, walked;
 
 	dhandle = NULL;
 
-	bucket = __wt_hash_city64(uri, strlen(uri)) % WT_HASH_ARRAY_SIZE;
+	hash = __wt_hash_city64(uri, strlen(uri));
+	bucket = hash % session->dhhash_size;
+	walked = 0;
 retry:	TAILQ_FOREACH(dhandle_cache, &session->dhhash[bucket], hashq) {
+		++walked;
 		dhandle = dhandle_cache->dhandle;
 		if (WT_DHANDLE_INACTIVE(dhandle) &&
 		    !WT_IS_METADATA(dhandle)) {
@@ -73,7 +117,8 @@ retry:	TAILQ_FOREACH(dhandle_cache, &session->dhhash[bucket], hashq) {
 			goto retry;
 		}
 
-		if (strcmp(uri, dhandle->name) != 0)
+		if (dhandle->name_hash != hash ||
+		    strcmp(uri, dhandle->name) != 0)
 			continue;
 		if (checkpoint == NULL && dhandle->checkpoint == NULL)
 			break;
@@ -82,6 +127,8 @@ retry:	TAILQ_FOREACH(dhandle_cache, &session->dhhash[bucket], hashq) {
 			break;
 	}
 
+	WT_STAT_CONN_INCR(session, dh_session_hash_lookup);
+	WT_STAT_CONN_INCRV(session, dh_session_hash_walk, walked);
 	*dhandle_cachep = dhandle_cache;
 }
 
@@ -407,6 +454,12 @@ __session_dhandle_sweep(WT_SESSION_IMPL *session)
 
 	WT_STAT_CONN_INCR(session, dh_session_sweeps);
 
+	/*
+	 * Cached cursors hold references to their handles: discard any that
+	 * can't be reopened first, so their handles can be discarded too.
+	 */
+	__wt_curfile_cache_discard(session, false);
+
 	TAILQ_FOREACH_SAFE(dhandle_cache,
 	    &session->dhandles, q, dhandle_cache_tmp) {
 		dhandle = dhandle_cache->dhandle;
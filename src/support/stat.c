@@ -857,6 +857,9 @@ static const char * const __stats_connection_desc[] = {
 	"connection: total fsync I/Os",
 	"connection: total read I/Os",
 	"connection: total write I/Os",
+	"cursor: cached cursors discarded",
+	"cursor: cursor cache hits",
+	"cursor: cursor cache misses",
 	"cursor: cursor create calls",
 	"cursor: cursor insert calls",
 	"cursor: cursor modify calls",
@@ -869,13 +872,21 @@ static const char * const __stats_connection_desc[] = {
 	"cursor: cursor search calls",
 	"cursor: cursor search near calls",
 	"cursor: cursor update calls",
+	"cursor: cursors currently cached",
 	"cursor: truncate calls",
+	"data-handle: connection data handle hash buckets",
+	"data-handle: connection data handle hash entries walked by lookups",
+	"data-handle: connection data handle hash lookups",
+	"data-handle: connection data handle hash resizes",
 	"data-handle: connection data handles currently active",
 	"data-handle: connection sweep candidate became referenced",
 	"data-handle: connection sweep dhandles closed",
 	"data-handle: connection sweep dhandles removed from hash list",
 	"data-handle: connection sweep time-of-death sets",
 	"data-handle: connection sweeps",
+	"data-handle: session data handle hash entries walked by lookups",
+	"data-handle: session data handle hash lookups",
+	"data-handle: session data handle hash resizes",
 	"data-handle: session dhandles swept",
 	"data-handle: session sweep attempts",
 	"lock: checkpoint lock acquisitions",
@@ -1191,6 +1202,9 @@ __wt_stat_connection_clear_single(WT_CONNECTION_STATS *stats)
 	stats->fsync_io = 0;
 	stats->read_io = 0;
 	stats->write_io = 0;
+	stats->cursor_cache_discard = 0;
+	stats->cursor_cache_hit = 0;
+	stats->cursor_cache_miss = 0;
 	stats->cursor_create = 0;
 	stats->cursor_insert = 0;
 	stats->cursor_modify = 0;
@@ -1203,13 +1217,21 @@ __wt_stat_connection_clear_single(WT_CONNECTION_STATS *stats)
 	stats->cursor_search = 0;
 	stats->cursor_search_near = 0;
 	stats->cursor_update = 0;
+		/* not clearing cursor_cache */
 	stats->cursor_truncate = 0;
+		/* not clearing dh_conn_hash_buckets */
+	stats->dh_conn_hash_walk = 0;
+	stats->dh_conn_hash_lookup = 0;
+	stats->dh_conn_hash_resize = 0;
 		/* not clearing dh_conn_handle_count */
 	stats->dh_sweep_ref = 0;
 	stats->dh_sweep_close = 0;
 	stats->dh_sweep_remove = 0;
 	stats->dh_sweep_tod = 0;
 	stats->dh_sweeps = 0;
+	stats->dh_session_hash_walk = 0;
+	stats->dh_session_hash_lookup = 0;
+	stats->dh_session_hash_resize = 0;
 	stats->dh_session_handles = 0;
 	stats->dh_session_sweeps = 0;
 	stats->lock_checkpoint_count = 0;
@@ -1563,6 +1585,9 @@ __wt_stat_connection_aggregate(
 	to->fsync_io += WT_STAT_READ(from, fsync_io);
 	to->read_io += WT_STAT_READ(from, read_io);
 	to->write_io += WT_STAT_READ(from, write_io);
+	to->cursor_cache_discard += WT_STAT_READ(from, cursor_cache_discard);
+	to->cursor_cache_hit += WT_STAT_READ(from, cursor_cache_hit);
+	to->cursor_cache_miss += WT_STAT_READ(from, cursor_cache_miss);
 	to->cursor_create += WT_STAT_READ(from, cursor_create);
 	to->cursor_insert += WT_STAT_READ(from, cursor_insert);
 	to->cursor_modify += WT_STAT_READ(from, cursor_modify);
@@ -1575,13 +1600,23 @@ __wt_stat_connection_aggregate(
 	to->cursor_search += WT_STAT_READ(from, cursor_search);
 	to->cursor_search_near += WT_STAT_READ(from, cursor_search_near);
 	to->cursor_update += WT_STAT_READ(from, cursor_update);
+	to->cursor_cache += WT_STAT_READ(from, cursor_cache);
 	to->cursor_truncate += WT_STAT_READ(from, cursor_truncate);
+	to->dh_conn_hash_buckets += WT_STAT_READ(from, dh_conn_hash_buckets);
+	to->dh_conn_hash_walk += WT_STAT_READ(from, dh_conn_hash_walk);
+	to->dh_conn_hash_lookup += WT_STAT_READ(from, dh_conn_hash_lookup);
+	to->dh_conn_hash_resize += WT_STAT_READ(from, dh_conn_hash_resize);
 	to->dh_conn_handle_count += WT_STAT_READ(from, dh_conn_handle_count);
 	to->dh_sweep_ref += WT_STAT_READ(from, dh_sweep_ref);
 	to->dh_sweep_close += WT_STAT_READ(from, dh_sweep_close);
 	to->dh_sweep_remove += WT_STAT_READ(from, dh_sweep_remove);
 	to->dh_sweep_tod += WT_STAT_READ(from, dh_sweep_tod);
 	to->dh_sweeps += WT_STAT_READ(from, dh_sweeps);
+	to->dh_session_hash_walk += WT_STAT_READ(from, dh_session_hash_walk);
+	to->dh_session_hash_lookup +=
+	    WT_STAT_READ(from, dh_session_hash_lookup);
+	to->dh_session_hash_resize +=
+	    WT_STAT_READ(from, dh_session_hash_resize);
 	to->dh_session_handles += WT_STAT_READ(from, dh_session_handles);
 	to->dh_session_sweeps += WT_STAT_READ(from, dh_session_sweeps);
 	to->lock_checkpoint_count +=
@@ -43,7 +43,7 @@ int	 util_load(WT_SESSION *, int, char *[]);
 int	 util_loadtext(WT_SESSION *, int, char *[]);
 int	 util_printlog(WT_SESSION *, int, char *[]);
 int	 util_read(WT_SESSION *, int, char *[]);
-int	 util_read_line(WT_SESSION *, ULINE *, bool, bool *);
+int	 util_read_line(WT_SESSION *, FILE *, ULINE *, bool, bool *);
 int	 util_rebalance(WT_SESSION *, int, char *[]);
 int	 util_rename(WT_SESSION *, int, char *[]);
 int	 util_salvage(WT_SESSION *, int, char *[]);
@@ -52,5 +52,6 @@ int	 util_str2recno(WT_SESSION *, const char *p, uint64_t *recnop);
 int	 util_truncate(WT_SESSION *, int, char *[]);
 int	 util_upgrade(WT_SESSION *, int, char *[]);
 char	*util_uri(WT_SESSION *, const char *, const char *);
+void	 util_verbose_report(const struct timespec *);
 int	 util_verify(WT_SESSION *, int, char *[]);
 int	 util_write(WT_SESSION *, int, char *[]);
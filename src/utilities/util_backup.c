@@ -8,7 +8,6 @@
 
 #include "util.h"
 
-static int copy(WT_SESSION *, const char *, const char *);
 static int usage(void);
 
 /*
@@ -46,19 +45,35 @@ append_target(WT_SESSION *session, const char *target, char **bufp)
 int
 util_backup(WT_SESSION *session, int argc, char *argv[])
 {
+	struct timespec start;
 	WT_CURSOR *cursor;
 	WT_DECL_RET;
 	int ch;
-	char *config;
-	const char *directory, *name;
+	char copy_config[256], *config;
+	const char *buffer_size, *directory, *rate, *threads;
+	bool zero_copy;
 
 	config = NULL;
-	while ((ch = __wt_getopt(progname, argc, argv, "t:")) != EOF)
+	buffer_size = rate = threads = NULL;
+	zero_copy = false;
+	while ((ch = __wt_getopt(progname, argc, argv, "b:p:r:t:z")) != EOF)
 		switch (ch) {
+		case 'b':
+			buffer_size = __wt_optarg;
+			break;
+		case 'p':
+			threads = __wt_optarg;
+			break;
+		case 'r':
+			rate = __wt_optarg;
+			break;
 		case 't':
 			if (append_target(session, __wt_optarg, &config))
 				return (1);
 			break;
+		case 'z':
+			zero_copy = true;
+			break;
 		case '?':
 		default:
 			return (usage());
@@ -72,66 +87,46 @@ util_backup(WT_SESSION *session, int argc, char *argv[])
 	}
 	directory = *argv;
 
-	if ((ret = session->open_cursor(
-	    session, "backup:", NULL, config, &cursor)) != 0) {
-		fprintf(stderr, "%s: cursor open(backup:) failed: %s\n",
-		    progname, session->strerror(session, ret));
+	if ((ret = __wt_snprintf(copy_config, sizeof(copy_config),
+	    "%s%s%s%s%s%s%s%s%s",
+	    zero_copy ? "zero_copy," : "",
+	    buffer_size != NULL ? "buffer_size=" : "",
+	    buffer_size != NULL ? buffer_size : "",
+	    buffer_size != NULL ? "," : "",
+	    threads != NULL ? "threads=" : "",
+	    threads != NULL ? threads : "",
+	    threads != NULL ? "," : "",
+	    rate != NULL ? "throttle=" : "",
+	    rate != NULL ? rate : "")) != 0) {
+		(void)util_err(session, ret, NULL);
 		goto err;
 	}
 
-	/* Copy the files. */
-	while (
-	    (ret = cursor->next(cursor)) == 0 &&
-	    (ret = cursor->get_key(cursor, &name)) == 0)
-		if ((ret = copy(session, directory, name)) != 0)
-			goto err;
-	if (ret == WT_NOTFOUND)
-		ret = 0;
-
-	if (ret != 0) {
-		fprintf(stderr, "%s: cursor next(backup:) failed: %s\n",
+	if ((ret = session->open_cursor(
+	    session, "backup:", NULL, config, &cursor)) != 0) {
+		fprintf(stderr, "%s: cursor open(backup:) failed: %s\n",
 		    progname, session->strerror(session, ret));
 		goto err;
 	}
 
-err:	free(config);
-	return (ret);
-}
-
-static int
-copy(WT_SESSION *session, const char *directory, const char *name)
-{
-	WT_DECL_RET;
-	size_t len;
-	char *to;
-
-	to = NULL;
-
-	/* Build the target pathname. */
-	len = strlen(directory) + strlen(name) + 2;
-	if ((to = malloc(len)) == NULL) {
-		fprintf(stderr, "%s: %s\n", progname, strerror(errno));
-		return (1);
-	}
-	if ((ret = __wt_snprintf(to, len, "%s/%s", directory, name)) != 0) {
-		fprintf(stderr, "%s: %s\n", progname, strerror(ret));
-		goto err;
-	}
-
-	if (verbose && printf("Backing up %s/%s to %s\n", home, name, to) < 0) {
-		fprintf(stderr, "%s: %s\n", progname, strerror(EIO));
-		goto err;
-	}
-
 	/*
-	 * Use WiredTiger to copy the file: ensuring stability of the copied
-	 * file on disk requires care, and WiredTiger knows how to do it.
+	 * Use WiredTiger to copy the files: ensuring stability of the copied
+	 * files on disk requires care, and WiredTiger knows how to do it.
 	 */
-	if ((ret = __wt_copy_and_sync(session, name, to)) != 0)
-		fprintf(stderr, "%s/%s to %s: backup copy: %s\n",
-		    home, name, to, session->strerror(session, ret));
+	__wt_epoch(NULL, &start);
+	if ((ret = __wt_backup_copy(cursor, directory, copy_config)) != 0)
+		fprintf(stderr, "%s: backup copy to %s failed: %s\n",
+		    progname, directory, session->strerror(session, ret));
+	else if (verbose)
+		/*
+		 * Verbose configures a progress counter, move to the next line
+		 * and report the throughput.
+		 */
+		util_verbose_report(&start);
+
+	WT_TRET(cursor->close(cursor));
 
-err:	free(to);
+err:	free(config);
 	return (ret);
 }
 
@@ -140,7 +135,8 @@ usage(void)
 {
 	(void)fprintf(stderr,
 	    "usage: %s %s "
-	    "backup [-t uri] directory\n",
+	    "backup [-z] [-b buffer-size] [-p threads] [-r rate] [-t uri] "
+	    "directory\n",
 	    progname, usage_prefix);
 	return (1);
 }
@@ -13,20 +13,42 @@
 #define	STRING_MATCH_CONFIG(s, item)					\
 	(strncmp(s, (item).str, (item).len) == 0 && (s)[(item).len] == '\0')
 
-static int dump_config(WT_SESSION *, const char *, WT_CURSOR *, bool, bool);
-static int dump_json_begin(WT_SESSION *);
-static int dump_json_end(WT_SESSION *);
-static int dump_json_separator(WT_SESSION *);
-static int dump_json_table_end(WT_SESSION *);
-static int dump_prefix(WT_SESSION *, bool, bool);
-static int dump_record(WT_CURSOR *, bool, bool);
-static int dump_suffix(WT_SESSION *, bool);
+/*
+ * A range of an object dumped to its own file by a parallel dump.
+ */
+typedef struct {
+	WT_SESSION *session;		/* Parent session */
+	const char *uri;		/* Object */
+	const char *checkpoint;		/* Checkpoint */
+	const char *start;		/* First key, NULL for the beginning */
+	const char *stop;		/* Following range's first key */
+	char *filename;			/* Output file */
+	wt_thread_t tid;
+	int thread_ret;			/* Thread return */
+} DUMP_SHARD;
+
+static int dump_config(
+    WT_SESSION *, const char *, WT_CURSOR *, bool, bool, FILE *);
+static int dump_json_begin(WT_SESSION *, FILE *);
+static int dump_json_end(WT_SESSION *, FILE *);
+static int dump_json_separator(WT_SESSION *, FILE *);
+static int dump_json_table_end(WT_SESSION *, FILE *);
+static int dump_open(WT_SESSION *,
+    const char *, const char *, bool, bool, WT_CURSOR **, char **);
+static int dump_parallel(
+    WT_SESSION *, const char *, const char *, const char *, u_int);
+static int dump_prefix(WT_SESSION *, bool, bool, FILE *);
+static int dump_record(
+    WT_CURSOR *, bool, bool, const char *, const char *, FILE *);
+static WT_THREAD_RET dump_shard(void *);
+static int dump_suffix(WT_SESSION *, bool, FILE *);
 static int dump_table_config(
-    WT_SESSION *, WT_CURSOR *, WT_CURSOR *, const char *, bool);
+    WT_SESSION *, WT_CURSOR *, WT_CURSOR *, const char *, bool, FILE *);
 static int dump_table_parts_config(
-    WT_SESSION *, WT_CURSOR *, const char *, const char *, bool);
+    WT_SESSION *, WT_CURSOR *, const char *, const char *, bool, FILE *);
 static int dup_json_string(const char *, char **);
-static int print_config(WT_SESSION *, const char *, const char *, bool, bool);
+static int print_config(
+    WT_SESSION *, const char *, const char *, bool, bool, FILE *);
 static int usage(void);
 
 int
@@ -34,27 +56,30 @@ util_dump(WT_SESSION *session, int argc, char *argv[])
 {
 	WT_CURSOR *cursor;
 	WT_DECL_RET;
-	size_t len;
+	u_int parallel;
 	int ch, i;
-	char *checkpoint, *config, *p, *simpleuri, *uri;
+	char *checkpoint, *ofile, *simpleuri, *uri;
 	bool hex, json, reverse;
 
 	hex = json = reverse = false;
-	checkpoint = config = simpleuri = uri = NULL;
+	parallel = 1;
+	checkpoint = ofile = simpleuri = uri = NULL;
 	cursor = NULL;
-	while ((ch = __wt_getopt(progname, argc, argv, "c:f:jrx")) != EOF)
+	while ((ch = __wt_getopt(progname, argc, argv, "c:f:jp:rx")) != EOF)
 		switch (ch) {
 		case 'c':
 			checkpoint = __wt_optarg;
 			break;
 		case 'f':			/* output file */
-			if (freopen(__wt_optarg, "w", stdout) == NULL)
-				return (util_err(
-				    session, errno, "%s: reopen", __wt_optarg));
+			ofile = __wt_optarg;
 			break;
 		case 'j':
 			json = true;
 			break;
+		case 'p':			/* parallel dump */
+			if ((parallel = (u_int)atoi(__wt_optarg)) == 0)
+				return (usage());
+			break;
 		case 'r':
 			reverse = true;
 			break;
@@ -80,14 +105,36 @@ util_dump(WT_SESSION *session, int argc, char *argv[])
 	if (argc < 1 || (argc != 1 && !json))
 		return (usage());
 
+	/*
+	 * A parallel dump writes each range of the object to its own file,
+	 * named by appending the range number to the output file name.
+	 */
+	if (parallel > 1) {
+		if (!json || ofile == NULL || argc != 1 || reverse) {
+			fprintf(stderr,
+			    "%s: the -p dump option requires -j and -f, a "
+			    "single object, and is incompatible with -r\n",
+			    progname);
+			goto err;
+		}
+		if ((uri = util_uri(session, argv[0], "table")) == NULL)
+			goto err;
+		ret = dump_parallel(session, uri, checkpoint, ofile, parallel);
+		free(uri);
+		return (ret);
+	}
+
+	if (ofile != NULL && freopen(ofile, "w", stdout) == NULL)
+		return (util_err(session, errno, "%s: reopen", ofile));
+
 	if (json &&
-	    (dump_json_begin(session) != 0 ||
-	    dump_prefix(session, hex, json) != 0))
+	    (dump_json_begin(session, stdout) != 0 ||
+	    dump_prefix(session, hex, json, stdout) != 0))
 		goto err;
 
 	for (i = 0; i < argc; i++) {
 		if (json && i > 0)
-			if (dump_json_separator(session) != 0)
+			if (dump_json_separator(session, stdout) != 0)
 				goto err;
 		free(uri);
 		free(simpleuri);
@@ -96,41 +143,16 @@ util_dump(WT_SESSION *session, int argc, char *argv[])
 		if ((uri = util_uri(session, argv[i], "table")) == NULL)
 			goto err;
 
-		len =
-		    checkpoint == NULL ? 0 : strlen("checkpoint=") +
-		    strlen(checkpoint) + 1;
-		len += strlen(json ? "dump=json" :
-		    (hex ? "dump=hex" : "dump=print"));
-		if ((config = malloc(len + 10)) == NULL)
+		if (dump_open(session, uri, checkpoint,
+		    hex, json, &cursor, &simpleuri) != 0)
 			goto err;
-		if (checkpoint == NULL)
-			config[0] = '\0';
-		else {
-			(void)strcpy(config, "checkpoint=");
-			(void)strcat(config, checkpoint);
-			(void)strcat(config, ",");
-		}
-		(void)strcat(config, json ? "dump=json" :
-		    (hex ? "dump=hex" : "dump=print"));
-		if ((ret = session->open_cursor(
-		    session, uri, NULL, config, &cursor)) != 0) {
-			fprintf(stderr, "%s: cursor open(%s) failed: %s\n",
-			    progname, uri, session->strerror(session, ret));
+		if (dump_config(
+		    session, simpleuri, cursor, hex, json, stdout) != 0)
 			goto err;
-		}
 
-		if ((simpleuri = strdup(uri)) == NULL) {
-			(void)util_err(session, errno, NULL);
+		if (dump_record(cursor, reverse, json, NULL, NULL, stdout) != 0)
 			goto err;
-		}
-		if ((p = strchr(simpleuri, '(')) != NULL)
-			*p = '\0';
-		if (dump_config(session, simpleuri, cursor, hex, json) != 0)
-			goto err;
-
-		if (dump_record(cursor, reverse, json) != 0)
-			goto err;
-		if (json && dump_json_table_end(session) != 0)
+		if (json && dump_json_table_end(session, stdout) != 0)
 			goto err;
 
 		ret = cursor->close(cursor);
@@ -140,14 +162,13 @@ util_dump(WT_SESSION *session, int argc, char *argv[])
 			goto err;
 		}
 	}
-	if (json && dump_json_end(session) != 0)
+	if (json && dump_json_end(session, stdout) != 0)
 		goto err;
 
 	if (0) {
 err:		ret = 1;
 	}
 
-	free(config);
 	free(uri);
 	free(simpleuri);
 	if (cursor != NULL && (ret = cursor->close(cursor)) != 0) {
@@ -157,13 +178,213 @@ err:		ret = 1;
 	return (ret);
 }
 
+/*
+ * dump_open --
+ *	Open a dump cursor on the uri, and return the uri without any
+ *	projection.
+ */
+static int
+dump_open(WT_SESSION *session, const char *uri, const char *checkpoint,
+    bool hex, bool json, WT_CURSOR **cursorp, char **simpleurip)
+{
+	WT_DECL_RET;
+	size_t len;
+	char *config, *p, *simpleuri;
+
+	*cursorp = NULL;
+	*simpleurip = NULL;
+
+	len =
+	    checkpoint == NULL ? 0 : strlen("checkpoint=") +
+	    strlen(checkpoint) + 1;
+	len += strlen(json ? "dump=json" :
+	    (hex ? "dump=hex" : "dump=print"));
+	if ((config = malloc(len + 10)) == NULL)
+		return (util_err(session, errno, NULL));
+	if (checkpoint == NULL)
+		config[0] = '\0';
+	else {
+		(void)strcpy(config, "checkpoint=");
+		(void)strcat(config, checkpoint);
+		(void)strcat(config, ",");
+	}
+	(void)strcat(config, json ? "dump=json" :
+	    (hex ? "dump=hex" : "dump=print"));
+	ret = session->open_cursor(session, uri, NULL, config, cursorp);
+	free(config);
+	if (ret != 0) {
+		fprintf(stderr, "%s: cursor open(%s) failed: %s\n",
+		    progname, uri, session->strerror(session, ret));
+		return (1);
+	}
+
+	if ((simpleuri = strdup(uri)) == NULL) {
+		(void)util_err(session, errno, NULL);
+		(void)(*cursorp)->close(*cursorp);
+		*cursorp = NULL;
+		return (1);
+	}
+	if ((p = strchr(simpleuri, '(')) != NULL)
+		*p = '\0';
+	*simpleurip = simpleuri;
+	return (0);
+}
+
+/*
+ * dump_parallel --
+ *	Dump an object to a set of files in parallel, one per range of keys.
+ */
+static int
+dump_parallel(WT_SESSION *session, const char *uri,
+    const char *checkpoint, const char *ofile, u_int parallel)
+{
+	DUMP_SHARD *shards;
+	WT_CURSOR *cursor;
+	WT_DECL_RET;
+	WT_EXTENSION_API *wt_api;
+	size_t len;
+	u_int i, nshards, nstarted;
+	int tret;
+	char **splits, *simpleuri;
+
+	shards = NULL;
+	splits = NULL;
+	nshards = nstarted = 0;
+
+	/*
+	 * Divide the object into ranges at leaf page boundaries. Objects that
+	 * can't be divided are dumped to a single file.
+	 */
+	if (dump_open(session,
+	    uri, checkpoint, false, true, &cursor, &simpleuri) != 0)
+		return (1);
+	free(simpleuri);
+	wt_api = session->connection->get_extension_api(session->connection);
+	if ((ret = wt_api->dump_split(
+	    wt_api, cursor, parallel, &splits)) == ENOTSUP)
+		ret = 0;
+	else if (ret != 0)
+		(void)util_err(session, ret, "%s: split", uri);
+	if ((tret = cursor->close(cursor)) != 0) {
+		(void)util_err(session, tret, NULL);
+		if (ret == 0)
+			ret = tret;
+	}
+	if (ret != 0)
+		goto err;
+	nshards = 1;
+	if (splits != NULL)
+		while (splits[nshards - 1] != NULL)
+			++nshards;
+
+	if ((shards = calloc(nshards, sizeof(DUMP_SHARD))) == NULL) {
+		ret = util_err(session, errno, NULL);
+		goto err;
+	}
+	len = strlen(ofile) + 20;
+	for (i = 0; i < nshards; ++i) {
+		shards[i].session = session;
+		shards[i].uri = uri;
+		shards[i].checkpoint = checkpoint;
+		shards[i].start = i == 0 ? NULL : splits[i - 1];
+		shards[i].stop = i == nshards - 1 ? NULL : splits[i];
+		if ((shards[i].filename = malloc(len)) == NULL) {
+			ret = util_err(session, errno, NULL);
+			goto err;
+		}
+		if ((ret = __wt_snprintf(
+		    shards[i].filename, len, "%s.%u", ofile, i)) != 0) {
+			ret = util_err(session, ret, NULL);
+			goto err;
+		}
+	}
+
+	/* If a thread can't be created, wait for those that were. */
+	for (; nstarted < nshards; ++nstarted)
+		if ((ret = __wt_thread_create(NULL, &shards[nstarted].tid,
+		    dump_shard, &shards[nstarted])) != 0) {
+			ret = util_err(session, ret, "thread create");
+			break;
+		}
+	for (i = 0; i < nstarted; ++i) {
+		WT_TRET(__wt_thread_join(NULL, shards[i].tid));
+		WT_TRET(shards[i].thread_ret);
+	}
+
+err:	if (shards != NULL)
+		for (i = 0; i < nshards; ++i)
+			free(shards[i].filename);
+	free(shards);
+	if (splits != NULL) {
+		for (i = 0; splits[i] != NULL; ++i)
+			free(splits[i]);
+		free(splits);
+	}
+	return (ret == 0 ? 0 : 1);
+}
+
+/*
+ * dump_shard --
+ *	Dump a range of an object to its own file, in its own session.
+ */
+static WT_THREAD_RET
+dump_shard(void *arg)
+{
+	DUMP_SHARD *shard;
+	FILE *fp;
+	WT_CONNECTION *conn;
+	WT_CURSOR *cursor;
+	WT_DECL_RET;
+	WT_SESSION *session;
+	int tret;
+	char *simpleuri;
+
+	shard = arg;
+	cursor = NULL;
+	fp = NULL;
+	session = NULL;
+	simpleuri = NULL;
+
+	conn = shard->session->connection;
+	if ((ret = conn->open_session(conn, NULL, NULL, &session)) != 0) {
+		ret = util_err(shard->session, ret, "connection.open_session");
+		goto err;
+	}
+	if ((fp = fopen(shard->filename, "w")) == NULL) {
+		ret = util_err(session, errno, "%s: open", shard->filename);
+		goto err;
+	}
+
+	/* Each file is a complete dump of the object's range. */
+	if (dump_json_begin(session, fp) != 0 ||
+	    dump_prefix(session, false, true, fp) != 0 ||
+	    dump_open(session, shard->uri,
+	    shard->checkpoint, false, true, &cursor, &simpleuri) != 0 ||
+	    dump_config(session, simpleuri, cursor, false, true, fp) != 0 ||
+	    dump_record(cursor,
+	    false, true, shard->start, shard->stop, fp) != 0 ||
+	    dump_json_table_end(session, fp) != 0 ||
+	    dump_json_end(session, fp) != 0)
+		ret = 1;
+
+err:	if (fp != NULL && fclose(fp) != 0 && ret == 0)
+		ret = util_err(session, errno, "%s: close", shard->filename);
+	free(simpleuri);
+	if (cursor != NULL && (tret = cursor->close(cursor)) != 0 && ret == 0)
+		ret = util_err(session, tret, NULL);
+	if (session != NULL)
+		WT_TRET(session->close(session, NULL));
+	shard->thread_ret = ret;
+	return (WT_THREAD_RET_VALUE);
+}
+
 /*
  * dump_config --
  *	Dump the config for the uri.
  */
 static int
 dump_config(WT_SESSION *session, const char *uri, WT_CURSOR *cursor, bool hex,
-    bool json)
+    bool json, FILE *fp)
 {
 	WT_CURSOR *mcursor;
 	WT_DECL_RET;
@@ -183,10 +404,10 @@ dump_config(WT_SESSION *session, const char *uri, WT_CURSOR *cursor, bool hex,
 	 */
 	mcursor->set_key(mcursor, uri);
 	if ((ret = mcursor->search(mcursor)) == 0) {
-		if ((!json && dump_prefix(session, hex, json) != 0) ||
+		if ((!json && dump_prefix(session, hex, json, fp) != 0) ||
 		    dump_table_config(session, mcursor, cursor,
-		    uri, json) != 0 ||
-		    dump_suffix(session, json) != 0)
+		    uri, json, fp) != 0 ||
+		    dump_suffix(session, json, fp) != 0)
 			ret = 1;
 	} else if (ret == WT_NOTFOUND)
 		ret = util_err(session, 0, "%s: No such object exists", uri);
@@ -207,9 +428,9 @@ dump_config(WT_SESSION *session, const char *uri, WT_CURSOR *cursor, bool hex,
  *	Output the dump file header prefix.
  */
 static int
-dump_json_begin(WT_SESSION *session)
+dump_json_begin(WT_SESSION *session, FILE *fp)
 {
-	if (printf("{\n") < 0)
+	if (fprintf(fp, "{\n") < 0)
 		return (util_err(session, EIO, NULL));
 	return (0);
 }
@@ -219,9 +440,9 @@ dump_json_begin(WT_SESSION *session)
  *	Output the dump file header suffix.
  */
 static int
-dump_json_end(WT_SESSION *session)
+dump_json_end(WT_SESSION *session, FILE *fp)
 {
-	if (printf("\n}\n") < 0)
+	if (fprintf(fp, "\n}\n") < 0)
 		return (util_err(session, EIO, NULL));
 	return (0);
 }
@@ -231,9 +452,9 @@ dump_json_end(WT_SESSION *session)
  *	Output a separator between two JSON outputs in a list.
  */
 static int
-dump_json_separator(WT_SESSION *session)
+dump_json_separator(WT_SESSION *session, FILE *fp)
 {
-	if (printf(",\n") < 0)
+	if (fprintf(fp, ",\n") < 0)
 		return (util_err(session, EIO, NULL));
 	return (0);
 }
@@ -243,9 +464,9 @@ dump_json_separator(WT_SESSION *session)
  *	Output the JSON syntax that ends a table.
  */
 static int
-dump_json_table_end(WT_SESSION *session)
+dump_json_table_end(WT_SESSION *session, FILE *fp)
 {
-	if (printf("            ]\n        }\n    ]") < 0)
+	if (fprintf(fp, "            ]\n        }\n    ]") < 0)
 		return (util_err(session, EIO, NULL));
 	return (0);
 }
@@ -364,7 +585,7 @@ dump_projection(WT_SESSION *session, const char *config, WT_CURSOR *cursor,
 static int
 dump_table_config(
     WT_SESSION *session, WT_CURSOR *mcursor, WT_CURSOR *cursor,
-    const char *uri, bool json)
+    const char *uri, bool json, FILE *fp)
 {
 	WT_DECL_RET;
 	const char *name, *v;
@@ -392,12 +613,12 @@ dump_table_config(
 		WT_ERR(dump_projection(session, v, cursor, &proj_config));
 		v = proj_config;
 	}
-	WT_ERR(print_config(session, uri, v, json, true));
+	WT_ERR(print_config(session, uri, v, json, true, fp));
 
 	WT_ERR(dump_table_parts_config(
-	    session, mcursor, name, "colgroup:", json));
+	    session, mcursor, name, "colgroup:", json, fp));
 	WT_ERR(dump_table_parts_config(
-	    session, mcursor, name, "index:", json));
+	    session, mcursor, name, "index:", json, fp));
 
 err:	free(proj_config);
 	return (ret);
@@ -409,7 +630,7 @@ err:	free(proj_config);
  */
 static int
 dump_table_parts_config(WT_SESSION *session, WT_CURSOR *cursor,
-    const char *name, const char *entry, bool json)
+    const char *name, const char *entry, bool json, FILE *fp)
 {
 	WT_DECL_RET;
 	size_t len;
@@ -430,7 +651,7 @@ dump_table_parts_config(WT_SESSION *session, WT_CURSOR *cursor,
 		} else {
 			groupname = "indices";
 		}
-		if (printf("            \"%s\" : [", groupname) < 0)
+		if (fprintf(fp, "            \"%s\" : [", groupname) < 0)
 			return (util_err(session, EIO, NULL));
 	}
 
@@ -476,18 +697,18 @@ match:		if ((ret = cursor->get_key(cursor, &key)) != 0)
 		if ((ret = cursor->get_value(cursor, &v)) != 0)
 			return (util_cerr(cursor, "get_value", ret));
 
-		if (json && printf("%s\n", (multiple ? "," : "")) < 0)
+		if (json && fprintf(fp, "%s\n", (multiple ? "," : "")) < 0)
 			return (util_err(session, EIO, NULL));
 		/*
 		 * The dumped configuration string is the original key plus the
 		 * source's configuration, where the values of the original key
 		 * override any source configurations of the same name.
 		 */
-		if (print_config(session, key, v, json, false) != 0)
+		if (print_config(session, key, v, json, false, fp) != 0)
 			return (util_err(session, EIO, NULL));
 		multiple = true;
 	}
-	if (json && printf("%s]%s\n",
+	if (json && fprintf(fp, "%s]%s\n",
 	    (multiple ? "\n            " : ""), sep) < 0)
 		return (util_err(session, EIO, NULL));
 
@@ -501,23 +722,23 @@ match:		if ((ret = cursor->get_key(cursor, &key)) != 0)
  *	Output the dump file header prefix.
  */
 static int
-dump_prefix(WT_SESSION *session, bool hex, bool json)
+dump_prefix(WT_SESSION *session, bool hex, bool json, FILE *fp)
 {
 	int vmajor, vminor, vpatch;
 
 	(void)wiredtiger_version(&vmajor, &vminor, &vpatch);
 
-	if (json && printf(
+	if (json && fprintf(fp,
 	    "    \"%s\" : \"%d (%d.%d.%d)\",\n",
 	    DUMP_JSON_VERSION_MARKER, DUMP_JSON_CURRENT_VERSION,
 	    vmajor, vminor, vpatch) < 0)
 		return (util_err(session, EIO, NULL));
 
-	if (!json && (printf(
+	if (!json && (fprintf(fp,
 	    "WiredTiger Dump (WiredTiger Version %d.%d.%d)\n",
 	    vmajor, vminor, vpatch) < 0 ||
-	    printf("Format=%s\n", hex ? "hex" : "print") < 0 ||
-	    printf("Header\n") < 0))
+	    fprintf(fp, "Format=%s\n", hex ? "hex" : "print") < 0 ||
+	    fprintf(fp, "Header\n") < 0))
 		return (util_err(session, EIO, NULL));
 
 	return (0);
@@ -525,14 +746,16 @@ dump_prefix(WT_SESSION *session, bool hex, bool json)
 
 /*
  * dump_record --
- *	Dump a single record, advance cursor to next/prev, along
- *	with JSON formatting if needed.
+ *	Dump the records from the cursor's next/prev position, or from the
+ *	start key to the stop key, along with JSON formatting if needed.
  */
 static int
-dump_record(WT_CURSOR *cursor, bool reverse, bool json)
+dump_record(WT_CURSOR *cursor, bool reverse, bool json,
+    const char *start, const char *stop, FILE *fp)
 {
 	WT_DECL_RET;
 	WT_SESSION *session;
+	int exact;
 	const char *infix, *key, *prefix, *suffix, *value;
 	bool once;
 
@@ -548,20 +771,34 @@ dump_record(WT_CURSOR *cursor, bool reverse, bool json)
 		infix = "\n";
 		suffix = "\n";
 	}
-	while ((ret =
-	    (reverse ? cursor->prev(cursor) : cursor->next(cursor))) == 0) {
+	if (start == NULL)
+		ret = reverse ? cursor->prev(cursor) : cursor->next(cursor);
+	else {
+		cursor->set_key(cursor, start);
+		if ((ret = cursor->search_near(cursor, &exact)) == 0 &&
+		    exact < 0)
+			ret = cursor->next(cursor);
+	}
+	for (; ret == 0;
+	    ret = reverse ? cursor->prev(cursor) : cursor->next(cursor)) {
 		if ((ret = cursor->get_key(cursor, &key)) != 0)
 			return (util_cerr(cursor, "get_key", ret));
+		/*
+		 * Dump keys are unique strings, the stop key starts the next
+		 * range.
+		 */
+		if (stop != NULL && strcmp(key, stop) == 0)
+			break;
 		if ((ret = cursor->get_value(cursor, &value)) != 0)
 			return (util_cerr(cursor, "get_value", ret));
-		if (printf("%s%s%s%s%s%s", json && once ? "," : "",
+		if (fprintf(fp, "%s%s%s%s%s%s", json && once ? "," : "",
 		    prefix, key, infix, value, suffix) < 0)
 			return (util_err(session, EIO, NULL));
 		once = true;
 	}
-	if (json && once && printf("\n") < 0)
+	if (json && once && fprintf(fp, "\n") < 0)
 		return (util_err(session, EIO, NULL));
-	return (ret == WT_NOTFOUND ? 0 :
+	return (ret == 0 || ret == WT_NOTFOUND ? 0 :
 	    util_cerr(cursor, (reverse ? "prev" : "next"), ret));
 }
 
@@ -570,16 +807,16 @@ dump_record(WT_CURSOR *cursor, bool reverse, bool json)
  *	Output the dump file header suffix.
  */
 static int
-dump_suffix(WT_SESSION *session, bool json)
+dump_suffix(WT_SESSION *session, bool json, FILE *fp)
 {
 	if (json) {
-		if (printf(
+		if (fprintf(fp,
 		    "        },\n"
 		    "        {\n"
 		    "            \"data\" : [") < 0)
 			return (util_err(session, EIO, NULL));
 	} else {
-		if (printf("Data\n") < 0)
+		if (fprintf(fp, "Data\n") < 0)
 			return (util_err(session, EIO, NULL));
 	}
 	return (0);
@@ -621,7 +858,7 @@ dup_json_string(const char *str, char **result)
  */
 static int
 print_config(WT_SESSION *session, const char *key, const char *cfg, bool json,
-    bool toplevel)
+    bool toplevel, FILE *fp)
 {
 	WT_DECL_RET;
 	char *jsonconfig;
@@ -637,17 +874,17 @@ print_config(WT_SESSION *session, const char *key, const char *cfg, bool json,
 
 	if (json) {
 		if (toplevel)
-			ret = printf(
+			ret = fprintf(fp,
 			    "    \"%s\" : [\n        {\n            "
 			    "\"config\" : \"%s\",\n", key, jsonconfig);
 		else
-			ret = printf(
+			ret = fprintf(fp,
 			    "                {\n"
 			    "                    \"uri\" : \"%s\",\n"
 			    "                    \"config\" : \"%s\"\n"
 			    "                }", key, jsonconfig);
 	} else
-		ret = printf("%s\n%s\n", key, cfg);
+		ret = fprintf(fp, "%s\n%s\n", key, cfg);
 	free(jsonconfig);
 	if (ret < 0)
 		return (util_err(session, EIO, NULL));
@@ -659,7 +896,8 @@ usage(void)
 {
 	(void)fprintf(stderr,
 	    "usage: %s %s "
-	    "dump [-jrx] [-c checkpoint] [-f output-file] uri\n",
+	    "dump [-jrx] [-c checkpoint] [-f output-file] [-p parallel] "
+	    "uri\n",
 	    progname, usage_prefix);
 	return (1);
 }
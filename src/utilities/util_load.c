@@ -26,24 +26,22 @@ int
 util_load(WT_SESSION *session, int argc, char *argv[])
 {
 	uint32_t flags;
+	u_int parallel;
 	int ch;
+	char **configp;
 	const char *filename;
 
 	flags = 0;
+	parallel = 1;
 
-	filename = "<stdin>";
-	while ((ch = __wt_getopt(progname, argc, argv, "af:jnr:")) != EOF)
+	filename = NULL;
+	while ((ch = __wt_getopt(progname, argc, argv, "af:jnp:r:")) != EOF)
 		switch (ch) {
 		case 'a':	/* append (ignore record number keys) */
 			append = true;
 			break;
 		case 'f':	/* input file */
-			if (freopen(__wt_optarg, "r", stdin) == NULL)
-				return (
-				    util_err(session,
-					errno, "%s: reopen", __wt_optarg));
-			else
-				filename = __wt_optarg;
+			filename = __wt_optarg;
 			break;
 		case 'j':	/* input is JSON */
 			json = true;
@@ -51,6 +49,10 @@ util_load(WT_SESSION *session, int argc, char *argv[])
 		case 'n':	/* don't overwrite existing data */
 			no_overwrite = true;
 			break;
+		case 'p':	/* parallel load */
+			if ((parallel = (u_int)atoi(__wt_optarg)) == 0)
+				return (usage());
+			break;
 		case 'r':	/* rename */
 			cmdname = __wt_optarg;
 			break;
@@ -74,12 +76,43 @@ util_load(WT_SESSION *session, int argc, char *argv[])
 		cmdconfig = argv;
 	}
 
+	/*
+	 * If the object is being renamed, rename the configuration pairs as
+	 * well, because we don't know if the user used the old or new names
+	 * for the pair's URI.
+	 */
+	if (cmdname != NULL)
+		for (configp = cmdconfig;
+		    cmdconfig != NULL && *configp != NULL; configp += 2)
+			if (config_rename(session, configp, cmdname))
+				return (1);
+
+	/*
+	 * A parallel load reads the files written by a parallel dump, named
+	 * by appending a file number to the input file name.
+	 */
+	if (parallel > 1) {
+		if (!json || filename == NULL || append)
+			return (util_err(session, EINVAL,
+			    "the -p (parallel) flag requires the -j and -f "
+			    "flags, and is incompatible with the -a flag"));
+		if (no_overwrite)
+			flags |= LOAD_JSON_NO_OVERWRITE;
+		return (util_load_json_parallel(
+		    session, filename, flags, parallel));
+	}
+
+	if (filename == NULL)
+		filename = "<stdin>";
+	else if (freopen(filename, "r", stdin) == NULL)
+		return (util_err(session, errno, "%s: reopen", filename));
+
 	if (json) {
 		if (append)
 			flags |= LOAD_JSON_APPEND;
 		if (no_overwrite)
 			flags |= LOAD_JSON_NO_OVERWRITE;
-		return (util_load_json(session, filename, flags));
+		return (util_load_json(session, stdin, filename, flags));
 	}
 	return (load_dump(session));
 }
@@ -235,14 +268,14 @@ config_read(WT_SESSION *session, char ***listp, bool *hexp)
 	memset(&l, 0, sizeof(l));
 
 	/* Header line #1: "WiredTiger Dump" and a WiredTiger version. */
-	if (util_read_line(session, &l, false, &eof))
+	if (util_read_line(session, stdin, &l, false, &eof))
 		return (1);
 	s = "WiredTiger Dump ";
 	if (strncmp(l.mem, s, strlen(s)) != 0)
 		return (format(session));
 
 	/* Header line #2: "Format={hex,print}". */
-	if (util_read_line(session, &l, false, &eof))
+	if (util_read_line(session, stdin, &l, false, &eof))
 		return (1);
 	if (strcmp(l.mem, "Format=print") == 0)
 		*hexp = false;
@@ -252,14 +285,15 @@ config_read(WT_SESSION *session, char ***listp, bool *hexp)
 		return (format(session));
 
 	/* Header line #3: "Header". */
-	if (util_read_line(session, &l, false, &eof))
+	if (util_read_line(session, stdin, &l, false, &eof))
 		return (1);
 	if (strcmp(l.mem, "Header") != 0)
 		return (format(session));
 
 	/* Now, read in lines until we get to the end of the headers. */
 	for (entry = max_entry = 0, list = NULL;; ++entry) {
-		if ((ret = util_read_line(session, &l, false, &eof)) != 0)
+		if ((ret = util_read_line(
+		    session, stdin, &l, false, &eof)) != 0)
 			goto err;
 		if (strcmp(l.mem, "Data") == 0)
 			break;
@@ -363,9 +397,10 @@ config_update(WT_SESSION *session, char **list)
 
 	/*
 	 * If the object has been renamed, replace all of the column group,
-	 * index, file and table names with the new name.
+	 * index, file and table names with the new name. The configuration
+	 * pairs were renamed when the command line was read.
 	 */
-	if (cmdname != NULL) {
+	if (cmdname != NULL)
 		for (listp = list; *listp != NULL; listp += 2)
 			if (WT_PREFIX_MATCH(*listp, "colgroup:") ||
 			    WT_PREFIX_MATCH(*listp, "file:") ||
@@ -375,17 +410,6 @@ config_update(WT_SESSION *session, char **list)
 				if (config_rename(session, listp, cmdname))
 					return (1);
 
-		/*
-		 * If the object was renamed, and there are configuration pairs,
-		 * rename the configuration pairs as well, because we don't know
-		 * if the user used the old or new names for the pair's URI.
-		 */
-		for (configp = cmdconfig;
-		    cmdconfig != NULL && *configp != NULL; configp += 2)
-			if (config_rename(session, configp, cmdname))
-				return (1);
-	}
-
 	/*
 	 * Updating the key/value formats seems like an easy mistake to make.
 	 * If there were command-line configuration pairs, walk the list of
@@ -538,14 +562,14 @@ insert(WT_CURSOR *cursor, const char *name)
 		 * and ignore it (a dump with "append" set), or not read it at
 		 * all (flat-text load).
 		 */
-		if (util_read_line(session, &key, true, &eof))
+		if (util_read_line(session, stdin, &key, true, &eof))
 			return (1);
 		if (eof)
 			break;
 		if (!append)
 			cursor->set_key(cursor, key.mem);
 
-		if (util_read_line(session, &value, false, &eof))
+		if (util_read_line(session, stdin, &value, false, &eof))
 			return (1);
 		cursor->set_value(cursor, value.mem);
 
@@ -571,7 +595,8 @@ usage(void)
 {
 	(void)fprintf(stderr,
 	    "usage: %s %s "
-	    "load [-as] [-f input-file] [-r name] [object configuration ...]\n",
+	    "load [-ajn] [-f input-file] [-p parallel] [-r name] "
+	    "[object configuration ...]\n",
 	    progname, usage_prefix);
 	return (1);
 }
@@ -24,5 +24,7 @@ int	 config_update(WT_SESSION *, char **);
 /* Flags for util_load_json */
 #define	LOAD_JSON_APPEND	0x0001	/* append (ignore record number keys) */
 #define	LOAD_JSON_NO_OVERWRITE	0x0002	/* don't overwrite existing data */
+#define	LOAD_JSON_PARALLEL	0x0004	/* one of a parallel dump's files */
 
-int	 util_load_json(WT_SESSION *, const char *, uint32_t);
+int	 util_load_json(WT_SESSION *, FILE *, const char *, uint32_t);
+int	 util_load_json_parallel(WT_SESSION *, const char *, uint32_t, u_int);
@@ -27,6 +27,7 @@
  */
 typedef struct {
 	WT_SESSION *session;    /* associated session */
+	FILE *fp;		/* input stream */
 	ULINE line;		/* current line */
 	const char *p;		/* points to cur position in line.mem */
 	bool ateof;		/* current token is EOF */
@@ -278,10 +279,16 @@ json_data(WT_SESSION *session,
 			toktype = json_peek(session, ins);
 			JSON_EXPECT(session, ins, toktype);
 			if (isrec && nfield == 0) {
-				/* Verify the dump has recnos in order. */
+				/*
+				 * Verify the dump has recnos in order. A file
+				 * from a parallel dump can start anywhere.
+				 */
 				recno++;
 				gotno = __wt_strtouq(ins->tokstart, &endp, 0);
 				gotnolen = (size_t)(endp - ins->tokstart);
+				if (recno == 1 &&
+				    LF_ISSET(LOAD_JSON_PARALLEL))
+					recno = gotno;
 				if (recno != gotno || ins->toklen != gotnolen) {
 					ret = util_err(session, 0,
 					    "%s: recno out of order", uri);
@@ -338,7 +345,8 @@ err:		if (ret == 0)
 		if (ret == 0)
 			ret = tret;
 	}
-	if (ret == 0)
+	/* Parallel loads are flushed when all of the files are loaded. */
+	if (ret == 0 && !LF_ISSET(LOAD_JSON_PARALLEL))
 		ret = util_flush(session, uri);
 	return (ret);
 }
@@ -495,8 +503,8 @@ json_peek(WT_SESSION *session, JSON_INPUT_STATE *ins)
 				}
 				ins->kvrawstart = 0;
 			}
-			if (util_read_line(
-			    session, &ins->line, true, &ins->ateof)) {
+			if (util_read_line(session,
+			    ins->fp, &ins->line, true, &ins->ateof)) {
 				ins->toktype = -1;
 				ret = -1;
 				goto err;
@@ -564,8 +572,8 @@ json_skip(WT_SESSION *session, JSON_INPUT_STATE *ins, const char **matches)
 		for (match = matches; *match != NULL; match++)
 			if ((hit = strstr(ins->p, *match)) != NULL)
 				goto out;
-		if (util_read_line(session, &ins->line, true, &ins->ateof)
-		    != 0) {
+		if (util_read_line(
+		    session, ins->fp, &ins->line, true, &ins->ateof) != 0) {
 			ins->toktype = -1;
 			return (1);
 		}
@@ -585,18 +593,21 @@ out:
 }
 
 /*
- * load_json --
+ * util_load_json --
  *	Load from the JSON format produced by 'wt dump -j'.
  */
 int
-util_load_json(WT_SESSION *session, const char *filename, uint32_t flags)
+util_load_json(
+    WT_SESSION *session, FILE *fp, const char *filename, uint32_t flags)
 {
 	JSON_INPUT_STATE instate;
 	WT_DECL_RET;
 
 	memset(&instate, 0, sizeof(instate));
 	instate.session = session;
-	if (util_read_line(session, &instate.line, false, &instate.ateof))
+	instate.fp = fp;
+	if (util_read_line(
+	    session, fp, &instate.line, false, &instate.ateof))
 		return (1);
 	instate.p = (const char *)instate.line.mem;
 	instate.linenum = 1;
@@ -609,3 +620,142 @@ err:	free(instate.line.mem);
 	free(instate.kvraw);
 	return (ret);
 }
+
+/*
+ * A thread loading files produced by a parallel 'wt dump -j -p'.
+ */
+typedef struct {
+	WT_SESSION *session;		/* Parent session */
+	const char *ifile;		/* Input file name prefix */
+	u_int first;			/* First file loaded */
+	u_int step;			/* Files between loaded files */
+	u_int nfiles;			/* Number of files */
+	uint32_t flags;
+	wt_thread_t tid;
+	int thread_ret;			/* Thread return */
+} LOAD_JSON_WORKER;
+
+/*
+ * load_json_worker --
+ *	Load a subset of the files of a parallel dump, in its own session.
+ */
+static WT_THREAD_RET
+load_json_worker(void *arg)
+{
+	FILE *fp;
+	LOAD_JSON_WORKER *worker;
+	WT_CONNECTION *conn;
+	WT_DECL_RET;
+	WT_SESSION *session;
+	size_t len;
+	u_int i;
+	char *filename;
+
+	worker = arg;
+	filename = NULL;
+	session = NULL;
+
+	conn = worker->session->connection;
+	if ((ret = conn->open_session(conn, NULL, NULL, &session)) != 0) {
+		ret = util_err(worker->session, ret, "connection.open_session");
+		goto err;
+	}
+	len = strlen(worker->ifile) + 20;
+	if ((filename = malloc(len)) == NULL) {
+		ret = util_err(session, errno, NULL);
+		goto err;
+	}
+	for (i = worker->first; i < worker->nfiles; i += worker->step) {
+		if ((ret = __wt_snprintf(
+		    filename, len, "%s.%u", worker->ifile, i)) != 0) {
+			ret = util_err(session, ret, NULL);
+			goto err;
+		}
+		if ((fp = fopen(filename, "r")) == NULL) {
+			ret = util_err(session, errno, "%s: open", filename);
+			goto err;
+		}
+		ret = util_load_json(session, fp, filename,
+		    worker->flags | LOAD_JSON_PARALLEL);
+		(void)fclose(fp);
+		if (ret != 0)
+			goto err;
+	}
+
+err:	free(filename);
+	if (session != NULL)
+		WT_TRET(session->close(session, NULL));
+	worker->thread_ret = ret;
+	return (WT_THREAD_RET_VALUE);
+}
+
+/*
+ * util_load_json_parallel --
+ *	Load the files produced by 'wt dump -j -p', named by appending a file
+ *	number to a prefix, with a number of threads.
+ */
+int
+util_load_json_parallel(WT_SESSION *session,
+    const char *ifile, uint32_t flags, u_int parallel)
+{
+	FILE *fp;
+	LOAD_JSON_WORKER *workers;
+	WT_DECL_RET;
+	size_t len;
+	u_int i, nfiles, nstarted, nworkers;
+	char *filename;
+
+	workers = NULL;
+	nstarted = nworkers = 0;
+
+	/* Count the files, they're numbered from 0. */
+	len = strlen(ifile) + 20;
+	if ((filename = malloc(len)) == NULL)
+		return (util_err(session, errno, NULL));
+	for (nfiles = 0;; ++nfiles) {
+		if ((ret = __wt_snprintf(
+		    filename, len, "%s.%u", ifile, nfiles)) != 0) {
+			ret = util_err(session, ret, NULL);
+			goto err;
+		}
+		if ((fp = fopen(filename, "r")) == NULL)
+			break;
+		(void)fclose(fp);
+	}
+	if (nfiles == 0) {
+		ret = util_err(session, errno, "%s: open", filename);
+		goto err;
+	}
+
+	nworkers = WT_MIN(parallel, nfiles);
+	if ((workers = calloc(nworkers, sizeof(LOAD_JSON_WORKER))) == NULL) {
+		ret = util_err(session, errno, NULL);
+		goto err;
+	}
+	/* If a thread can't be created, wait for those that were. */
+	for (i = 0; i < nworkers; ++i, ++nstarted) {
+		workers[i].session = session;
+		workers[i].ifile = ifile;
+		workers[i].first = i;
+		workers[i].step = nworkers;
+		workers[i].nfiles = nfiles;
+		workers[i].flags = flags;
+		if ((ret = __wt_thread_create(NULL,
+		    &workers[i].tid, load_json_worker, &workers[i])) != 0) {
+			ret = util_err(session, ret, "thread create");
+			break;
+		}
+	}
+	for (i = 0; i < nstarted; ++i) {
+		WT_TRET(__wt_thread_join(NULL, workers[i].tid));
+		WT_TRET(workers[i].thread_ret);
+	}
+
+	/* Flush everything loaded. */
+	if (ret == 0 && (ret = session->checkpoint(session, NULL)) != 0)
+		ret = util_err(session, ret, "session.checkpoint");
+
+err:	free(filename);
+	free(workers);
+	return (ret == 0 ? 0 : 1);
+}
@@ -128,13 +128,13 @@ insert(WT_CURSOR *cursor, const char *name, bool readkey)
 		 * all (flat-text load).
 		 */
 		if (readkey) {
-			if (util_read_line(session, &key, true, &eof))
+			if (util_read_line(session, stdin, &key, true, &eof))
 				return (1);
 			if (eof)
 				break;
 			cursor->set_key(cursor, key.mem);
 		}
-		if (util_read_line(session, &value, !readkey, &eof))
+		if (util_read_line(session, stdin, &value, !readkey, &eof))
 			return (1);
 		if (eof)
 			break;
@@ -41,10 +41,11 @@ util_err(WT_SESSION *session, int e, const char *fmt, ...)
 
 /*
  * util_read_line --
- *	Read a line from stdin into a ULINE.
+ *	Read a line from a stream into a ULINE.
  */
 int
-util_read_line(WT_SESSION *session, ULINE *l, bool eof_expected, bool *eofp)
+util_read_line(WT_SESSION *session,
+    FILE *fp, ULINE *l, bool eof_expected, bool *eofp)
 {
 	static uint64_t line = 0;
 	size_t len;
@@ -59,7 +60,7 @@ util_read_line(WT_SESSION *session, ULINE *l, bool eof_expected, bool *eofp)
 		l->memsize = 1024;
 	}
 	for (len = 0;; ++len) {
-		if ((ch = getchar()) == EOF) {
+		if ((ch = getc(fp)) == EOF) {
 			if (len == 0) {
 				if (eof_expected) {
 					*eofp = true;
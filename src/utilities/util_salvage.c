@@ -13,17 +13,23 @@ static int usage(void);
 int
 util_salvage(WT_SESSION *session, int argc, char *argv[])
 {
+	struct timespec start;
 	WT_DECL_RET;
 	int ch;
-	const char *force;
-	char *uri;
+	char config[64], *uri;
+	const char *threads;
+	bool force;
 
-	force = NULL;
+	force = false;
+	threads = NULL;
 	uri = NULL;
-	while ((ch = __wt_getopt(progname, argc, argv, "F")) != EOF)
+	while ((ch = __wt_getopt(progname, argc, argv, "Ft:")) != EOF)
 		switch (ch) {
 		case 'F':
-			force = "force";
+			force = true;
+			break;
+		case 't':
+			threads = __wt_optarg;
 			break;
 		case '?':
 		default:
@@ -38,18 +44,26 @@ util_salvage(WT_SESSION *session, int argc, char *argv[])
 	if ((uri = util_uri(session, *argv, "file")) == NULL)
 		return (1);
 
-	if ((ret = session->salvage(session, uri, force)) != 0)
+	if ((ret = __wt_snprintf(config, sizeof(config), "%s%s%s",
+	    force ? "force," : "",
+	    threads != NULL ? "threads=" : "",
+	    threads != NULL ? threads : "")) != 0) {
+		(void)util_err(session, ret, NULL);
+		goto err;
+	}
+	__wt_epoch(NULL, &start);
+	if ((ret = session->salvage(session, uri, config)) != 0)
 		(void)util_err(session, ret, "session.salvage: %s", uri);
 	else {
 		/*
 		 * Verbose configures a progress counter, move to the next
-		 * line.
+		 * line and report the throughput.
 		 */
 		if (verbose)
-			printf("\n");
+			util_verbose_report(&start);
 	}
 
-	free(uri);
+err:	free(uri);
 	return (ret);
 }
 
@@ -58,7 +72,7 @@ usage(void)
 {
 	(void)fprintf(stderr,
 	    "usage: %s %s "
-	    "salvage [-F] uri\n",
+	    "salvage [-F] [-t threads] uri\n",
 	    progname, usage_prefix);
 	return (1);
 }
@@ -41,6 +41,8 @@ __handle_message_verbose(WT_EVENT_HANDLER *handler,
  * __handle_progress_verbose --
  *	Default WT_EVENT_HANDLER->handle_progress implementation: ignore.
  */
+static uint64_t progress_last;			/* Last progress count */
+
 static int
 __handle_progress_verbose(WT_EVENT_HANDLER *handler,
     WT_SESSION *session, const char *operation, uint64_t progress)
@@ -48,6 +50,7 @@ __handle_progress_verbose(WT_EVENT_HANDLER *handler,
 	WT_UNUSED(handler);
 	WT_UNUSED(session);
 
+	progress_last = progress;
 	return (
 	    printf("\r\t%s %-20" PRIu64, operation, progress) < 0 ? EIO : 0);
 }
@@ -61,3 +64,22 @@ static WT_EVENT_HANDLER __event_handler_verbose = {
 };
 
 WT_EVENT_HANDLER *verbose_handler = &__event_handler_verbose;
+
+/*
+ * util_verbose_report --
+ *	Finish the progress counter line and report the throughput of the
+ * operation.
+ */
+void
+util_verbose_report(const struct timespec *start)
+{
+	struct timespec stop;
+	uint64_t msecs;
+
+	__wt_epoch(NULL, &stop);
+	msecs = WT_TIMEDIFF_MS(stop, *start);
+	printf("\n\t%" PRIu64 " in %" PRIu64 ".%03" PRIu64 " seconds "
+	    "(%" PRIu64 " per second)\n",
+	    progress_last, msecs / WT_THOUSAND, msecs % WT_THOUSAND,
+	    progress_last * WT_THOUSAND / WT_MAX(msecs, 1));
+}
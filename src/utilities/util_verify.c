@@ -13,15 +13,16 @@ static int usage(void);
 int
 util_verify(WT_SESSION *session, int argc, char *argv[])
 {
+	struct timespec start;
 	WT_DECL_RET;
 	size_t size;
 	int ch;
-	char *config, *dump_offsets, *uri;
+	char *config, *dump_offsets, *threads, *uri;
 	bool dump_address, dump_blocks, dump_layout, dump_pages;
 
 	dump_address = dump_blocks = dump_layout = dump_pages = false;
-	config = dump_offsets = uri = NULL;
-	while ((ch = __wt_getopt(progname, argc, argv, "d:")) != EOF)
+	config = dump_offsets = threads = uri = NULL;
+	while ((ch = __wt_getopt(progname, argc, argv, "d:t:")) != EOF)
 		switch (ch) {
 		case 'd':
 			if (strcmp(__wt_optarg, "dump_address") == 0)
@@ -45,6 +46,9 @@ util_verify(WT_SESSION *session, int argc, char *argv[])
 			else
 				return (usage());
 			break;
+		case 't':
+			threads = __wt_optarg;
+			break;
 		case '?':
 		default:
 			return (usage());
@@ -59,41 +63,47 @@ util_verify(WT_SESSION *session, int argc, char *argv[])
 		return (1);
 
 	/* Build the configuration string as necessary. */
-	if (dump_address ||
-	    dump_blocks || dump_layout || dump_offsets != NULL || dump_pages) {
+	if (dump_address || dump_blocks || dump_layout ||
+	    dump_offsets != NULL || dump_pages || threads != NULL) {
 		size =
 		    strlen("dump_address,") +
 		    strlen("dump_blocks,") +
 		    strlen("dump_layout,") +
 		    strlen("dump_pages,") +
 		    strlen("dump_offsets[],") +
-		    (dump_offsets == NULL ? 0 : strlen(dump_offsets)) + 20;
+		    (dump_offsets == NULL ? 0 : strlen(dump_offsets)) +
+		    strlen("threads=,") +
+		    (threads == NULL ? 0 : strlen(threads)) + 20;
 		if ((config = malloc(size)) == NULL) {
 			ret = util_err(session, errno, NULL);
 			goto err;
 		}
 		if ((ret = __wt_snprintf(config, size,
-		    "%s%s%s%s%s%s%s",
+		    "%s%s%s%s%s%s%s%s%s%s",
 		    dump_address ? "dump_address," : "",
 		    dump_blocks ? "dump_blocks," : "",
 		    dump_layout ? "dump_layout," : "",
 		    dump_offsets != NULL ? "dump_offsets=[" : "",
 		    dump_offsets != NULL ? dump_offsets : "",
 		    dump_offsets != NULL ? "]," : "",
-		    dump_pages ? "dump_pages," : "")) != 0) {
+		    dump_pages ? "dump_pages," : "",
+		    threads != NULL ? "threads=" : "",
+		    threads != NULL ? threads : "",
+		    threads != NULL ? "," : "")) != 0) {
 			(void)util_err(session, ret, NULL);
 			goto err;
 		}
 	}
+	__wt_epoch(NULL, &start);
 	if ((ret = session->verify(session, uri, config)) != 0)
 		(void)util_err(session, ret, "session.verify: %s", uri);
 	else {
 		/*
 		 * Verbose configures a progress counter, move to the next
-		 * line.
+		 * line and report the throughput.
 		 */
 		if (verbose)
-			printf("\n");
+			util_verbose_report(&start);
 	}
 
 err:	free(config);
@@ -109,6 +119,6 @@ usage(void)
 	    "verify %s\n",
 	    progname, usage_prefix,
 	    "[-d dump_address | dump_blocks | dump_layout | "
-	    "dump_offsets=#,# | dump_pages] uri");
+	    "dump_offsets=#,# | dump_pages] [-t threads] uri");
 	return (1);
 }
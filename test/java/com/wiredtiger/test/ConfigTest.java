@@ -162,6 +162,32 @@ public class ConfigTest {
         teardown();
     }
 
+    // Compiled configurations are checked, and can be used as strings.
+    @Test
+    public void test_compile_configuration()
+    throws WiredTigerException {
+        setup();
+        String config = conn.compile_configuration(
+            "WT_SESSION.begin_transaction", "isolation=snapshot");
+        assertEquals("isolation=snapshot", config);
+        session.begin_transaction(config);
+        session.commit_transaction(null);
+
+        Exception e = null;
+        System.err.println("\n-- expect error output --");
+        try {
+            conn.compile_configuration(
+                "WT_SESSION.begin_transaction", "isolation=none");
+        }
+        catch (WiredTigerException wte) {
+            e = wte;
+        }
+        System.err.println("-- end expected error output --");
+        Assert.assertTrue(e != null &&
+                          e.toString().indexOf("Invalid argument") >= 0);
+        teardown();
+    }
+
     public static void main(String[] args) {
         ConfigTest tester = new ConfigTest();
         try {
@@ -174,6 +200,7 @@ public class ConfigTest {
             tester.test_format_string_s_10();
             tester.test_format_string_S_default();
             tester.test_format_string_s_default();
+            tester.test_compile_configuration();
         } catch (WiredTigerException wte) {
             System.err.println("WiredTigerException: " + wte);
         }
@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import gc, select, wiredtiger, wttest
+from wiredtiger import WiredTigerError, compile_format
+from wtscenario import make_scenarios
+
+# A minimal event loop and future, enough for wiredtiger.aio where asyncio
+# isn't available.
+class SimpleFuture(object):
+    def __init__(self):
+        self._done = False
+        self._result = self._exception = None
+
+    def cancelled(self):
+        return False
+
+    def done(self):
+        return self._done
+
+    def set_result(self, result):
+        self._done = True
+        self._result = result
+
+    def set_exception(self, exception):
+        self._done = True
+        self._exception = exception
+
+    def result(self):
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+class SimpleLoop(object):
+    def __init__(self):
+        self.readers = {}
+
+    def add_reader(self, fd, callback):
+        self.readers[fd] = callback
+
+    def remove_reader(self, fd):
+        del self.readers[fd]
+
+    def create_future(self):
+        return SimpleFuture()
+
+    def run_until_complete(self, futures):
+        while not all(f.done() for f in futures):
+            for fd in select.select(self.readers.keys(), [], [], 10)[0]:
+                self.readers[fd]()
+        return [f.result() for f in futures]
+
+# test_async04.py
+#    Asynchronous operations with completions collected through AsyncQueue,
+#    and the asyncio front-end in wiredtiger.aio.
+class test_async04(wttest.WiredTigerTestCase):
+    nentries = 500
+    async_ops = 20
+
+    scenarios = make_scenarios([
+        ('file-col', dict(keyfmt='r', uri='file:async04')),
+        ('file-row', dict(keyfmt='S', uri='file:async04')),
+        ('table-row', dict(keyfmt='S', uri='table:async04')),
+    ])
+
+    def conn_config(self):
+        return 'async=(enabled=true,ops_max=%d,threads=3)' % self.async_ops
+
+    def key(self, i):
+        if self.keyfmt == 'r':
+            return i + 1
+        return 'key%06d' % i
+
+    def value(self, i):
+        return 'value%d' % i
+
+    def readable(self, q, timeout):
+        return q.fileno() in select.select([q.fileno()], [], [], timeout)[0]
+
+    # Start an operation, collecting completions while no handle is free.
+    def submit(self, q, done, optype, key, value):
+        while True:
+            opid = q._submit(self.uri, None, optype, key, value)
+            if opid is not None:
+                return opid
+            self.assertTrue(self.readable(q, 10))
+            done.extend(q._drain())
+
+    def test_queue(self):
+        self.session.create(self.uri,
+            'key_format=' + self.keyfmt + ',value_format=S')
+        kplan = compile_format(self.keyfmt)
+        vplan = compile_format('S')
+        q = self.conn._async_queue()
+
+        done = []
+        ids = {}
+        for i in xrange(self.nentries):
+            ids[self.submit(q, done, wiredtiger.WT_AOP_INSERT,
+                kplan.pack(self.key(i)), vplan.pack(self.value(i)))] = i
+        self.conn.async_flush()
+
+        # Completions are signalled once, and collected in one drain.
+        self.assertTrue(self.readable(q, 10))
+        done.extend(q._drain())
+        self.assertFalse(self.readable(q, 0))
+        self.assertEqual(q._drain(), [])
+        self.assertEqual(sorted(opid for opid, ret, value in done),
+            sorted(ids.keys()))
+        self.assertEqual(set((ret, value) for opid, ret, value in done),
+            set([(0, None)]))
+
+        # Searches return copies of the values.
+        done = []
+        ids = {}
+        for i in xrange(0, self.nentries, 7):
+            ids[self.submit(q, done, wiredtiger.WT_AOP_SEARCH,
+                kplan.pack(self.key(i)), None)] = i
+        missing = self.submit(q, done, wiredtiger.WT_AOP_SEARCH,
+            kplan.pack(self.key(self.nentries + 10)), None)
+        self.conn.async_flush()
+        done.extend(q._drain())
+        self.assertEqual(len(done), len(ids) + 1)
+        for opid, ret, value in done:
+            if opid == missing:
+                self.assertEqual((ret, value), (wiredtiger.WT_NOTFOUND, None))
+            else:
+                self.assertEqual(ret, 0)
+                self.assertEqual(
+                    vplan.unpack(value), [self.value(ids[opid])])
+
+        self.assertRaises(ValueError, lambda: q._submit(
+            self.uri, None, wiredtiger.WT_AOP_NONE, None, None))
+
+    # Freeing a queue with operations in flight waits for them to complete.
+    def test_queue_free(self):
+        self.session.create(self.uri,
+            'key_format=' + self.keyfmt + ',value_format=S')
+        kplan = compile_format(self.keyfmt)
+        vplan = compile_format('S')
+        q = self.conn._async_queue()
+        done = []
+        for i in xrange(self.nentries):
+            self.submit(q, done, wiredtiger.WT_AOP_INSERT,
+                kplan.pack(self.key(i)), vplan.pack(self.value(i)))
+        del q
+        gc.collect()
+
+        c = self.session.open_cursor(self.uri, None)
+        self.assertEqual(sum(1 for row in c), self.nentries)
+        c.close()
+
+    # The front-end with the minimal event loop, so it runs without asyncio.
+    def test_aio_simple_loop(self):
+        import wiredtiger.aio
+
+        self.session.create(self.uri,
+            'key_format=' + self.keyfmt + ',value_format=S')
+        loop = SimpleLoop()
+        aconn = wiredtiger.aio.AsyncConnection(self.conn, loop)
+        table = aconn.table(self.uri)
+
+        inserts = [table.insert(self.key(i), self.value(i))
+            for i in xrange(self.nentries)]
+        self.assertEqual(aconn.pending(), self.nentries)
+        loop.run_until_complete(inserts)
+        self.assertEqual(aconn.pending(), 0)
+        self.assertEqual(
+            loop.run_until_complete(
+                [table.search(self.key(i)) for i in xrange(self.nentries)]),
+            [self.value(i) for i in xrange(self.nentries)])
+
+        loop.run_until_complete([table.remove(self.key(4))])
+        missing = table.search(self.key(4))
+        self.assertRaises(KeyError, loop.run_until_complete, [missing])
+
+        last = table.insert(self.key(self.nentries), 'last')
+        aconn.close()
+        self.assertTrue(last.done())
+        self.assertEqual(loop.readers, {})
+
+    def test_aio(self):
+        try:
+            import asyncio
+        except ImportError:
+            try:
+                import trollius as asyncio
+            except ImportError:
+                self.skipTest('asyncio is not available')
+        import wiredtiger.aio
+
+        self.session.create(self.uri,
+            'key_format=' + self.keyfmt + ',value_format=S')
+        loop = asyncio.new_event_loop()
+        aconn = wiredtiger.aio.AsyncConnection(self.conn, loop)
+        table = aconn.table(self.uri)
+
+        # Many more operations in flight than there are handles.
+        inserts = [table.insert(self.key(i), self.value(i))
+            for i in xrange(self.nentries)]
+        self.assertEqual(aconn.pending(), self.nentries)
+        loop.run_until_complete(asyncio.gather(*inserts))
+        self.assertEqual(aconn.pending(), 0)
+
+        searches = [table.search(self.key(i)) for i in xrange(self.nentries)]
+        self.assertEqual(
+            loop.run_until_complete(asyncio.gather(*searches)),
+            [self.value(i) for i in xrange(self.nentries)])
+
+        loop.run_until_complete(table.update(self.key(3), 'updated'))
+        loop.run_until_complete(table.remove(self.key(4)))
+        self.assertEqual(
+            loop.run_until_complete(table.search(self.key(3))), 'updated')
+        missing = table.search(self.key(4))
+        self.assertRaises(KeyError, loop.run_until_complete, missing)
+
+        # Closing resolves anything still in flight.
+        last = table.insert(self.key(self.nentries), 'last')
+        aconn.close()
+        self.assertTrue(last.done())
+        self.assertRaises(WiredTigerError, lambda: table.search(self.key(0)))
+        loop.close()
+
+        c = self.session.open_cursor(self.uri, None)
+        self.assertEqual(c[self.key(self.nentries)], 'last')
+        c.close()
+
+if __name__ == '__main__':
+    wttest.run()
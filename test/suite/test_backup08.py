@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import os, time
+import wiredtiger, wiredtiger.backup, wttest
+from helper import compare_files
+from suite_subprocess import suite_subprocess
+from wtdataset import SimpleDataSet, ComplexDataSet
+from wtscenario import make_scenarios
+
+# test_backup08.py
+#    Parallel, chunked copies of the files listed by a backup cursor.
+class test_backup08(wttest.WiredTigerTestCase, suite_subprocess):
+    dir = 'backup.dir'
+    uri = 'table:backup08'
+    uri2 = 'table:backup08_2'
+
+    threads = [
+        ('serial', dict(threads=1)),
+        ('parallel', dict(threads=4)),
+    ]
+    copies = [
+        ('buffered', dict(zero_copy=False)),
+        ('zero_copy', dict(zero_copy=True)),
+    ]
+    scenarios = make_scenarios(threads, copies)
+
+    # Populate two tables, one big enough to be copied in several chunks
+    # with a small buffer size.
+    def populate(self):
+        SimpleDataSet(self, self.uri, 20000,
+            config='leaf_page_max=4KB').populate()
+        ComplexDataSet(self, self.uri2, 100).populate()
+        self.session.checkpoint()
+        os.mkdir(self.dir)
+
+    # Return the sizes of the files listed by a backup cursor; the backup
+    # metadata file only exists while the cursor is open.
+    def backup_files(self):
+        files = {}
+        cursor = self.session.open_cursor('backup:', None, None)
+        while cursor.next() == 0:
+            name = cursor.get_key()
+            files[name] = os.path.getsize(name)
+        cursor.close()
+        return files
+
+    # Confirm every database file listed by a backup cursor was copied
+    # unchanged.
+    def check_files(self):
+        files = self.backup_files()
+        self.assertTrue(len(files) > 2)
+        for name in files:
+            if name != 'WiredTiger.backup':
+                self.assertTrue(compare_files(
+                    self, name, os.path.join(self.dir, name)))
+            self.assertFalse(
+                os.path.exists(os.path.join(self.dir, name + '.copy')))
+
+    def check_backup(self):
+        for uri in (self.uri, self.uri2):
+            self.runWt(['dump', uri], outfilename='orig')
+            self.runWt(['-h', self.dir, 'dump', uri], outfilename='backup')
+            self.assertTrue(compare_files(self, 'orig', 'backup'))
+
+    def test_backup_copy(self):
+        self.populate()
+        wiredtiger.backup.copy(self.session, self.dir, threads=self.threads,
+            buffer_size='4KB', zero_copy=self.zero_copy)
+        self.check_files()
+        self.check_backup()
+
+    def test_backup_copy_util(self):
+        self.populate()
+        args = ['backup', '-p', str(self.threads), '-b', '4KB']
+        if self.zero_copy:
+            args.append('-z')
+        self.runWt(args + [self.dir])
+        self.check_files()
+        self.check_backup()
+
+    # A backup of chosen targets copies their files and the metadata.
+    def test_backup_copy_target(self):
+        self.populate()
+        wiredtiger.backup.copy(self.session, self.dir,
+            targets=[self.uri2], threads=self.threads)
+        files = os.listdir(self.dir)
+        self.assertFalse('backup08.wt' in files)
+        self.assertTrue('backup08_2_cgroup1.wt' in files)
+        self.runWt(['-h', self.dir, 'dump', self.uri2], outfilename='backup')
+
+    # A throttled copy takes at least as long as its rate allows.
+    def test_backup_copy_throttle(self):
+        self.populate()
+        total = sum(self.backup_files().values())
+        start = time.time()
+        wiredtiger.backup.copy(self.session, self.dir, threads=self.threads,
+            throttle=total, zero_copy=self.zero_copy)
+        self.assertGreaterEqual(time.time() - start, 0.9)
+        self.check_backup()
+
+    def test_backup_copy_config(self):
+        cursor = self.session.open_cursor('backup:', None, None)
+        for config, msg in (
+            ('threads=0', '/threads must be between/'),
+            ('buffer_size=1', '/buffer_size must be between/'),
+            ('throttle=-1', '/throttle must be/'),
+            ('parallel=4', '/unknown backup copy configuration key/')):
+            self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+                lambda: cursor._backup_copy(self.dir, config), msg)
+        cursor.close()
+        cursor = self.session.open_cursor('metadata:', None, None)
+        self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+            lambda: cursor._backup_copy(self.dir, None),
+            '/not a backup cursor/')
+        cursor.close()
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import random, threading, wiredtiger, wttest
+from wtthread import checkpoint_thread
+from wtscenario import make_scenarios
+
+class read_thread(threading.Thread):
+    def __init__(self, conn, uri, nrows, seed, done):
+        threading.Thread.__init__(self)
+        self.conn = conn
+        self.uri = uri
+        self.nrows = nrows
+        self.seed = seed
+        self.done = done
+        self.reads = 0
+        self.errors = []
+
+    def run(self):
+        session = self.conn.open_session()
+        cursor = session.open_cursor(self.uri, None, None)
+        r = random.Random(self.seed)
+        while not self.done.isSet():
+            i = r.randrange(1, self.nrows + 1)
+            cursor.set_key(i)
+            if cursor.search() != 0 or cursor.get_value() != str(i):
+                self.errors.append(i)
+            rows = cursor.next_batch(10)
+            if [row[0] for row in rows] != \
+                range(i + 1, min(i + 11, self.nrows + 1)):
+                self.errors.append(i)
+            self.reads += 1
+        session.close()
+
+# test_checkpoint03.py
+#   Read from several Python threads while checkpoints run in the background,
+#   the binding releases the GIL for both.
+class test_checkpoint03(wttest.WiredTigerTestCase):
+    scenarios = make_scenarios([
+        ('file', dict(uri='file:test', nthreads=4)),
+        ('table', dict(uri='table:test', nthreads=8)),
+    ])
+
+    nrows = 10000
+    nreads = 2000
+    seed = 3
+
+    def test_checkpoint03(self):
+        self.session.create(self.uri, 'key_format=r,value_format=S')
+        cursor = self.session.open_cursor(self.uri, None, 'bulk')
+        cursor.insert_many((i, str(i)) for i in xrange(1, self.nrows + 1))
+        cursor.close()
+
+        done = threading.Event()
+        ckpt = checkpoint_thread(self.conn, done)
+        # Each reader reads its own sequence of keys.
+        readers = [read_thread(
+            self.conn, self.uri, self.nrows, self.seed * 1000 + i, done)
+            for i in xrange(self.nthreads)]
+        ckpt.start()
+        for t in readers:
+            t.start()
+        while sum(t.reads for t in readers) < self.nreads and \
+            any(t.is_alive() for t in readers):
+            done.wait(0.01)
+        done.set()
+        for t in readers:
+            t.join()
+        ckpt.join()
+
+        for t in readers:
+            self.assertEqual(t.errors, [])
+            self.assertGreater(t.reads, 0)
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import wiredtiger, wttest
+
+# test_config07.py
+#    Test compiled configurations.
+class test_config07(wttest.WiredTigerTestCase):
+    uri = 'table:test_config07'
+
+    def populate(self):
+        self.session.create(self.uri, 'key_format=S,value_format=S')
+        cursor = self.session.open_cursor(self.uri)
+        for i in range(10):
+            cursor['key%03d' % i] = 'value%03d' % i
+        cursor.close()
+
+    # A compiled configuration is a copy of its string.
+    def test_compile_string(self):
+        config = 'isolation=snapshot,name=txn1'
+        compiled = self.conn.compile_configuration(
+            'WT_SESSION.begin_transaction', config)
+        self.assertEqual(str(compiled), config)
+        compiled = self.conn.compile_configuration(
+            'WT_SESSION.commit_transaction')
+        self.assertEqual(str(compiled), '')
+
+    # Compiled configurations apply their settings.
+    def test_compile_begin_transaction(self):
+        self.populate()
+        uncommitted = self.conn.compile_configuration(
+            'WT_SESSION.begin_transaction', 'isolation=read-uncommitted')
+        snapshot = self.conn.compile_configuration(
+            'WT_SESSION.begin_transaction', 'isolation=snapshot')
+        commit = self.conn.compile_configuration(
+            'WT_SESSION.commit_transaction', 'sync=off')
+
+        writer = self.conn.open_session()
+        wcursor = writer.open_cursor(self.uri)
+        writer.begin_transaction()
+        wcursor['key000'] = 'updated'
+
+        cursor = self.session.open_cursor(self.uri)
+        for i in range(3):
+            self.session.begin_transaction(uncommitted)
+            self.assertEqual(cursor['key000'], 'updated')
+            self.session.commit_transaction(commit)
+            self.session.begin_transaction(snapshot)
+            self.assertEqual(cursor['key000'], 'value000')
+            self.session.commit_transaction(commit)
+        writer.rollback_transaction()
+
+    def test_compile_open_cursor(self):
+        self.populate()
+        compiled = self.conn.compile_configuration(
+            'WT_SESSION.open_cursor', 'overwrite=false')
+        cursor = self.session.open_cursor(self.uri, None, compiled)
+        cursor.set_key('key001')
+        cursor.set_value('value')
+        self.assertRaises(wiredtiger.WiredTigerError, lambda: cursor.insert())
+        cursor.set_key('key100')
+        cursor.set_value('value100')
+        self.assertEqual(cursor.insert(), 0)
+        cursor.close()
+
+        # Other sessions can use the same compiled configuration.
+        session = self.conn.open_session()
+        cursor = session.open_cursor(self.uri, None, compiled)
+        cursor.set_key('key002')
+        cursor.set_value('value')
+        self.assertRaises(wiredtiger.WiredTigerError, lambda: cursor.insert())
+        session.close()
+
+        compiled = self.conn.compile_configuration(
+            'WT_SESSION.open_cursor', 'next_random=true')
+        cursor = self.session.open_cursor(self.uri, None, compiled)
+        self.assertEqual(cursor.next(), 0)
+        cursor.close()
+
+    # The connection's space for compiled configurations grows as needed.
+    def test_compile_many(self):
+        self.populate()
+        compiled = [self.conn.compile_configuration(
+            'WT_SESSION.open_cursor', 'checkpoint_wait=true,' * i +
+            ('overwrite=false', 'overwrite=true')[i % 2])
+            for i in range(1000)]
+        compiled.append(self.conn.compile_configuration(
+            'WT_SESSION.begin_transaction', 'name=' + 'x' * 100000))
+        self.session.begin_transaction(compiled[-1])
+        self.session.commit_transaction()
+        for i in (0, 1, 998, 999):
+            cursor = self.session.open_cursor(self.uri, None, compiled[i])
+            cursor.set_key('key001')
+            cursor.set_value('value')
+            if i % 2 == 0:
+                self.assertRaises(
+                    wiredtiger.WiredTigerError, lambda: cursor.insert())
+            else:
+                self.assertEqual(cursor.insert(), 0)
+            cursor.close()
+
+    # Invalid configurations are rejected when they're compiled.
+    def test_compile_invalid(self):
+        msg = '/Invalid argument/'
+        self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+            lambda: self.conn.compile_configuration(
+            'WT_SESSION.begin_transaction', 'isolation=none'), msg)
+        self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+            lambda: self.conn.compile_configuration(
+            'WT_SESSION.begin_transaction', 'not_valid=true'), msg)
+        self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+            lambda: self.conn.compile_configuration(
+            'WT_SESSION.not_a_method', ''), msg)
+
+    # Only some methods can have compiled configurations.
+    def test_compile_unsupported(self):
+        self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+            lambda: self.conn.compile_configuration(
+            'WT_SESSION.create', 'key_format=S'), '/cannot be compiled/')
+
+    # A configuration compiled for one method is an ordinary string to others.
+    def test_compile_other_method(self):
+        self.populate()
+        compiled = self.conn.compile_configuration(
+            'WT_SESSION.begin_transaction', 'isolation=snapshot')
+        self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+            lambda: self.session.open_cursor(self.uri, None, compiled),
+            '/Invalid argument/')
+        compiled = self.conn.compile_configuration(
+            'WT_SESSION.begin_transaction', 'priority=10')
+        self.session.begin_transaction(compiled)
+        self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+            lambda: self.session.commit_transaction(compiled),
+            '/Invalid argument/')
+
+if __name__ == '__main__':
+    wttest.run()
@@ -26,7 +26,7 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 
-import random, string
+import random, string, threading
 import wiredtiger, wttest
 from helper import copy_wiredtiger_home
 from wtdataset import SimpleDataSet
@@ -44,10 +44,30 @@ class test_cursor12(wttest.WiredTigerTestCase):
         ('lsm', dict(uri='lsm:modify')),
         ('table', dict(uri='table:modify')),
     ]
+    # Modifications can be Modify objects, (offset, size, data) tuples or
+    # a ModifyVector.
+    forms = [
+        ('object', dict(form='object')),
+        ('tuple', dict(form='tuple')),
+        ('vector', dict(form='vector')),
+    ]
     # Skip record number keys with LSM.
-    scenarios = filter_scenarios(make_scenarios(types, keyfmt),
+    scenarios = filter_scenarios(make_scenarios(types, keyfmt, forms),
         lambda name, d: not ('lsm' in d['uri'] and d['keyfmt'] == 'r'))
 
+    # Return the modifications in the scenario's form, given a list of
+    # [data, offset, size] lists.
+    def modifications(self, mods):
+        if self.form == 'object':
+            return [wiredtiger.Modify(*m) for m in mods]
+        elif self.form == 'tuple':
+            return [(m[1], m[2], m[0]) for m in mods]
+        vector = wiredtiger.ModifyVector()
+        for m in mods:
+            vector.append(m[1], m[2], m[0])
+        self.assertEqual(len(vector), len(mods))
+        return vector
+
     # List with original value, final value, and modifications to get
     # there.
     list = [
@@ -191,10 +211,7 @@ class test_cursor12(wttest.WiredTigerTestCase):
             c.reset()
 
             c.set_key(ds.key(row))
-            mods = []
-            for j in i['mods']:
-                mod = wiredtiger.Modify(j[0], j[1], j[2])
-                mods.append(mod)
+            mods = self.modifications(i['mods'])
             self.assertEquals(c.modify(mods), 0)
             c.reset()
 
@@ -289,9 +306,7 @@ class test_cursor12(wttest.WiredTigerTestCase):
         for i in range(0, 50000):
             new = "".join([random.choice(string.digits) for i in xrange(5)])
             orig = orig[:10] + new + orig[15:]
-            mods = []
-            mod = wiredtiger.Modify(new, 10, 5)
-            mods.append(mod)
+            mods = self.modifications([[new, 10, 5]])
             self.assertEquals(c.modify(mods), 0)
 
         c.set_key(ds.key(10))
@@ -308,9 +323,7 @@ class test_cursor12(wttest.WiredTigerTestCase):
         c.set_key(ds.key(10))
         self.assertEquals(c.remove(), 0)
 
-        mods = []
-        mod = wiredtiger.Modify('ABCD', 3, 3)
-        mods.append(mod)
+        mods = self.modifications([['ABCD', 3, 3]])
 
         c.set_key(ds.key(10))
         self.assertEqual(c.modify(mods), wiredtiger.WT_NOTFOUND)
@@ -332,9 +345,7 @@ class test_cursor12(wttest.WiredTigerTestCase):
         self.assertEquals(c.insert(), 0)
 
         # Test that we can successfully modify our own record.
-        mods = []
-        mod = wiredtiger.Modify('ABCD', 3, 3)
-        mods.append(mod)
+        mods = self.modifications([['ABCD', 3, 3]])
         c.set_key(ds.key(30))
         self.assertEqual(c.modify(mods), 0)
 
@@ -343,9 +354,7 @@ class test_cursor12(wttest.WiredTigerTestCase):
         xc = xs.open_cursor(self.uri, None)
         xc.set_key(ds.key(30))
         xc.set_value(ds.value(30))
-        mods = []
-        mod = wiredtiger.Modify('ABCD', 3, 3)
-        mods.append(mod)
+        mods = self.modifications([['ABCD', 3, 3]])
         xc.set_key(ds.key(30))
         self.assertEqual(xc.modify(mods), wiredtiger.WT_NOTFOUND)
 
@@ -353,11 +362,90 @@ class test_cursor12(wttest.WiredTigerTestCase):
         self.session.rollback_transaction()
 
         # Test that we can't modify our aborted insert.
-        mods = []
-        mod = wiredtiger.Modify('ABCD', 3, 3)
-        mods.append(mod)
+        mods = self.modifications([['ABCD', 3, 3]])
         c.set_key(ds.key(30))
         self.assertEqual(c.modify(mods), wiredtiger.WT_NOTFOUND)
 
+    # Check a ModifyVector can be applied repeatedly and cleared, and bad
+    # modifications are rejected.
+    def test_modify_vector(self):
+        ds = SimpleDataSet(self,
+            self.uri, 20, key_format=self.keyfmt, value_format='u')
+        ds.populate()
+
+        c = self.session.open_cursor(self.uri, None)
+        c.set_key(ds.key(10))
+        c.set_value('ABCDEFGH')
+        self.assertEquals(c.update(), 0)
+        vector = wiredtiger.ModifyVector()
+        vector.append(0, 1, bytearray('+'))
+        for i in xrange(3):
+            c.set_key(ds.key(10))
+            self.assertEquals(c.modify(vector), 0)
+        vector.clear()
+        self.assertEqual(len(vector), 0)
+        vector.append(8, 0, '+')
+        c.set_key(ds.key(10))
+        self.assertEquals(c.modify(vector), 0)
+        self.assertEquals(c.get_value(), '+BCDEFGH+')
+
+        c.set_key(ds.key(10))
+        self.assertRaises(ValueError, vector.append, -1, 0, 'x')
+        self.assertRaises(TypeError, vector.append, 0, 0, 42)
+        self.assertRaises(TypeError, c.modify, [(0, 1)])
+        self.assertRaises(ValueError, c.modify, [(0, -1, 'x')])
+        self.assertRaises(TypeError, c.modify, 42)
+        self.assertEquals(c.modify([(1, 1, '-')]), 0)
+        self.assertEquals(c.get_value(), '+-CDEFGH+')
+
+    # Check a ModifyVector can't be changed while another thread's modify
+    # call is using it.
+    def test_modify_vector_threads(self):
+        if self.form != 'vector':
+            return
+        ds = SimpleDataSet(self,
+            self.uri, 20, key_format=self.keyfmt, value_format='u')
+        ds.populate()
+
+        vector = wiredtiger.ModifyVector()
+        for i in xrange(100):
+            vector.append(i * 2, 1, bytearray('+'))
+        done = threading.Event()
+        errors = []
+
+        def modifier():
+            session = self.conn.open_session()
+            c = session.open_cursor(self.uri, None)
+            try:
+                while not done.isSet():
+                    c.set_key(ds.key(10))
+                    self.assertEquals(c.modify(vector), 0)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                session.close()
+
+        t = threading.Thread(target=modifier)
+        t.start()
+        for i in xrange(2000):
+            # Changes fail while the other thread's modify call is running.
+            try:
+                vector.clear()
+                for j in xrange(100):
+                    vector.append(j * 2, 1, bytearray('+'))
+            except RuntimeError:
+                pass
+        done.set()
+        t.join()
+        self.assertEqual(errors, [])
+
+        # Once the modify calls are done, the vector can be changed.
+        vector.clear()
+        vector.append(0, 1, '-')
+        c = self.session.open_cursor(self.uri, None)
+        c.set_key(ds.key(10))
+        self.assertEquals(c.modify(vector), 0)
+        self.assertEquals(c.get_value()[0], '-')
+
 if __name__ == '__main__':
     wttest.run()
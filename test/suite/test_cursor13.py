@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import wiredtiger, wttest
+from wiredtiger import packing
+from wtscenario import make_scenarios
+
+# test_cursor13.py
+#    Test views of cursor keys and values.
+class test_cursor13(wttest.WiredTigerTestCase):
+    types = [
+        ('file', dict(uri='file:view')),
+        ('table', dict(uri='table:view')),
+    ]
+    formats = [
+        ('recno', dict(keyfmt='r', valfmt='S')),
+        ('string', dict(keyfmt='S', valfmt='u')),
+        ('mixed', dict(keyfmt='Si', valfmt='SiQu')),
+    ]
+    scenarios = make_scenarios(types, formats)
+
+    nentries = 100
+
+    def key(self, i):
+        if self.keyfmt == 'r':
+            return i
+        elif self.keyfmt == 'S':
+            return 'key%06d' % i
+        return ('key%06d' % i, -i)
+
+    def value(self, i):
+        if self.valfmt == 'S':
+            return 'value%d' % i
+        elif self.valfmt == 'u':
+            return ('\0%d' % i) * 1000
+        return ('value%d' % i, i, 1 << 40, 'x' * i)
+
+    def test_view(self):
+        self.session.create(self.uri,
+            'key_format=' + self.keyfmt + ',value_format=' + self.valfmt)
+        c = self.session.open_cursor(self.uri, None)
+        for i in xrange(1, self.nentries + 1):
+            c[self.key(i)] = self.value(i)
+        c.close()
+
+        c = self.session.open_cursor(self.uri, None)
+        i = 0
+        views = []
+        while c.next() == 0:
+            i += 1
+            kview = c.get_raw_key_view()
+            vview = c.get_raw_value_view()
+            self.assertEqual(kview.tobytes(), c._get_key())
+            self.assertEqual(vview.tobytes(), c._get_value())
+            self.assertEqual(len(vview), len(c._get_value()))
+            self.assertTrue(memoryview(vview).readonly)
+
+            # Views unpack the same as strings, with either packer.
+            key = packing.unpack(c.key_format, kview)
+            value = packing.unpack(c.value_format, vview)
+            self.assertEqual(key, c.get_keys())
+            self.assertEqual(value, c.get_values())
+            self.assertEqual(
+                packing._unpack_python(c.value_format, vview), value)
+            views.append((kview, vview))
+        self.assertEqual(i, self.nentries)
+
+        # Views refer to the cursor's memory: once the cursor has moved on,
+        # using them raises.
+        for kview, vview in views:
+            self.assertRaises(wiredtiger.WiredTigerError, kview.tobytes)
+            self.assertRaises(wiredtiger.WiredTigerError,
+                lambda: packing.unpack(self.valfmt, vview))
+            self.assertRaises(wiredtiger.WiredTigerError, lambda: len(vview))
+
+        # Without a position, there is nothing to view.
+        c.reset()
+        self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+            c.get_raw_value_view, '/requires value be set/')
+
+        # Setting a key, ending a transaction and closing the cursor each
+        # invalidate views.
+        c.set_key(self.key(1))
+        self.assertEqual(c.search(), 0)
+        vview = c.get_raw_value_view()
+        c.set_key(self.key(2))
+        self.assertRaises(wiredtiger.WiredTigerError, vview.tobytes)
+
+        self.session.begin_transaction()
+        c.set_key(self.key(1))
+        self.assertEqual(c.search(), 0)
+        vview = c.get_raw_value_view()
+        self.assertEqual(packing.unpack(self.valfmt, vview), c.get_values())
+        self.session.commit_transaction()
+        self.assertRaises(wiredtiger.WiredTigerError, vview.tobytes)
+
+        c.set_key(self.key(1))
+        self.assertEqual(c.search(), 0)
+        vview = c.get_raw_value_view()
+        c.close()
+        self.assertRaises(wiredtiger.WiredTigerError, vview.tobytes)
+
+        # Views can't be written through.
+        c = self.session.open_cursor(self.uri, None)
+        self.assertEqual(c.next(), 0)
+        vview = c.get_raw_value_view()
+        self.assertRaises(
+            TypeError, lambda: memoryview(vview).__setitem__(0, 'x'))
+        c.close()
+
+if __name__ == '__main__':
+    wttest.run()
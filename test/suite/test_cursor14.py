@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import wiredtiger, wttest
+from wiredtiger import packing
+from wtscenario import make_scenarios
+
+# test_cursor14.py
+#    Test batched cursor traversal with next_batch and prev_batch.
+class test_cursor14(wttest.WiredTigerTestCase):
+    types = [
+        ('file', dict(uri='file:batch')),
+        ('table', dict(uri='table:batch')),
+    ]
+    formats = [
+        ('recno', dict(keyfmt='r', valfmt='S')),
+        ('string', dict(keyfmt='S', valfmt='u')),
+        ('mixed', dict(keyfmt='Si', valfmt='SiQu')),
+    ]
+    scenarios = make_scenarios(types, formats)
+
+    nentries = 250
+
+    def key(self, i):
+        if self.keyfmt == 'r':
+            return i
+        elif self.keyfmt == 'S':
+            return 'key%06d' % i
+        return ('key%06d' % i, -i)
+
+    def value(self, i):
+        if self.valfmt == 'S':
+            return 'value%d' % i
+        elif self.valfmt == 'u':
+            return ('\0%d' % i) * 100
+        return ('value%d' % i, i, 1 << 40, 'x' * i)
+
+    def populate(self):
+        self.session.create(self.uri,
+            'key_format=' + self.keyfmt + ',value_format=' + self.valfmt)
+        c = self.session.open_cursor(self.uri, None)
+        for i in xrange(1, self.nentries + 1):
+            c[self.key(i)] = self.value(i)
+        c.close()
+
+    def batches(self, step, n):
+        c = self.session.open_cursor(self.uri, None)
+        rows = []
+        while True:
+            batch = step(c)(n)
+            rows.extend(batch)
+            if len(batch) < n:
+                break
+        c.close()
+        return rows
+
+    # Batches return the same rows as iteration, in either direction.
+    def test_batch(self):
+        self.populate()
+        c = self.session.open_cursor(self.uri, None)
+        expect = [row for row in c]
+        c.close()
+        self.assertEqual(len(expect), self.nentries)
+
+        for n in (1, 7, self.nentries, self.nentries + 1):
+            self.assertEqual(
+                self.batches(lambda c: c.next_batch, n), expect)
+            self.assertEqual(
+                self.batches(lambda c: c.prev_batch, n), expect[::-1])
+
+    # Batches continue from the cursor's position, and leave the cursor
+    # positioned on the last row returned.
+    def test_batch_position(self):
+        self.populate()
+        c = self.session.open_cursor(self.uri, None)
+        c.set_key(self.key(10))
+        self.assertEqual(c.search(), 0)
+        rows = c.next_batch(5)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(c.get_keys(), rows[-1][:len(c.get_keys())])
+        self.assertEqual(c.get_values(), packing.unpack(
+            c.value_format, c._get_value()))
+        self.assertEqual(c.next(), 0)
+        self.assertEqual(c.get_keys(), packing.unpack(
+            c.key_format, c.get_raw_key_view()))
+        self.assertEqual(c.prev_batch(0), [])
+        c.close()
+
+    # Raw batches hold the packed keys and values, with offsets.
+    def test_batch_raw(self):
+        self.populate()
+        c = self.session.open_cursor(self.uri, None)
+        expect = []
+        while c.next() == 0:
+            expect.append((c._get_key(), c._get_value()))
+        c.close()
+
+        c = self.session.open_cursor(self.uri, None)
+        keys, key_offsets, values, value_offsets = c.next_batch(
+            self.nentries + 1, raw=True)
+        self.assertEqual(len(key_offsets), self.nentries + 1)
+        self.assertEqual(len(value_offsets), self.nentries + 1)
+        self.assertEqual(key_offsets[-1], len(keys))
+        self.assertEqual(value_offsets[-1], len(values))
+        rows = [(keys[key_offsets[i]:key_offsets[i + 1]],
+            values[value_offsets[i]:value_offsets[i + 1]])
+            for i in xrange(self.nentries)]
+        self.assertEqual(rows, expect)
+
+        # Reaching the end reset the cursor, so the next batch starts over.
+        keys, key_offsets, values, value_offsets = c.next_batch(
+            3, raw=True)
+        self.assertEqual(len(key_offsets), 4)
+        self.assertEqual(keys, ''.join([k for k, v in expect[:3]]))
+        self.assertEqual(values, ''.join([v for k, v in expect[:3]]))
+        c.close()
+
+        # An empty table gives an empty batch.
+        self.session.truncate(self.uri, None, None, None)
+        c = self.session.open_cursor(self.uri, None)
+        keys, key_offsets, values, value_offsets = c.prev_batch(
+            10, raw=True)
+        self.assertEqual((keys, list(key_offsets)), ('', [0]))
+        self.assertEqual((values, list(value_offsets)), ('', [0]))
+        c.close()
+
+    def test_batch_errors(self):
+        self.populate()
+        c = self.session.open_cursor(self.uri, None)
+        self.assertRaises(ValueError, lambda: c.next_batch(-1))
+        c.close()
+        c = self.session.open_cursor(self.uri, None, 'dump=json')
+        self.assertRaises(wiredtiger.WiredTigerError,
+            lambda: c.next_batch(10))
+        c.close()
+
+if __name__ == '__main__':
+    wttest.run()
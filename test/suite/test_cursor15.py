@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import wiredtiger, wttest
+from wtscenario import make_scenarios
+
+# test_cursor15.py
+#    Test inserting many rows with Cursor.insert_many.
+class test_cursor15(wttest.WiredTigerTestCase):
+    types = [
+        ('file', dict(uri='file:insert')),
+        ('table', dict(uri='table:insert')),
+    ]
+    formats = [
+        ('recno', dict(keyfmt='r', valfmt='S')),
+        ('string', dict(keyfmt='S', valfmt='u')),
+        ('mixed', dict(keyfmt='Si', valfmt='SiQu')),
+    ]
+    cursors = [
+        ('bulk', dict(config='bulk')),
+        ('regular', dict(config=None)),
+    ]
+    scenarios = make_scenarios(types, formats, cursors)
+
+    nentries = 1000
+
+    def key(self, i):
+        if self.keyfmt == 'r':
+            return i
+        elif self.keyfmt == 'S':
+            return 'key%06d' % i
+        return ('key%06d' % i, -i)
+
+    def value(self, i):
+        if self.valfmt == 'S':
+            return 'value%d' % i
+        elif self.valfmt == 'u':
+            return ('\0%d' % i) * 10
+        return ('value%d' % i, i, 1 << 40, 'x' * (i % 100))
+
+    def rows(self, start, stop):
+        for i in xrange(start, stop):
+            yield (self.key(i), self.value(i))
+
+    def check(self, expect):
+        c = self.session.open_cursor(self.uri, None)
+        for i in expect:
+            c.set_key(self.key(i))
+            self.assertEqual(c.search(), 0)
+            value = self.value(i)
+            if type(value) == tuple:
+                value = list(value)
+            self.assertEqual(c.get_value(), value)
+        c.reset()
+        self.assertEqual(sum(1 for row in c), len(expect))
+        c.close()
+
+    def create(self):
+        self.session.create(self.uri,
+            'key_format=' + self.keyfmt + ',value_format=' + self.valfmt)
+
+    # Insert from a generator, in batches of various sizes.
+    def test_insert_many(self):
+        for batch_size in (1, 7, 1000, 5000):
+            self.create()
+            c = self.session.open_cursor(self.uri, None, self.config)
+            self.assertEqual(c.insert_many(
+                self.rows(1, self.nentries + 1), batch_size), [])
+            c.close()
+            self.check(range(1, self.nentries + 1))
+            self.session.drop(self.uri, None)
+
+    # Rows that can't be packed are reported, the rest are inserted.
+    def test_insert_many_pack_failures(self):
+        self.create()
+        rows = list(self.rows(1, 11))
+        rows[3] = (self.key(4), None)
+        rows[7] = (self.key(8),)
+        c = self.session.open_cursor(self.uri, None, self.config)
+        failures = c.insert_many(rows, batch_size=4)
+        c.close()
+        self.assertEqual([(i, row) for i, row, e in failures],
+            [(3, rows[3]), (7, rows[7])])
+        for i, row, e in failures:
+            self.assertTrue(isinstance(e, Exception))
+        self.check([1, 2, 3, 5, 6, 7, 9, 10])
+
+    # Insert failures are reported, the rows after them are inserted.
+    def test_insert_many_duplicates(self):
+        if self.config == 'bulk':
+            self.skipTest('bulk cursors do not detect duplicates')
+        self.create()
+        c = self.session.open_cursor(self.uri, None)
+        c.insert_many(self.rows(1, 11))
+        c.close()
+
+        c = self.session.open_cursor(self.uri, None, 'overwrite=false')
+        failures = c.insert_many(self.rows(11, 21), batch_size=3)
+        self.assertEqual(failures, [])
+        rows = list(self.rows(21, 31))
+        rows[2] = (self.key(1), self.value(1))
+        rows[4] = (self.key(4), None)
+        rows[6] = (self.key(3), self.value(3))
+        failures = c.insert_many(rows, batch_size=4)
+        c.close()
+        self.assertEqual([(i, row) for i, row, e in failures],
+            [(2, rows[2]), (4, rows[4]), (6, rows[6])])
+        for i in (0, 2):
+            e = failures[i][2]
+            self.assertTrue(isinstance(e, wiredtiger.WiredTigerError))
+            self.assertTrue(str(e).startswith('WT_DUPLICATE_KEY'))
+        self.check(range(1, 23) + [24, 26, 28, 29, 30])
+
+    # An insert failure inside a transaction stops the insert.
+    def test_insert_many_rollback(self):
+        if self.config == 'bulk':
+            self.skipTest('bulk cursors are not transactional')
+        self.create()
+        self.session.begin_transaction('isolation=snapshot')
+        c = self.session.open_cursor(self.uri, None)
+        c.insert_many(self.rows(1, 11))
+
+        # Another transaction updates a row, inserting it conflicts.
+        session2 = self.conn.open_session()
+        c2 = session2.open_cursor(self.uri, None)
+        session2.begin_transaction()
+        c2[self.key(15)] = self.value(15)
+
+        failures = c.insert_many(self.rows(11, 21), batch_size=3)
+        self.assertEqual([(i, row) for i, row, e in failures],
+            [(4, (self.key(15), self.value(15)))])
+        self.assertTrue(str(failures[0][2]).startswith('WT_ROLLBACK'))
+        self.session.rollback_transaction()
+        session2.rollback_transaction()
+        session2.close()
+        self.check([])
+
+    # Bulk cursors report keys out of order, the rows after them are loaded.
+    def test_insert_many_bulk_order(self):
+        if self.config != 'bulk':
+            self.skipTest('only bulk cursors require ordered keys')
+        self.create()
+        rows = list(self.rows(1, 11))
+        rows[5], rows[6] = rows[6], rows[5]
+        c = self.session.open_cursor(self.uri, None, self.config)
+        with self.expectedStderrPattern('out-of-order keys'):
+            failures = c.insert_many(rows, batch_size=4)
+        c.close()
+        self.assertEqual([(i, row) for i, row, e in failures],
+            [(6, rows[6])])
+        self.assertTrue(isinstance(failures[0][2], wiredtiger.WiredTigerError))
+        self.check([1, 2, 3, 4, 5, 7, 8, 9, 10])
+
+    def test_insert_many_errors(self):
+        self.create()
+        c = self.session.open_cursor(self.uri, None)
+        self.assertRaises(ValueError, lambda: c.insert_many([], 0))
+        self.assertEqual(c.insert_many([]), [])
+        c.close()
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import wiredtiger, wttest
+from wtscenario import make_scenarios
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# test_cursor16.py
+#    Test reading and inserting NumPy arrays with Cursor.to_numpy and
+#    Cursor.from_numpy.
+class test_cursor16(wttest.WiredTigerTestCase):
+    types = [
+        ('file', dict(uri='file:numpy')),
+        ('table', dict(uri='table:numpy')),
+    ]
+    formats = [
+        ('recno', dict(keyfmt='r', valfmt='Q')),
+        ('fix', dict(keyfmt='r', valfmt='8t')),
+        ('int', dict(keyfmt='i', valfmt='10s')),
+        ('mixed', dict(keyfmt='Q', valfmt='bhi4s2q')),
+    ]
+    cursors = [
+        ('bulk', dict(config='bulk')),
+        ('regular', dict(config=None)),
+    ]
+    scenarios = make_scenarios(types, formats, cursors)
+
+    nentries = 1000
+
+    def setUp(self):
+        if numpy is None:
+            self.skipTest('numpy is not installed')
+        wttest.WiredTigerTestCase.setUp(self)
+
+    def row(self, i):
+        if self.keyfmt == 'r':
+            key = i + 1
+        elif self.keyfmt == 'i':
+            key = i * 3 - 100
+        else:
+            key = i * 3
+        if self.valfmt == 'Q':
+            return (key, (1 << 63) + i)
+        elif self.valfmt == '8t':
+            return (key, i % 256)
+        elif self.valfmt == '10s':
+            return (key, 'value%d' % i)
+        return (key, -(i % 128), i - 500, -i, 'v%d' % (i % 100),
+            1 << 40, -(1 << 40))
+
+    def array(self, cursor, start, stop):
+        return numpy.array([self.row(i) for i in xrange(start, stop)],
+            cursor.numpy_dtype())
+
+    def create(self):
+        self.session.create(self.uri,
+            'key_format=' + self.keyfmt + ',value_format=' + self.valfmt)
+
+    # Check the engine sees the rows inserted from an array.
+    def test_from_numpy(self):
+        self.create()
+        c = self.session.open_cursor(self.uri, None, self.config)
+        arr = self.array(c, 0, self.nentries)
+        self.assertEqual(c.from_numpy(arr), [])
+        c.close()
+
+        c = self.session.open_cursor(self.uri, None)
+        count = 0
+        for row in c:
+            # NumPy strings drop trailing nul bytes.
+            row = tuple([v.rstrip('\0') if type(v) == str else v
+                for v in row])
+            self.assertEqual(row, self.row(count))
+            count += 1
+        self.assertEqual(count, self.nentries)
+
+    # Check reading arrays, in pieces, back to the start after the end.
+    def test_to_numpy(self):
+        self.create()
+        c = self.session.open_cursor(self.uri, None)
+        for i in xrange(self.nentries):
+            row = self.row(i)
+            c[row[0]] = row[1:]
+        expect = self.array(c, 0, self.nentries)
+
+        got = c.to_numpy(300)
+        self.assertEqual(len(got), 300)
+        self.assertTrue(numpy.array_equal(got, expect[:300]))
+        got = c.to_numpy(self.nentries)
+        self.assertEqual(len(got), self.nentries - 300)
+        self.assertTrue(numpy.array_equal(got, expect[300:]))
+        # The cursor was reset at the end.
+        got = c.to_numpy(self.nentries * 2)
+        self.assertTrue(numpy.array_equal(got, expect))
+        self.assertEqual(len(c.to_numpy(0)), 0)
+
+    # Check field names and the checks on arrays.
+    def test_numpy_dtype(self):
+        self.create()
+        c = self.session.open_cursor(self.uri, None, self.config)
+        dtype = c.numpy_dtype()
+        if self.valfmt == 'bhi4s2q':
+            self.assertEqual(dtype.names, ('key', 'value0', 'value1',
+                'value2', 'value3', 'value4', 'value5'))
+        else:
+            self.assertEqual(dtype.names, ('key', 'value'))
+        names = ['f%d' % i for i in xrange(len(dtype.names))]
+        self.assertEqual(c.numpy_dtype(names).names, tuple(names))
+        self.assertRaises(ValueError, c.numpy_dtype, names[1:])
+
+        # Names are ignored, types must match.
+        arr = self.array(c, 0, 10)
+        arr.dtype.names = names
+        self.assertEqual(c.from_numpy(arr), [])
+        self.assertRaises(ValueError, c.from_numpy,
+            numpy.zeros(10, [('a', 'f8'), ('b', 'f8')]))
+        self.assertRaises(ValueError, c.from_numpy, numpy.zeros(10))
+
+    # Variable-width formats can't be used.
+    def test_numpy_variable(self):
+        for keyfmt, valfmt in (('S', 'i'), ('i', 'u'), ('q', 'iS')):
+            uri = 'table:variable_' + keyfmt + valfmt
+            self.session.create(uri,
+                'key_format=' + keyfmt + ',value_format=' + valfmt)
+            c = self.session.open_cursor(uri, None)
+            self.assertRaises(ValueError, c.numpy_dtype)
+            self.assertRaises(ValueError, c.to_numpy, 10)
+            self.assertRaises(ValueError, c.from_numpy,
+                numpy.zeros(10, [('a', 'i4'), ('b', 'i4')]))
+            c.close()
+
+    # Failed inserts are reported without stopping the insert.
+    def test_numpy_duplicate(self):
+        if self.config == 'bulk':
+            return
+        self.create()
+        c = self.session.open_cursor(self.uri, None, 'overwrite=false')
+        self.assertEqual(c.from_numpy(self.array(c, 0, 10)), [])
+        failures = c.from_numpy(self.array(c, 5, 15))
+        self.assertEqual([i for i, e in failures], range(5))
+        for i, e in failures:
+            self.assertTrue(isinstance(e, wiredtiger.WiredTigerError))
+        c.reset()
+        self.assertEqual(len(c.to_numpy(100)), 15)
+
+    # An insert failing with WT_ROLLBACK stops the insert.
+    def test_numpy_rollback(self):
+        if self.config == 'bulk':
+            return
+        self.create()
+        self.session.begin_transaction('isolation=snapshot')
+        c = self.session.open_cursor(self.uri, None)
+
+        # Another transaction updates a row, inserting it conflicts.
+        session2 = self.conn.open_session()
+        c2 = session2.open_cursor(self.uri, None)
+        session2.begin_transaction()
+        row = self.row(4)
+        c2[row[0]] = row[1:]
+
+        failures = c.from_numpy(self.array(c, 0, 10))
+        self.assertEqual([i for i, e in failures], [4])
+        self.assertTrue(str(failures[0][1]).startswith('WT_ROLLBACK'))
+        self.session.rollback_transaction()
+        session2.rollback_transaction()
+        session2.close()
+
+    # Fields that run past the end of the record are rejected.
+    def test_numpy_overrun(self):
+        self.create()
+        c = self.session.open_cursor(self.uri, None)
+        arr = self.array(c, 0, 10)
+        itemsize = arr.dtype.itemsize
+        offsets = c._numpy_offsets(arr.dtype)
+        self.assertEqual(c._numpy(arr, len(arr), itemsize, offsets, True), [])
+
+        # The key is 4 or 8 bytes wide, starting it at the last byte of
+        # the record runs past the end.
+        bad = [itemsize - 1] + offsets[1:]
+        for insert in (True, False):
+            self.assertRaises(ValueError,
+                lambda: c._numpy(arr, len(arr), itemsize, bad, insert))
+        self.assertRaises(ValueError,
+            lambda: c._numpy(arr, len(arr), itemsize, offsets[1:], True))
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import wiredtiger, wttest
+from wiredtiger import stat
+from wtscenario import make_scenarios
+
+# test_cursor17.py
+#    Test caching cursors in sessions configured with cache_cursors.
+class test_cursor17(wttest.WiredTigerTestCase):
+    conn_config = 'statistics=(fast)'
+    types = [
+        ('file', dict(uri='file:cache')),
+        ('table', dict(uri='table:cache')),
+    ]
+    scenarios = make_scenarios(types)
+
+    nentries = 100
+
+    def setUp(self):
+        wttest.WiredTigerTestCase.setUp(self)
+        self.session.reconfigure('cache_cursors=true')
+
+    def create(self, uri):
+        self.session.create(uri, 'key_format=S,value_format=S')
+        c = self.session.open_cursor(uri, None)
+        for i in xrange(self.nentries):
+            c['key%03d' % i] = 'value%03d' % i
+        c.close()
+
+    def get_stat(self, which):
+        stat_cursor = self.session.open_cursor('statistics:', None, None)
+        val = stat_cursor[which][2]
+        stat_cursor.close()
+        return val
+
+    def cache_stats(self):
+        return (self.get_stat(stat.conn.cursor_cache_hit),
+            self.get_stat(stat.conn.cursor_cache_miss))
+
+    def check(self, c):
+        count = 0
+        for k, v in c:
+            self.assertEqual(k, 'key%03d' % count)
+            self.assertEqual(v, 'value%03d' % count)
+            count += 1
+        self.assertEqual(count, self.nentries)
+        c.reset()
+
+    # Reopening a closed cursor with the same configuration is a hit, other
+    # configurations miss.
+    def test_cursor_cache(self):
+        self.create(self.uri)
+        hit1, miss1 = self.cache_stats()
+        for i in xrange(10):
+            c = self.session.open_cursor(self.uri, None)
+            self.check(c)
+            self.assertEqual(c['key050'], 'value050')
+            c.close()
+        hit2, miss2 = self.cache_stats()
+        self.assertEqual(hit2 - hit1, 10)
+
+        c = self.session.open_cursor(self.uri, None, 'overwrite=false')
+        self.assertRaises(wiredtiger.WiredTigerError,
+            lambda: c.set_key('key000') or c.set_value('x') or c.insert())
+        c.close()
+        hit3, miss3 = self.cache_stats()
+        self.assertEqual(hit3, hit2)
+        self.assertEqual(miss3 - miss2, 1)
+
+        # The cached cursor kept its configuration.
+        c = self.session.open_cursor(self.uri, None, 'overwrite=false')
+        c.set_key('key000')
+        c.set_value('x')
+        self.assertRaises(wiredtiger.WiredTigerError, lambda: c.insert())
+        c.close()
+        self.assertEqual(self.cache_stats()[0], hit3 + 1)
+
+        # Cursors in the cache don't stop other sessions dropping objects.
+        c = self.session.open_cursor(self.uri, None)
+        c.close()
+        self.assertTrue(self.get_stat(stat.conn.cursor_cache) > 0)
+        s = self.conn.open_session()
+        s.drop(self.uri)
+        s.close()
+        self.create(self.uri)
+        c = self.session.open_cursor(self.uri, None)
+        self.check(c)
+        c.close()
+
+    # Schema changes invalidate cached cursors.
+    def test_cursor_cache_schema(self):
+        self.create(self.uri)
+        c = self.session.open_cursor(self.uri, None)
+        c.close()
+        self.session.drop(self.uri)
+        self.assertRaises(wiredtiger.WiredTigerError,
+            lambda: self.session.open_cursor(self.uri, None))
+
+        self.create(self.uri)
+        c = self.session.open_cursor(self.uri, None)
+        c.close()
+        newuri = self.uri + '_renamed'
+        self.session.rename(self.uri, newuri, None)
+        self.assertRaises(wiredtiger.WiredTigerError,
+            lambda: self.session.open_cursor(self.uri, None))
+        c = self.session.open_cursor(newuri, None)
+        self.check(c)
+        c.close()
+
+        # Adding an index to a simple table changes the cursor type.
+        if self.uri.startswith('table:'):
+            self.session.create('table:cache_index',
+                'key_format=S,value_format=SS,columns=(k,v0,v1)')
+            c = self.session.open_cursor('table:cache_index', None)
+            c['key000'] = ('a', 'b')
+            c.close()
+            self.session.create('index:cache_index:v0', 'columns=(v0)')
+            c = self.session.open_cursor('table:cache_index', None)
+            c['key001'] = ('c', 'd')
+            c.close()
+            c = self.session.open_cursor('index:cache_index:v0', None)
+            self.assertEqual(c['c'], ['c', 'd'])
+            c.close()
+
+    # Turning off caching or closing the session discards cached cursors.
+    def test_cursor_cache_discard(self):
+        self.create(self.uri)
+        c = self.session.open_cursor(self.uri, None)
+        c.close()
+        self.assertEqual(self.get_stat(stat.conn.cursor_cache), 1)
+        self.session.reconfigure('cache_cursors=false')
+        self.assertEqual(self.get_stat(stat.conn.cursor_cache), 0)
+        hit1, miss1 = self.cache_stats()
+        c = self.session.open_cursor(self.uri, None)
+        c.close()
+        self.assertEqual(self.cache_stats(), (hit1, miss1))
+        self.assertEqual(self.get_stat(stat.conn.cursor_cache), 0)
+
+        s = self.conn.open_session('cache_cursors=true')
+        c = s.open_cursor(self.uri, None)
+        c.close()
+        self.assertEqual(self.get_stat(stat.conn.cursor_cache), 1)
+        s.close()
+        self.assertEqual(self.get_stat(stat.conn.cursor_cache), 0)
+        self.session.verify(self.uri, None)
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import wiredtiger, wttest
+from wiredtiger import stat
+
+# test_dhandle01.py
+#    Test the data handle hash tables grow with the number of handles.
+class test_dhandle01(wttest.WiredTigerTestCase):
+    conn_config = 'statistics=(fast)'
+    ntables = 1500
+
+    def uri(self, i):
+        return 'table:dhandle%05d' % i
+
+    def get_stat(self, which):
+        stat_cursor = self.session.open_cursor('statistics:', None, None)
+        val = stat_cursor[which][2]
+        stat_cursor.close()
+        return val
+
+    def check(self, i):
+        c = self.session.open_cursor(self.uri(i), None)
+        self.assertEqual(c[i], str(i))
+        c.close()
+
+    def test_dhandle_hash_grow(self):
+        self.assertEqual(self.get_stat(stat.conn.dh_conn_hash_buckets), 512)
+        for i in xrange(self.ntables):
+            self.session.create(self.uri(i), 'key_format=i,value_format=S')
+            c = self.session.open_cursor(self.uri(i), None)
+            c[i] = str(i)
+            c.close()
+        # Each table has a table and a file handle.
+        self.assertGreater(self.get_stat(stat.conn.dh_conn_hash_buckets), 512)
+        self.assertGreater(self.get_stat(stat.conn.dh_conn_hash_resize), 0)
+        self.assertGreater(
+            self.get_stat(stat.conn.dh_session_hash_resize), 0)
+
+        # Every handle can be found, by this session and a new one.
+        for i in xrange(self.ntables):
+            self.check(i)
+        self.session.close()
+        self.session = self.conn.open_session()
+        for i in xrange(0, self.ntables, 2):
+            self.session.drop(self.uri(i))
+        for i in xrange(1, self.ntables, 2):
+            self.check(i)
+
+        # Checkpoint handles share a bucket with the live handle.
+        self.session.checkpoint()
+        for i in xrange(1, self.ntables, 10):
+            c = self.session.open_cursor(self.uri(i), None,
+                'checkpoint=WiredTigerCheckpoint')
+            self.assertEqual(c[i], str(i))
+            c.close()
+        self.session.verify(self.uri(1), None)
+
+        self.reopen_conn()
+        for i in xrange(1, self.ntables, 2):
+            self.check(i)
+
+if __name__ == '__main__':
+    wttest.run()
@@ -105,5 +105,28 @@ class test_pack(wttest.WiredTigerTestCase):
         self.check("1s", "4")
         self.check("2s", "42")
 
+    def test_format_plans(self):
+        from wiredtiger import packing
+        plan = packing.compile_format('iSu')
+        self.assertTrue(packing.compile_format('iSu') is plan)
+        self.assertEqual(plan.unpack(plan.pack(7, 'seven', 'x' * 20)),
+            [7, 'seven', 'x' * 20])
+
+        # Filling the cache evicts the least recently used plans.
+        for i in xrange(packing.PLAN_CACHE_SIZE):
+            packing.compile_format('iSu')
+            packing.compile_format(str(i + 1) + 'S')
+        self.assertTrue(packing.compile_format('iSu') is plan)
+        self.assertTrue(len(packing._plans) <= packing.PLAN_CACHE_SIZE)
+
+        # Cursors compile their formats when opened.
+        uri = 'table:' + test_pack.name + '-plans'
+        self.session.create(uri, 'key_format=iSu,value_format=S')
+        cursor = self.session.open_cursor(uri, None, None)
+        self.assertTrue(cursor._key_plan is plan)
+        cursor[(1, 'one', 'x')] = 'value'
+        self.assertEqual(cursor[(1, 'one', 'x')], 'value')
+        cursor.close()
+
 if __name__ == '__main__':
     wttest.run()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# test_pack02.py
+#    Tests the C packing accelerator produces the same results as the
+#    pure-Python packing module and the WiredTiger C API.
+#
+
+import wiredtiger, wttest
+from wiredtiger import packing
+from wtscenario import make_scenarios
+
+class test_pack02(wttest.WiredTigerTestCase):
+    name = 'test_pack02'
+
+    scenarios = make_scenarios([
+        ('ints', dict(fmt='iii', values=[0, 101, -99])),
+        ('repeat', dict(fmt='3i', values=[0, 8256, -8257])),
+        ('bytes', dict(fmt='bB', values=[-128, 255])),
+        ('bits', dict(fmt='5t', values=[31])),
+        ('big', dict(fmt='qQ', values=[-2 ** 63, 2 ** 64 - 1])),
+        ('unsigned', dict(fmt='HIL', values=[65535, 2 ** 32 - 1, 0])),
+        ('string', dict(fmt='S', values=['abc'])),
+        ('fixstring', dict(fmt='10SS', values=['aaaaa\0\0\0\0\0', 'spam'])),
+        ('fixlen', dict(fmt='5s', values=['ab\0de'])),
+        ('raw', dict(fmt='u', values=['\0\x42' * 20])),
+        ('rawsized', dict(fmt='u3u', values=['\x42' * 10, 'abc'])),
+        ('mixed', dict(fmt='SiQu', values=['key', -5, 2 ** 63, 'v' * 300])),
+    ])
+
+    def test_python(self):
+        if packing.pack == packing._pack_python:
+            self.skipTest('the _packing extension is not built')
+        packed = packing.pack(self.fmt, *self.values)
+        self.assertEqual(packed,
+            packing._pack_python(self.fmt, *self.values))
+        self.assertEqual(packing.unpack(self.fmt, packed), self.values)
+        self.assertEqual(packing.unpack(self.fmt, packed),
+            packing._unpack_python(self.fmt, packed))
+
+    # The engine packs index keys from the table's value columns, check
+    # the bytes match what we pack for the same columns.
+    def test_engine(self):
+        nvalues = len(self.values)
+        colnames = ','.join('v' + str(i) for i in xrange(nvalues))
+        uri = 'table:' + self.name
+        self.session.create(uri, 'columns=(k,' + colnames + '),' +
+            'key_format=i,value_format=' + self.fmt)
+        self.session.create('index:' + self.name + ':inverse',
+            'columns=(' + colnames + ')')
+        c = self.session.open_cursor(uri, None, None)
+        c[1234] = tuple(self.values)
+        c.close()
+
+        c = self.session.open_cursor('index:' + self.name + ':inverse')
+        self.assertEqual(c.next(), 0)
+        self.assertEqual(c._get_key(),
+            packing.pack(self.fmt + 'i', *(self.values + [1234])))
+        self.assertEqual(c.get_keys(), self.values)
+        c.close()
+
+    def test_pack_into(self):
+        packed = packing.pack(self.fmt, *self.values)
+        for pack_into in (packing.pack_into, packing._pack_into_python):
+            buf = bytearray()
+            self.assertEqual(pack_into(self.fmt, buf, *self.values),
+                len(packed))
+            self.assertEqual(str(buf[:len(packed)]), packed)
+
+            # A larger buffer is written in place and isn't shrunk.
+            buf = bytearray('#' * (len(packed) + 10))
+            self.assertEqual(pack_into(self.fmt, buf, *self.values),
+                len(packed))
+            self.assertEqual(str(buf), packed + '#' * 10)
+
+            # A failed pack doesn't change the buffer.
+            self.assertRaises(IndexError, pack_into, self.fmt, buf)
+            self.assertEqual(str(buf), packed + '#' * 10)
+
+    # Cursors reuse their key and value buffers: check shorter keys and
+    # values don't pick up bytes left from longer ones.
+    def test_cursor_buffers(self):
+        uri = 'table:' + self.name
+        self.session.create(uri, 'key_format=S,value_format=S')
+        c = self.session.open_cursor(uri, None, None)
+        for i in xrange(20, 0, -1):
+            c['k' * i] = 'v' * i
+        c.close()
+        c = self.session.open_cursor(uri, None, None)
+        for i in xrange(1, 21):
+            self.assertEqual(c['k' * i], 'v' * i)
+        c.set_key('k' * 5)
+        c.set_value('shorter')
+        c.update()
+        self.assertEqual(c['k' * 5], 'shorter')
+        c.reset()
+        self.assertEqual(sum(1 for row in c), 20)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, packing.pack, '<i', 1)
+        self.assertRaises(ValueError, packing.pack, 'B', 256)
+        self.assertRaises(ValueError, packing.pack, 'b', 128)
+        self.assertRaises(ValueError, packing.pack, '3t', 8)
+        self.assertRaises(IndexError, packing.pack, 'ii', 1)
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import threading, time
+import wiredtiger, wttest
+from wiredtiger.pool import SessionPool, PoolTimeout
+
+# test_pool01.py
+#    Session pools.
+class test_pool01(wttest.WiredTigerTestCase):
+    uri = 'table:pool01'
+
+    def setUp(self):
+        wttest.WiredTigerTestCase.setUp(self)
+        self.session.create(self.uri, 'key_format=i,value_format=S')
+
+    # Sessions and their cursors are reused.
+    def test_pool_reuse(self):
+        pool = SessionPool(self.conn, max_sessions=2, cursors=[self.uri])
+        with pool.checkout() as s:
+            first = s.session
+            c = s.cursor(self.uri)
+            c[1] = 'one'
+            c.set_key(1)
+            self.assertEqual(c.search(), 0)
+        with pool.checkout() as s:
+            self.assertTrue(s.session is first)
+            self.assertTrue(s.cursor(self.uri) is c)
+            # The cursor was reset at checkin.
+            self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+                lambda: c.get_key(), '/requires key be set/')
+            self.assertEqual(s.cursor(self.uri)[1], 'one')
+        stats = pool.stats()
+        self.assertEqual(stats['opened'], 1)
+        self.assertEqual(stats['checkouts'], 2)
+        self.assertEqual(stats['open'], 1)
+        self.assertEqual(stats['idle'], 1)
+        pool.close()
+        self.assertEqual(pool.stats()['open'], 0)
+        self.assertRaises(wiredtiger.WiredTigerError, pool.checkout)
+
+    # A transaction left running is rolled back at checkin.
+    def test_pool_rollback(self):
+        pool = SessionPool(self.conn, max_sessions=1)
+        s = pool.checkout()
+        s.begin_transaction()
+        s.cursor(self.uri)[2] = 'two'
+        pool.checkin(s)
+        self.assertEqual(pool.stats()['rollbacks'], 1)
+        self.assertRaises(ValueError, pool.checkin, s)
+        with pool.checkout() as s:
+            c = s.cursor(self.uri)
+            c.set_key(2)
+            self.assertEqual(c.search(), wiredtiger.WT_NOTFOUND)
+            # The session can start a new transaction.
+            s.begin_transaction()
+            s.commit_transaction()
+        pool.close()
+
+    # Sessions failing their check are closed, not reused.
+    def test_pool_check(self):
+        pool = SessionPool(self.conn, max_sessions=1,
+            check=lambda s: False)
+        with pool.checkout() as s:
+            first = s.session
+        with pool.checkout() as s:
+            self.assertTrue(s.session is not first)
+        stats = pool.stats()
+        self.assertEqual(stats['discards'], 2)
+        self.assertEqual(stats['open'], 0)
+        pool.close()
+
+    # A full pool waits for a checkin, or times out.
+    def test_pool_wait(self):
+        pool = SessionPool(self.conn, max_sessions=1)
+        s = pool.checkout()
+        self.assertRaises(PoolTimeout, pool.checkout, 0.1)
+        t = threading.Timer(0.2, pool.checkin, [s])
+        t.start()
+        with pool.checkout(10) as s2:
+            self.assertTrue(s2.session is s.session)
+        t.join()
+        stats = pool.stats()
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertGreater(stats['waits'], 1)
+        pool.close()
+
+    # Idle sessions are closed after the idle timeout.
+    def test_pool_reap(self):
+        pool = SessionPool(self.conn, max_sessions=4, min_sessions=1,
+            idle_timeout=0.1)
+        sessions = [pool.checkout() for i in range(4)]
+        for s in sessions:
+            pool.checkin(s)
+        self.assertEqual(pool.stats()['idle'], 4)
+        time.sleep(0.2)
+        self.assertEqual(pool.reap(), 3)
+        self.assertEqual(pool.stats()['open'], 1)
+        pool.close()
+
+    # Many threads share a small pool.
+    def test_pool_threads(self):
+        pool = SessionPool(self.conn, max_sessions=3, cursors=[self.uri])
+        errors = []
+        def worker(n):
+            try:
+                for i in xrange(200):
+                    with pool.checkout() as s:
+                        s.cursor(self.uri)[n * 1000 + i] = str(i)
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=worker, args=(n,))
+            for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        stats = pool.stats()
+        self.assertLessEqual(stats['opened'], 3)
+        self.assertEqual(stats['checkouts'], 1600)
+        pool.close()
+        c = self.session.open_cursor(self.uri)
+        self.assertEqual(sum(1 for k, v in c), 1600)
+        c.close()
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import os, shutil
+from suite_subprocess import suite_subprocess
+from wtscenario import make_scenarios
+import wiredtiger, wttest
+
+# test_salvage02.py
+#    Parallel salvage: WT_SESSION.salvage threads and wt salvage -t
+class test_salvage02(wttest.WiredTigerTestCase, suite_subprocess):
+    uri = 'file:salvage02.wt'
+    types = [
+        ('row', dict(key_format='S', value_format='S', nentries=20000)),
+        ('var', dict(key_format='r', value_format='S', nentries=20000)),
+        ('fix', dict(key_format='r', value_format='8t', nentries=200000)),
+    ]
+    scenarios = make_scenarios(types)
+
+    def key(self, i):
+        if self.key_format == 'S':
+            return 'key%06d' % i
+        return i + 1
+
+    def value(self, i):
+        if self.value_format == '8t':
+            return i % 256
+        return 'value%06d' % i
+
+    def populate(self):
+        self.session.create(self.uri, 'key_format=' + self.key_format +
+            ',value_format=' + self.value_format + ',leaf_page_max=4KB')
+        c = self.session.open_cursor(self.uri)
+        for i in xrange(self.nentries):
+            c[self.key(i)] = self.value(i)
+        c.close()
+
+    def contents(self, session):
+        c = session.open_cursor(self.uri)
+        ret = [(k, v) for k, v in c]
+        c.close()
+        return ret
+
+    def test_salvage_threads(self):
+        self.populate()
+        expect = self.contents(self.session)
+        self.session.salvage(self.uri, 'threads=4')
+        self.assertEqual(self.contents(self.session), expect)
+
+    def test_salvage_threads_damaged(self):
+        self.populate()
+        self.close_conn()
+
+        # Overwrite chunks of the file that don't fall on block boundaries,
+        # the scan threads start inside blocks.
+        filename = self.uri.split(':')[1]
+        size = os.path.getsize(filename)
+        with open(filename, 'r+b') as f:
+            for pct in (20, 45, 70):
+                f.seek(size * pct / 100 + 100)
+                f.write('\1\xff\x80' * 1000)
+
+        # Salvage a copy with a single thread, and compare the results with
+        # a parallel salvage: the blocks found must be the same.
+        os.mkdir('copy')
+        for f in os.listdir('.'):
+            if f.startswith('WiredTiger') or f.endswith('.wt'):
+                shutil.copy(f, 'copy')
+        self.runWt(['-h', 'copy', 'salvage', self.uri])
+        self.runWt(['-v', 'salvage', '-t', '3', self.uri],
+            outfilename='salvage.out')
+        self.check_file_contains('salvage.out', 'per second')
+
+        conn = self.wiredtiger_open('copy')
+        expect = self.contents(conn.open_session())
+        conn.close()
+        got = self.contents(self.session)
+        self.assertEqual(got, expect)
+        self.assertGreater(len(got), 0)
+
+if __name__ == '__main__':
+    wttest.run()
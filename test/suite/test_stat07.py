@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import pickle, wiredtiger, wttest
+from wtdataset import SimpleDataSet, ComplexDataSet
+from wtscenario import make_scenarios
+from wiredtiger import stat
+
+# test_stat07.py
+#    Statistics snapshots.
+class test_stat07(wttest.WiredTigerTestCase):
+    conn_config = 'statistics=(all)'
+    uri = [
+        ('file', dict(uri='file:snapshot', dataset=SimpleDataSet)),
+        ('table', dict(uri='table:snapshot', dataset=SimpleDataSet)),
+        ('complex', dict(uri='table:snapshot', dataset=ComplexDataSet)),
+    ]
+    scenarios = make_scenarios(uri)
+
+    def first_key(self, keys):
+        return min(v for k, v in vars(keys).items() if not k.startswith('_'))
+
+    # Check a snapshot has the same values as a statistics cursor.
+    def check(self, snapshot, uri):
+        count = 0
+        cursor = self.session.open_cursor(uri, None, 'statistics=(size)')
+        for key in xrange(snapshot.base, snapshot.base + len(snapshot)):
+            self.assertEqual(snapshot[key], cursor[key][2])
+            count += 1
+        cursor.close()
+        self.assertGreater(count, 0)
+
+    def test_stat_snapshot(self):
+        self.dataset(self, self.uri, 100).populate()
+
+        # Size statistics are stable across cursor opens.
+        snapshot = self.session.stat_snapshot(self.uri, 'statistics=(size)')
+        self.assertEqual(snapshot.base, self.first_key(stat.dsrc))
+        self.check(snapshot, 'statistics:' + self.uri)
+        snapshot = self.session.stat_snapshot(
+            'statistics:', 'statistics=(size)')
+        self.assertEqual(snapshot.base, self.first_key(stat.conn))
+
+        # Snapshots index by key, slices and iteration are in key order.
+        snapshot = self.session.stat_snapshot(self.uri)
+        self.assertTrue(snapshot[stat.dsrc.btree_entries] >= 100)
+        self.assertEqual(list(snapshot[:2]),
+            [snapshot[snapshot.base], snapshot[snapshot.base + 1]])
+        self.assertEqual(len(list(snapshot)), len(snapshot))
+        self.assertRaises(IndexError, lambda: snapshot[0])
+        self.assertRaises(IndexError,
+            lambda: snapshot[snapshot.base + len(snapshot)])
+
+        # Snapshots can be pickled.
+        copy = pickle.loads(pickle.dumps(snapshot))
+        self.assertEqual(copy.base, snapshot.base)
+        self.assertEqual(copy.time, snapshot.time)
+        self.assertEqual(list(copy), list(snapshot))
+
+        # The modules snapshots use aren't part of the wiredtiger namespace.
+        for name in ('operator', 'struct', 'time'):
+            self.assertFalse(hasattr(wiredtiger, name))
+
+    # Snapshots from an open statistics cursor see changes.
+    def test_stat_snapshot_delta(self):
+        ds = self.dataset(self, self.uri, 100)
+        ds.populate()
+        statcursor = self.session.open_cursor('statistics:' + self.uri)
+        before = statcursor.stat_snapshot()
+        c = self.session.open_cursor(self.uri, None)
+        for i in xrange(1, 51):
+            c.set_key(ds.key(i))
+            self.assertEqual(c.search(), 0)
+        c.close()
+        after = statcursor.stat_snapshot()
+        statcursor.close()
+
+        # Complex tables also count searches in their column groups.
+        delta = after - before
+        if self.dataset == SimpleDataSet:
+            self.assertEqual(delta[stat.dsrc.cursor_search], 50)
+        else:
+            self.assertGreater(delta[stat.dsrc.cursor_search], 50)
+        self.assertEqual(list(after.delta(before)), list(delta))
+        self.assertEqual(delta.time, after.time)
+
+        rate = after.rate(before)
+        self.assertEqual(rate.typecode, 'd')
+        self.assertAlmostEqual(rate[stat.dsrc.cursor_search],
+            delta[stat.dsrc.cursor_search] / (after.time - before.time))
+        self.assertRaises(ValueError, lambda: before.rate(after))
+
+        conn = self.session.stat_snapshot()
+        self.assertRaises(ValueError, lambda: after - conn)
+
+    def test_stat_snapshot_invalid(self):
+        self.dataset(self, self.uri, 100).populate()
+        c = self.session.open_cursor(self.uri, None)
+        self.assertRaises(TypeError, lambda: c.stat_snapshot())
+        c.close()
+        self.assertRaises(wiredtiger.WiredTigerError,
+            lambda: self.session.stat_snapshot('table:nonexistent'))
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import glob, re
+import wiredtiger, wttest
+
+# test_stat08.py
+#    Latency histogram statistics.
+class test_stat08(wttest.WiredTigerTestCase):
+    conn_config = 'statistics=(fast,latency)'
+    uri = 'table:latency'
+    types = ('cursor search', 'cursor insert', 'cursor update',
+        'cursor remove', 'transaction commit', 'page read')
+
+    # Return a dictionary of the histograms by operation type, each a list
+    # of the operation count, total, maximum and (low, high, count) buckets.
+    def histograms(self, config=None):
+        hists = {}
+        c = self.session.open_cursor('statistics:latency', None, config)
+        for key, desc, pvalue, value in c:
+            name, field = desc.split(': ', 1)
+            hist = hists.setdefault(name, [])
+            m = re.match(r'latency (\d+)-(\d+)ns$', field)
+            if m:
+                hist.append((int(m.group(1)), int(m.group(2)), value))
+            elif field.endswith('and over'):
+                hist.append((int(field.split()[1][:-2]), None, value))
+            else:
+                hist.append(value)
+        c.close()
+        self.assertEqual(sorted(hists.keys()), sorted(self.types))
+        return hists
+
+    def check(self, hist):
+        count, total, maximum, buckets = hist[0], hist[1], hist[2], hist[3:]
+        self.assertEqual(sum(b[2] for b in buckets), count)
+        if count != 0:
+            self.assertGreaterEqual(total, maximum)
+            self.assertGreater(maximum, 0)
+            # The maximum is in the last bucket with operations.
+            low, high, n = [b for b in buckets if b[2] != 0][-1]
+            self.assertGreaterEqual(maximum, low)
+            if high is not None:
+                self.assertLessEqual(maximum, high)
+
+        # The buckets are contiguous.
+        self.assertEqual(buckets[0][0], 0)
+        for prev, b in zip(buckets, buckets[1:]):
+            self.assertEqual(prev[1] + 1, b[0])
+
+    def test_latency(self):
+        self.session.create(self.uri, 'key_format=i,value_format=S')
+        c = self.session.open_cursor(self.uri)
+        for i in xrange(1, 101):
+            self.session.begin_transaction()
+            c[i] = 'value' + str(i)
+            self.session.commit_transaction()
+        for i in xrange(1, 101):
+            c.set_key(i)
+            self.assertEqual(c.search(), 0)
+        for i in xrange(1, 51):
+            c.set_key(i)
+            c.set_value('update' + str(i))
+            self.assertEqual(c.update(), 0)
+        for i in xrange(1, 11):
+            c.set_key(i)
+            self.assertEqual(c.remove(), 0)
+        c.close()
+
+        hists = self.histograms()
+        for name in self.types:
+            self.check(hists[name])
+        self.assertGreaterEqual(hists['cursor insert'][0], 100)
+        self.assertGreaterEqual(hists['cursor search'][0], 100)
+        self.assertGreaterEqual(hists['cursor update'][0], 50)
+        self.assertGreaterEqual(hists['cursor remove'][0], 10)
+        self.assertEqual(hists['transaction commit'][0], 100)
+
+        # Pages are read from disk after a restart.
+        self.reopen_conn()
+        c = self.session.open_cursor(self.uri)
+        self.assertEqual(len(list(c)), 90)
+        c.close()
+        hists = self.histograms()
+        self.check(hists['page read'])
+        self.assertGreater(hists['page read'][0], 0)
+
+        # Statistics snapshots work on the histograms.
+        snapshot = self.session.stat_snapshot('statistics:latency')
+        self.assertEqual(snapshot.base, 4000)
+        self.assertEqual(snapshot[4000], hists['cursor search'][0])
+
+    def test_latency_clear(self):
+        self.session.begin_transaction()
+        self.session.commit_transaction()
+        self.assertEqual(
+            self.histograms('statistics=(clear)')['transaction commit'][0], 1)
+        self.assertEqual(self.histograms()['transaction commit'][0], 0)
+
+    def test_latency_log(self):
+        self.conn.reconfigure('statistics_log=(wait=100,on_close)')
+        self.session.begin_transaction()
+        self.session.commit_transaction()
+        self.close_conn()
+
+        lines = [l for f in glob.glob('WiredTigerStat.*') for l in open(f)
+            if ' latency transaction commit: latency operations' in l]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0].split()[3], '1')
+
+    def test_latency_not_configured(self):
+        self.conn.reconfigure('statistics=(fast)')
+        self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+            lambda: self.session.open_cursor('statistics:latency'),
+            '/require the database statistics configuration/')
+
+if __name__ == '__main__':
+    wttest.run()
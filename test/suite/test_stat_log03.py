@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import glob, time
+import wiredtiger, wttest
+from wiredtiger import stat
+from wiredtiger.statlog import StatLogReader
+
+# test_stat_log03.py
+#    Binary statistics log format.
+class test_stat_log03(wttest.WiredTigerTestCase):
+    uri = 'table:binlog'
+    conn_config = 'statistics=(fast),statistics_log=(wait=100,binary,' +\
+        'on_close,sources=[file:])'
+
+    def insert(self, count):
+        self.session.create(self.uri, 'key_format=i,value_format=S')
+        c = self.session.open_cursor(self.uri)
+        for i in xrange(count):
+            c[i + 1] = 'value' + str(i)
+        c.close()
+
+    def read_log(self):
+        files = glob.glob('WiredTigerStat.[0-9]*')
+        self.assertEqual(len(files), 1)
+        reader = StatLogReader(files[0])
+        intervals = list(reader)
+        reader.close()
+        return intervals, reader
+
+    # Statistics logged on close, one interval.
+    def test_stat_log_binary(self):
+        self.insert(100)
+        self.close_conn()
+
+        intervals, reader = self.read_log()
+        self.assertEqual(len(intervals), 1)
+        self.assertTrue(reader.version.startswith('WiredTiger'))
+        when, sources = intervals[0]
+        self.assertLessEqual(abs(when - time.time()), 60)
+
+        dsrc = sources['file:binlog.wt']
+        self.assertEqual(dsrc.base, min(
+            v for k, v in vars(stat.dsrc).items() if not k.startswith('_')))
+        self.assertEqual(dsrc[stat.dsrc.cursor_insert], 100)
+        self.assertEqual(reader.descriptions('file:binlog.wt')
+            [stat.dsrc.cursor_insert - dsrc.base], 'cursor: insert calls')
+
+        # The connection statistics are logged under the database home.
+        conns = [s for n, s in sources.items() if not n.startswith('file:')]
+        self.assertEqual(len(conns), 1)
+        self.assertGreaterEqual(conns[0][stat.conn.cursor_insert], 100)
+
+    # Each open of the log file starts over: appending to an existing file
+    # doesn't carry over the previous values.
+    def test_stat_log_binary_append(self):
+        self.insert(10)
+        self.reopen_conn()
+        self.insert(25)
+        self.close_conn()
+
+        intervals, reader = self.read_log()
+        self.assertEqual(len(intervals), 2)
+        self.assertLessEqual(intervals[0][0], intervals[1][0])
+        self.assertEqual(
+            [s['file:binlog.wt'][stat.dsrc.cursor_insert]
+            for w, s in intervals], [10, 25])
+
+    # Read the log while it's being written, counters never go backwards.
+    def test_stat_log_binary_running(self):
+        self.conn.reconfigure(
+            'statistics_log=(wait=1,binary,sources=[file:])')
+        self.insert(10)
+        intervals = []
+        for i in xrange(10):
+            time.sleep(1)
+            intervals, reader = self.read_log()
+            if len(intervals) >= 3:
+                break
+        self.assertGreaterEqual(len(intervals), 3)
+
+        prev = None
+        for when, sources in intervals:
+            self.assertTrue(sources)
+            conn = [s for n, s in sources.items()
+                if not n.startswith('file:')][0]
+            if prev is not None:
+                self.assertGreaterEqual(when, prev[0])
+                self.assertGreaterEqual(conn[stat.conn.cursor_create],
+                    prev[1][stat.conn.cursor_create])
+            prev = (when, conn)
+
+    # An interval isn't returned until all of its records are in the file,
+    # and reading picks up the interval where it stopped.
+    def test_stat_log_binary_partial(self):
+        self.insert(100)
+        self.close_conn()
+
+        files = glob.glob('WiredTigerStat.[0-9]*')
+        self.assertEqual(len(files), 1)
+        with open(files[0], 'rb') as f:
+            data = f.read()
+        with open('partial', 'wb') as f:
+            f.write(data[:-1])
+
+        reader = StatLogReader('partial')
+        self.assertEqual(list(reader), [])
+        with open('partial', 'ab') as f:
+            f.write(data[-1:])
+        intervals = list(reader)
+        reader.close()
+        self.assertEqual(len(intervals), 1)
+        self.assertEqual(
+            intervals[0][1]['file:binlog.wt'][stat.dsrc.cursor_insert], 100)
+
+    def test_stat_log_binary_json(self):
+        self.close_conn()
+        self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+            lambda: self.wiredtiger_open('.', 'create,statistics=(fast),' +
+            'statistics_log=(wait=1,binary,json)'), '/incompatible/')
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import glob, json
+from suite_subprocess import suite_subprocess
+from wtscenario import make_scenarios
+import wiredtiger, wttest
+
+# test_util18.py
+#    Utilities: parallel wt dump -j -p and wt load -j -p
+class test_util18(wttest.WiredTigerTestCase, suite_subprocess):
+    nentries = 20000
+
+    types = [
+        ('row', dict(uri='table:util18', key_format='S', split=True)),
+        ('col', dict(uri='table:util18', key_format='r', split=True)),
+        ('file', dict(uri='file:util18', key_format='i', split=True)),
+        ('lsm', dict(uri='lsm:util18', key_format='S', split=False)),
+    ]
+    scenarios = make_scenarios(types)
+
+    def key(self, i):
+        if self.key_format == 'S':
+            return 'key%06d' % i
+        return i + 1
+
+    def populate(self):
+        self.session.create(self.uri, 'key_format=' + self.key_format +
+            ',value_format=S,leaf_page_max=4KB,internal_page_max=4KB')
+        c = self.session.open_cursor(self.uri)
+        for i in xrange(self.nentries):
+            c[self.key(i)] = 'value%06d' % i
+        c.close()
+
+    def data(self, filename):
+        with open(filename) as f:
+            return json.load(f)[self.uri][1]['data']
+
+    def test_dump_load_parallel(self):
+        self.populate()
+        self.runWt(['dump', '-j', '-f', 'dump.json', self.uri])
+        self.runWt(['dump', '-j', '-p', '4', '-f', 'pdump', self.uri])
+
+        # Each file is a complete dump of a range of the object, together
+        # they're the single dump.
+        files = sorted(glob.glob('pdump.*'), key=lambda f: int(f[6:]))
+        if self.split:
+            self.assertGreater(len(files), 1)
+            self.assertLessEqual(len(files), 4)
+        else:
+            self.assertEqual(len(files), 1)
+        expect = self.data('dump.json')
+        self.assertEqual(len(expect), self.nentries)
+        self.assertEqual(sum((self.data(f) for f in files), []), expect)
+
+        # Load the files in parallel into a new object.
+        newname = self.uri.split(':')[0] + ':util18_load'
+        self.runWt(['load', '-j', '-p', '3', '-f', 'pdump', '-r',
+            newname.split(':')[1]])
+        self.runWt(['dump', '-j', '-f', 'load.json', newname])
+        with open('load.json') as f:
+            self.assertEqual(json.load(f)[newname][1]['data'], expect)
+
+    def test_dump_parallel_one(self):
+        # With one thread, a parallel dump is an ordinary dump.
+        self.populate()
+        self.runWt(['dump', '-j', '-f', 'dump.json', self.uri])
+        self.runWt(['dump', '-j', '-p', '1', '-f', 'pdump.json', self.uri])
+        self.assertEqual(open('dump.json').read(), open('pdump.json').read())
+
+    def test_parallel_errors(self):
+        self.populate()
+        self.runWt(['dump', '-p', '2', '-f', 'pdump', self.uri],
+            errfilename='err.out', failure=True)
+        self.check_file_contains('err.out', 'requires -j and -f')
+        self.runWt(['dump', '-j', '-p', '2', self.uri],
+            errfilename='err.out', failure=True)
+        self.check_file_contains('err.out', 'requires -j and -f')
+        self.runWt(['load', '-j', '-p', '2', '-f', 'missing'],
+            errfilename='err.out', failure=True)
+        self.check_file_contains('err.out', 'missing.0')
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2017 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import os
+from suite_subprocess import suite_subprocess
+from wtscenario import make_scenarios
+import wiredtiger, wttest
+
+# test_verify02.py
+#    Parallel verify: WT_SESSION.verify threads and wt verify -t
+class test_verify02(wttest.WiredTigerTestCase, suite_subprocess):
+    uri = 'file:verify02.wt'
+    nentries = 20000
+
+    types = [
+        ('row', dict(key_format='S', value_format='S')),
+        ('var', dict(key_format='r', value_format='S')),
+        ('fix', dict(key_format='r', value_format='8t')),
+    ]
+    threads = [
+        ('1', dict(threads=1)),
+        ('4', dict(threads=4)),
+    ]
+    scenarios = make_scenarios(types, threads)
+
+    def key(self, i):
+        if self.key_format == 'S':
+            return 'key%06d' % i
+        return i + 1
+
+    def value(self, i, gen):
+        if self.value_format == '8t':
+            return (i + gen) % 256
+        return 'value%06d.%d' % (i, gen)
+
+    # Small pages, so the root page has many subtrees several levels deep.
+    def populate(self, gen=0):
+        if gen == 0:
+            self.session.create(self.uri, 'key_format=' + self.key_format +
+                ',value_format=' + self.value_format +
+                ',allocation_size=512,leaf_page_max=512,internal_page_max=512')
+        c = self.session.open_cursor(self.uri)
+        for i in xrange(0, self.nentries, gen + 1):
+            c[self.key(i)] = self.value(i, gen)
+        c.close()
+
+    def test_verify_threads(self):
+        self.populate()
+        self.session.checkpoint()
+        self.populate(1)
+        self.session.checkpoint()
+        self.reopen_conn()
+        self.session.verify(self.uri, 'threads=%d' % self.threads)
+
+        # Verify doesn't change the object.
+        c = self.session.open_cursor(self.uri)
+        for i in xrange(self.nentries):
+            self.assertEqual(c[self.key(i)], self.value(i, 1 - i % 2))
+        c.close()
+
+    def test_verify_threads_dump(self):
+        # The dump options verify the tree in order, with a single thread.
+        self.populate()
+        self.reopen_conn()
+        with self.expectedStdoutPattern('page tree-depth'):
+            self.session.verify(self.uri,
+                'dump_layout,threads=%d' % self.threads)
+
+    def test_verify_threads_process(self):
+        self.populate()
+        self.runWt(['-v', 'verify', '-t', str(self.threads), self.uri],
+            outfilename='verify.out')
+        self.check_file_contains('verify.out', 'WT_SESSION.verify')
+        self.check_file_contains('verify.out', 'per second')
+
+    def test_verify_threads_damaged(self):
+        self.populate()
+        self.close_conn()
+
+        # Overwrite a page in the middle of the file.
+        filename = self.uri.split(':')[1]
+        with open(filename, 'r+b') as f:
+            f.seek(os.path.getsize(filename) / 2 / 4096 * 4096)
+            f.write('\0' * 4096)
+        self.runWt(['verify', '-t', str(self.threads), self.uri],
+            errfilename='verify.err', failure=True)
+        self.check_non_empty_file('verify.err')
+
+if __name__ == '__main__':
+    wttest.run()
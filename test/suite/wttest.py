@@ -38,7 +38,7 @@ except ImportError:
 
 from contextlib import contextmanager
 import glob, os, re, shutil, sys, time, traceback
-import wiredtiger, wtscenario
+import wiredtiger, wiredtiger.backup, wtscenario
 
 def shortenWithEllipsis(s, maxlen):
     if len(s) > maxlen:
@@ -441,14 +441,7 @@ class WiredTigerTestCase(unittest.TestCase):
             session = self.session
         shutil.rmtree(backup_dir, ignore_errors=True)
         os.mkdir(backup_dir)
-        bkp_cursor = session.open_cursor('backup:', None, None)
-        while True:
-            ret = bkp_cursor.next()
-            if ret != 0:
-                break
-            shutil.copy(bkp_cursor.get_key(), backup_dir)
-        self.assertEqual(ret, wiredtiger.WT_NOTFOUND)
-        bkp_cursor.close()
+        wiredtiger.backup.copy(session, backup_dir)
 
     @contextmanager
     def expectedStdout(self, expect):